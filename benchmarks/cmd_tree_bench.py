@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""Lookup, completion and printout benchmark for large command trees.
+
+A generated tree with one node for each action of each object of each subsystem is built, which
+is the typical structure of a generated mission command tree. The default size has more than
+100000 nodes. Random full paths are looked up with the path index of
+:py:class:`tmtccmd.config.tmtc.CmdTreeNode` and with the previous implementation, which scanned
+the children of each node linearly and called the containment check again at every level of
+the extraction.
+
+The completion latency of :py:class:`tmtccmd.config.prompt.CmdTreeCompleter` is measured for
+typical inputs, including the first completion for a node which builds its prefix index. The
+setup time is compared with the :py:class:`tmtccmd.config.prompt.NestedCompleter` built from the
+name dictionary of the tree, which was used by the CLI prompt before. The completer is also
+measured on a flat tree where the root node has all nodes as children.
+
+The printout of the whole tree is measured as a string and written line by line to
+:py:data:`os.devnull`, including the peak memory of both variants.
+
+Saving and loading the tree with :py:mod:`tmtccmd.config.tree_cache` is measured as well.
+Loading creates the same nodes as the build, so it is only faster for trees which are expensive
+to generate, for example trees parsed from object and action lists.
+
+The tree is also written as a CSV file and loaded with the lazy loader of
+:py:mod:`tmtccmd.config.tree_loader`. The load time and peak memory are measured, and the cost
+of navigating to a single command, which only creates the nodes along its path.
+
+The command path dispatch of :py:class:`tmtccmd.tmtc.dispatch.CmdPathDispatcher` is measured
+with one literal pattern for each action and with a single parameter pattern, and compared with
+a linear comparison of the path against all action paths, like an ``if``/``elif`` chain.
+
+Example: ``python benchmarks/cmd_tree_bench.py --subsystems 10 --objects 100 --actions 100``
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from prompt_toolkit.completion import CompleteEvent
+from prompt_toolkit.document import Document
+
+from tmtccmd.config.prompt import CmdTreeCompleter, NestedCompleter
+from tmtccmd.config.tmtc import CmdTreeNode
+from tmtccmd.config.tree_cache import load_cmd_tree, save_cmd_tree
+from tmtccmd.config.tree_loader import load_cmd_tree_file
+from tmtccmd.tmtc.dispatch import CmdPathDispatcher
+
+
+def build_tree(subsystems: int, objects: int, actions: int) -> CmdTreeNode:
+    root = CmdTreeNode.root_node()
+    for subsystem_idx in range(subsystems):
+        subsystem = CmdTreeNode(f"subsystem_{subsystem_idx}", "Subsystem")
+        root.add_child(subsystem)
+        for object_idx in range(objects):
+            obj = CmdTreeNode(f"object_{object_idx}", "Object")
+            subsystem.add_child(obj)
+            for action_idx in range(actions):
+                obj.add_child(CmdTreeNode(f"action_{action_idx}", "Action"))
+    return root
+
+
+def legacy_contains(node: CmdTreeNode, node_name_list: list[str]) -> bool:
+    if len(node_name_list) == 0:
+        return False
+    if len(node_name_list) == 2 and node_name_list == ["", ""]:
+        return True
+    if node_name_list[0] == "":
+        node_name_list = node_name_list[1:]
+    for child in node.children.values():
+        if node_name_list[0] == child.name:
+            if len(node_name_list) == 1:
+                return True
+            return legacy_contains(child, node_name_list[1:])
+    return False
+
+
+def legacy_extract(node: CmdTreeNode, node_list: list[str]) -> CmdTreeNode | None:
+    if not legacy_contains(node, node_list):
+        return None
+    if len(node_list) == 1:
+        return node.children[node_list[0]]
+    return legacy_extract(node.children[node_list[0]], node_list[1:])
+
+
+def bench(name: str, lookup: Callable[[str], object], paths: list[str]):
+    start = time.perf_counter()
+    for path in paths:
+        lookup(path)
+    duration = time.perf_counter() - start
+    print(f"{name}: {duration / len(paths) * 1e6:.2f} us per lookup")
+
+
+def bench_completer(name: str, root: CmdTreeNode, inputs: list[str]):
+    start = time.perf_counter()
+    completer = CmdTreeCompleter(root)
+    print(f"{name}: completer created in {(time.perf_counter() - start) * 1e3:.3f} ms")
+    for text in inputs:
+        start = time.perf_counter()
+        num = len(list(completer.get_completions(Document(text), CompleteEvent())))
+        duration = time.perf_counter() - start
+        print(f"{name}: {num} completions for {text!r} in {duration * 1e3:.2f} ms")
+
+
+def bench_printout(root: CmdTreeNode):
+    for name, render in [
+        ("str_for_tree", lambda _: root.str_for_tree(True)),
+        ("write_tree", lambda stream: root.write_tree(stream, True)),
+    ]:
+        with open(os.devnull, "w", encoding="utf-8") as devnull:
+            start = time.perf_counter()
+            render(devnull)
+            duration = time.perf_counter() - start
+            tracemalloc.start()
+            render(devnull)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        print(f"{name}: {duration * 1e3:.1f} ms, peak memory {peak / 1e6:.2f} MB")
+
+
+def bench_tree_cache(root: CmdTreeNode):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_path = os.path.join(tmp_dir, "cmd_tree.json")
+        start = time.perf_counter()
+        save_cmd_tree(root, cache_path, "bench")
+        save_time = time.perf_counter() - start
+        start = time.perf_counter()
+        loaded = load_cmd_tree(cache_path, "bench")
+        load_time = time.perf_counter() - start
+        size = os.path.getsize(cache_path)
+    assert loaded is not None
+    print(
+        f"tree cache: saved in {save_time * 1e3:.1f} ms, loaded in {load_time * 1e3:.1f} ms, "
+        f"file size {size / 1e6:.2f} MB"
+    )
+
+
+def bench_lazy_loader(root: CmdTreeNode, path: str):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = os.path.join(tmp_dir, "cmd_tree.csv")
+        with open(csv_path, "w", encoding="utf-8") as file:
+            stack = [(child, child.name) for child in root.children.values()]
+            while stack:
+                node, node_path = stack.pop()
+                file.write(f"{node_path},{node.description}\n")
+                stack.extend((sub, f"{node_path}/{sub.name}") for sub in node.children.values())
+        start = time.perf_counter()
+        lazy_root = load_cmd_tree_file(csv_path)
+        load_time = time.perf_counter() - start
+        start = time.perf_counter()
+        lazy_root.extract_subnode(path)
+        lookup_time = time.perf_counter() - start
+        tracemalloc.start()
+        load_cmd_tree_file(csv_path).extract_subnode(path)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    print(
+        f"lazy CSV loader: loaded in {load_time * 1e3:.1f} ms, first lookup of {path} in "
+        f"{lookup_time * 1e3:.3f} ms, peak memory {peak / 1e6:.1f} MB"
+    )
+
+
+def bench_dispatch(all_paths: list[str], paths: list[str]):
+    start = time.perf_counter()
+    literal_dispatcher = CmdPathDispatcher()
+    for path in all_paths:
+        literal_dispatcher.register(path, len)
+    print(
+        f"dispatcher with {len(all_paths)} literal patterns created in "
+        f"{(time.perf_counter() - start) * 1e3:.1f} ms"
+    )
+    param_dispatcher = CmdPathDispatcher()
+    param_dispatcher.register("{subsystem}/{obj}/{action}", len)
+    bench("dispatch resolve (literal patterns)", literal_dispatcher.resolve, paths)
+    bench("dispatch resolve (parameter pattern)", param_dispatcher.resolve, paths)
+
+    def linear(path: str):
+        for candidate in all_paths:
+            if candidate == path:
+                return candidate
+        return None
+
+    bench("dispatch (linear comparison)", linear, paths[:20])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--subsystems", type=int, default=10)
+    parser.add_argument("--objects", type=int, default=100)
+    parser.add_argument("--actions", type=int, default=100)
+    parser.add_argument("--lookups", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    start = time.perf_counter()
+    root = build_tree(args.subsystems, args.objects, args.actions)
+    build_time = time.perf_counter() - start
+    # The memory is measured with a second tree because tracing slows down the build.
+    tracemalloc.start()
+    build_tree(args.subsystems, args.objects, args.actions)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    num_nodes = 1 + args.subsystems * (1 + args.objects * (1 + args.actions))
+    print(
+        f"Built tree with {num_nodes} nodes in {build_time * 1e3:.1f} ms, "
+        f"peak memory {peak / 1e6:.1f} MB"
+    )
+    rng = random.Random(args.seed)
+    paths = [
+        f"subsystem_{rng.randrange(args.subsystems)}/object_{rng.randrange(args.objects)}/"
+        f"action_{rng.randrange(args.actions)}"
+        for _ in range(args.lookups)
+    ]
+    missing = [f"{path}_missing" for path in paths]
+    bench("contains_path (index)", root.contains_path, paths)
+    bench("extract_subnode (index)", root.extract_subnode, paths)
+    bench("contains_path missing (index)", root.contains_path, missing)
+    bench("contains_path (legacy)", lambda p: legacy_contains(root, p.split("/")), paths)
+    bench("extract_subnode (legacy)", lambda p: legacy_extract(root, p.split("/")), paths)
+    bench("contains_path missing (legacy)", lambda p: legacy_contains(root, p.split("/")), missing)
+
+    start = time.perf_counter()
+    NestedCompleter.from_nested_dict(root.name_dict["/"], separator="/")
+    print(f"NestedCompleter from name_dict created in {(time.perf_counter() - start) * 1e3:.1f} ms")
+    bench_completer(
+        "tree",
+        root,
+        ["", "subsystem_1/", "subsystem_1/obj", "subsystem_1/object_1", "subsystem_1/o9"]
+        + ["subsystem_1/object_42/", "subsystem_1/object_42/a", "subsystem_1/object_42/7"],
+    )
+    bench_printout(root)
+    bench_tree_cache(root)
+    bench_lazy_loader(root, paths[0])
+    bench_dispatch(
+        [
+            f"subsystem_{subsystem}/object_{obj}/action_{action}"
+            for subsystem in range(args.subsystems)
+            for obj in range(args.objects)
+            for action in range(args.actions)
+        ],
+        paths,
+    )
+    flat_root = CmdTreeNode.root_node()
+    for idx in range(num_nodes - 1):
+        flat_root.add_child(CmdTreeNode(f"cmd_{idx}", "Command"))
+    bench_completer("flat tree", flat_root, ["c", "cmd_1", "cmd_12", "cmd_1", "_99", "9x9"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Deframing throughput benchmark for COBS and DLE framed streams.
+
+A stream of framed PUS TM packets is fed in chunks of a fixed size, like a reception thread
+reading a burst from a serial port. The streaming deframers of :py:mod:`tmtccmd.com.framing` are
+compared with the parsing done by the default serial interfaces of the ``com-interface`` library:
+
+- COBS: The parser of :py:class:`com_interface.serial_cobs.SerialCobsComIF`.
+- DLE: :py:meth:`dle_encoder.DleEncoder.decode` for each frame, which is what
+  :py:class:`com_interface.serial_dle.SerialDleComIF` does after its reception thread collected
+  the frame byte by byte. The byte-wise reception itself is not included.
+
+Example: ``python benchmarks/framing_bench.py --packets 20000 --chunk-size 4096``
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from collections.abc import Callable
+
+from com_interface.serial_base import SerialCfg
+from com_interface.serial_cobs import SerialCobsComIF
+from dle_encoder import ETX_CHAR, DleEncoder, DleErrorCodes
+from spacepackets.ccsds.time import CdsShortTimestamp
+from spacepackets.ecss.tm import PusTm
+
+from tmtccmd.com.framing import CobsDeframer, DleDeframer, cobs_encode_frame, dle_encode_frame
+
+APID = 0x02
+
+
+def create_packets(count: int, size: int, seed: int) -> list[bytes]:
+    rng = random.Random(seed)
+    timestamp = CdsShortTimestamp.empty().pack()
+    return [
+        PusTm(
+            apid=APID,
+            service=3,
+            subservice=25,
+            timestamp=timestamp,
+            seq_count=i % 0x4000,
+            source_data=rng.randbytes(size),
+        ).pack()
+        for i in range(count)
+    ]
+
+
+def chunked(stream: bytes, chunk_size: int) -> list[bytes]:
+    return [stream[i : i + chunk_size] for i in range(0, len(stream), chunk_size)]
+
+
+def cobs_default(chunks: list[bytes]) -> int:
+    com_if = SerialCobsComIF(SerialCfg("cobs", "", 115200))
+    received = 0
+    for chunk in chunks:
+        com_if._serial_ring_buf.appendleft(chunk)
+        received += len(com_if.receive())
+    return received
+
+
+def cobs_stream(chunks: list[bytes]) -> int:
+    deframer = CobsDeframer()
+    return sum(len(deframer.feed(chunk)) for chunk in chunks)
+
+
+def dle_default(chunks: list[bytes]) -> int:
+    encoder = DleEncoder()
+    received = 0
+    # The reception thread of the default interface splits the stream at ETX characters.
+    for frame in b"".join(chunks).split(bytes([ETX_CHAR])):
+        if not frame:
+            continue
+        retval, _, _ = encoder.decode(frame + bytes([ETX_CHAR]))
+        if retval == DleErrorCodes.OK:
+            received += 1
+    return received
+
+
+def dle_stream(chunks: list[bytes]) -> int:
+    deframer = DleDeframer()
+    return sum(len(deframer.feed(chunk)) for chunk in chunks)
+
+
+def bench(name: str, deframe: Callable[[list[bytes]], int], chunks: list[bytes], expected: int):
+    num_bytes = sum(len(chunk) for chunk in chunks)
+    start = time.perf_counter()
+    received = deframe(chunks)
+    duration = time.perf_counter() - start
+    status = "" if received == expected else f" ({expected - received} packets missing)"
+    print(
+        f"{name}: {received} packets in {duration * 1e3:.1f} ms, "
+        f"{num_bytes / duration / 1e6:.2f} MB/s{status}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--packets", type=int, default=5000, help="Number of TM packets")
+    parser.add_argument("--size", type=int, default=200, help="Source data size of each packet")
+    parser.add_argument("--chunk-size", type=int, default=4096, help="Read chunk size")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--skip-default",
+        action="store_true",
+        help="Only run the streaming deframers, the default COBS parser is slow for many packets",
+    )
+    args = parser.parse_args()
+    packets = create_packets(args.packets, args.size, args.seed)
+    cobs_chunks = chunked(b"".join(cobs_encode_frame(p) for p in packets), args.chunk_size)
+    dle_chunks = chunked(b"".join(dle_encode_frame(p) for p in packets), args.chunk_size)
+    if not args.skip_default:
+        bench("COBS default", cobs_default, cobs_chunks, len(packets))
+    bench("COBS stream", cobs_stream, cobs_chunks, len(packets))
+    if not args.skip_default:
+        bench("DLE default", dle_default, dle_chunks, len(packets))
+    bench("DLE stream", dle_stream, dle_chunks, len(packets))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Import time benchmark with a time budget for the most commonly imported tmtccmd modules.
+
+Each module is imported in fresh interpreters started with ``python -X importtime``. The
+cumulative import time of the module, including all its dependencies, is taken from the
+interpreter output, and the median of several runs is reported. The share of the tmtccmd
+modules themselves is reported as well.
+
+With ``--check``, the script exits with an error if a median exceeds its budget or if one of
+the heavy optional subsystems is imported by ``import tmtccmd``. The budgets are generous
+upper limits for slow CI runners. They are intended to catch regressions like a heavy eager
+import, not small variations.
+
+Example: ``python benchmarks/import_bench.py --runs 7 --check``
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+#: Budgets for the cumulative import time in milliseconds.
+IMPORT_BUDGETS_MS = {
+    "tmtccmd": 100.0,
+    "tmtccmd.config": 250.0,
+    "tmtccmd.tmtc": 350.0,
+}
+
+#: Modules which must not be imported by ``import tmtccmd``. Also used by the import tests.
+LAZY_MODULES = [
+    "argparse",
+    "cfdppy",
+    "com_interface",
+    "prompt_toolkit",
+    "serial",
+    "tmtccmd.config.args",
+    "tmtccmd.core",
+    "tmtccmd.tmtc",
+]
+
+
+def measure(module: str) -> tuple[float, float]:
+    """Import the module in a fresh interpreter.
+
+    :return: Cumulative import time of the module and summed self time of all tmtccmd modules
+        in milliseconds
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative = None
+    own = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        name = fields[2].strip()
+        if name.startswith("tmtccmd"):
+            own += int(fields[0])
+        if name == module:
+            cumulative = int(fields[1])
+    if cumulative is None:
+        raise RuntimeError(f"no import time reported for {module}")
+    return cumulative / 1e3, own / 1e3
+
+
+def imported_lazy_modules() -> list[str]:
+    """Return the modules of :py:data:`LAZY_MODULES` which are imported by ``import tmtccmd``
+    in a fresh interpreter."""
+    code = f"import sys, tmtccmd; print(' '.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout.split()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Interpreter runs per module")
+    parser.add_argument(
+        "--check", action="store_true", help="Exit with an error if a budget is exceeded"
+    )
+    parser.add_argument(
+        "--budget",
+        action="append",
+        default=[],
+        metavar="MODULE=MS",
+        help="Override or add a budget in milliseconds",
+    )
+    args = parser.parse_args()
+    budgets = dict(IMPORT_BUDGETS_MS)
+    for budget in args.budget:
+        module, limit = budget.split("=", 1)
+        budgets[module] = float(limit)
+    failed = False
+    for module, limit in budgets.items():
+        samples = [measure(module) for _ in range(args.runs)]
+        cumulative = statistics.median(sample[0] for sample in samples)
+        own = statistics.median(sample[1] for sample in samples)
+        status = "ok" if cumulative <= limit else "OVER BUDGET"
+        failed |= cumulative > limit
+        print(
+            f"{module}: {cumulative:.1f} ms cumulative, {own:.1f} ms in tmtccmd modules, "
+            f"budget {limit:.0f} ms: {status}"
+        )
+    eager = imported_lazy_modules()
+    if eager:
+        failed = True
+        print(f"import tmtccmd eagerly imports: {', '.join(eager)}")
+    if args.check and failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""TM handling throughput benchmark based on a replayed recording.
+
+A recording created with :py:class:`tmtccmd.com.recording.RecordingComInterface` is replayed at
+maximum speed into a :py:class:`tmtccmd.tmtc.CcsdsTmListener`. The handler used here unpacks
+each packet as a PUS TM, which is the minimum work done by typical TM handlers. If no recording
+is passed, a synthetic pass is generated with the dummy interface simulator.
+
+Example: ``python benchmarks/replay_bench.py pass.rec``
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from spacepackets.ccsds.time import CdsShortTimestamp
+from spacepackets.ecss.tm import PusTm
+
+from tmtccmd.com.dummy import DummyInterface, DummySimCfg
+from tmtccmd.com.recording import RecordingComInterface, ReplayComInterface
+from tmtccmd.tmtc import CcsdsTmHandler, CcsdsTmListener, GenericApidHandlerBase
+
+
+class UnpackingHandler(GenericApidHandlerBase):
+    def __init__(self):
+        super().__init__(None)
+        self.handled = 0
+
+    def handle_tm(self, apid: int, packet: bytes, _user_args: Any):
+        PusTm.unpack(packet, CdsShortTimestamp.TIMESTAMP_SIZE)
+        self.handled += 1
+
+
+def create_synthetic_recording(path: Path, duration: float, rate: float):
+    """Record the simulator output of a pass with the given duration without waiting for it."""
+    now = 0.0
+
+    def clock() -> float:
+        return now
+
+    sim_cfg = DummySimCfg(hk_rate=rate, max_burst=int(rate) + 1)
+    with RecordingComInterface(DummyInterface(sim_cfg, clock=clock), path, clock=clock) as recorder:
+        recorder.open()
+        while now < duration:
+            now += 0.1
+            recorder.receive()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("recording", nargs="?", default=None, help="Recording file path")
+    parser.add_argument("--duration", type=float, default=600.0, help="Synthetic pass duration")
+    parser.add_argument("--rate", type=float, default=200.0, help="Synthetic TM rate")
+    parser.add_argument("--batch", type=int, default=None, help="Packets per receive call")
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = args.recording
+        if path is None:
+            path = Path(tmp_dir) / "synthetic.rec"
+            create_synthetic_recording(path, args.duration, args.rate)
+        replay = ReplayComInterface(path, speed=None, max_batch=args.batch)
+        handler = UnpackingHandler()
+        listener = CcsdsTmListener(CcsdsTmHandler(generic_handler=handler))
+        replay.open()
+        start = time.perf_counter()
+        while not replay.finished:
+            listener.operation(replay)
+        duration = time.perf_counter() - start
+        replay.close()
+    print(
+        f"Handled {handler.handled} packets in {duration:.3f} s "
+        f"({handler.handled / duration:.0f} packets/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
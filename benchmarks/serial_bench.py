@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""Throughput and latency benchmarks for the serial COBS and DLE communication interfaces.
+
+No hardware is required. A Linux pseudo-terminal pair is created for each run. The interface
+under test opens the slave side, which is configured with the same setup path as a real serial
+port: :py:func:`tmtccmd.config.com.default_serial_cfg_baud_and_port_setup` reads the port and
+the baud rate from a temporary TOML file, and
+:py:func:`tmtccmd.config.com.create_default_serial_interface` creates the interface. An echo peer
+runs in a separate process on the master side. It deframes each received packet and sends it
+back with the same framing.
+
+A pseudo-terminal does not limit the data rate to the configured baud rate. The echo peer
+therefore paces its replies to the line rate of the baud rate, assuming 10 bits per byte. A baud
+rate of 0 disables the pacing.
+
+Measured values:
+
+- Round-trip latency: Time between sending a packet and receiving its echo.
+- Throughput: Rate at which a burst of packets is sent and all echoes are received.
+- CPU time per packet: CPU time of the benchmark process, which includes the reception thread of
+  the interface, divided by the number of echoed packets. The CPU time of the echo peer is not
+  included.
+
+Example: ``python benchmarks/serial_bench.py --framing cobs dle --baud 115200 921600 0``
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import select
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from com_interface import ComInterface
+from spacepackets.ecss.tc import PusTelecommand
+
+from tmtccmd.com.framing import CobsDeframer, DleDeframer, cobs_encode_frame, dle_encode_frame
+from tmtccmd.config.com import (
+    create_default_serial_interface,
+    default_serial_cfg_baud_and_port_setup,
+)
+from tmtccmd.config.defs import CoreComInterfaces
+
+APID = 0x02
+
+FRAMING_TO_COM_IF_KEY = {
+    "cobs": CoreComInterfaces.SERIAL_COBS.value,
+    "dle": CoreComInterfaces.SERIAL_DLE.value,
+}
+
+
+def echo_peer(master_fd: int, framing: str, baud: int, stop: multiprocessing.Event):
+    """Echo all received packets with the same framing, paced to the line rate of the baud
+    rate."""
+    deframer = CobsDeframer() if framing == "cobs" else DleDeframer()
+    encode_frame = cobs_encode_frame if framing == "cobs" else dle_encode_frame
+    byte_time = 10.0 / baud if baud > 0 else 0.0
+    next_free = time.perf_counter()
+    while not stop.is_set():
+        ready, _, _ = select.select([master_fd], [], [], 0.05)
+        if not ready:
+            continue
+        try:
+            data = os.read(master_fd, 65536)
+        except OSError:
+            # The slave side was closed.
+            break
+        for packet in deframer.feed(data):
+            reply = encode_frame(packet)
+            if byte_time > 0:
+                now = time.perf_counter()
+                next_free = max(now, next_free) + len(reply) * byte_time
+                if next_free > now:
+                    time.sleep(next_free - now)
+            os.write(master_fd, reply)
+
+
+def create_interface(
+    framing: str, port: str, baud: int, polling_frequency: float | None, stream_deframing: bool
+):
+    com_if_key = FRAMING_TO_COM_IF_KEY[framing]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cfg_path = Path(tmp_dir) / "tmtc_conf.toml"
+        # The baud rate is not applied by the pseudo-terminal, but it must be a valid value.
+        cfg_path.write_text(f'[serial]\nport = "{port}"\nbaud = {baud if baud > 0 else 115200}\n')
+        serial_cfg = default_serial_cfg_baud_and_port_setup(com_if_key, str(cfg_path))
+    if polling_frequency is not None:
+        serial_cfg.polling_frequency = polling_frequency
+    com_if = create_default_serial_interface(com_if_key, serial_cfg, stream_deframing)
+    assert com_if is not None
+    return com_if
+
+
+def receive_n(com_if: ComInterface, num: int, timeout: float) -> int:
+    received = 0
+    end = time.perf_counter() + timeout
+    while received < num and time.perf_counter() < end:
+        num_received = len(com_if.receive())
+        received += num_received
+        if num_received == 0:
+            time.sleep(0.0002)
+    return received
+
+
+def create_packets(count: int, size: int) -> list[bytes]:
+    # The app data contains every byte value so the framing has to escape delimiters.
+    app_data = bytes(i % 256 for i in range(size))
+    return [
+        PusTelecommand(apid=APID, service=17, subservice=1, seq_count=i, app_data=app_data).pack()
+        for i in range(count)
+    ]
+
+
+def bench_latency(com_if: ComInterface, packets: list[bytes], timeout: float) -> list[float]:
+    rtts = []
+    for packet in packets:
+        start = time.perf_counter()
+        com_if.send(packet)
+        if receive_n(com_if, 1, timeout) < 1:
+            print("Timeout waiting for echo", file=sys.stderr)
+            continue
+        rtts.append(time.perf_counter() - start)
+    return rtts
+
+
+def bench_throughput(
+    com_if: ComInterface, packets: list[bytes], timeout: float
+) -> tuple[float, float, int]:
+    start = time.perf_counter()
+    cpu_start = time.process_time()
+    received = 0
+    for packet in packets:
+        com_if.send(packet)
+        received += len(com_if.receive())
+    received += receive_n(com_if, len(packets) - received, timeout)
+    return time.perf_counter() - start, time.process_time() - cpu_start, received
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run(framing: str, baud: int, args: argparse.Namespace):
+    master_fd, slave_fd = os.openpty()
+    port = os.ttyname(slave_fd)
+    stop = multiprocessing.get_context("fork").Event()
+    peer = multiprocessing.get_context("fork").Process(
+        target=echo_peer, args=(master_fd, framing, baud, stop), daemon=True
+    )
+    peer.start()
+    os.close(master_fd)
+    com_if = create_interface(framing, port, baud, args.polling_frequency, args.stream_deframing)
+    com_if.open()
+    # The interface opened its own file descriptor for the slave side.
+    os.close(slave_fd)
+    name = (
+        f"{framing}{' stream' if args.stream_deframing else ''} @ {baud if baud > 0 else 'unpaced'}"
+    )
+    try:
+        rtts = bench_latency(com_if, create_packets(args.latency_count, args.size), args.timeout)
+        if rtts:
+            print(
+                f"{name} round-trip latency over {len(rtts)} packets: "
+                f"min {min(rtts) * 1e3:.3f} ms, median {statistics.median(rtts) * 1e3:.3f} ms, "
+                f"p99 {percentile(rtts, 0.99) * 1e3:.3f} ms, max {max(rtts) * 1e3:.3f} ms"
+            )
+        packets = create_packets(args.count, args.size)
+        timeout = args.timeout
+        if baud > 0:
+            timeout += 10.0 * sum(len(packet) for packet in packets) * 1.1 / baud
+        duration, cpu_time, received = bench_throughput(com_if, packets, timeout)
+        num_bytes = received * len(packets[0])
+        print(
+            f"{name} throughput: {received}/{len(packets)} packets echoed in "
+            f"{duration * 1e3:.1f} ms ({received / duration:.0f} packets/s, "
+            f"{num_bytes / duration / 1e3:.1f} kB/s), "
+            f"CPU {cpu_time / max(received, 1) * 1e6:.1f} us/packet"
+        )
+    finally:
+        com_if.close()
+        stop.set()
+        peer.join(2.0)
+
+
+def main():
+    if not sys.platform.startswith("linux"):
+        print("The serial benchmark requires Linux pseudo-terminals", file=sys.stderr)
+        sys.exit(1)
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--framing", nargs="+", choices=["cobs", "dle"], default=["cobs", "dle"])
+    parser.add_argument(
+        "--baud",
+        nargs="+",
+        type=int,
+        default=[115200, 921600, 0],
+        help="Emulated baud rates, 0 for unpaced",
+    )
+    parser.add_argument("--count", type=int, default=500, help="Packets for the throughput run")
+    parser.add_argument("--latency-count", type=int, default=50, help="Packets for the latency run")
+    parser.add_argument("--size", type=int, default=64, help="Application data size")
+    parser.add_argument("--timeout", type=float, default=2.0, help="Echo timeout in seconds")
+    parser.add_argument(
+        "--polling-frequency",
+        type=float,
+        default=None,
+        help="Override the polling frequency of the serial configuration in seconds",
+    )
+    parser.add_argument(
+        "--stream-deframing",
+        action="store_true",
+        help="Benchmark the streaming serial interface instead of the default ones",
+    )
+    args = parser.parse_args()
+    for framing in args.framing:
+        for baud in args.baud:
+            run(framing, baud, args)
+
+
+if __name__ == "__main__":
+    main()
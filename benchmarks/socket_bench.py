@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""End-to-end benchmarks for the UDP and TCP communication interfaces.
+
+The benchmarks run against the local PUS responder :py:mod:`tmtccmd.com.responder`, which is
+started in-process unless an external responder address is given. All packets pass through the
+real sockets and the interfaces created by
+:py:func:`tmtccmd.config.com.create_default_tcpip_interface`.
+
+Measured values:
+
+- Round-trip latency: Time between sending a ping TC and receiving the ping reply.
+- TC throughput: Rate at which a burst of TCs is sent and all verification replies are received.
+- TM throughput: Rate of synthetic HK TM received from the responder.
+
+Example: ``python benchmarks/socket_bench.py --iface udp tcp --count 500``
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+
+from com_interface import ComInterface
+from com_interface.ip_utils import EthAddr, TcpIpType
+from com_interface.tcp import TcpSpacepacketsClient
+from spacepackets.ccsds import PacketId, PacketType
+from spacepackets.ecss.tc import PusTelecommand
+
+from tmtccmd.com.dummy import DummySimCfg
+from tmtccmd.com.responder import PusResponder
+from tmtccmd.config.com import TcpipConfig, create_default_tcpip_interface
+from tmtccmd.config.defs import CoreComInterfaces
+
+APID = 0x02
+TM_PACKET_IDS = [PacketId(PacketType.TM, True, APID)]
+
+
+def create_interface(iface: str, addr: EthAddr, tcp_thread_delay: float | None) -> ComInterface:
+    if iface == "tcp" and tcp_thread_delay is not None:
+        return TcpSpacepacketsClient(
+            com_if_id=CoreComInterfaces.TCP.value,
+            space_packet_ids=TM_PACKET_IDS,
+            inner_thread_delay=tcp_thread_delay,
+            target_address=addr,
+        )
+    com_if_key = CoreComInterfaces.UDP.value if iface == "udp" else CoreComInterfaces.TCP.value
+    com_if = create_default_tcpip_interface(
+        TcpipConfig(
+            if_type=TcpIpType.UDP if iface == "udp" else TcpIpType.TCP,
+            com_if_key=com_if_key,
+            config_path="",
+            send_addr=addr,
+            space_packet_ids=TM_PACKET_IDS,
+        )
+    )
+    assert com_if is not None
+    return com_if
+
+
+def receive_n(com_if: ComInterface, num: int, timeout: float) -> int:
+    received = 0
+    end = time.perf_counter() + timeout
+    while received < num and time.perf_counter() < end:
+        received += len(com_if.receive())
+    return received
+
+
+def bench_latency(com_if: ComInterface, count: int, timeout: float) -> list[float]:
+    rtts = []
+    for seq_count in range(count):
+        tc = PusTelecommand(apid=APID, service=17, subservice=1, seq_count=seq_count).pack()
+        start = time.perf_counter()
+        com_if.send(tc)
+        # Acceptance, start, ping reply and completion
+        if receive_n(com_if, 4, timeout) < 4:
+            print(f"Timeout waiting for ping reply {seq_count}", file=sys.stderr)
+            continue
+        rtts.append(time.perf_counter() - start)
+    return rtts
+
+
+def bench_tc_throughput(com_if: ComInterface, count: int, timeout: float) -> tuple[float, int]:
+    tcs = [
+        PusTelecommand(apid=APID, service=8, subservice=128, seq_count=i, app_data=bytes(16)).pack()
+        for i in range(count)
+    ]
+    start = time.perf_counter()
+    received = 0
+    for tc in tcs:
+        com_if.send(tc)
+        received += len(com_if.receive())
+    # Acceptance and completion for each TC
+    received += receive_n(com_if, 2 * count - received, timeout)
+    return time.perf_counter() - start, received
+
+
+def bench_tm_throughput(com_if: ComInterface, duration: float) -> int:
+    # Register with the responder by sending a TC first.
+    com_if.send(PusTelecommand(apid=APID, service=17, subservice=1).pack())
+    receive_n(com_if, 4, 2.0)
+    start = time.perf_counter()
+    received = 0
+    while time.perf_counter() - start < duration:
+        received += len(com_if.receive())
+        time.sleep(0.001)
+    return received
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run_tc_benchmarks(iface: str, addr: EthAddr, args: argparse.Namespace):
+    com_if = create_interface(iface, addr, args.tcp_thread_delay)
+    com_if.open()
+    try:
+        rtts = bench_latency(com_if, args.count, args.timeout)
+        if rtts:
+            print(
+                f"{iface} round-trip latency over {len(rtts)} pings: "
+                f"min {min(rtts) * 1e3:.3f} ms, median {statistics.median(rtts) * 1e3:.3f} ms, "
+                f"p99 {percentile(rtts, 0.99) * 1e3:.3f} ms, max {max(rtts) * 1e3:.3f} ms"
+            )
+        duration, received = bench_tc_throughput(com_if, args.count, args.timeout)
+        print(
+            f"{iface} TC throughput: {args.count} TCs and {received} replies in "
+            f"{duration * 1e3:.1f} ms ({args.count / duration:.0f} TC/s)"
+        )
+    finally:
+        com_if.close()
+
+
+def run_tm_benchmark(iface: str, addr: EthAddr, args: argparse.Namespace):
+    com_if = create_interface(iface, addr, args.tcp_thread_delay)
+    com_if.open()
+    try:
+        received = bench_tm_throughput(com_if, args.duration)
+        print(
+            f"{iface} TM throughput: {received / args.duration:.0f} TM/s received "
+            f"at a configured rate of {args.hk_rate:.0f} TM/s"
+        )
+    finally:
+        com_if.close()
+
+
+def local_responder(iface: str, sim_cfg: DummySimCfg | None) -> PusResponder:
+    return PusResponder(
+        udp_addr=EthAddr("127.0.0.1", 0) if iface == "udp" else None,
+        tcp_addr=EthAddr("127.0.0.1", 0) if iface == "tcp" else None,
+        sim_cfg=sim_cfg,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iface", nargs="+", choices=["udp", "tcp"], default=["udp", "tcp"])
+    parser.add_argument("--count", type=int, default=200, help="Number of TCs per benchmark")
+    parser.add_argument("--timeout", type=float, default=2.0, help="Reply timeout in seconds")
+    parser.add_argument(
+        "--hk-rate", type=float, default=1000.0, help="Synthetic TM rate, 0 to skip"
+    )
+    parser.add_argument("--duration", type=float, default=2.0, help="TM benchmark duration")
+    parser.add_argument(
+        "--tcp-thread-delay",
+        type=float,
+        default=None,
+        help="Use a custom inner thread delay for the TCP client instead of the default one",
+    )
+    parser.add_argument(
+        "--responder",
+        default=None,
+        metavar="ADDR:PORT",
+        help="Use an external responder listening on the same UDP and TCP port. Only the TC "
+        "benchmarks are run, and the responder should not stream TM",
+    )
+    args = parser.parse_args()
+    if args.responder is not None:
+        ip_addr, port = args.responder.rsplit(":", 1)
+        for iface in args.iface:
+            run_tc_benchmarks(iface, EthAddr(ip_addr, int(port)), args)
+        return
+    for iface in args.iface:
+        # The TM stream runs on a separate responder so it does not distort the TC benchmarks.
+        with local_responder(iface, None) as responder:
+            addr = responder.udp_addr if iface == "udp" else responder.tcp_addr
+            assert addr is not None
+            run_tc_benchmarks(iface, addr, args)
+        if args.hk_rate > 0:
+            with local_responder(iface, DummySimCfg(apid=APID, hk_rate=args.hk_rate)) as responder:
+                addr = responder.udp_addr if iface == "udp" else responder.tcp_addr
+                assert addr is not None
+                run_tm_benchmark(iface, addr, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,6 @@
 
 import logging
 import sys
-import time
 from typing import Any
 
 from com_interface import ComInterface
@@ -36,13 +35,16 @@ from tmtccmd.config.com import (
     create_com_interface_default,
 )
 from tmtccmd.config.defs import default_toml_path
+from tmtccmd.config.watcher import ConfigWatcher
 from tmtccmd.logging import add_colorlog_console_logger
 from tmtccmd.pus import VerificationWrapper
 from tmtccmd.pus.s5_fsfw_event import Service5Tm
 from tmtccmd.tmtc import (
     CcsdsTmHandler,
+    CmdPathDispatcher,
     DefaultPusQueueHelper,
     FeedWrapper,
+    InvalidBatchScriptError,
     ProcedureWrapper,
     QueueWrapper,
     SendCbParams,
@@ -50,6 +52,8 @@ from tmtccmd.tmtc import (
     TcHandlerBase,
     TcProcedureType,
     TcQueueEntryType,
+    load_batch_script,
+    submit_batch,
 )
 
 _LOGGER = logging.getLogger()
@@ -60,6 +64,20 @@ EXAMPLE_CFDP_APID = 0xF0
 CFDP_LOCAL_ENTITY_ID = UnsignedByteField(byte_len=2, val=1)
 CFDP_REMOTE_ENTITY_ID = UnsignedByteField(byte_len=2, val=EXAMPLE_CFDP_APID)
 
+# Maps the command paths to the functions which fill the TC queue. Parameters like
+# "acs/{device}/reset" can be used to handle many similar paths with one function.
+CMD_DISPATCHER = CmdPathDispatcher()
+
+
+@CMD_DISPATCHER.route("ping")
+def pack_ping(q: DefaultPusQueueHelper):
+    q.add_pus_tc(PusTelecommand(apid=EXAMPLE_PUS_APID, service=17, subservice=1))
+
+
+@CMD_DISPATCHER.route("test/event")
+def pack_test_event(q: DefaultPusQueueHelper):
+    q.add_pus_tc(PusTelecommand(apid=EXAMPLE_PUS_APID, service=17, subservice=128))
+
 
 class ExampleHookClass(HookBase):
     def __init__(self, toml_cfg_path: str):
@@ -220,17 +238,8 @@ class TcHandler(TcHandlerBase):
             def_proc = info.to_tree_commanding_procedure()
             cmd_path = def_proc.cmd_path
             assert cmd_path is not None
-            # Path starts with / so the first entry of the list will be an empty string. We cut
-            # off that string.
-            cmd_path_list = cmd_path.split("/")[1:] if cmd_path[0] == "/" else cmd_path.split("/")
-            if cmd_path_list[0] == "ping":
-                return self.queue_helper.add_pus_tc(
-                    PusTelecommand(apid=EXAMPLE_PUS_APID, service=17, subservice=1)
-                )
-            elif cmd_path_list[0] == "test" and cmd_path_list[1] == "event":
-                return self.queue_helper.add_pus_tc(
-                    PusTelecommand(apid=EXAMPLE_PUS_APID, service=17, subservice=128)
-                )
+            if not CMD_DISPATCHER.dispatch(cmd_path, self.queue_helper):
+                _LOGGER.warning(f"No handler for command path {cmd_path}")
 
 
 # Note about lint disable: I could split up the function but I prefer to have the whole
@@ -278,25 +287,36 @@ def main():  # noqa: C901
         tc_handler=tc_handler,
         init_procedure=init_proc,
     )
+    if params.cmd_params.batch_script is not None and not params.use_gui:
+        # All command paths are checked before anything is sent.
+        try:
+            commands = load_batch_script(
+                params.cmd_params.batch_script, hook_obj.get_command_definitions()
+            )
+        except (OSError, InvalidBatchScriptError) as e:
+            _LOGGER.error(f"Could not load batch script: {e}")
+            sys.exit(1)
+        submit_batch(tmtc_backend, commands)
     tmtccmd.start(tmtc_backend=tmtc_backend, hook_obj=hook_obj)
     try:
-        while True:
-            state = tmtc_backend.periodic_op(None)
-            if state.request == BackendRequest.TERMINATION_NO_ERROR:
-                tmtc_backend.close_com_if()
-                sys.exit(0)
-            elif state.request == BackendRequest.DELAY_IDLE:
-                _LOGGER.info("TMTC Client in IDLE mode")
-                time.sleep(3.0)
-            elif state.request == BackendRequest.DELAY_LISTENER:
-                time.sleep(0.8)
-            elif state.request == BackendRequest.DELAY_CUSTOM:
-                if state.next_delay.total_seconds() <= 0.4:
-                    time.sleep(state.next_delay.total_seconds())
-                else:
-                    time.sleep(0.4)
-            elif state.request == BackendRequest.CALL_NEXT:
-                pass
+        # Changed runtime settings of the configuration file, for example the inter-command
+        # delay or the log levels, are applied without a restart.
+        with ConfigWatcher.from_hook(hook_obj, tmtc_backend):
+            while True:
+                state = tmtc_backend.periodic_op(None)
+                if state.request == BackendRequest.TERMINATION_NO_ERROR:
+                    tmtc_backend.close_com_if()
+                    sys.exit(0)
+                elif state.request == BackendRequest.DELAY_IDLE:
+                    _LOGGER.info("TMTC Client in IDLE mode")
+                    tmtc_backend.wait_for_wakeup(3.0)
+                elif state.request == BackendRequest.DELAY_LISTENER:
+                    tmtc_backend.wait_for_wakeup(0.8)
+                elif state.request == BackendRequest.DELAY_CUSTOM:
+                    # Returns early if entries were submitted to the backend from another thread.
+                    tmtc_backend.wait_for_wakeup(min(state.next_delay.total_seconds(), 0.4))
+                elif state.request == BackendRequest.CALL_NEXT:
+                    pass
     except KeyboardInterrupt:
         tmtc_backend.close_com_if()
         sys.exit(0)
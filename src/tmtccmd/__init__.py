@@ -4,36 +4,79 @@ It also re-exports commonly used classes and functions.
 
 from __future__ import annotations
 
+import importlib
 import logging
 import os
 import sys
 from datetime import timedelta
-from typing import Optional, Union, cast
-
-from tmtccmd.config import (
-    CoreMode,
-    CoreModeConverter,
-    HookBase,
-    PreArgsParsingWrapper,
-    SetupParams,
-    SetupWrapper,
-    TreeCommandingParams,
-    backend_mode_conversion,
-)
-from tmtccmd.config.args import ProcedureParamsWrapper
-from tmtccmd.core import ModeWrapper
-from tmtccmd.core.base import BackendRequest, FrontendBase
-from tmtccmd.core.ccsds import BackendBase, CcsdsTmtcWorker
-from tmtccmd.tmtc import (
-    CcsdsTmHandler,
-    ProcedureWrapper,
-    TcHandlerBase,
-    TcProcedureBase,
-    TmHandlerBase,
-    TmTypes,
-    TreeCommandingProcedure,
-)
-from tmtccmd.tmtc.ccsds_tm_listener import CcsdsTmListener
+from typing import TYPE_CHECKING, Any, Optional, Union, cast
+
+if TYPE_CHECKING:
+    from tmtccmd.config import (
+        CoreMode,
+        CoreModeConverter,
+        HookBase,
+        PreArgsParsingWrapper,
+        SetupParams,
+        SetupWrapper,
+        TreeCommandingParams,
+        backend_mode_conversion,
+    )
+    from tmtccmd.config.args import ProcedureParamsWrapper
+    from tmtccmd.core import ModeWrapper
+    from tmtccmd.core.base import BackendRequest, FrontendBase
+    from tmtccmd.core.ccsds import BackendBase, CcsdsTmtcWorker
+    from tmtccmd.tmtc import (
+        CcsdsTmHandler,
+        ProcedureWrapper,
+        TcHandlerBase,
+        TcProcedureBase,
+        TmHandlerBase,
+        TmTypes,
+        TreeCommandingProcedure,
+    )
+    from tmtccmd.tmtc.ccsds_tm_listener import CcsdsTmListener
+
+# The re-exported classes and functions are imported when they are accessed for the first time,
+# so importing the package or a single submodule does not pull in all subsystems.
+_LAZY_ATTRS = {
+    "CoreMode": "tmtccmd.config",
+    "CoreModeConverter": "tmtccmd.config",
+    "HookBase": "tmtccmd.config",
+    "PreArgsParsingWrapper": "tmtccmd.config",
+    "SetupParams": "tmtccmd.config",
+    "SetupWrapper": "tmtccmd.config",
+    "TreeCommandingParams": "tmtccmd.config",
+    "backend_mode_conversion": "tmtccmd.config",
+    "ProcedureParamsWrapper": "tmtccmd.config.args",
+    "ModeWrapper": "tmtccmd.core",
+    "BackendRequest": "tmtccmd.core.base",
+    "FrontendBase": "tmtccmd.core.base",
+    "BackendBase": "tmtccmd.core.ccsds",
+    "CcsdsTmtcWorker": "tmtccmd.core.ccsds",
+    "CcsdsTmHandler": "tmtccmd.tmtc",
+    "ProcedureWrapper": "tmtccmd.tmtc",
+    "TcHandlerBase": "tmtccmd.tmtc",
+    "TcProcedureBase": "tmtccmd.tmtc",
+    "TmHandlerBase": "tmtccmd.tmtc",
+    "TmTypes": "tmtccmd.tmtc",
+    "TreeCommandingProcedure": "tmtccmd.tmtc",
+    "CcsdsTmListener": "tmtccmd.tmtc.ccsds_tm_listener",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_ATTRS})
+
 
 __all__ = [
     "PreArgsParsingWrapper",
@@ -189,6 +232,11 @@ def create_default_tmtc_backend(
     :param tm_handler:
     :return:
     """
+    from tmtccmd.config import CoreMode, CoreModeConverter, backend_mode_conversion
+    from tmtccmd.core import ModeWrapper
+    from tmtccmd.core.ccsds import CcsdsTmtcWorker
+    from tmtccmd.tmtc.ccsds_tm_listener import CcsdsTmListener
+
     global __SETUP_WAS_CALLED
 
     if not __SETUP_WAS_CALLED:
@@ -226,5 +274,7 @@ def create_default_tmtc_backend(
 
 
 def setup_backend_def_procedure(backend: CcsdsTmtcWorker, tmtc_params: TreeCommandingProcedure):
+    from tmtccmd.tmtc import TreeCommandingProcedure
+
     assert tmtc_params.cmd_path is not None
     backend.current_procedure = TreeCommandingProcedure(tmtc_params.cmd_path)
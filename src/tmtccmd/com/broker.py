@@ -0,0 +1,303 @@
+"""TM fan-out broker which allows multiple TMTC clients to share one communication interface.
+
+The :py:class:`TmBroker` owns the real communication interface and listens on a
+``SOCK_SEQPACKET`` Unix domain socket. Each received TM packet is forwarded to all connected
+clients, and TCs sent by any client are forwarded to the communication interface one after
+another. Clients use a :py:class:`tmtccmd.com.uds.UnixSocketClient` connected to the broker
+socket, which can also be configured with the ``unix`` COM interface key.
+
+The same packet object is queued for all subscribers, so packets are not copied per subscriber
+inside the broker. Each subscriber has its own bounded send queue. If a subscriber does not read
+fast enough and its queue is full, the oldest packets in its queue are dropped or the subscriber
+is disconnected, depending on the :py:class:`SlowSubscriberPolicy`. Other subscribers are not
+affected by a slow subscriber.
+
+The broker can be started as a separate process with ``python -m tmtccmd.com.broker``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import dataclasses
+import enum
+import logging
+import os
+import select
+import socket
+import threading
+import time
+from collections import deque
+
+from com_interface import ComInterface, SendError
+
+from tmtccmd.com.uds import UDS_MAX_PACKET_SIZE
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SlowSubscriberPolicy(enum.Enum):
+    #: Drop the oldest queued packets of the subscriber.
+    DROP_OLDEST = 0
+    #: Disconnect the subscriber.
+    DISCONNECT = 1
+
+
+@dataclasses.dataclass
+class SubscriberStats:
+    """
+    :var tm_sent: Number of TM packets sent to the subscriber
+    :var tm_dropped: Number of TM packets dropped because the subscriber was too slow
+    :var tm_queued: Number of TM packets currently waiting in the send queue of the subscriber
+    :var tc_received: Number of TCs received from the subscriber
+    """
+
+    tm_sent: int = 0
+    tm_dropped: int = 0
+    tm_queued: int = 0
+    tc_received: int = 0
+
+
+class _Subscriber:
+    def __init__(self, conn: socket.socket):
+        self.conn = conn
+        self.queue: deque[bytes] = deque()
+        self.queued_bytes = 0
+        self.stats = SubscriberStats()
+
+
+class TmBroker:
+    """Fan-out broker running in a separate thread.
+
+    :param com_if: Communication interface owned by the broker. It is opened when the broker is
+        started and closed when it is stopped
+    :param socket_path: Path of the Unix domain socket the clients connect to. An existing file
+        at that path is removed
+    :param max_queued_bytes: Send queue limit for each subscriber
+    :param policy: Handling of subscribers exceeding the send queue limit
+    :param poll_interval: Maximum time in seconds between polling the communication interface
+    :var tm_receive_errors: Number of failed receive calls of the communication interface. The
+        broker keeps running and polling the interface after a failed call
+    """
+
+    def __init__(
+        self,
+        com_if: ComInterface,
+        socket_path: str,
+        max_queued_bytes: int = 4 * 1024 * 1024,
+        policy: SlowSubscriberPolicy = SlowSubscriberPolicy.DROP_OLDEST,
+        poll_interval: float = 0.005,
+    ):
+        self.com_if = com_if
+        self.socket_path = socket_path
+        self.max_queued_bytes = max_queued_bytes
+        self.policy = policy
+        self.poll_interval = poll_interval
+        self.tm_received = 0
+        self.tc_forwarded = 0
+        self.tc_failed = 0
+        self.tm_receive_errors = 0
+        self._receive_ok = True
+        self._server: socket.socket | None = None
+        self._subscribers: dict[socket.socket, _Subscriber] = {}
+        self._stats_lock = threading.Lock()
+        self._stop_signal = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> TmBroker:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    @property
+    def num_subscribers(self) -> int:
+        return len(self._subscribers)
+
+    def subscriber_stats(self) -> list[SubscriberStats]:
+        """Statistics of all currently connected subscribers."""
+        with self._stats_lock:
+            return [
+                dataclasses.replace(sub.stats, tm_queued=len(sub.queue))
+                for sub in self._subscribers.values()
+            ]
+
+    def start(self):
+        if self._thread is not None:
+            return
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.socket_path)
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+        self._server.bind(self.socket_path)
+        self._server.listen()
+        self._server.setblocking(False)
+        if not self.com_if.is_open():
+            self.com_if.open()
+        self._stop_signal.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop_signal.set()
+        self._thread.join()
+        self._thread = None
+        for conn in list(self._subscribers):
+            self._remove(conn)
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.socket_path)
+        self.com_if.close()
+
+    def serve_forever(self):
+        """Start the broker and block until a keyboard interrupt is received."""
+        self.start()
+        try:
+            while True:
+                time.sleep(1.0)
+        except KeyboardInterrupt:
+            _LOGGER.info("Keyboard interrupt, stopping broker")
+        finally:
+            self.stop()
+
+    def _run(self):
+        assert self._server is not None
+        while not self._stop_signal.is_set():
+            readable = [self._server, *self._subscribers]
+            writable = [conn for conn, sub in self._subscribers.items() if sub.queue]
+            ready_r, ready_w, _ = select.select(readable, writable, [], self.poll_interval)
+            for conn in ready_r:
+                if conn is self._server:
+                    self._accept()
+                elif conn in self._subscribers:
+                    self._forward_tcs(conn)
+            self._distribute(self._receive_tm())
+            for conn in ready_w:
+                if conn in self._subscribers:
+                    self._flush(self._subscribers[conn])
+
+    def _accept(self):
+        assert self._server is not None
+        try:
+            conn, _ = self._server.accept()
+        except BlockingIOError:
+            return
+        conn.setblocking(False)
+        with self._stats_lock:
+            self._subscribers[conn] = _Subscriber(conn)
+        _LOGGER.info(f"Broker client connected, {len(self._subscribers)} clients")
+
+    def _remove(self, conn: socket.socket):
+        with self._stats_lock:
+            self._subscribers.pop(conn, None)
+        conn.close()
+        _LOGGER.info(f"Broker client disconnected, {len(self._subscribers)} clients")
+
+    def _forward_tcs(self, conn: socket.socket):
+        sub = self._subscribers[conn]
+        while True:
+            try:
+                tc = conn.recv(UDS_MAX_PACKET_SIZE)
+            except BlockingIOError:
+                return
+            except ConnectionResetError:
+                tc = b""
+            if not tc:
+                self._remove(conn)
+                return
+            sub.stats.tc_received += 1
+            try:
+                self.com_if.send(tc)
+                self.tc_forwarded += 1
+            except (SendError, OSError) as e:
+                self.tc_failed += 1
+                _LOGGER.warning(f"Forwarding TC failed: {e}")
+
+    def _receive_tm(self) -> list[bytes]:
+        try:
+            packets = self.com_if.receive()
+        except OSError as e:
+            # Only the first error of a sequence of failed calls is logged.
+            if self._receive_ok:
+                _LOGGER.error(f"Receiving TM from {self.com_if.id} failed: {e}")
+            self.tm_receive_errors += 1
+            self._receive_ok = False
+            return []
+        if not self._receive_ok:
+            _LOGGER.info(f"Receiving TM from {self.com_if.id} works again")
+            self._receive_ok = True
+        return packets
+
+    def _distribute(self, packets: list[bytes]):
+        if not packets:
+            return
+        self.tm_received += len(packets)
+        num_bytes = sum(len(packet) for packet in packets)
+        for sub in list(self._subscribers.values()):
+            sub.queue.extend(packets)
+            sub.queued_bytes += num_bytes
+            self._flush(sub)
+
+    def _flush(self, sub: _Subscriber):
+        queue = sub.queue
+        send = sub.conn.send
+        try:
+            while queue:
+                send(queue[0])
+                sub.queued_bytes -= len(queue.popleft())
+                sub.stats.tm_sent += 1
+        except BlockingIOError:
+            pass
+        except OSError:
+            self._remove(sub.conn)
+            return
+        if sub.queued_bytes <= self.max_queued_bytes:
+            return
+        if self.policy == SlowSubscriberPolicy.DISCONNECT:
+            _LOGGER.warning("Disconnecting slow broker client")
+            self._remove(sub.conn)
+            return
+        while sub.queued_bytes > self.max_queued_bytes:
+            sub.queued_bytes -= len(queue.popleft())
+            sub.stats.tm_dropped += 1
+
+
+def main():
+    from tmtccmd.config.com import (
+        create_com_interface_config_default,
+        create_com_interface_default,
+    )
+
+    parser = argparse.ArgumentParser(
+        prog="python -m tmtccmd.com.broker",
+        description="TM fan-out broker sharing one communication interface between clients",
+    )
+    parser.add_argument("-c", "--com-if", required=True, help="COM interface key")
+    parser.add_argument("--cfg", default="tmtc_conf.toml", help="Configuration file path")
+    parser.add_argument("-s", "--socket", default="/tmp/tmtccmd-broker.sock", help="Socket path")
+    parser.add_argument(
+        "--max-queued",
+        type=int,
+        default=4 * 1024 * 1024,
+        help="Send queue limit for each client in bytes",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    com_cfg = create_com_interface_config_default(args.com_if, args.cfg, None)
+    if com_cfg is None:
+        parser.error(f"could not create configuration for COM interface {args.com_if}")
+    com_if = create_com_interface_default(com_cfg)
+    if com_if is None:
+        parser.error(f"could not create COM interface {args.com_if}")
+    broker = TmBroker(com_if, args.socket, max_queued_bytes=args.max_queued)
+    broker.start()
+    _LOGGER.info(f"Broker for {com_if.id} listening on {args.socket}")
+    broker.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,94 +1,292 @@
 """Dummy Virtual Communication Interface. Currently serves to use the TMTC program without needing
-external hardware or an extra socket
+external hardware or an extra socket.
+
+It can also be configured as a TM load simulator with :py:class:`DummySimCfg`, which generates
+periodic HK, event and verification telemetry at configurable rates and applies configurable
+latency, jitter, loss and reordering to all telemetry. This can be used to benchmark the TM
+handling chain without hardware.
 """
 
 from __future__ import annotations
 
+import dataclasses
+import heapq
+import random
+import struct
+import time
+from collections.abc import Callable
+from datetime import timedelta
 from typing import Any
 
+import crcmod.predefined
 from com_interface import ComInterface
+from spacepackets.ccsds.spacepacket import PacketId, PacketSeqCtrl, PacketType, SequenceFlags
 from spacepackets.ccsds.time import CdsShortTimestamp
 from spacepackets.ecss.pus_1_verification import (
     RequestId,
     Service1Tm,
     VerificationParams,
 )
+from spacepackets.ecss.pus_5_event import Subservice as Pus5Subservice
 from spacepackets.ecss.pus_17_test import Service17Tm
 from spacepackets.ecss.tc import PusTelecommand
+from spacepackets.ecss.tm import PusTm
 
 from tmtccmd.config import CoreComInterfaces
 from tmtccmd.pus.s1_verification import Subservice as Pus1Subservice
+from tmtccmd.pus.s3_fsfw_hk import Subservice as Pus3Subservice
 from tmtccmd.pus.s17_test import Subservice as Pus17Subservice
+from tmtccmd.pus.tm.s5_fsfw_event import EventDefinition, Service5Tm
 from tmtccmd.tmtc import TelemetryListT
 
+_crc16_ccitt_false = crcmod.predefined.mkPredefinedCrcFun("crc-ccitt-false")
+
+
+@dataclasses.dataclass
+class DummySimCfg:
+    """Configuration of the TM load simulator of the dummy interface.
+
+    :var apid: APID of all generated periodic telemetry
+    :var hk_rate: Rate of HK packets in packets per second. HK packets use the
+        :py:class:`tmtccmd.pus.tm.s3_fsfw_hk.Service3FsfwHkPacket` layout
+    :var hk_data_len: Length of the HK data following the object ID and set ID
+    :var event_rate: Rate of FSFW event packets in packets per second
+    :var verif_rate: Rate of verification (acceptance success) packets in packets per second
+    :var latency: Constant latency added to all telemetry, including TC replies
+    :var jitter: Maximum additional uniformly distributed random latency
+    :var loss_rate: Probability that a packet is lost
+    :var reorder_rate: Probability that a packet is delayed by :py:attr:`reorder_delay`,
+        which usually causes it to arrive after packets generated later
+    :var max_burst: Maximum number of packets generated per stream and reception call. Backlogs
+        exceeding this number are discarded, for example after the receiver was not polled for
+        a long time
+    :var seed: Seed for the random number generator to get reproducible runs
+    """
+
+    apid: int = 0
+    hk_rate: float = 0.0
+    hk_data_len: int = 32
+    hk_object_id: int = 0x01020304
+    hk_set_id: int = 0
+    event_rate: float = 0.0
+    verif_rate: float = 0.0
+    latency: timedelta = dataclasses.field(default_factory=timedelta)
+    jitter: timedelta = dataclasses.field(default_factory=timedelta)
+    loss_rate: float = 0.0
+    reorder_rate: float = 0.0
+    reorder_delay: timedelta = dataclasses.field(default_factory=lambda: timedelta(milliseconds=10))
+    max_burst: int = 10000
+    seed: int | None = None
+
+
+class _PeriodicTmStream:
+    """Periodic packet stream. A packet template is packed once for each timestamp update and
+    only the sequence count and the CRC16 are patched for each generated packet."""
+
+    def __init__(self, rate: float, create_template: Callable[[bytes], bytes], start: float):
+        self.rate = rate
+        self.create_template = create_template
+        self.start = start
+        self.generated = 0
+        self.template = bytearray()
+
+    def due(self, now: float) -> int:
+        return int((now - self.start) * self.rate) - self.generated
+
+    def generate(self, seq_count: int) -> bytes:
+        packet = self.template
+        packet[2] = (packet[2] & 0xC0) | ((seq_count >> 8) & 0x3F)
+        packet[3] = seq_count & 0xFF
+        struct.pack_into("!H", packet, len(packet) - 2, _crc16_ccitt_false(bytes(packet[:-2])))
+        return bytes(packet)
+
 
 class DummyHandler:
-    def __init__(self):
+    def __init__(
+        self,
+        sim_cfg: DummySimCfg | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param sim_cfg: Optional TM load simulator configuration. Only ping TCs are answered
+            and all telemetry is available immediately if this is not set.
+        :param clock: Monotonic clock in seconds used by the simulator
+        """
         self.last_tc: PusTelecommand | None = None
         self.next_telemetry_package = []
         self.current_ssc = 0
         self.reply_pending = False
+        self.sim_cfg = sim_cfg
+        self.tm_generated = 0
+        self.tm_lost = 0
+        self._clock = clock
+        self._rng = random.Random(sim_cfg.seed if sim_cfg is not None else None)
+        self._in_flight: list[tuple[float, int, bytes]] = []
+        self._in_flight_idx = 0
+        self._streams: list[_PeriodicTmStream] = []
+        if sim_cfg is not None:
+            self._create_streams(sim_cfg)
+
+    def _create_streams(self, cfg: DummySimCfg):
+        now = self._clock()
+        hk_source_data = struct.pack("!II", cfg.hk_object_id, cfg.hk_set_id) + bytes(
+            cfg.hk_data_len
+        )
+        event = EventDefinition(
+            event_id=0, reporter_id=struct.pack("!I", cfg.hk_object_id), param1=0, param2=0
+        )
+        verif_params = VerificationParams(
+            req_id=RequestId(
+                PacketId(PacketType.TC, True, cfg.apid),
+                PacketSeqCtrl(SequenceFlags.UNSEGMENTED, 0),
+            )
+        )
+        if cfg.hk_rate > 0:
+            self._streams.append(
+                _PeriodicTmStream(
+                    cfg.hk_rate,
+                    lambda stamp: PusTm(
+                        service=3,
+                        subservice=Pus3Subservice.TM_HK_REPORT,
+                        timestamp=stamp,
+                        source_data=hk_source_data,
+                        apid=cfg.apid,
+                    ).pack(),
+                    now,
+                )
+            )
+        if cfg.event_rate > 0:
+            self._streams.append(
+                _PeriodicTmStream(
+                    cfg.event_rate,
+                    lambda stamp: Service5Tm(
+                        apid=cfg.apid,
+                        subservice=Pus5Subservice.TM_INFO_EVENT,
+                        event=event,
+                        timestamp=stamp,
+                    ).pack(),
+                    now,
+                )
+            )
+        if cfg.verif_rate > 0:
+            self._streams.append(
+                _PeriodicTmStream(
+                    cfg.verif_rate,
+                    lambda stamp: Service1Tm(
+                        subservice=Pus1Subservice.TM_ACCEPTANCE_SUCCESS,
+                        apid=cfg.apid,
+                        verif_params=verif_params,
+                        timestamp=stamp,
+                    ).pack(),
+                    now,
+                )
+            )
+
+    def _next_ssc(self) -> int:
+        ssc = self.current_ssc
+        self.current_ssc = (self.current_ssc + 1) & 0x3FFF
+        return ssc
+
+    def _emit(self, packet: bytes, gen_time: float):
+        """Pass a generated packet through the simulated link."""
+        cfg = self.sim_cfg
+        self.tm_generated += 1
+        if cfg is None:
+            self.next_telemetry_package.append(packet)
+            return
+        rng = self._rng
+        if cfg.loss_rate > 0 and rng.random() < cfg.loss_rate:
+            self.tm_lost += 1
+            return
+        delivery = gen_time + cfg.latency.total_seconds()
+        if cfg.jitter:
+            delivery += rng.uniform(0, cfg.jitter.total_seconds())
+        if cfg.reorder_rate > 0 and rng.random() < cfg.reorder_rate:
+            delivery += cfg.reorder_delay.total_seconds()
+        self._in_flight_idx += 1
+        heapq.heappush(self._in_flight, (delivery, self._in_flight_idx, packet))
+
+    def _update(self):
+        """Generate all due periodic packets and release all delivered packets."""
+        if self.sim_cfg is None:
+            return
+        now = self._clock()
+        if self._streams:
+            stamp = CdsShortTimestamp.now().pack()
+            for stream in self._streams:
+                due = stream.due(now)
+                if due <= 0:
+                    continue
+                if due > self.sim_cfg.max_burst:
+                    stream.generated += due - self.sim_cfg.max_burst
+                    due = self.sim_cfg.max_burst
+                stream.template = bytearray(stream.create_template(stamp))
+                for _ in range(due):
+                    gen_time = stream.start + stream.generated / stream.rate
+                    stream.generated += 1
+                    self._emit(stream.generate(self._next_ssc()), gen_time)
+        in_flight = self._in_flight
+        while in_flight and in_flight[0][0] <= now:
+            self.next_telemetry_package.append(heapq.heappop(in_flight)[2])
+        self.reply_pending = bool(self.next_telemetry_package)
+
+    def packets_available(self) -> int:
+        self._update()
+        if self.sim_cfg is None:
+            return int(self.reply_pending)
+        return len(self.next_telemetry_package)
 
     def insert_telecommand(self, data: bytearray | bytes):
         self.last_tc = PusTelecommand.unpack(data)
-        self.reply_pending = True
         self.generate_reply_package()
+        self.reply_pending = self.sim_cfg is None or bool(self.next_telemetry_package)
 
     def generate_reply_package(self):
         """Generate a reply package. Currently, this only generates a reply for a ping
         telecommand."""
         assert self.last_tc is not None
         if self.last_tc.service == 17 and self.last_tc.subservice == 1:
-            current_time_stamp = CdsShortTimestamp.now()
-            tm_packer = Service1Tm(
-                subservice=Pus1Subservice.TM_ACCEPTANCE_SUCCESS,
-                apid=self.last_tc.apid,
-                seq_count=self.current_ssc,
-                verif_params=VerificationParams(
-                    req_id=RequestId(self.last_tc.packet_id, self.last_tc.packet_seq_control)
-                ),
-                timestamp=current_time_stamp.pack(),
-            )
-
-            self.current_ssc += 1
-            tm_packet_raw = tm_packer.pack()
-            self.next_telemetry_package.append(tm_packet_raw)
-            tm_packer = Service1Tm(
-                subservice=Pus1Subservice.TM_START_SUCCESS,
-                apid=self.last_tc.apid,
-                seq_count=self.current_ssc,
-                verif_params=VerificationParams(
-                    req_id=RequestId(self.last_tc.packet_id, self.last_tc.packet_seq_control)
-                ),
-                timestamp=current_time_stamp.pack(),
+            gen_time = self._clock()
+            timestamp = CdsShortTimestamp.now().pack()
+            verif_params = VerificationParams(
+                req_id=RequestId(self.last_tc.packet_id, self.last_tc.packet_seq_control)
             )
-            tm_packet_raw = tm_packer.pack()
-            self.next_telemetry_package.append(tm_packet_raw)
-            self.current_ssc += 1
-
-            tm_packer = Service17Tm(
-                subservice=Pus17Subservice.TM_REPLY,
-                apid=self.last_tc.apid,
-                timestamp=current_time_stamp.pack(),
+            for subservice in (
+                Pus1Subservice.TM_ACCEPTANCE_SUCCESS,
+                Pus1Subservice.TM_START_SUCCESS,
+            ):
+                self._emit(
+                    Service1Tm(
+                        subservice=subservice,
+                        apid=self.last_tc.apid,
+                        seq_count=self._next_ssc(),
+                        verif_params=verif_params,
+                        timestamp=timestamp,
+                    ).pack(),
+                    gen_time,
+                )
+            self._emit(
+                Service17Tm(
+                    subservice=Pus17Subservice.TM_REPLY,
+                    apid=self.last_tc.apid,
+                    ssc=self._next_ssc(),
+                    timestamp=timestamp,
+                ).pack(),
+                gen_time,
             )
-            tm_packet_raw = tm_packer.pack()
-            self.next_telemetry_package.append(tm_packet_raw)
-            self.current_ssc += 1
-
-            tm_packer = Service1Tm(
-                subservice=Pus1Subservice.TM_COMPLETION_SUCCESS,
-                apid=self.last_tc.apid,
-                seq_count=self.current_ssc,
-                verif_params=VerificationParams(
-                    req_id=RequestId(self.last_tc.packet_id, self.last_tc.packet_seq_control)
-                ),
-                timestamp=current_time_stamp.pack(),
+            self._emit(
+                Service1Tm(
+                    subservice=Pus1Subservice.TM_COMPLETION_SUCCESS,
+                    apid=self.last_tc.apid,
+                    seq_count=self._next_ssc(),
+                    verif_params=verif_params,
+                    timestamp=timestamp,
+                ).pack(),
+                gen_time,
             )
-            tm_packet_raw = tm_packer.pack()
-            self.next_telemetry_package.append(tm_packet_raw)
-            self.current_ssc += 1
 
     def receive_reply_package(self) -> TelemetryListT:
+        self._update()
         if self.reply_pending:
             return_list = self.next_telemetry_package.copy()
             self.next_telemetry_package.clear()
@@ -99,9 +297,17 @@ class DummyHandler:
 
 
 class DummyInterface(ComInterface):
-    def __init__(self):
+    def __init__(
+        self,
+        sim_cfg: DummySimCfg | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param sim_cfg: Can be used to configure the dummy interface as a TM load simulator
+        :param clock: Monotonic clock in seconds used by the simulator
+        """
         self.com_if_id = CoreComInterfaces.DUMMY.value
-        self.dummy_handler = DummyHandler()
+        self.dummy_handler = DummyHandler(sim_cfg, clock)
         self._open = False
         self.initialized = False
 
@@ -142,7 +348,7 @@ class DummyInterface(ComInterface):
             thrown on decoding errors.
         :return: Number of packets available.
         """
-        return bool(self.dummy_handler.reply_pending)
+        return self.dummy_handler.packets_available()
 
     def send(self, data: bytes | bytearray):
         if data is not None:
@@ -0,0 +1,191 @@
+"""Helpers to extract packets from byte streams."""
+
+from __future__ import annotations
+
+from cobs import cobs
+from dle_encoder import CARRIAGE_RETURN, DLE_CHAR, ESCAPE_JUMP, ETX_CHAR, STX_CHAR
+from spacepackets.ccsds.spacepacket import SPACE_PACKET_HEADER_SIZE
+
+_STX = bytes([STX_CHAR])
+_ETX = bytes([ETX_CHAR])
+_DLE = bytes([DLE_CHAR])
+_CR = bytes([CARRIAGE_RETURN])
+_ESCAPED_STX = bytes([DLE_CHAR, STX_CHAR + ESCAPE_JUMP])
+_ESCAPED_ETX = bytes([DLE_CHAR, ETX_CHAR + ESCAPE_JUMP])
+_ESCAPED_CR = bytes([DLE_CHAR, CARRIAGE_RETURN + ESCAPE_JUMP])
+_UNESCAPE_TABLE = {
+    STX_CHAR + ESCAPE_JUMP: _STX,
+    ETX_CHAR + ESCAPE_JUMP: _ETX,
+    CARRIAGE_RETURN + ESCAPE_JUMP: _CR,
+}
+
+
+def split_space_packets(buf: bytearray) -> list[bytes]:
+    """Remove all complete space packets from the start of the passed buffer. The packet length
+    is taken from the space packet header, and the packet ID is not checked. An incomplete packet
+    at the end of the buffer is left in the buffer.
+
+    :param buf: Stream buffer, which is modified in place
+    :return: List of complete space packets
+    """
+    packets = []
+    offset = 0
+    while len(buf) - offset >= SPACE_PACKET_HEADER_SIZE:
+        packet_len = ((buf[offset + 4] << 8) | buf[offset + 5]) + SPACE_PACKET_HEADER_SIZE + 1
+        if len(buf) - offset < packet_len:
+            break
+        packets.append(bytes(buf[offset : offset + packet_len]))
+        offset += packet_len
+    del buf[:offset]
+    return packets
+
+
+def cobs_encode_frame(packet: bytes | bytearray) -> bytes:
+    """Encode a packet with COBS and enclose it in zero delimiters, which is the framing used by
+    :py:class:`com_interface.serial_cobs.SerialCobsComIF`."""
+    return b"\x00" + cobs.encode(packet) + b"\x00"
+
+
+def dle_encode_frame(packet: bytes | bytearray, escape_cr: bool = False) -> bytes:
+    """Encode a packet with escaped DLE encoding enclosed in STX and ETX. The result is identical
+    to :py:meth:`dle_encoder.DleEncoder.encode`, but uses replace operations on the whole packet.
+    """
+    # DLE has to be escaped first, because escaping the other characters inserts DLEs.
+    encoded = bytes(packet).replace(_DLE, _DLE + _DLE)
+    encoded = encoded.replace(_STX, _ESCAPED_STX).replace(_ETX, _ESCAPED_ETX)
+    if escape_cr:
+        encoded = encoded.replace(_CR, _ESCAPED_CR)
+    return _STX + encoded + _ETX
+
+
+class CobsDeframer:
+    """Streaming deframer for zero-delimited COBS frames.
+
+    Received chunks are split at the zero delimiters with a single :py:meth:`bytes.split` call
+    and each frame is decoded with :py:func:`cobs.cobs.decode`. An incomplete frame at the end of
+    a chunk is kept until the next chunk is fed. Bytes received before the first delimiter are
+    discarded, because the start of the frame is unknown.
+
+    :param max_frame_size: Incomplete frames exceeding this size are discarded and counted as
+        parsing errors
+    :var parsing_error_count: Number of frames which could not be decoded
+    """
+
+    def __init__(self, max_frame_size: int = 65536):
+        self.max_frame_size = max_frame_size
+        self.parsing_error_count = 0
+        self._buf = bytearray()
+        self._synced = False
+
+    def reset(self):
+        self._buf.clear()
+        self._synced = False
+
+    def feed(self, data: bytes | bytearray) -> list[bytes]:
+        """Feed received data and return all packets completed by it."""
+        if self._buf:
+            self._buf.extend(data)
+            data = self._buf
+        frames = data.split(b"\x00")
+        remainder = frames.pop()
+        packets = []
+        if frames:
+            if not self._synced:
+                self._synced = True
+                frames[0] = b""
+            for frame in frames:
+                if not frame:
+                    continue
+                try:
+                    packet = cobs.decode(frame)
+                except cobs.DecodeError:
+                    self.parsing_error_count += 1
+                    continue
+                if packet:
+                    packets.append(packet)
+        if len(remainder) > self.max_frame_size:
+            self.parsing_error_count += 1
+            self._buf = bytearray()
+            self._synced = False
+        else:
+            self._buf = bytearray(remainder)
+        return packets
+
+
+class DleDeframer:
+    """Streaming deframer for frames with escaped DLE encoding, as sent by
+    :py:class:`com_interface.serial_dle.SerialDleComIF`.
+
+    STX and ETX do not appear inside an encoded frame, so frames are located with
+    :py:meth:`bytes.find`. Frames without DLE characters are returned directly, otherwise they
+    are unescaped by splitting at the DLE characters. An incomplete frame at the end of a chunk is
+    kept until the next chunk is fed.
+
+    :param max_frame_size: Incomplete frames exceeding this size are discarded and counted as
+        parsing errors
+    :var parsing_error_count: Number of frames which could not be decoded
+    """
+
+    def __init__(self, max_frame_size: int = 65536):
+        self.max_frame_size = max_frame_size
+        self.parsing_error_count = 0
+        self._buf = bytearray()
+
+    def reset(self):
+        self._buf.clear()
+
+    def feed(self, data: bytes | bytearray) -> list[bytes]:
+        """Feed received data and return all packets completed by it."""
+        if self._buf:
+            self._buf.extend(data)
+            data = bytes(self._buf)
+        packets = []
+        offset = 0
+        while True:
+            start = data.find(_STX, offset)
+            if start < 0:
+                offset = len(data)
+                break
+            end = data.find(_ETX, start + 1)
+            if end < 0:
+                offset = start
+                break
+            # A STX inside the frame means the previous frame was not terminated.
+            start = data.rfind(_STX, start, end)
+            packet = self._unescape(data[start + 1 : end])
+            if packet is None:
+                self.parsing_error_count += 1
+            elif packet:
+                packets.append(packet)
+            offset = end + 1
+        remainder = data[offset:]
+        if len(remainder) > self.max_frame_size:
+            self.parsing_error_count += 1
+            remainder = b""
+        self._buf = bytearray(remainder)
+        return packets
+
+    @staticmethod
+    def _unescape(frame: bytes) -> bytes | None:
+        if _DLE not in frame:
+            return frame
+        parts = frame.split(_DLE)
+        decoded = [parts[0]]
+        idx = 1
+        while idx < len(parts):
+            part = parts[idx]
+            if not part:
+                # Two consecutive DLE characters encode a DLE. The next part is not escaped.
+                if idx + 1 >= len(parts):
+                    return None
+                decoded.append(_DLE)
+                decoded.append(parts[idx + 1])
+                idx += 2
+                continue
+            escaped = part[0]
+            if escaped not in _UNESCAPE_TABLE:
+                return None
+            decoded.append(_UNESCAPE_TABLE[escaped])
+            decoded.append(part[1:])
+            idx += 1
+        return b"".join(decoded)
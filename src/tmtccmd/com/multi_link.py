@@ -0,0 +1,306 @@
+"""Aggregating communication interface for multiple links to the same target.
+
+The :py:class:`MultiLinkComInterface` merges the TM of several underlying communication
+interfaces, optionally removing duplicate packets received on more than one link, and distributes
+or fails over TC sending depending on the health and the latency of the links. Failed links are
+reopened by a background thread so the aggregated interface keeps working while single links
+drop out.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import enum
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Sequence
+from datetime import timedelta
+from typing import Any
+
+from com_interface import ComInterface, SendError
+from spacepackets.ccsds.spacepacket import PacketType
+from spacepackets.ccsds.time import CdsShortTimestamp
+
+_LOGGER = logging.getLogger(__name__)
+
+# Primary header, PUS version, service, subservice, message counter and destination ID.
+_PUS_TM_FIXED_HEADER_LEN = 13
+
+
+class LinkSelectPolicy(enum.Enum):
+    #: Always use the first healthy link in the order the links were passed.
+    FAILOVER = 0
+    #: Spread the TCs over all healthy links.
+    ROUND_ROBIN = 1
+    #: Use the healthy link with the lowest measured latency. Links without a latency
+    #: measurement are preferred so they are measured as well.
+    LOWEST_LATENCY = 2
+
+
+@dataclasses.dataclass
+class LinkStats:
+    """Statistics of a single link.
+
+    :var healthy: The link is open and no error occurred since it was last opened
+    :var latency: Smoothed latency between sending a TC and receiving its acceptance
+        verification on the same link. None if no measurement is available
+    :var tc_sent: Number of TCs sent on the link
+    :var tm_received: Number of TM packets received on the link, including duplicates
+    :var failures: Number of times the link failed
+    :var last_error: Last exception raised by the link
+    """
+
+    healthy: bool = False
+    latency: float | None = None
+    tc_sent: int = 0
+    tm_received: int = 0
+    failures: int = 0
+    last_error: Exception | None = None
+
+
+class MultiLinkComInterface(ComInterface):
+    """Aggregates multiple communication interfaces to the same target.
+
+    The link latency is measured automatically for PUS TCs: The time a TC was sent is stored
+    using its request ID, and the acceptance success verification TM received on the same link
+    completes the measurement. The measurement can also be supplied externally with
+    :py:meth:`update_latency`.
+
+    :param links: Underlying interfaces
+    :param policy: TC link selection policy
+    :param dedup: Drop TM packets which were already received recently, for example on another
+        link
+    :param dedup_window: Number of recently received packets considered for duplicate detection
+    :param reconnect_interval: Interval at which the background thread tries to reopen failed
+        links
+    :param latency_smoothing: Weight of a new latency measurement for the exponential smoothing
+    :param timestamp_len: Timestamp length of received PUS TM, required for the latency
+        measurement
+    :param com_if_id: ID of the interface
+    :raises ValueError: No links were passed
+    """
+
+    def __init__(
+        self,
+        links: Sequence[ComInterface],
+        policy: LinkSelectPolicy = LinkSelectPolicy.FAILOVER,
+        dedup: bool = True,
+        dedup_window: int = 1024,
+        reconnect_interval: timedelta = timedelta(seconds=2),
+        latency_smoothing: float = 0.2,
+        timestamp_len: int = CdsShortTimestamp.TIMESTAMP_SIZE,
+        com_if_id: str = "multi",
+    ):
+        if not links:
+            raise ValueError("at least one link is required")
+        self.links = list(links)
+        self.policy = policy
+        self.dedup = dedup
+        self.dedup_window = dedup_window
+        self.reconnect_interval = reconnect_interval
+        self.latency_smoothing = latency_smoothing
+        self.timestamp_len = timestamp_len
+        self.com_if_id = com_if_id
+        self.stats = [LinkStats() for _ in self.links]
+        self.duplicates_dropped = 0
+        self._lock = threading.Lock()
+        self._open = False
+        self._rr_index = 0
+        self._recent: set[bytes] = set()
+        self._recent_order: deque[bytes] = deque()
+        self._pending_latency: OrderedDict[bytes, tuple[int, float]] = OrderedDict()
+        self._stop_signal = threading.Event()
+        self._reconnect_thread: threading.Thread | None = None
+
+    @property
+    def id(self) -> str:
+        return self.com_if_id
+
+    def initialize(self, args: Any = 0) -> Any:
+        for link in self.links:
+            link.initialize(args)
+
+    def open(self, args: Any = 0) -> None:
+        """Open all links. Links which fail to open are retried in the background.
+
+        :raises OSError: No link could be opened
+        """
+        if self._open:
+            return
+        for idx in range(len(self.links)):
+            self._try_open(idx)
+        if not any(stats.healthy for stats in self.stats):
+            raise OSError("no link could be opened")
+        self._open = True
+        self._stop_signal.clear()
+        self._reconnect_thread = threading.Thread(target=self._reconnect_task, daemon=True)
+        self._reconnect_thread.start()
+
+    def is_open(self) -> bool:
+        return self._open
+
+    def close(self, args: Any = 0) -> None:
+        if not self._open:
+            return
+        self._stop_signal.set()
+        if self._reconnect_thread is not None:
+            self._reconnect_thread.join()
+            self._reconnect_thread = None
+        with self._lock:
+            for link, stats in zip(self.links, self.stats, strict=True):
+                stats.healthy = False
+                try:
+                    link.close(args)
+                except OSError:
+                    _LOGGER.warning(f"Error closing link {link.id}")
+        self._open = False
+
+    def healthy_links(self) -> list[int]:
+        """Indexes of all currently healthy links."""
+        with self._lock:
+            return [idx for idx, stats in enumerate(self.stats) if stats.healthy]
+
+    def update_latency(self, link_idx: int, latency: float):
+        """Supply a latency measurement in seconds for a link."""
+        with self._lock:
+            self._update_latency(link_idx, latency)
+
+    def _update_latency(self, link_idx: int, latency: float):
+        stats = self.stats[link_idx]
+        if stats.latency is None:
+            stats.latency = latency
+        else:
+            alpha = self.latency_smoothing
+            stats.latency = alpha * latency + (1.0 - alpha) * stats.latency
+
+    def _try_open(self, idx: int) -> bool:
+        link = self.links[idx]
+        try:
+            if not link.is_open():
+                link.open()
+            healthy = link.is_open()
+        except OSError as e:
+            healthy = False
+            self.stats[idx].last_error = e
+        if healthy:
+            with self._lock:
+                self.stats[idx].healthy = True
+            _LOGGER.info(f"Link {link.id} opened")
+        return healthy
+
+    def _mark_failed(self, idx: int, error: Exception):
+        with self._lock:
+            stats = self.stats[idx]
+            if not stats.healthy:
+                return
+            stats.healthy = False
+            stats.failures += 1
+            stats.last_error = error
+        _LOGGER.warning(f"Link {self.links[idx].id} failed: {error}")
+        with contextlib.suppress(OSError):
+            self.links[idx].close()
+
+    def _reconnect_task(self):
+        while not self._stop_signal.wait(self.reconnect_interval.total_seconds()):
+            for idx, stats in enumerate(self.stats):
+                if self._stop_signal.is_set():
+                    return
+                if not stats.healthy:
+                    self._try_open(idx)
+
+    def _select_order(self) -> list[int]:
+        """Healthy links in the order they should be tried for the next TC."""
+        with self._lock:
+            healthy = [idx for idx, stats in enumerate(self.stats) if stats.healthy]
+            if not healthy or self.policy == LinkSelectPolicy.FAILOVER:
+                return healthy
+            if self.policy == LinkSelectPolicy.ROUND_ROBIN:
+                start = self._rr_index % len(healthy)
+                self._rr_index += 1
+                return healthy[start:] + healthy[:start]
+            return sorted(
+                healthy,
+                key=lambda idx: (
+                    -1.0 if self.stats[idx].latency is None else self.stats[idx].latency
+                ),
+            )
+
+    def send(self, data: bytes | bytearray) -> None:
+        """Send a TC on the link selected by the policy. The next healthy link is used if
+        sending fails.
+
+        :raises SendError: No healthy link is available or sending failed on all links
+        """
+        last_error: Exception | None = None
+        for idx in self._select_order():
+            try:
+                self.links[idx].send(data)
+            except (SendError, OSError) as e:
+                last_error = e
+                self._mark_failed(idx, e)
+                continue
+            self._on_tc_sent(idx, data)
+            return
+        raise SendError("no healthy link available for sending", last_error)
+
+    def _on_tc_sent(self, idx: int, data: bytes | bytearray):
+        with self._lock:
+            self.stats[idx].tc_sent += 1
+            if len(data) < 4 or (data[0] >> 4) & 0x01 != PacketType.TC:
+                return
+            # The request ID consists of the packet ID and the packet sequence control.
+            self._pending_latency[bytes(data[0:4])] = (idx, time.monotonic())
+            if len(self._pending_latency) > self.dedup_window:
+                self._pending_latency.popitem(last=False)
+
+    def _check_acceptance(self, idx: int, packet: bytes):
+        """Complete a latency measurement if the packet is an acceptance success TM."""
+        req_id_offset = _PUS_TM_FIXED_HEADER_LEN + self.timestamp_len
+        if len(packet) < req_id_offset + 4 or packet[7] != 1 or packet[8] != 1:
+            return
+        pending = self._pending_latency.pop(bytes(packet[req_id_offset : req_id_offset + 4]), None)
+        if pending is not None and pending[0] == idx:
+            self._update_latency(idx, time.monotonic() - pending[1])
+
+    def _is_duplicate(self, packet: bytes) -> bool:
+        key = bytes(packet)
+        if key in self._recent:
+            return True
+        self._recent.add(key)
+        self._recent_order.append(key)
+        if len(self._recent_order) > self.dedup_window:
+            self._recent.discard(self._recent_order.popleft())
+        return False
+
+    def receive(self, parameters: Any = 0) -> list[bytes]:
+        packets = []
+        for idx in self.healthy_links():
+            try:
+                received = self.links[idx].receive(parameters)
+            except OSError as e:
+                self._mark_failed(idx, e)
+                continue
+            if not received:
+                continue
+            with self._lock:
+                self.stats[idx].tm_received += len(received)
+                for packet in received:
+                    if self._pending_latency:
+                        self._check_acceptance(idx, packet)
+                    if self.dedup and self._is_duplicate(packet):
+                        self.duplicates_dropped += 1
+                        continue
+                    packets.append(packet)
+        return packets
+
+    def packets_available(self, parameters: Any = 0) -> int:
+        available = 0
+        for idx in self.healthy_links():
+            try:
+                available += self.links[idx].packets_available(parameters)
+            except OSError as e:
+                self._mark_failed(idx, e)
+        return available
@@ -0,0 +1,275 @@
+"""Automatic reconnection for communication interfaces.
+
+:py:class:`ReconnectingComInterface` wraps a communication interface and supervises it with a
+background thread. Opening the interface and reconnecting after link failures is done in that
+thread, using an exponential backoff with jitter between the attempts. All calls from the user
+return immediately, so the cycle time of the backend is not affected by reconnect attempts.
+TCs sent while the link is down are buffered, dropped or rejected depending on the configured
+:py:class:`TcBufferPolicy`.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import enum
+import logging
+import random
+import threading
+from collections import deque
+from collections.abc import Callable
+from datetime import timedelta
+from typing import Any
+
+from com_interface import ComInterface, SendError
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TcBufferPolicy(enum.Enum):
+    #: Buffer TCs while the link is down and send them after reconnecting. The oldest TCs are
+    #: dropped if the buffer is full.
+    BUFFER = 0
+    #: Silently drop TCs while the link is down.
+    DROP = 1
+    #: Raise a :py:class:`com_interface.SendError` while the link is down.
+    REJECT = 2
+
+
+@dataclasses.dataclass
+class ReconnectCfg:
+    """Configuration of the reconnect supervision.
+
+    :var initial_delay: Delay after the first failed connection attempt
+    :var max_delay: Upper limit for the delay between two attempts
+    :var multiplier: Factor the delay is multiplied with after each failed attempt
+    :var jitter: Relative random variation of each delay, for example 0.1 for +-10 %
+    :var tc_policy: Handling of TCs sent while the link is down
+    :var max_buffered_tcs: Buffer size for the :py:attr:`TcBufferPolicy.BUFFER` policy
+    """
+
+    initial_delay: timedelta = timedelta(milliseconds=500)
+    max_delay: timedelta = timedelta(seconds=30)
+    multiplier: float = 2.0
+    jitter: float = 0.1
+    tc_policy: TcBufferPolicy = TcBufferPolicy.BUFFER
+    max_buffered_tcs: int = 1000
+
+
+class ReconnectingComInterface(ComInterface):
+    """Communication interface wrapper which automatically reconnects the wrapped interface.
+
+    :py:meth:`open` only starts the supervision and always returns immediately, and
+    :py:meth:`is_open` returns True while the supervision is active. Use :py:attr:`connected` to
+    check the state of the link itself. A link is considered failed if the wrapped interface
+    raises an :py:class:`OSError` or a :py:class:`com_interface.SendError`, or if it reports that
+    it is not open anymore.
+
+    Some interfaces can not be reopened after they were closed or after a failed connection
+    attempt. A factory can be passed for these, which is then used to create a new interface for
+    each further connection attempt. Interfaces created by the factory are closed again if the
+    connection attempt fails.
+
+    The :py:class:`tmtccmd.CcsdsTmtcWorker` does not wrap its interface by itself. Pass the
+    wrapper as the communication interface of the worker to use it, either created directly or
+    with the ``reconnect_cfg`` argument of
+    :py:func:`tmtccmd.config.com.create_com_interface_default`.
+
+    :param com_if: Wrapped interface
+    :param cfg: Reconnect configuration
+    :param factory: Optional factory for new interfaces
+    :param com_if_id: ID of the wrapper. Defaults to the ID of the wrapped interface
+    """
+
+    def __init__(
+        self,
+        com_if: ComInterface,
+        cfg: ReconnectCfg | None = None,
+        factory: Callable[[], ComInterface] | None = None,
+        com_if_id: str | None = None,
+    ):
+        self.com_if = com_if
+        self._factory = factory
+        self.cfg = cfg if cfg is not None else ReconnectCfg()
+        self.com_if_id = com_if_id if com_if_id is not None else self.com_if.id
+        self.attempts = 0
+        self.connects = 0
+        self.failures = 0
+        self.tcs_dropped = 0
+        self._lock = threading.RLock()
+        self._connected = False
+        self._supervising = False
+        self._tc_buffer: deque[bytes] = deque()
+        self._link_down = threading.Event()
+        self._stop_signal = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._rng = random.Random()
+
+    @property
+    def id(self) -> str:
+        return self.com_if_id
+
+    @property
+    def connected(self) -> bool:
+        return self._connected
+
+    @property
+    def buffered_tcs(self) -> int:
+        return len(self._tc_buffer)
+
+    def initialize(self, args: Any = 0) -> Any:
+        return self.com_if.initialize(args)
+
+    def open(self, args: Any = 0) -> None:
+        """Start the supervision thread, which opens the wrapped interface."""
+        if self._supervising:
+            return
+        self._supervising = True
+        self._stop_signal.clear()
+        self._link_down.set()
+        self._thread = threading.Thread(target=self._supervise, daemon=True)
+        self._thread.start()
+
+    def is_open(self) -> bool:
+        return self._supervising
+
+    def close(self, args: Any = 0) -> None:
+        if not self._supervising:
+            return
+        self._stop_signal.set()
+        self._link_down.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        with self._lock:
+            if self._connected:
+                self._connected = False
+                with contextlib.suppress(OSError):
+                    self.com_if.close(args)
+        self._supervising = False
+
+    def next_delay(self, delay: float) -> float:
+        """Calculate the delay after the next failed attempt in seconds."""
+        return min(delay * self.cfg.multiplier, self.cfg.max_delay.total_seconds())
+
+    def _jittered(self, delay: float) -> float:
+        jitter = self.cfg.jitter
+        if jitter <= 0:
+            return delay
+        return delay * (1.0 + self._rng.uniform(-jitter, jitter))
+
+    def _supervise(self):
+        delay = self.cfg.initial_delay.total_seconds()
+        while not self._stop_signal.is_set():
+            self._link_down.wait()
+            if self._stop_signal.is_set():
+                return
+            if self._try_connect():
+                delay = self.cfg.initial_delay.total_seconds()
+                continue
+            if self._stop_signal.wait(self._jittered(delay)):
+                return
+            delay = self.next_delay(delay)
+
+    def _try_connect(self) -> bool:
+        com_if = self.com_if
+        self.attempts += 1
+        try:
+            if self._factory is not None and self.attempts > 1:
+                com_if = self._factory()
+                com_if.initialize()
+            if not com_if.is_open():
+                com_if.open()
+            connected = com_if.is_open()
+        except OSError as e:
+            _LOGGER.debug(f"Connection attempt for {self.com_if_id} failed: {e}")
+            connected = False
+        if not connected:
+            if com_if is not self.com_if:
+                # Release the sockets or handles of the failed interface before the next attempt.
+                with contextlib.suppress(OSError):
+                    com_if.close()
+            return False
+        with self._lock:
+            self.com_if = com_if
+            self._connected = True
+            self._link_down.clear()
+            self.connects += 1
+            _LOGGER.info(f"Communication interface {self.com_if_id} connected")
+            self._flush_buffer()
+        return True
+
+    def _flush_buffer(self):
+        while self._tc_buffer and self._connected:
+            data = self._tc_buffer[0]
+            try:
+                self.com_if.send(data)
+            except (SendError, OSError) as e:
+                self._on_failure(e)
+                return
+            self._tc_buffer.popleft()
+
+    def _on_failure(self, error: Exception | None):
+        with self._lock:
+            if not self._connected:
+                return
+            self._connected = False
+            self.failures += 1
+            with contextlib.suppress(OSError):
+                self.com_if.close()
+            self._link_down.set()
+        _LOGGER.warning(f"Communication interface {self.com_if_id} lost: {error}")
+
+    def _handle_tc_while_down(self, data: bytes | bytearray):
+        policy = self.cfg.tc_policy
+        if policy == TcBufferPolicy.REJECT:
+            raise SendError(f"communication interface {self.com_if_id} is not connected", None)
+        if policy == TcBufferPolicy.DROP:
+            self.tcs_dropped += 1
+            return
+        if len(self._tc_buffer) >= self.cfg.max_buffered_tcs:
+            self._tc_buffer.popleft()
+            self.tcs_dropped += 1
+        self._tc_buffer.append(bytes(data))
+
+    def send(self, data: bytes | bytearray) -> None:
+        """Send a TC, or handle it according to the TC policy if the link is down.
+
+        :raises SendError: The link is down and the policy is :py:attr:`TcBufferPolicy.REJECT`
+        """
+        with self._lock:
+            if self._connected:
+                try:
+                    self.com_if.send(data)
+                    return
+                except (SendError, OSError) as e:
+                    self._on_failure(e)
+            self._handle_tc_while_down(data)
+
+    def _check_link(self) -> bool:
+        if not self._connected:
+            return False
+        if not self.com_if.is_open():
+            self._on_failure(None)
+            return False
+        return True
+
+    def receive(self, parameters: Any = 0) -> list[bytes]:
+        with self._lock:
+            if not self._check_link():
+                return []
+            try:
+                return self.com_if.receive(parameters)
+            except OSError as e:
+                self._on_failure(e)
+                return []
+
+    def packets_available(self, parameters: Any = 0) -> int:
+        with self._lock:
+            if not self._check_link():
+                return 0
+            try:
+                return self.com_if.packets_available(parameters)
+            except OSError as e:
+                self._on_failure(e)
+                return 0
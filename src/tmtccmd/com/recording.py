@@ -0,0 +1,356 @@
+"""Recording and replay of the traffic of communication interfaces.
+
+:py:class:`RecordingComInterface` wraps any :py:class:`com_interface.ComInterface` and records all
+sent and received packets into a compact binary file. :py:class:`ReplayComInterface` feeds the
+received packets of a recording back in real time, scaled in time or at maximum speed. This can be
+used to reproduce passes, for example as a throughput regression test for the TM handlers.
+
+The file layout is the following, with all fields using network byte order:
+
+1. File header: 4 byte magic ``TCRC`` and 1 byte format version.
+2. Packet records: 1 byte direction (0 for received, 1 for sent packets), 8 byte monotonic
+   timestamp in microseconds relative to the start of the recording, 4 byte packet length and
+   the packet itself.
+
+The file does not contain a record count so it stays valid if the recording is interrupted. A
+truncated last record is ignored by the reader.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import enum
+import mmap
+import struct
+import time
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from com_interface import ComInterface
+
+RECORDING_MAGIC = b"TCRC"
+RECORDING_VERSION = 1
+
+_HEADER_FMT = "!4sB"
+_HEADER_LEN = struct.calcsize(_HEADER_FMT)
+_RECORD_HEADER = struct.Struct("!BQI")
+_RECORD_HEADER_LEN = _RECORD_HEADER.size
+
+
+class InvalidRecordingError(Exception):
+    pass
+
+
+class PacketDirection(enum.IntEnum):
+    RECEIVED = 0
+    SENT = 1
+
+
+@dataclasses.dataclass
+class RecordedPacket:
+    """
+    :var direction: Whether the packet was received or sent
+    :var timestamp: Time in seconds relative to the start of the recording
+    :var packet: Raw packet
+    """
+
+    direction: PacketDirection
+    timestamp: float
+    packet: bytes
+
+
+class RecordingComInterface(ComInterface):
+    """Wrapper which records all packets sent and received through a communication interface.
+    All calls are delegated to the wrapped interface. The recording file is created
+    on construction and closed with :py:meth:`close_recording` or at the end of a ``with``
+    block. The recording continues when the wrapped interface is closed and opened again, for
+    example by :py:class:`tmtccmd.com.reconnect.ReconnectingComInterface` after a link failure.
+
+    :param com_if: Wrapped interface
+    :param path: Recording file path. Existing files are overwritten
+    :param clock: Monotonic clock in seconds
+    """
+
+    def __init__(
+        self,
+        com_if: ComInterface,
+        path: Path | str,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.com_if = com_if
+        self.path = Path(path)
+        self._clock = clock
+        self._file: BinaryIO | None = open(self.path, "wb")  # noqa: SIM115
+        self._file.write(struct.pack(_HEADER_FMT, RECORDING_MAGIC, RECORDING_VERSION))
+        self._start = clock()
+
+    @property
+    def id(self) -> str:
+        return self.com_if.id
+
+    def initialize(self, args: Any = 0) -> Any:
+        return self.com_if.initialize(args)
+
+    def open(self, args: Any = 0) -> None:
+        self.com_if.open(args)
+
+    def is_open(self) -> bool:
+        return self.com_if.is_open()
+
+    def close(self, args: Any = 0) -> None:
+        self.com_if.close(args)
+
+    def close_recording(self):
+        """Close the recording file without closing the wrapped interface. Packets are not
+        recorded anymore afterwards."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> RecordingComInterface:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        self.close_recording()
+
+    def _record(self, direction: PacketDirection, packet: bytes | bytearray):
+        if self._file is None:
+            return
+        timestamp_us = round((self._clock() - self._start) * 1e6)
+        self._file.write(_RECORD_HEADER.pack(direction, timestamp_us, len(packet)))
+        self._file.write(packet)
+
+    def send(self, data: bytes | bytearray) -> None:
+        self.com_if.send(data)
+        self._record(PacketDirection.SENT, data)
+
+    def receive(self, parameters: Any = 0) -> list[bytes]:
+        packets = self.com_if.receive(parameters)
+        for packet in packets:
+            self._record(PacketDirection.RECEIVED, packet)
+        return packets
+
+    def packets_available(self, parameters: Any = 0) -> int:
+        return self.com_if.packets_available(parameters)
+
+
+class RecordingReader:
+    """Memory-mapped reader for recording files.
+
+    :raises InvalidRecordingError: Invalid file header
+    """
+
+    def __init__(self, path: Path | str):
+        self._file: BinaryIO = open(path, "rb")  # noqa: SIM115
+        try:
+            self._data: mmap.mmap | bytes = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        except ValueError:
+            # Empty files can not be memory-mapped
+            self._data = b""
+        try:
+            self._parse_header()
+        except InvalidRecordingError:
+            self.close()
+            raise
+
+    def _parse_header(self):
+        if len(self._data) < _HEADER_LEN:
+            raise InvalidRecordingError("file too short for recording header")
+        magic, version = struct.unpack_from(_HEADER_FMT, self._data, 0)
+        if magic != RECORDING_MAGIC:
+            raise InvalidRecordingError(f"invalid magic {magic!r}")
+        if version != RECORDING_VERSION:
+            raise InvalidRecordingError(f"unsupported recording version {version}")
+
+    def records(self, direction: PacketDirection | None = None) -> Iterator[RecordedPacket]:
+        """Iterate over the recorded packets.
+
+        :param direction: Only yield packets with the given direction if specified
+        """
+        for record_dir, timestamp_us, packet in self._raw_records():
+            if direction is None or record_dir == direction:
+                yield RecordedPacket(PacketDirection(record_dir), timestamp_us / 1e6, packet)
+
+    def _raw_records(self) -> Iterator[tuple[int, int, bytes]]:
+        data = self._data
+        end = len(data)
+        offset = _HEADER_LEN
+        unpack_from = _RECORD_HEADER.unpack_from
+        while offset + _RECORD_HEADER_LEN <= end:
+            direction, timestamp_us, packet_len = unpack_from(data, offset)
+            offset += _RECORD_HEADER_LEN
+            if offset + packet_len > end:
+                break
+            yield direction, timestamp_us, data[offset : offset + packet_len]
+            offset += packet_len
+
+    def _next_record(self, offset: int, direction: PacketDirection) -> tuple[int, int, int] | None:
+        """Find the next record with the given direction at or after the record offset without
+        copying any packets.
+
+        :return: Timestamp in microseconds, packet offset and packet length, or None if there is
+            no complete record left
+        """
+        data = self._data
+        end = len(data)
+        unpack_from = _RECORD_HEADER.unpack_from
+        while offset + _RECORD_HEADER_LEN <= end:
+            record_dir, timestamp_us, packet_len = unpack_from(data, offset)
+            offset += _RECORD_HEADER_LEN
+            if offset + packet_len > end:
+                return None
+            if record_dir == direction:
+                return timestamp_us, offset, packet_len
+            offset += packet_len
+        return None
+
+    def __iter__(self) -> Iterator[RecordedPacket]:
+        return self.records()
+
+    def close(self):
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._file.close()
+
+    def __enter__(self) -> RecordingReader:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class ReplayComInterface(ComInterface):
+    """Communication interface which replays the received packets of a recording. Sent packets
+    are discarded and only counted.
+
+    The replay starts when the interface is opened. A packet is returned by :py:meth:`receive`
+    once the time it was received at, relative to the first received packet and divided by the
+    speed factor, has elapsed.
+
+    :param path: Recording file path
+    :param speed: Replay speed factor, for example 1.0 for real time or 10.0 for ten times the
+        real time. None replays the packets at maximum speed
+    :param max_batch: Maximum number of packets returned by one :py:meth:`receive` call. None
+        means no limit
+    :param com_if_id: ID of the interface
+    :param clock: Monotonic clock in seconds
+    :raises ValueError: Invalid speed factor
+    :raises InvalidRecordingError: Invalid recording file
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        speed: float | None = 1.0,
+        max_batch: int | None = None,
+        com_if_id: str = "replay",
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if speed is not None and speed <= 0:
+            raise ValueError("replay speed must be positive")
+        self.path = Path(path)
+        self.speed = speed
+        self.max_batch = max_batch
+        self.com_if_id = com_if_id
+        self.tc_count = 0
+        self._clock = clock
+        self._reader: RecordingReader | None = None
+        # Offset of the next record which was not returned yet
+        self._offset = _HEADER_LEN
+        # Number of due received records starting at the offset which were already counted by
+        # packets_available, and the offset after the last of them
+        self._due_count = 0
+        self._due_offset = _HEADER_LEN
+        self._first_timestamp_us: int | None = None
+        self._replay_start = 0.0
+        self._finished = False
+
+    @property
+    def id(self) -> str:
+        return self.com_if_id
+
+    @property
+    def finished(self) -> bool:
+        """All packets of the recording were returned."""
+        return self._finished
+
+    def initialize(self, args: Any = 0) -> Any:
+        pass
+
+    def open(self, args: Any = 0) -> None:
+        if self._reader is not None:
+            return
+        self._reader = RecordingReader(self.path)
+        self._offset = _HEADER_LEN
+        self._due_count = 0
+        self._due_offset = _HEADER_LEN
+        first = self._reader._next_record(_HEADER_LEN, PacketDirection.RECEIVED)
+        self._first_timestamp_us = first[0] if first is not None else None
+        self._finished = first is None
+        self._replay_start = self._clock()
+
+    def is_open(self) -> bool:
+        return self._reader is not None
+
+    def close(self, args: Any = 0) -> None:
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+    def _due_limit_us(self) -> float:
+        if self.speed is None or self._first_timestamp_us is None:
+            return float("inf")
+        elapsed = (self._clock() - self._replay_start) * self.speed
+        return self._first_timestamp_us + elapsed * 1e6
+
+    def send(self, data: bytes | bytearray) -> None:
+        self.tc_count += 1
+
+    def receive(self, parameters: Any = 0) -> list[bytes]:
+        reader = self._reader
+        if reader is None or self._finished:
+            return []
+        packets = []
+        limit = self._due_limit_us()
+        max_batch = self.max_batch
+        data = reader._data
+        next_record = reader._next_record
+        received = PacketDirection.RECEIVED
+        offset = self._offset
+        while max_batch is None or len(packets) < max_batch:
+            record = next_record(offset, received)
+            if record is None:
+                self._finished = True
+                break
+            timestamp_us, start, length = record
+            if timestamp_us > limit:
+                break
+            packets.append(bytes(data[start : start + length]))
+            offset = start + length
+        else:
+            self._finished = next_record(offset, received) is None
+        self._offset = offset
+        if len(packets) < self._due_count:
+            self._due_count -= len(packets)
+        else:
+            self._due_count = 0
+            self._due_offset = offset
+        return packets
+
+    def packets_available(self, parameters: Any = 0) -> int:
+        """Number of received packets of the recording which are due."""
+        reader = self._reader
+        if reader is None:
+            return 0
+        limit = self._due_limit_us()
+        while True:
+            record = reader._next_record(self._due_offset, PacketDirection.RECEIVED)
+            if record is None or record[0] > limit:
+                break
+            self._due_count += 1
+            self._due_offset = record[1] + record[2]
+        return self._due_count
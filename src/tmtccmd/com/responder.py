@@ -0,0 +1,258 @@
+"""Local PUS responder which can be used to exercise the UDP and TCP communication interfaces
+without flight software.
+
+The responder listens on a UDP and a TCP socket. Telecommands are expected to be raw space
+packets. UDP datagrams and the TCP stream may contain multiple packets, and packets may be split
+across TCP segments. Each PUS TC is answered with the verification TM, and ping TCs are
+additionally answered with a ping reply. Synthetic TM configured with a
+:py:class:`tmtccmd.com.dummy.DummySimCfg` is streamed to all known clients.
+
+The responder can be started as a separate process with ``python -m tmtccmd.com.responder``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import select
+import socket
+import threading
+import time
+
+from com_interface.ip_utils import EthAddr
+from spacepackets.ccsds.time import CdsShortTimestamp
+from spacepackets.ecss.pus_1_verification import RequestId, Service1Tm, VerificationParams
+from spacepackets.ecss.tc import PusTelecommand
+
+from tmtccmd.com.dummy import DummyHandler, DummySimCfg
+from tmtccmd.com.framing import split_space_packets
+from tmtccmd.pus.s1_verification import Subservice as Pus1Subservice
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_RESPONDER_PORT = 7301
+DEFAULT_RESPONDER_ADDR = EthAddr("127.0.0.1", DEFAULT_RESPONDER_PORT)
+
+
+class PusResponder:
+    """Local PUS responder running in a separate thread.
+
+    Port 0 can be used for both addresses to let the operating system pick a free port. The
+    actually bound addresses are available with :py:attr:`udp_addr` and :py:attr:`tcp_addr`
+    after :py:meth:`start` was called.
+    """
+
+    def __init__(
+        self,
+        udp_addr: EthAddr | None = DEFAULT_RESPONDER_ADDR,
+        tcp_addr: EthAddr | None = DEFAULT_RESPONDER_ADDR,
+        sim_cfg: DummySimCfg | None = None,
+        poll_interval: float = 0.005,
+    ):
+        """
+        :param udp_addr: UDP address to listen on. No UDP socket is opened if this is None
+        :param tcp_addr: TCP address to listen on. No TCP socket is opened if this is None
+        :param sim_cfg: Optional configuration of the synthetic TM stream
+        :param poll_interval: Maximum time in seconds between two updates of the TM stream
+        """
+        self.udp_addr = udp_addr
+        self.tcp_addr = tcp_addr
+        self.poll_interval = poll_interval
+        self.tc_count = 0
+        self.tm_sent = 0
+        self._sim = DummyHandler(sim_cfg) if sim_cfg is not None else None
+        self._ping_handler = DummyHandler()
+        self._seq_count = 0
+        self._udp_socket: socket.socket | None = None
+        self._tcp_server: socket.socket | None = None
+        self._tcp_clients: dict[socket.socket, bytearray] = {}
+        self._udp_peers: set[tuple[str, int]] = set()
+        self._stop_signal = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> PusResponder:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def start(self):
+        if self._thread is not None:
+            return
+        if self.udp_addr is not None:
+            self._udp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self._udp_socket.bind(self.udp_addr.to_tuple)
+            self._udp_socket.setblocking(False)
+            self.udp_addr = EthAddr(*self._udp_socket.getsockname())
+        if self.tcp_addr is not None:
+            self._tcp_server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._tcp_server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            self._tcp_server.bind(self.tcp_addr.to_tuple)
+            self._tcp_server.listen()
+            self._tcp_server.setblocking(False)
+            self.tcp_addr = EthAddr(*self._tcp_server.getsockname())
+        self._stop_signal.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop_signal.set()
+        self._thread.join()
+        self._thread = None
+        for client in self._tcp_clients:
+            client.close()
+        self._tcp_clients.clear()
+        self._udp_peers.clear()
+        if self._udp_socket is not None:
+            self._udp_socket.close()
+            self._udp_socket = None
+        if self._tcp_server is not None:
+            self._tcp_server.close()
+            self._tcp_server = None
+
+    def serve_forever(self):
+        """Start the responder and block until a keyboard interrupt is received."""
+        self.start()
+        try:
+            while True:
+                time.sleep(1.0)
+        except KeyboardInterrupt:
+            _LOGGER.info("Keyboard interrupt, stopping responder")
+        finally:
+            self.stop()
+
+    def _run(self):
+        while not self._stop_signal.is_set():
+            readable = [*self._tcp_clients]
+            if self._udp_socket is not None:
+                readable.append(self._udp_socket)
+            if self._tcp_server is not None:
+                readable.append(self._tcp_server)
+            ready, _, _ = select.select(readable, [], [], self.poll_interval)
+            for sock in ready:
+                if sock is self._udp_socket:
+                    self._handle_udp()
+                elif sock is self._tcp_server:
+                    client, _ = sock.accept()
+                    client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                    self._tcp_clients[client] = bytearray()
+                else:
+                    self._handle_tcp_client(sock)
+            if self._sim is not None:
+                for packet in self._sim.receive_reply_package():
+                    self._broadcast(packet)
+
+    def _handle_udp(self):
+        assert self._udp_socket is not None
+        while True:
+            try:
+                data, sender = self._udp_socket.recvfrom(65535)
+            except (BlockingIOError, ConnectionResetError):
+                return
+            self._udp_peers.add(sender)
+            for tc in split_space_packets(bytearray(data)):
+                for reply in self._handle_tc(tc):
+                    self._udp_socket.sendto(reply, sender)
+                    self.tm_sent += 1
+
+    def _handle_tcp_client(self, client: socket.socket):
+        try:
+            data = client.recv(65535)
+        except ConnectionResetError:
+            data = b""
+        if not data:
+            client.close()
+            del self._tcp_clients[client]
+            return
+        buf = self._tcp_clients[client]
+        buf.extend(data)
+        replies = [reply for tc in split_space_packets(buf) for reply in self._handle_tc(tc)]
+        if replies:
+            self._send_tcp(client, b"".join(replies))
+            self.tm_sent += len(replies)
+
+    def _send_tcp(self, client: socket.socket, data: bytes):
+        try:
+            client.sendall(data)
+        except OSError:
+            client.close()
+            self._tcp_clients.pop(client, None)
+
+    def _broadcast(self, packet: bytes):
+        if self._udp_socket is not None:
+            for peer in self._udp_peers:
+                self._udp_socket.sendto(packet, peer)
+                self.tm_sent += 1
+        for client in list(self._tcp_clients):
+            self._send_tcp(client, packet)
+            self.tm_sent += 1
+
+    def _handle_tc(self, raw_tc: bytes) -> list[bytes]:
+        try:
+            tc = PusTelecommand.unpack(raw_tc)
+        except ValueError:
+            _LOGGER.warning(f"Received invalid PUS TC with length {len(raw_tc)}")
+            return []
+        self.tc_count += 1
+        if tc.service == 17 and tc.subservice == 1:
+            self._ping_handler.insert_telecommand(raw_tc)
+            return self._ping_handler.receive_reply_package()
+        timestamp = CdsShortTimestamp.now().pack()
+        verif_params = VerificationParams(req_id=RequestId(tc.packet_id, tc.packet_seq_control))
+        replies = []
+        for subservice in (
+            Pus1Subservice.TM_ACCEPTANCE_SUCCESS,
+            Pus1Subservice.TM_COMPLETION_SUCCESS,
+        ):
+            replies.append(
+                Service1Tm(
+                    subservice=subservice,
+                    apid=tc.apid,
+                    seq_count=self._seq_count,
+                    verif_params=verif_params,
+                    timestamp=timestamp,
+                ).pack()
+            )
+            self._seq_count = (self._seq_count + 1) & 0x3FFF
+        return replies
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m tmtccmd.com.responder",
+        description="Local PUS responder for the UDP and TCP communication interfaces",
+    )
+    parser.add_argument("--addr", default="127.0.0.1", help="Address to listen on")
+    parser.add_argument("--udp-port", type=int, default=DEFAULT_RESPONDER_PORT)
+    parser.add_argument("--tcp-port", type=int, default=DEFAULT_RESPONDER_PORT)
+    parser.add_argument("--apid", type=int, default=0, help="APID of the synthetic TM")
+    parser.add_argument("--hk-rate", type=float, default=0.0, help="HK packets per second")
+    parser.add_argument("--event-rate", type=float, default=0.0, help="Events per second")
+    parser.add_argument("--verif-rate", type=float, default=0.0, help="Verification TM per second")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    sim_cfg = None
+    if args.hk_rate > 0 or args.event_rate > 0 or args.verif_rate > 0:
+        sim_cfg = DummySimCfg(
+            apid=args.apid,
+            hk_rate=args.hk_rate,
+            event_rate=args.event_rate,
+            verif_rate=args.verif_rate,
+        )
+    responder = PusResponder(
+        udp_addr=EthAddr(args.addr, args.udp_port),
+        tcp_addr=EthAddr(args.addr, args.tcp_port),
+        sim_cfg=sim_cfg,
+    )
+    responder.start()
+    _LOGGER.info(
+        f"PUS responder listening on UDP {responder.udp_addr} and TCP {responder.tcp_addr}"
+    )
+    responder.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
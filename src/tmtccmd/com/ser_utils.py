@@ -1,56 +1,26 @@
-import json
 import logging
 
-try:
-    import tomllib  # Python 3.11+
-except ModuleNotFoundError:
-    import tomli as tomllib  # Fallback for older versions
-from typing import TextIO
-
 import serial
 import serial.tools.list_ports
 
-from tmtccmd.util.json import (
-    JsonKeyNames,
-    check_json_file,
-)
+from tmtccmd.config.loader import load_tmtc_file_cfg
+from tmtccmd.util.json import check_json_file
 
 _LOGGER = logging.getLogger(__name__)
 
 
 def load_baud_rate_from_json(cfg_path: str) -> int | None:
-    baud_rate = None
     if not check_json_file(json_cfg_path=cfg_path):
         return None
-    with open(cfg_path) as read:
-        try:
-            load_data = json.load(read)
-            baud_rate = load_data[JsonKeyNames.SERIAL_BAUDRATE.value]
-        except KeyError:
-            pass
-    return baud_rate
+    return load_tmtc_file_cfg(cfg_path).serial.baud_rate
 
 
 def load_baud_rate_from_toml(cfg_path: str) -> int | None:
-    baud_rate = None
-    try:
-        with open(cfg_path, "rb") as f:
-            cfg = tomllib.load(f)
-        baud_rate = cfg["serial"]["baud"]
-    except (FileNotFoundError, KeyError, tomllib.TOMLDecodeError):
-        pass
-    return baud_rate
+    return load_tmtc_file_cfg(cfg_path).serial.baud_rate
 
 
 def load_serial_port_from_toml(cfg_path: str) -> str | None:
-    baud_rate = None
-    try:
-        with open(cfg_path, "rb") as f:
-            cfg = tomllib.load(f)
-        baud_rate = cfg["serial"]["port"]
-    except (FileNotFoundError, KeyError, tomllib.TOMLDecodeError):
-        pass
-    return baud_rate
+    return load_tmtc_file_cfg(cfg_path).serial.port
 
 
 def determine_baud_rate(cfg_path: str) -> int | None:
@@ -60,20 +30,11 @@ def determine_baud_rate(cfg_path: str) -> int | None:
     :return: Determined baud rate
     """
     baud_rate = None
-    prompt_baud_rate = False
     if cfg_path.endswith("json"):
         baud_rate = load_baud_rate_from_json(cfg_path=cfg_path)
     elif cfg_path.endswith("toml"):
         baud_rate = load_baud_rate_from_toml(cfg_path=cfg_path)
-
     if baud_rate is None:
-        with open(cfg_path) as read:
-            try:
-                load_data = json.load(read)
-                baud_rate = load_data[JsonKeyNames.SERIAL_BAUDRATE.value]
-            except KeyError:
-                prompt_baud_rate = True
-    if prompt_baud_rate:
         while True:
             baud_rate = input("Please enter the baudrate for the serial protocol: ")
             if baud_rate.isdigit():
@@ -90,53 +51,23 @@ def determine_com_port(cfg_path: str) -> str | None:
 
     :return: Determined serial port
     """
-    reconfig_com_port = False
+    com_port = None
     if cfg_path.endswith("json"):
         if not check_json_file(json_cfg_path=cfg_path):
-            reconfig_com_port = True
-        with open(cfg_path, "r+") as json_file:
-            com_port = __determine_com_port_with_json_file(
-                json_file=json_file,
-                reconfig_com_port=reconfig_com_port,
-            )
+            return prompt_com_port()
+        cfg = load_tmtc_file_cfg(cfg_path)
+        com_port = cfg.serial.port
+        if com_port is not None:
+            _LOGGER.info(f"Loaded serial port {com_port} from JSON configuration file")
+        else:
+            com_port = __try_hint_handling(cfg.serial.hint)
     if cfg_path.endswith("toml"):
         com_port = load_serial_port_from_toml(cfg_path=cfg_path)
     return com_port
 
 
-def __determine_com_port_with_json_file(json_file: TextIO, reconfig_com_port: bool) -> str | None:
-    try_hint = False
-    json_obj = json.load(json_file)
-    com_port = ""
-    if not reconfig_com_port:
-        try_hint, com_port = __try_com_port_load(json_obj=json_obj)
-    if try_hint:
-        com_port = __try_hint_handling(
-            json_obj=json_obj,
-        )
-        if com_port is None:
-            return None
-
-    if reconfig_com_port:
-        com_port = prompt_com_port()
-    return com_port
-
-
-def __try_com_port_load(json_obj) -> tuple[bool, str]:
-    try_hint = False
-    com_port = ""
-    try:
-        com_port = json_obj[JsonKeyNames.SERIAL_PORT.value]
-        _LOGGER.info(f"Loaded serial port {com_port} from JSON configuration file")
-    except KeyError:
-        try_hint = True
-    return try_hint, com_port
-
-
-def __try_hint_handling(json_obj) -> str | None:
-    try:
-        hint = json_obj[JsonKeyNames.SERIAL_HINT.value]
-    except KeyError:
+def __try_hint_handling(hint: str | None) -> str | None:
+    if hint is None:
         hint = __prompt_hint_handling()
 
     com_port_found, com_port = find_com_port_from_hint(hint=hint)
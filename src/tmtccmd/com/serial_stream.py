@@ -0,0 +1,126 @@
+"""Serial communication interface with chunk-based deframing for COBS and DLE framed streams.
+
+The default serial interfaces of the ``com-interface`` library read and parse the received data
+byte by byte, which limits the throughput for large TM bursts on high baud rates. The
+:py:class:`StreamingSerialComIF` reads all available data at once and uses the deframers of
+:py:mod:`tmtccmd.com.framing`. It is compatible with the framing of
+:py:class:`com_interface.serial_cobs.SerialCobsComIF` and
+:py:class:`com_interface.serial_dle.SerialDleComIF`.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import deque
+from typing import Any
+
+import serial
+from com_interface import ComInterface, SendError
+from com_interface.serial_base import SerialCfg, SerialComBase, SerialCommunicationType
+
+from tmtccmd.com.framing import CobsDeframer, DleDeframer, cobs_encode_frame, dle_encode_frame
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class StreamingSerialComIF(SerialComBase, ComInterface):
+    """Serial communication interface which spins up a reception thread on :py:meth:`open`.
+    The thread waits for at most the polling frequency of the serial configuration for new data,
+    so received packets are available without an additional polling delay.
+
+    :param ser_cfg: Serial configuration
+    :param com_type: Framing used on the serial port
+    :param max_frame_size: Maximum encoded frame size accepted by the deframer
+    """
+
+    def __init__(
+        self,
+        ser_cfg: SerialCfg,
+        com_type: SerialCommunicationType,
+        max_frame_size: int = 65536,
+    ):
+        super().__init__(_LOGGER, ser_cfg=ser_cfg, ser_com_type=com_type)
+        if com_type == SerialCommunicationType.COBS:
+            self._deframer: CobsDeframer | DleDeframer = CobsDeframer(max_frame_size)
+        else:
+            self._deframer = DleDeframer(max_frame_size)
+        self._packet_deque: deque[bytes] = deque()
+        self._polling_shutdown = threading.Event()
+        self._reception_thread: threading.Thread | None = None
+
+    @property
+    def id(self) -> str:
+        return self.ser_cfg.com_if_id
+
+    @property
+    def parsing_error_count(self) -> int:
+        return self._deframer.parsing_error_count
+
+    def initialize(self, args: Any = 0) -> Any:
+        pass
+
+    def open(self, args: Any = 0) -> None:
+        """
+        :raises OSError: Opening the serial port failed
+        """
+        if self.is_open():
+            return
+        self.open_port()
+        self._deframer.reset()
+        self._polling_shutdown.clear()
+        self._reception_thread = threading.Thread(target=self._poll_packets, daemon=True)
+        self._reception_thread.start()
+
+    def is_open(self) -> bool:
+        return self.is_port_open()
+
+    def close(self, args: Any = 0) -> None:
+        if self._reception_thread is None:
+            return
+        self._polling_shutdown.set()
+        self._reception_thread.join()
+        self._reception_thread = None
+        self.close_port()
+
+    def send(self, data: bytes | bytearray) -> None:
+        """
+        :raises SendError: Interface not open or writing to the serial port failed
+        """
+        if self.serial is None:
+            raise SendError("serial interface is not open", None)
+        if self.ser_com_type == SerialCommunicationType.COBS:
+            frame = cobs_encode_frame(data)
+        else:
+            frame = dle_encode_frame(data)
+        try:
+            self.serial.write(frame)
+        except serial.SerialException as e:
+            raise SendError(f"writing to {self.ser_cfg.serial_port} failed: {e}", e) from e
+
+    def receive(self, parameters: Any = 0) -> list[bytes]:
+        packets = []
+        # deque is thread-safe for appends and pops from and to the opposite side
+        while self._packet_deque:
+            packets.append(self._packet_deque.popleft())
+        return packets
+
+    def packets_available(self, parameters: Any = 0) -> int:
+        return len(self._packet_deque)
+
+    def _poll_packets(self):
+        assert self.serial is not None
+        self.serial.timeout = self.ser_cfg.polling_frequency
+        while not self._polling_shutdown.is_set():
+            try:
+                # Block until at least one byte arrives, then read everything available.
+                data = self.serial.read(1)
+                if not data:
+                    continue
+                waiting = self.serial.in_waiting
+                if waiting > 0:
+                    data += self.serial.read(waiting)
+            except serial.SerialException as e:
+                _LOGGER.error(f"Reading from {self.ser_cfg.serial_port} failed: {e}")
+                break
+            self._packet_deque.extend(self._deframer.feed(data))
@@ -0,0 +1,390 @@
+"""Shared-memory communication interface for simulators running on the same host.
+
+The TMTC commander and the simulator exchange packets through a memory-mapped file, by default
+located in ``/dev/shm`` on Linux and in the temporary directory on other platforms, which
+contains two single-producer/single-consumer ring buffers: One for TCs sent by the commander and
+one for TM sent by the simulator. Packets are copied into the ring buffers directly, without any
+socket calls or kernel copies on the data path.
+
+Each side can block until new packets are available with :py:meth:`SharedMemoryLink.wait`. The
+wakeup works similarly to a futex: The waiting side sets a flag inside the shared memory and
+waits on a FIFO next to the shared memory file, and the producer only writes to the FIFO if the
+flag is set. No system call is made on the data path while the consumer is busy.
+
+The file layout is the following, with all fields using little endian byte order:
+
+1. File header (64 bytes): 4 byte magic ``TCSM``, 1 byte format version and the 4 byte capacity
+   of each ring buffer data region at offset 8.
+2. TC ring buffer and TM ring buffer. Each ring buffer consists of a 128 byte header and the
+   data region. The header contains the 8 byte write index at offset 0, and the 8 byte read
+   index and the 4 byte waiting flag of the consumer at offset 64, so producer and consumer
+   fields are in separate cache lines. The indexes count the total number of bytes written and
+   read.
+3. Ring buffer records: 4 byte packet length followed by the packet. Records wrap around at the
+   end of the data region.
+
+The index updates rely on aligned 8 byte stores being atomic, which is the case on all common
+64-bit platforms.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import dataclasses
+import enum
+import logging
+import mmap
+import os
+import select
+import struct
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from com_interface import ComInterface, SendError
+
+from tmtccmd.config.defs import CoreComInterfaces
+from tmtccmd.config.loader import load_tmtc_file_cfg
+from tmtccmd.util.json import check_json_file
+
+_LOGGER = logging.getLogger(__name__)
+
+SHM_MAGIC = b"TCSM"
+SHM_VERSION = 1
+DEFAULT_SHM_PATH = str(
+    Path("/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()) / "tmtccmd"
+)
+DEFAULT_SHM_CAPACITY = 1 << 20
+
+_FILE_HEADER_LEN = 64
+_RING_HEADER_LEN = 128
+_HEAD_OFFSET = 0
+_TAIL_OFFSET = 64
+_WAITING_OFFSET = 72
+_U64 = struct.Struct("<Q")
+_U32 = struct.Struct("<I")
+_LEN_FIELD = 4
+
+
+class InvalidSharedMemoryError(Exception):
+    pass
+
+
+class ShmSide(enum.Enum):
+    #: TMTC commander side, which sends TCs and receives TM.
+    GROUND = 0
+    #: Simulator side, which receives TCs and sends TM.
+    TARGET = 1
+
+
+@dataclasses.dataclass
+class ShmCfg:
+    """
+    :var path: Path of the shared memory file
+    :var capacity: Size of each ring buffer data region in bytes. Only used when the file is
+        created, otherwise the capacity is read from the file
+    """
+
+    path: str = DEFAULT_SHM_PATH
+    capacity: int = DEFAULT_SHM_CAPACITY
+
+
+class _Ring:
+    """Single-producer/single-consumer ring buffer view on a shared memory region."""
+
+    def __init__(self, buf: mmap.mmap, offset: int, capacity: int, fifo_fd: int | None):
+        self.buf = buf
+        self.header = offset
+        self.data = offset + _RING_HEADER_LEN
+        self.capacity = capacity
+        self.fifo_fd = fifo_fd
+
+    def _load(self, field: int) -> int:
+        return _U64.unpack_from(self.buf, self.header + field)[0]
+
+    def _store(self, field: int, value: int):
+        _U64.pack_into(self.buf, self.header + field, value)
+
+    @property
+    def waiting(self) -> bool:
+        return _U32.unpack_from(self.buf, self.header + _WAITING_OFFSET)[0] != 0
+
+    @waiting.setter
+    def waiting(self, waiting: bool):
+        _U32.pack_into(self.buf, self.header + _WAITING_OFFSET, int(waiting))
+
+    def used(self) -> int:
+        return self._load(_HEAD_OFFSET) - self._load(_TAIL_OFFSET)
+
+    def _copy_in(self, pos: int, data: bytes | bytearray | memoryview):
+        first = min(len(data), self.capacity - pos)
+        self.buf[self.data + pos : self.data + pos + first] = data[:first]
+        if first < len(data):
+            self.buf[self.data : self.data + len(data) - first] = data[first:]
+
+    def _copy_out(self, pos: int, length: int) -> bytes:
+        first = min(length, self.capacity - pos)
+        chunk = self.buf[self.data + pos : self.data + pos + first]
+        if first < length:
+            chunk += self.buf[self.data : self.data + length - first]
+        return chunk
+
+    def write(self, packets: list[bytes | bytearray]) -> int:
+        """Write packets and publish them with a single index update.
+
+        :return: Number of packets written. Writing stops at the first packet which does not fit
+        :raises ValueError: A packet is larger than the ring buffer, so it can never be written
+        """
+        for packet in packets:
+            if _LEN_FIELD + len(packet) > self.capacity:
+                raise ValueError(
+                    f"packet with {len(packet)} bytes does not fit into ring buffer with "
+                    f"capacity {self.capacity}"
+                )
+        head = self._load(_HEAD_OFFSET)
+        free = self.capacity - (head - self._load(_TAIL_OFFSET))
+        written = 0
+        for packet in packets:
+            record_len = _LEN_FIELD + len(packet)
+            if record_len > free:
+                break
+            self._copy_in(head % self.capacity, _U32.pack(len(packet)))
+            self._copy_in((head + _LEN_FIELD) % self.capacity, packet)
+            head += record_len
+            free -= record_len
+            written += 1
+        if written:
+            self._store(_HEAD_OFFSET, head)
+            if self.fifo_fd is not None and self.waiting:
+                with contextlib.suppress(BlockingIOError):
+                    os.write(self.fifo_fd, b"\x00")
+        return written
+
+    def read_all(self, max_packets: int | None = None) -> list[bytes]:
+        tail = self._load(_TAIL_OFFSET)
+        head = self._load(_HEAD_OFFSET)
+        packets = []
+        while tail < head:
+            (length,) = _U32.unpack(self._copy_out(tail % self.capacity, _LEN_FIELD))
+            packets.append(self._copy_out((tail + _LEN_FIELD) % self.capacity, length))
+            tail += _LEN_FIELD + length
+            if max_packets is not None and len(packets) >= max_packets:
+                break
+        if packets:
+            self._store(_TAIL_OFFSET, tail)
+        return packets
+
+    def count(self) -> int:
+        tail = self._load(_TAIL_OFFSET)
+        head = self._load(_HEAD_OFFSET)
+        num = 0
+        while tail < head:
+            (length,) = _U32.unpack(self._copy_out(tail % self.capacity, _LEN_FIELD))
+            tail += _LEN_FIELD + length
+            num += 1
+        return num
+
+
+class SharedMemoryLink:
+    """One side of the shared memory link. The shared memory file is created if it does not
+    exist yet. The FIFOs used for the wakeup are created next to it with the suffixes
+    ``.tc`` and ``.tm``. They are not used on platforms without FIFO support, where
+    :py:meth:`wait` returns immediately.
+
+    :param cfg: Shared memory configuration
+    :param side: Side of the link
+    :raises InvalidSharedMemoryError: Existing file with an invalid format
+    """
+
+    def __init__(self, cfg: ShmCfg, side: ShmSide):
+        self.cfg = cfg
+        self.side = side
+        path = Path(cfg.path)
+        if not path.exists():
+            self._create_file(path, cfg.capacity)
+        fd = os.open(path, os.O_RDWR)
+        try:
+            if os.fstat(fd).st_size < _FILE_HEADER_LEN:
+                raise InvalidSharedMemoryError(f"shared memory file {cfg.path} is not initialized")
+            self._buf = mmap.mmap(fd, 0)
+        finally:
+            os.close(fd)
+        self._check_header()
+        capacity = _U32.unpack_from(self._buf, 8)[0]
+        self.capacity = capacity
+        self._fifo_fds = [
+            self._open_fifo(path.with_name(path.name + suffix)) for suffix in (".tc", ".tm")
+        ]
+        ring_len = _RING_HEADER_LEN + capacity
+        tc_ring = _Ring(self._buf, _FILE_HEADER_LEN, capacity, self._fifo_fds[0])
+        tm_ring = _Ring(self._buf, _FILE_HEADER_LEN + ring_len, capacity, self._fifo_fds[1])
+        if side == ShmSide.GROUND:
+            self._tx, self._rx = tc_ring, tm_ring
+        else:
+            self._tx, self._rx = tm_ring, tc_ring
+
+    @staticmethod
+    def _create_file(path: Path, capacity: int):
+        """Create the shared memory file atomically, so the other side never sees a file without
+        a valid header. The file is prepared under a temporary name and then linked to the final
+        path, which fails if the other side created the file first."""
+        header = bytearray(_FILE_HEADER_LEN)
+        header[0:5] = SHM_MAGIC + bytes([SHM_VERSION])
+        _U32.pack_into(header, 8, capacity)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            try:
+                os.write(fd, header)
+                os.ftruncate(fd, _FILE_HEADER_LEN + 2 * (_RING_HEADER_LEN + capacity))
+            finally:
+                os.close(fd)
+            with contextlib.suppress(FileExistsError):
+                os.link(tmp_path, path)
+        finally:
+            os.unlink(tmp_path)
+
+    def _check_header(self):
+        error = None
+        if len(self._buf) < _FILE_HEADER_LEN or self._buf[0:4] != SHM_MAGIC:
+            error = f"invalid shared memory file {self.cfg.path}"
+        elif self._buf[4] != SHM_VERSION:
+            error = f"unsupported shared memory version {self._buf[4]}"
+        else:
+            capacity = _U32.unpack_from(self._buf, 8)[0]
+            if len(self._buf) < _FILE_HEADER_LEN + 2 * (_RING_HEADER_LEN + capacity):
+                error = f"shared memory file {self.cfg.path} is truncated"
+        if error is not None:
+            self._buf.close()
+            raise InvalidSharedMemoryError(error)
+
+    @staticmethod
+    def _open_fifo(path: Path) -> int | None:
+        if not hasattr(os, "mkfifo"):
+            return None
+        with contextlib.suppress(FileExistsError):
+            os.mkfifo(path, 0o600)
+        # Opening with O_RDWR does not block even if there is no reader or writer yet.
+        return os.open(path, os.O_RDWR | os.O_NONBLOCK)
+
+    def send(self, packets: list[bytes | bytearray]) -> int:
+        """Write packets to the outgoing ring buffer.
+
+        :return: Number of packets written. The remaining packets did not fit into the ring
+            buffer
+        :raises ValueError: A packet is larger than the ring buffer
+        """
+        return self._tx.write(packets)
+
+    def receive(self, max_packets: int | None = None) -> list[bytes]:
+        return self._rx.read_all(max_packets)
+
+    def packets_available(self) -> int:
+        return self._rx.count()
+
+    def wait(self, timeout: float) -> bool:
+        """Block until packets are available in the incoming ring buffer or the timeout expired.
+
+        :return: True if packets are available
+        """
+        rx = self._rx
+        if rx.used() > 0:
+            return True
+        if rx.fifo_fd is None:
+            return False
+        rx.waiting = True
+        try:
+            # Check again after setting the flag so a packet written in between is not missed.
+            if rx.used() > 0:
+                return True
+            ready, _, _ = select.select([rx.fifo_fd], [], [], timeout)
+            if ready:
+                with contextlib.suppress(BlockingIOError):
+                    os.read(rx.fifo_fd, 4096)
+        finally:
+            rx.waiting = False
+        return rx.used() > 0
+
+    def close(self):
+        for fd in self._fifo_fds:
+            if fd is not None:
+                os.close(fd)
+        self._fifo_fds = [None, None]
+        self._buf.close()
+
+    def unlink(self):
+        """Remove the shared memory file and the FIFOs."""
+        path = Path(self.cfg.path)
+        for file in (path, path.with_name(path.name + ".tc"), path.with_name(path.name + ".tm")):
+            with contextlib.suppress(FileNotFoundError):
+                file.unlink()
+
+
+class SharedMemoryComInterface(ComInterface):
+    """Communication interface for the ground side of a :py:class:`SharedMemoryLink`.
+
+    :param cfg: Shared memory configuration
+    :param com_if_id: ID of the interface
+    """
+
+    def __init__(
+        self, cfg: ShmCfg | None = None, com_if_id: str = CoreComInterfaces.SHARED_MEMORY.value
+    ):
+        self.cfg = cfg if cfg is not None else ShmCfg()
+        self.com_if_id = com_if_id
+        self.link: SharedMemoryLink | None = None
+
+    @property
+    def id(self) -> str:
+        return self.com_if_id
+
+    def initialize(self, args: Any = 0) -> Any:
+        pass
+
+    def open(self, args: Any = 0) -> None:
+        if self.link is None:
+            self.link = SharedMemoryLink(self.cfg, ShmSide.GROUND)
+
+    def is_open(self) -> bool:
+        return self.link is not None
+
+    def close(self, args: Any = 0) -> None:
+        if self.link is not None:
+            self.link.close()
+            self.link = None
+
+    def send(self, data: bytes | bytearray) -> None:
+        """
+        :raises SendError: Interface not open or TC ring buffer full
+        :raises ValueError: Packet larger than the TC ring buffer
+        """
+        if self.link is None:
+            raise SendError("shared memory interface is not open", None)
+        if self.link.send([data]) != 1:
+            raise SendError("shared memory TC ring buffer is full", None)
+
+    def receive(self, parameters: Any = 0) -> list[bytes]:
+        if self.link is None:
+            return []
+        return self.link.receive()
+
+    def packets_available(self, parameters: Any = 0) -> int:
+        if self.link is None:
+            return 0
+        return self.link.packets_available()
+
+
+def load_shm_cfg(cfg_path: str) -> ShmCfg:
+    """Load the shared memory configuration from a JSON or TOML configuration file. For TOML
+    files, the ``path`` and ``capacity`` keys of the ``shm`` table are used. Default values are
+    used for missing keys."""
+    cfg = ShmCfg()
+    if cfg_path.endswith("json") and not check_json_file(json_cfg_path=cfg_path):
+        return cfg
+    if not cfg_path.endswith(("json", "toml")):
+        return cfg
+    section = load_tmtc_file_cfg(cfg_path).shm
+    if section.path is not None:
+        cfg.path = section.path
+    if section.capacity is not None:
+        cfg.capacity = section.capacity
+    return cfg
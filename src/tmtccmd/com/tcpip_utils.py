@@ -1,12 +1,5 @@
 from __future__ import annotations
 
-from pathlib import Path
-
-try:
-    import tomllib  # Python 3.11+
-except ModuleNotFoundError:
-    import tomli as tomllib  # Fallback for older versions
-
 import json
 import logging
 import socket
@@ -14,6 +7,7 @@ import struct
 
 from com_interface.ip_utils import EthAddr, TcpIpType
 
+from tmtccmd.config.loader import load_tmtc_file_cfg
 from tmtccmd.util.json import JsonKeyNames, check_json_file
 
 _LOGGER = logging.getLogger(__name__)
@@ -43,51 +37,26 @@ def determine_udp_recv_address(cfg_path: str) -> EthAddr | None:
 
 
 def load_tcpip_address_from_toml(tcpip_type: TcpIpType, toml_cfg_path: str) -> EthAddr | None:
-    addr = EthAddr("", 0)
-
-    if tcpip_type == TcpIpType.TCP:
-        toml_key = "tcp"
-    elif tcpip_type == TcpIpType.UDP or tcpip_type == TcpIpType.UDP_RECV:
-        toml_key = "udp"
-
-    try:
-        with Path(toml_cfg_path).open("rb") as f:
-            cfg = tomllib.load(f)
-
-        section = cfg[toml_key]
-        ip_address = section["addr"]
-        port = int(section["port"])
-        addr = EthAddr(ip_address, port)
-    except (FileNotFoundError, KeyError, tomllib.TOMLDecodeError, ValueError):
-        pass
-
-    return addr
+    cfg = load_tmtc_file_cfg(toml_cfg_path)
+    section = cfg.tcp if tcpip_type == TcpIpType.TCP else cfg.udp
+    if section.send_addr is None:
+        return EthAddr("", 0)
+    return EthAddr(*section.send_addr)
 
 
 def load_tcpip_address_json(tcpip_type: TcpIpType, json_cfg_path: str) -> EthAddr | None:
-    addr = EthAddr("", 0)
     if not check_json_file(json_cfg_path=json_cfg_path):
         return None
-
+    cfg = load_tmtc_file_cfg(json_cfg_path)
     if tcpip_type == TcpIpType.TCP:
-        json_key_address = JsonKeyNames.TCPIP_TCP_DEST_IP_ADDRESS.value
-        json_key_port = JsonKeyNames.TCPIP_TCP_DEST_PORT.value
+        addr = cfg.tcp.send_addr
     elif tcpip_type == TcpIpType.UDP:
-        json_key_address = JsonKeyNames.TCPIP_UDP_DEST_IP_ADDRESS.value
-        json_key_port = JsonKeyNames.TCPIP_UDP_DEST_PORT.value
-    elif tcpip_type == TcpIpType.UDP_RECV:
-        json_key_address = JsonKeyNames.TCPIP_UDP_RECV_IP_ADDRESS.value
-        json_key_port = JsonKeyNames.TCPIP_UDP_RECV_PORT.value
-
-    with open(json_cfg_path) as write:
-        load_data = json.load(write)
-        if json_key_address not in load_data or json_key_port not in load_data:
-            return None
-        else:
-            ip_address = load_data[json_key_address]
-            port = int(load_data[json_key_port])
-            addr = EthAddr(ip_address, port)
-    return addr
+        addr = cfg.udp.send_addr
+    else:
+        addr = cfg.udp.recv_addr
+    if addr is None:
+        return None
+    return EthAddr(*addr)
 
 
 def prompt_ip_address(type_str: str) -> EthAddr:
@@ -138,12 +107,13 @@ def determine_recv_buffer_len(json_cfg_path: str, tcpip_type: TcpIpType):
 
     if not check_json_file(json_cfg_path=json_cfg_path):
         reconfigure_recv_buf_size = True
-    with open(json_cfg_path) as write:
-        load_data = json.load(write)
-        if json_key not in load_data:
+    else:
+        cfg = load_tmtc_file_cfg(json_cfg_path)
+        section = cfg.tcp if tcpip_type == TcpIpType.TCP else cfg.udp
+        if section.recv_max_size is None:
             reconfigure_recv_buf_size = True
         else:
-            recv_max_size = load_data[json_key]
+            recv_max_size = section.recv_max_size
     if reconfigure_recv_buf_size:
         recv_max_size = prompt_recv_buffer_len(tcpip_type=tcpip_type)
         store_size = input("Do you store the maximum receive size configuration? ([Y]/n): ")
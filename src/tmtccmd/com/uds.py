@@ -0,0 +1,184 @@
+"""Unix domain socket communication interface for simulators and ground segment gateways running
+on the same host.
+
+By default, a ``SOCK_SEQPACKET`` socket is used, which preserves packet boundaries, so one
+packet is transferred per message. A ``SOCK_STREAM`` socket can be used on platforms without
+``SOCK_SEQPACKET`` support, for example macOS. Space packet framing is used in that case.
+"""
+
+from __future__ import annotations
+
+import enum
+import logging
+import select
+import socket
+from typing import Any
+
+from com_interface import ComInterface, SendError
+
+from tmtccmd.com.framing import split_space_packets
+from tmtccmd.config.defs import CoreComInterfaces
+from tmtccmd.config.loader import load_tmtc_file_cfg
+from tmtccmd.util.json import check_json_file
+
+_LOGGER = logging.getLogger(__name__)
+
+UDS_MAX_PACKET_SIZE = 65536
+
+
+class UnixSocketType(enum.Enum):
+    SEQPACKET = "seqpacket"
+    STREAM = "stream"
+
+
+class UnixSocketClient(ComInterface):
+    """Client for a Unix domain socket server, for example a simulator.
+
+    :param socket_path: Path of the socket of the server
+    :param socket_type: Socket type of the server
+    :param com_if_id: ID of the interface
+    """
+
+    def __init__(
+        self,
+        socket_path: str,
+        socket_type: UnixSocketType = UnixSocketType.SEQPACKET,
+        com_if_id: str = CoreComInterfaces.UNIX.value,
+    ):
+        self.socket_path = socket_path
+        self.socket_type = socket_type
+        self.com_if_id = com_if_id
+        self._socket: socket.socket | None = None
+        self._stream_buf = bytearray()
+
+    @property
+    def id(self) -> str:
+        return self.com_if_id
+
+    def initialize(self, args: Any = 0) -> Any:
+        pass
+
+    def open(self, args: Any = 0) -> None:
+        """
+        :raises OSError: Connecting to the server failed
+        """
+        if self._socket is not None:
+            return
+        sock_type = (
+            socket.SOCK_SEQPACKET
+            if self.socket_type == UnixSocketType.SEQPACKET
+            else socket.SOCK_STREAM
+        )
+        sock = socket.socket(socket.AF_UNIX, sock_type)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        sock.setblocking(False)
+        self._socket = sock
+        self._stream_buf.clear()
+
+    def is_open(self) -> bool:
+        return self._socket is not None
+
+    def close(self, args: Any = 0) -> None:
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def send(self, data: bytes | bytearray) -> None:
+        """
+        :raises SendError: Interface not open or sending failed
+        """
+        if self._socket is None:
+            raise SendError("Unix socket interface is not open", None)
+        try:
+            if self.socket_type == UnixSocketType.SEQPACKET:
+                self._socket.send(data)
+            else:
+                self._socket.sendall(data)
+        except OSError as e:
+            raise SendError(f"sending on Unix socket {self.socket_path} failed: {e}", e) from e
+
+    def packets_available(self, parameters: Any = 0) -> int:
+        if self._socket is None:
+            return 0
+        if self.socket_type == UnixSocketType.STREAM and split_space_packets(
+            bytearray(self._stream_buf)
+        ):
+            return 1
+        ready, _, _ = select.select([self._socket], [], [], 0)
+        return int(bool(ready))
+
+    def receive(self, parameters: Any = 0) -> list[bytes]:
+        if self._socket is None:
+            return []
+        packets = []
+        while True:
+            try:
+                data = self._socket.recv(UDS_MAX_PACKET_SIZE)
+            except BlockingIOError:
+                break
+            except ConnectionResetError:
+                data = b""
+            if not data:
+                _LOGGER.warning(f"Unix socket {self.socket_path} was closed by the server")
+                self.close()
+                break
+            if self.socket_type == UnixSocketType.SEQPACKET:
+                packets.append(data)
+            else:
+                self._stream_buf.extend(data)
+        if self.socket_type == UnixSocketType.STREAM:
+            packets.extend(split_space_packets(self._stream_buf))
+        return packets
+
+
+def determine_unix_socket_path(cfg_path: str) -> str | None:
+    if cfg_path.endswith("json"):
+        return load_unix_socket_path_json(json_cfg_path=cfg_path)
+    elif cfg_path.endswith("toml"):
+        return load_unix_socket_path_from_toml(toml_cfg_path=cfg_path)
+    else:
+        raise ValueError(f"invalid configuration file {cfg_path}, can only handle JSON or TOML")
+
+
+def determine_unix_socket_type(cfg_path: str) -> UnixSocketType:
+    socket_type = None
+    if cfg_path.endswith("json"):
+        socket_type = load_unix_socket_type_json(json_cfg_path=cfg_path)
+    elif cfg_path.endswith("toml"):
+        socket_type = load_unix_socket_type_from_toml(toml_cfg_path=cfg_path)
+    if socket_type is None:
+        return UnixSocketType.SEQPACKET
+    return socket_type
+
+
+def load_unix_socket_path_from_toml(toml_cfg_path: str) -> str | None:
+    return load_tmtc_file_cfg(toml_cfg_path).unix.path
+
+
+def load_unix_socket_type_from_toml(toml_cfg_path: str) -> UnixSocketType | None:
+    return _to_socket_type(load_tmtc_file_cfg(toml_cfg_path).unix.socket_type)
+
+
+def load_unix_socket_path_json(json_cfg_path: str) -> str | None:
+    if not check_json_file(json_cfg_path=json_cfg_path):
+        return None
+    return load_tmtc_file_cfg(json_cfg_path).unix.path
+
+
+def load_unix_socket_type_json(json_cfg_path: str) -> UnixSocketType | None:
+    if not check_json_file(json_cfg_path=json_cfg_path):
+        return None
+    return _to_socket_type(load_tmtc_file_cfg(json_cfg_path).unix.socket_type)
+
+
+def _to_socket_type(socket_type: str | None) -> UnixSocketType | None:
+    if socket_type is None:
+        return None
+    try:
+        return UnixSocketType(socket_type)
+    except ValueError:
+        return None
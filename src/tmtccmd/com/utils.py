@@ -1,12 +1,8 @@
 import json
 import logging
 
-try:
-    import tomllib  # Python 3.11+
-except ModuleNotFoundError:
-    import tomli as tomllib  # Fallback for older versions
-
 from tmtccmd.config.defs import ComIfDictT, CoreComInterfaces
+from tmtccmd.config.loader import load_tmtc_file_cfg
 from tmtccmd.util.conf_util import wrapped_prompt
 from tmtccmd.util.json import JsonKeyNames, check_json_file
 
@@ -32,27 +28,13 @@ def determine_com_if(com_if_dict: ComIfDictT, cfg_path: str, use_prompts: bool)
 def load_com_if_from_json(cfg_path: str) -> str | None:
     if not check_json_file(cfg_path):
         return None
-    with open(cfg_path) as read:
-        com_if_string = ""
-        try:
-            load_data = json.load(read)
-            com_if_string = load_data[JsonKeyNames.COM_IF.value]
-        except KeyError:
-            return None
-        com_if_string = str(com_if_string)
-    return com_if_string
+    return load_tmtc_file_cfg(cfg_path).com_if
 
 
 def load_com_if_from_toml(cfg_path: str) -> str | None:
     if not cfg_path.endswith(".toml"):
         return None
-    try:
-        with open(cfg_path, "rb") as read:
-            load_data = tomllib.load(read)
-            com_if_string = load_data["tmtc"]["interface"]
-    except (FileNotFoundError, KeyError, tomllib.TOMLDecodeError):
-        return None
-    return str(com_if_string)
+    return load_tmtc_file_cfg(cfg_path).com_if
 
 
 def prompt_com_if(com_if_dict: ComIfDictT) -> str:
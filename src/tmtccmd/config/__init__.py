@@ -8,34 +8,11 @@ Submodules:
   and arguments converts to create the data structures expected by this library from passed CLI
   arguments."""
 
-import logging
-from pathlib import Path
-from typing import Optional
-
-from cfdppy.request import PutRequest
-from spacepackets.cfdp import CfdpLv
-from spacepackets.cfdp.tlv import ProxyPutRequest, ProxyPutRequestParams
-from spacepackets.util import UnsignedByteField
-
-from tmtccmd.cfdp.request import PutRequestCfgWrapper
-from tmtccmd.core import TcMode, TmMode
-from tmtccmd.core.base import ModeWrapper
-from tmtccmd.tmtc.procedure import (
-    CfdpProcedure,
-    ProcedureWrapper,
-    TcProcedureType,
-    TreeCommandingProcedure,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
 
-from .args import (
-    PreArgsParsingWrapper,
-    ProcedureParamsWrapper,
-    SetupParams,
-    TreeCommandingParams,
-    add_default_tmtccmd_args,
-    create_default_args_parser,
-    parse_default_tmtccmd_input_arguments,
-)
 from .defs import (
     CORE_COM_IF_DICT,
     CfdpParams,
@@ -45,11 +22,66 @@ from .defs import (
     CoreModeConverter,
     default_json_path,
 )
-from .hook import HookBase
 from .tmtc import CmdTreeNode
 
+if TYPE_CHECKING:
+    from tmtccmd.core.base import ModeWrapper
+    from tmtccmd.tmtc.procedure import CfdpProcedure, ProcedureWrapper, TreeCommandingProcedure
+
+    from .args import (
+        PreArgsParsingWrapper,
+        ProcedureParamsWrapper,
+        SetupParams,
+        TreeCommandingParams,
+        add_default_tmtccmd_args,
+        create_default_args_parser,
+        parse_default_tmtccmd_input_arguments,
+    )
+    from .hook import HookBase
+
+# The argument parser helpers and the hook base pull in prompt_toolkit, cfdppy and all
+# communication interfaces. They are only imported when accessed for the first time.
+_LAZY_ATTRS = {
+    "PreArgsParsingWrapper": "tmtccmd.config.args",
+    "ProcedureParamsWrapper": "tmtccmd.config.args",
+    "SetupParams": "tmtccmd.config.args",
+    "TreeCommandingParams": "tmtccmd.config.args",
+    "add_default_tmtccmd_args": "tmtccmd.config.args",
+    "create_default_args_parser": "tmtccmd.config.args",
+    "parse_default_tmtccmd_input_arguments": "tmtccmd.config.args",
+    "HookBase": "tmtccmd.config.hook",
+    "PutRequest": "cfdppy.request",
+    "CfdpLv": "spacepackets.cfdp",
+    "ProxyPutRequest": "spacepackets.cfdp.tlv",
+    "ProxyPutRequestParams": "spacepackets.cfdp.tlv",
+    "UnsignedByteField": "spacepackets.util",
+    "PutRequestCfgWrapper": "tmtccmd.cfdp.request",
+    "TcMode": "tmtccmd.core",
+    "TmMode": "tmtccmd.core",
+    "ModeWrapper": "tmtccmd.core.base",
+    "CfdpProcedure": "tmtccmd.tmtc.procedure",
+    "ProcedureWrapper": "tmtccmd.tmtc.procedure",
+    "TcProcedureType": "tmtccmd.tmtc.procedure",
+    "TreeCommandingProcedure": "tmtccmd.tmtc.procedure",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_ATTRS})
+
 
 def backend_mode_conversion(mode: str, mode_wrapper: ModeWrapper):
+    from tmtccmd.core import TcMode, TmMode
+
     if mode == CoreModeConverter.get_str(CoreMode.LISTENER_MODE):
         mode_wrapper.tm_mode = TmMode.LISTENER
         mode_wrapper.tc_mode = TcMode.IDLE
@@ -89,10 +121,15 @@ class SetupWrapper:
 
 
 def tmtc_params_to_procedure(params: TreeCommandingParams) -> TreeCommandingProcedure:
+    from tmtccmd.tmtc.procedure import TreeCommandingProcedure
+
     return TreeCommandingProcedure(cmd_path=params.cmd_path)
 
 
 def cfdp_put_req_params_to_procedure(params: CfdpParams) -> CfdpProcedure:
+    from tmtccmd.cfdp.request import PutRequestCfgWrapper
+    from tmtccmd.tmtc.procedure import CfdpProcedure
+
     proc_info = CfdpProcedure()
     proc_info.request_wrapper.base = PutRequestCfgWrapper(params)
     return proc_info
@@ -101,6 +138,8 @@ def cfdp_put_req_params_to_procedure(params: CfdpParams) -> CfdpProcedure:
 def params_to_procedure_conversion(
     param_wrapper: ProcedureParamsWrapper,
 ) -> ProcedureWrapper:
+    from tmtccmd.tmtc.procedure import ProcedureWrapper, TcProcedureType
+
     proc_wrapper = ProcedureWrapper(None)
     if param_wrapper.ptype == TcProcedureType.TREE_COMMANDING:
         tree_cmd_params = param_wrapper.tree_commanding_params()
@@ -8,13 +8,14 @@ import os
 import sys
 from collections.abc import Sequence
 from dataclasses import dataclass
+from typing import TextIO
 
 from com_interface import ComInterface
 from prompt_toolkit.shortcuts import CompleteStyle
 from spacepackets.cfdp import TransmissionMode
 
 from tmtccmd.com.utils import determine_com_if
-from tmtccmd.config.prompt import prompt_cmd_path
+from tmtccmd.config.prompt import print_tree, prompt_cmd_path
 from tmtccmd.config.tmtc import CmdTreeNode
 from tmtccmd.tmtc.procedure import TcProcedureType
 
@@ -88,6 +89,8 @@ class CommandingParams:
     print_tree: bool = False
     tree_print_with_description: bool = True
     tree_print_max_depth: int | None = None
+    tree_print_use_pager: bool = False
+    batch_script: str | None = None
 
 
 @dataclass
@@ -215,9 +218,19 @@ def add_tree_commanding_arguments(parser_or_subparser: argparse.ArgumentParser):
         nargs="*",
         default=None,
         help=(
-            f"Optional arguments [b] [p] [<numMaxDepth>]. Print the command definition tree. You "
-            f"can{os.linesep}optionally add b to omit descriptions, p to display hidden nodes, "
-            f"and a maximum print depth."
+            f"Optional arguments [b] [p] [l] [<numMaxDepth>]. Print the command definition tree. "
+            f"You{os.linesep}can optionally add b to omit descriptions, p to display hidden "
+            f"nodes, l to display{os.linesep}the tree in a pager and a maximum print depth."
+        ),
+    )
+    parser_or_subparser.add_argument(
+        "-b",
+        "--batch",
+        dest="batch_script",
+        default=None,
+        help=(
+            "Batch script with one command path per line, which are sent one after another "
+            "without prompts"
         ),
     )
     add_tmtc_mode_arguments(parser_or_subparser)
@@ -495,8 +508,12 @@ def args_to_all_params_tmtc(
         for arg in pargs.print_tree:
             if "b" in arg:
                 params.cmd_params.tree_print_with_description = False
+            if "l" in arg:
+                params.cmd_params.tree_print_use_pager = True
             if arg.isdigit():
                 params.cmd_params.tree_print_max_depth = int(arg)
+    # Namespaces created by older or custom parsers might not contain the batch argument.
+    params.cmd_params.batch_script = getattr(pargs, "batch_script", None)
     mode_set_explicitely = False
     if pargs.mode is None:
         params.mode = CoreModeConverter.get_str(CoreMode.ONE_QUEUE_MODE)
@@ -506,6 +523,7 @@ def args_to_all_params_tmtc(
     if (
         params.backend_params.listener
         and (not pargs.cmd_path)
+        and (not params.cmd_params.batch_script)
         and not mode_set_explicitely
         and (not pargs.prompt_proc)
     ):
@@ -520,6 +538,7 @@ def args_to_all_params_tmtc(
     if (
         params.mode != CoreModeConverter.get_str(CoreMode.LISTENER_MODE)
         and not params.cmd_params.print_tree
+        and not params.cmd_params.batch_script
     ):
         determine_cmd_path(
             params=params,
@@ -530,7 +549,13 @@ def args_to_all_params_tmtc(
         )
 
 
-def perform_tree_printout(cmd_params: CommandingParams, cmd_def_tree: CmdTreeNode):
+def perform_tree_printout(
+    cmd_params: CommandingParams, cmd_def_tree: CmdTreeNode, stream: TextIO | None = None
+):
+    """Print the command tree line by line with the tree printout parameters.
+
+    :param stream: Stream for the printout, :py:data:`sys.stdout` if None
+    """
     if cmd_params.tree_print_with_description:
         info_str = "with full descriptions"
     else:
@@ -538,11 +563,12 @@ def perform_tree_printout(cmd_params: CommandingParams, cmd_def_tree: CmdTreeNod
     if cmd_params.tree_print_max_depth is not None:
         info_str += f" and maximum depth {cmd_params.tree_print_max_depth}"
     print(f"Printing command tree {info_str}:")
-    print(
-        cmd_def_tree.str_for_tree(
-            cmd_params.tree_print_with_description,
-            cmd_params.tree_print_max_depth,
-        )
+    print_tree(
+        cmd_def_tree,
+        cmd_params.tree_print_with_description,
+        cmd_params.tree_print_max_depth,
+        use_pager=cmd_params.tree_print_use_pager,
+        stream=stream,
     )
 
 
@@ -6,6 +6,7 @@ from typing import cast
 from com_interface import ComInterface
 from com_interface.serial_base import (
     SerialCfg,
+    SerialCommunicationType,
 )
 from com_interface.serial_cobs import SerialCobsComIF
 from com_interface.serial_dle import SerialDleComIF
@@ -13,13 +14,22 @@ from com_interface.tcp import TcpSpacepacketsClient
 from com_interface.udp import UdpClient
 from spacepackets.ccsds import PacketId
 
+from tmtccmd.com.reconnect import ReconnectCfg, ReconnectingComInterface
 from tmtccmd.com.ser_utils import determine_baud_rate, determine_com_port
+from tmtccmd.com.serial_stream import StreamingSerialComIF
+from tmtccmd.com.shm import SharedMemoryComInterface, ShmCfg, load_shm_cfg
 from tmtccmd.com.tcpip_utils import (
     EthAddr,
     TcpIpType,
     determine_tcp_send_address,
     determine_udp_send_address,
 )
+from tmtccmd.com.uds import (
+    UnixSocketClient,
+    UnixSocketType,
+    determine_unix_socket_path,
+    determine_unix_socket_type,
+)
 from tmtccmd.config.defs import CoreComInterfaces
 
 _LOGGER = logging.getLogger(__name__)
@@ -59,18 +69,52 @@ class TcpipConfig(ComConfigCommon):
 
 
 class SerialConfigCommon(ComConfigCommon):
-    def __init__(self, com_if_key: str, config_path: str, serial_cfg: SerialCfg):
+    """
+    :param stream_deframing: Use the :py:class:`tmtccmd.com.serial_stream.StreamingSerialComIF`
+        instead of the default serial interfaces of the ``com-interface`` library
+    """
+
+    def __init__(
+        self,
+        com_if_key: str,
+        config_path: str,
+        serial_cfg: SerialCfg,
+        stream_deframing: bool = False,
+    ):
         super().__init__(com_if_key=com_if_key, cfg_path=config_path)
         self.serial_cfg = serial_cfg
+        self.stream_deframing = stream_deframing
 
 
 class DummyConfig(ComConfigCommon):
     pass
 
 
+class SharedMemoryConfig(ComConfigCommon):
+    def __init__(self, com_if_key: str, config_path: str, shm_cfg: ShmCfg):
+        super().__init__(com_if_key=com_if_key, cfg_path=config_path)
+        self.shm_cfg = shm_cfg
+
+
+class UnixSocketConfig(ComConfigCommon):
+    def __init__(
+        self,
+        com_if_key: str,
+        config_path: str,
+        socket_path: str,
+        socket_type: UnixSocketType = UnixSocketType.SEQPACKET,
+    ):
+        super().__init__(com_if_key=com_if_key, cfg_path=config_path)
+        self.socket_path = socket_path
+        self.socket_type = socket_type
+
+
+ComConfigT = TcpipConfig | SerialConfigCommon | DummyConfig | SharedMemoryConfig | UnixSocketConfig
+
+
 def create_com_interface_config_default(
     com_if_key: str, cfg_path: str, space_packet_ids: Sequence[PacketId] | None
-) -> TcpipConfig | SerialConfigCommon | DummyConfig | None:
+) -> ComConfigT | None:
     if com_if_key == CoreComInterfaces.DUMMY.value:
         return DummyConfig(com_if_key=com_if_key, cfg_path=cfg_path)
     elif com_if_key == CoreComInterfaces.UDP.value:
@@ -99,21 +143,47 @@ def create_com_interface_config_default(
         # those values
         cfg = default_serial_cfg_baud_and_port_setup(com_if_id=com_if_key, cfg_path=cfg_path)
         return SerialConfigCommon(com_if_key=com_if_key, config_path=cfg_path, serial_cfg=cfg)
+    elif com_if_key == CoreComInterfaces.SHARED_MEMORY.value:
+        return SharedMemoryConfig(
+            com_if_key=com_if_key, config_path=cfg_path, shm_cfg=load_shm_cfg(cfg_path)
+        )
+    elif com_if_key == CoreComInterfaces.UNIX.value:
+        socket_path = determine_unix_socket_path(cfg_path)
+        if socket_path is None:
+            return None
+        return UnixSocketConfig(
+            com_if_key=com_if_key,
+            config_path=cfg_path,
+            socket_path=socket_path,
+            socket_type=determine_unix_socket_type(cfg_path),
+        )
     else:
         return None
 
 
 def create_com_interface_default(
-    config: TcpipConfig | SerialConfigCommon | DummyConfig,
+    config: ComConfigT,
+    reconnect_cfg: ReconnectCfg | None = None,
 ) -> ComInterface | None:
     """Return the desired communication interface object
 
     :param cfg: Generic configuration
+    :param reconnect_cfg: If this is set, the interface is wrapped by a
+        :py:class:`tmtccmd.com.reconnect.ReconnectingComInterface`, which opens the interface in
+        the background and reconnects it automatically after link failures. A new interface is
+        created for each further connection attempt.
     :return:
     """
     if config.com_if_key == "":
         _LOGGER.warning("COM Interface key string is empty. Using dummy COM interface")
     try:
+        if reconnect_cfg is not None:
+            com_if = __create_com_if(config)
+            if com_if is None:
+                return None
+            return ReconnectingComInterface(
+                com_if, cfg=reconnect_cfg, factory=lambda: __create_com_if(config)
+            )
         return __create_com_if(config)
     except ConnectionRefusedError:
         _LOGGER.exception("TCP/IP connection refused")
@@ -127,7 +197,7 @@ def create_com_interface_default(
         sys.exit(1)
 
 
-def __create_com_if(cfg: TcpipConfig | SerialConfigCommon | DummyConfig) -> ComInterface | None:
+def __create_com_if(cfg: ComConfigT) -> ComInterface | None:
     from tmtccmd.com.dummy import DummyInterface
 
     if (
@@ -144,7 +214,14 @@ def __create_com_if(cfg: TcpipConfig | SerialConfigCommon | DummyConfig) -> ComI
         communication_interface = create_default_serial_interface(
             com_if_key=cfg.com_if_key,
             serial_cfg=cfg.serial_cfg,
+            stream_deframing=cfg.stream_deframing,
         )
+    elif cfg.com_if_key == CoreComInterfaces.SHARED_MEMORY.value:
+        assert isinstance(cfg, SharedMemoryConfig)
+        communication_interface = SharedMemoryComInterface(cfg.shm_cfg)
+    elif cfg.com_if_key == CoreComInterfaces.UNIX.value:
+        assert isinstance(cfg, UnixSocketConfig)
+        communication_interface = UnixSocketClient(cfg.socket_path, cfg.socket_type)
     else:
         communication_interface = DummyInterface()
     if communication_interface is None:
@@ -227,16 +304,26 @@ def create_default_tcpip_interface(tcpip_cfg: TcpipConfig) -> ComInterface | Non
     return communication_interface
 
 
-def create_default_serial_interface(com_if_key: str, serial_cfg: SerialCfg) -> ComInterface | None:
+def create_default_serial_interface(
+    com_if_key: str, serial_cfg: SerialCfg, stream_deframing: bool = False
+) -> ComInterface | None:
     """Create a default serial interface. Requires a certain set of global variables set up. See
     :func:`set_up_serial_cfg` for more details.
 
     :param com_if_key:
     :param serial_cfg: Generic serial configuration parameters
+    :param stream_deframing: Create a :py:class:`tmtccmd.com.serial_stream.StreamingSerialComIF`,
+        which deframes the received data in large chunks instead of byte by byte
     :return:
     """
     try:
-        if com_if_key == CoreComInterfaces.SERIAL_DLE.value:
+        if stream_deframing and com_if_key == CoreComInterfaces.SERIAL_DLE.value:
+            communication_interface = StreamingSerialComIF(
+                serial_cfg, SerialCommunicationType.DLE_ENCODING
+            )
+        elif stream_deframing and com_if_key == CoreComInterfaces.SERIAL_COBS.value:
+            communication_interface = StreamingSerialComIF(serial_cfg, SerialCommunicationType.COBS)
+        elif com_if_key == CoreComInterfaces.SERIAL_DLE.value:
             # Ignore the DLE config for now, it is not that important anyway
             communication_interface = SerialDleComIF(ser_cfg=serial_cfg, dle_cfg=None)
         elif com_if_key == CoreComInterfaces.SERIAL_COBS.value:
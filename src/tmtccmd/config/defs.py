@@ -43,6 +43,8 @@ class CoreComInterfaces(str, enum.Enum):
     SERIAL_COBS = "serial_cobs"
     SERIAL_DLE = "serial_dle"
     SERIAL_QEMU = "serial_qemu"
+    SHARED_MEMORY = "shm"
+    UNIX = "unix"
     UNSPECIFIED = "unspec"
 
 
@@ -53,6 +55,8 @@ CORE_COM_IF_DICT: ComIfMapping = {
     CoreComInterfaces.SERIAL_COBS: ("Serial Interace with COBS encoding", None),
     CoreComInterfaces.SERIAL_DLE: ("Serial Interace with DLE encoding", None),
     CoreComInterfaces.SERIAL_QEMU: ("Serial Interface using QEMU", None),
+    CoreComInterfaces.SHARED_MEMORY: ("Shared memory ring buffers for local simulators", None),
+    CoreComInterfaces.UNIX: ("Unix domain socket", None),
     CoreComInterfaces.UNSPECIFIED: ("Unspecified", None),
 }
 
@@ -0,0 +1,310 @@
+"""Unified loader for the JSON or TOML configuration file.
+
+The configuration file is parsed once into an immutable :py:class:`TmtcFileCfg`. The result is
+cached using the path, the modification time and the size of the file, so repeated lookups, for
+example for the communication interface, the serial port and the baud rate, only need a
+:py:func:`os.stat` call. A changed file is parsed again on the next lookup.
+
+The following keys are supported. TOML files use tables, JSON files use the flat keys of
+:py:class:`tmtccmd.util.json.JsonKeyNames`.
+
+.. list-table::
+   :header-rows: 1
+
+   * - TOML
+     - JSON
+   * - ``tmtc.interface``
+     - ``com_if``
+   * - ``serial.port``, ``serial.baud``, ``serial.hint``
+     - ``serial_port``, ``serial_baudrate``, ``serial_hint``
+   * - ``udp.addr``, ``udp.port``
+     - ``tcpip_udp_ip_addr``, ``tcpip_udp_port``
+   * - ``tcp.addr``, ``tcp.port``
+     - ``tcpip_tcp_ip_addr``, ``tcpip_tcp_port``
+   * - ``shm.path``, ``shm.capacity``
+     - ``shm_path``, ``shm_capacity``
+   * - ``unix.path``, ``unix.type``
+     - ``unix_socket_path``, ``unix_socket_type``
+   * - ``tmtc.delay``
+     - ``inter_cmd_delay``
+   * - ``tmtc.keep_listener_mode``, ``tmtc.keep_multi_queue_mode``
+     - ``keep_listener_mode``, ``keep_multi_queue_mode``
+   * - ``log.level``, ``log.levels``
+     - ``log_level``, ``log_levels``
+
+The runtime settings of :py:class:`RuntimeFileCfg` can be changed while the commander is
+running, see :py:mod:`tmtccmd.config.watcher`.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+import os
+import threading
+from typing import Any
+
+try:
+    import tomllib  # Python 3.11+
+except ModuleNotFoundError:
+    import tomli as tomllib  # Fallback for older versions
+
+from tmtccmd.util.json import JsonKeyNames
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(frozen=True)
+class SerialFileCfg:
+    port: str | None = None
+    baud_rate: int | None = None
+    hint: str | None = None
+
+
+@dataclasses.dataclass(frozen=True)
+class TcpipFileCfg:
+    """
+    :var send_addr: Destination address as an IP address and port tuple
+    :var recv_addr: Receive address as an IP address and port tuple, only supported for UDP
+    :var recv_max_size: Maximum receive size, only supported for JSON files
+    """
+
+    send_addr: tuple[str, int] | None = None
+    recv_addr: tuple[str, int] | None = None
+    recv_max_size: int | None = None
+
+
+@dataclasses.dataclass(frozen=True)
+class ShmFileCfg:
+    path: str | None = None
+    capacity: int | None = None
+
+
+@dataclasses.dataclass(frozen=True)
+class UnixFileCfg:
+    path: str | None = None
+    socket_type: str | None = None
+
+
+@dataclasses.dataclass(frozen=True)
+class RuntimeFileCfg:
+    """Settings which can be applied to a running :py:class:`tmtccmd.CcsdsTmtcWorker`.
+
+    :var inter_cmd_delay: Delay between telecommands in seconds
+    :var keep_listener_mode: See :py:attr:`tmtccmd.CcsdsTmtcWorker.keep_listener_mode`
+    :var keep_multi_queue_mode: See :py:attr:`tmtccmd.CcsdsTmtcWorker.keep_multi_queue_mode`
+    :var log_level: Level of the root logger, for example ``"DEBUG"``. Numeric levels are kept
+        as integers, so levels without a name can be used as well
+    :var log_levels: Logger name and level pairs for specific loggers
+    """
+
+    inter_cmd_delay: float | None = None
+    keep_listener_mode: bool | None = None
+    keep_multi_queue_mode: bool | None = None
+    log_level: str | int | None = None
+    log_levels: tuple[tuple[str, str | int], ...] = ()
+
+
+@dataclasses.dataclass(frozen=True)
+class TmtcFileCfg:
+    """Parsed configuration file. Values which are missing or have an invalid type are None.
+
+    :var path: Path of the configuration file
+    :var valid: The file exists and could be parsed
+    :var com_if: Communication interface key
+    """
+
+    path: str = ""
+    valid: bool = False
+    com_if: str | None = None
+    serial: SerialFileCfg = dataclasses.field(default_factory=SerialFileCfg)
+    udp: TcpipFileCfg = dataclasses.field(default_factory=TcpipFileCfg)
+    tcp: TcpipFileCfg = dataclasses.field(default_factory=TcpipFileCfg)
+    shm: ShmFileCfg = dataclasses.field(default_factory=ShmFileCfg)
+    unix: UnixFileCfg = dataclasses.field(default_factory=UnixFileCfg)
+    runtime: RuntimeFileCfg = dataclasses.field(default_factory=RuntimeFileCfg)
+
+
+_CACHE_LOCK = threading.Lock()
+_CACHE: dict[str, tuple[tuple[int, int], TmtcFileCfg]] = {}
+
+
+def load_tmtc_file_cfg(cfg_path: str) -> TmtcFileCfg:
+    """Load the configuration file, using the cached result if the file did not change.
+
+    Files with the ``.toml`` suffix are parsed as TOML, all other files as JSON. A configuration
+    with :py:attr:`TmtcFileCfg.valid` set to False is returned if the file does not exist or can
+    not be parsed.
+    """
+    try:
+        stat = os.stat(cfg_path)
+    except OSError:
+        return TmtcFileCfg(path=cfg_path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    with _CACHE_LOCK:
+        cached = _CACHE.get(cfg_path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    cfg = _parse_file(cfg_path)
+    with _CACHE_LOCK:
+        _CACHE[cfg_path] = (key, cfg)
+    return cfg
+
+
+def clear_tmtc_file_cfg_cache():
+    with _CACHE_LOCK:
+        _CACHE.clear()
+
+
+def _parse_file(cfg_path: str) -> TmtcFileCfg:
+    try:
+        if cfg_path.endswith("toml"):
+            with open(cfg_path, "rb") as f:
+                return _from_toml(cfg_path, tomllib.load(f))
+        with open(cfg_path) as f:
+            data = json.load(f)
+    except (OSError, UnicodeDecodeError, tomllib.TOMLDecodeError, json.JSONDecodeError) as e:
+        _LOGGER.warning(f"Could not parse configuration file {cfg_path}: {e}")
+        return TmtcFileCfg(path=cfg_path)
+    if not isinstance(data, dict):
+        _LOGGER.warning(f"Configuration file {cfg_path} does not contain a JSON object")
+        return TmtcFileCfg(path=cfg_path)
+    return _from_json(cfg_path, data)
+
+
+def _opt_str(value: Any) -> str | None:
+    if value is None or isinstance(value, (dict, list)):
+        return None
+    return str(value)
+
+
+def _opt_int(value: Any) -> int | None:
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _opt_float(value: Any) -> float | None:
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _opt_bool(value: Any) -> bool | None:
+    return value if isinstance(value, bool) else None
+
+
+def _opt_log_level(value: Any) -> str | int | None:
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value if value >= 0 else None
+    if not isinstance(value, str) or not isinstance(logging.getLevelName(value.upper()), int):
+        return None
+    return value.upper()
+
+
+def _log_levels(value: Any) -> tuple[tuple[str, str | int], ...]:
+    if not isinstance(value, dict):
+        return ()
+    levels = []
+    for name, level in value.items():
+        level = _opt_log_level(level)
+        if level is not None:
+            levels.append((str(name), level))
+    return tuple(levels)
+
+
+def _opt_addr(addr: Any, port: Any) -> tuple[str, int] | None:
+    addr = _opt_str(addr)
+    port = _opt_int(port)
+    if addr is None or port is None:
+        return None
+    return addr, port
+
+
+def _table(data: dict[str, Any], name: str) -> dict[str, Any]:
+    table = data.get(name)
+    return table if isinstance(table, dict) else {}
+
+
+def _from_toml(cfg_path: str, data: dict[str, Any]) -> TmtcFileCfg:
+    serial = _table(data, "serial")
+    udp = _table(data, "udp")
+    tcp = _table(data, "tcp")
+    shm = _table(data, "shm")
+    unix = _table(data, "unix")
+    tmtc = _table(data, "tmtc")
+    log = _table(data, "log")
+    return TmtcFileCfg(
+        path=cfg_path,
+        valid=True,
+        com_if=_opt_str(tmtc.get("interface")),
+        serial=SerialFileCfg(
+            port=_opt_str(serial.get("port")),
+            baud_rate=_opt_int(serial.get("baud")),
+            hint=_opt_str(serial.get("hint")),
+        ),
+        udp=TcpipFileCfg(send_addr=_opt_addr(udp.get("addr"), udp.get("port"))),
+        tcp=TcpipFileCfg(send_addr=_opt_addr(tcp.get("addr"), tcp.get("port"))),
+        shm=ShmFileCfg(path=_opt_str(shm.get("path")), capacity=_opt_int(shm.get("capacity"))),
+        unix=UnixFileCfg(path=_opt_str(unix.get("path")), socket_type=_opt_str(unix.get("type"))),
+        runtime=RuntimeFileCfg(
+            inter_cmd_delay=_opt_float(tmtc.get("delay")),
+            keep_listener_mode=_opt_bool(tmtc.get("keep_listener_mode")),
+            keep_multi_queue_mode=_opt_bool(tmtc.get("keep_multi_queue_mode")),
+            log_level=_opt_log_level(log.get("level")),
+            log_levels=_log_levels(log.get("levels")),
+        ),
+    )
+
+
+def _from_json(cfg_path: str, data: dict[str, Any]) -> TmtcFileCfg:
+    def get(key: JsonKeyNames) -> Any:
+        return data.get(key.value)
+
+    return TmtcFileCfg(
+        path=cfg_path,
+        valid=True,
+        com_if=_opt_str(get(JsonKeyNames.COM_IF)),
+        serial=SerialFileCfg(
+            port=_opt_str(get(JsonKeyNames.SERIAL_PORT)),
+            baud_rate=_opt_int(get(JsonKeyNames.SERIAL_BAUDRATE)),
+            hint=_opt_str(get(JsonKeyNames.SERIAL_HINT)),
+        ),
+        udp=TcpipFileCfg(
+            send_addr=_opt_addr(
+                get(JsonKeyNames.TCPIP_UDP_DEST_IP_ADDRESS), get(JsonKeyNames.TCPIP_UDP_DEST_PORT)
+            ),
+            recv_addr=_opt_addr(
+                get(JsonKeyNames.TCPIP_UDP_RECV_IP_ADDRESS), get(JsonKeyNames.TCPIP_UDP_RECV_PORT)
+            ),
+            recv_max_size=_opt_int(get(JsonKeyNames.TCPIP_UDP_RECV_MAX_SIZE)),
+        ),
+        tcp=TcpipFileCfg(
+            send_addr=_opt_addr(
+                get(JsonKeyNames.TCPIP_TCP_DEST_IP_ADDRESS), get(JsonKeyNames.TCPIP_TCP_DEST_PORT)
+            ),
+            recv_max_size=_opt_int(get(JsonKeyNames.TCPIP_TCP_RECV_MAX_SIZE)),
+        ),
+        shm=ShmFileCfg(
+            path=_opt_str(get(JsonKeyNames.SHM_PATH)),
+            capacity=_opt_int(get(JsonKeyNames.SHM_CAPACITY)),
+        ),
+        unix=UnixFileCfg(
+            path=_opt_str(get(JsonKeyNames.UNIX_SOCKET_PATH)),
+            socket_type=_opt_str(get(JsonKeyNames.UNIX_SOCKET_TYPE)),
+        ),
+        runtime=RuntimeFileCfg(
+            inter_cmd_delay=_opt_float(get(JsonKeyNames.INTER_CMD_DELAY)),
+            keep_listener_mode=_opt_bool(get(JsonKeyNames.KEEP_LISTENER_MODE)),
+            keep_multi_queue_mode=_opt_bool(get(JsonKeyNames.KEEP_MULTI_QUEUE_MODE)),
+            log_level=_opt_log_level(get(JsonKeyNames.LOG_LEVEL)),
+            log_levels=_log_levels(get(JsonKeyNames.LOG_LEVELS)),
+        ),
+    )
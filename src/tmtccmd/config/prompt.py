@@ -1,9 +1,18 @@
 from __future__ import annotations
 
+import bisect
+import contextlib
+import heapq
+import itertools
 import logging
 import os
 import re
-from collections.abc import Iterable
+import shlex
+import subprocess
+import sys
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from typing import TextIO
 
 import prompt_toolkit
 from prompt_toolkit.completion import (
@@ -133,32 +142,249 @@ class NestedCompleter(Completer):
             yield from completer.get_completions(document, complete_event)
 
 
+class _ChildIndex:
+    """Search index for the child names of one node.
+
+    :var names: Child names in tree order
+    :var sorted_names: Sorted folded names, used to find all names starting with a word with a
+        binary search
+    :var order: Position of each sorted name in the tree order
+    :var blob: Folded names joined with line feeds, used to search substrings and fuzzy matches
+        with the string and regular expression search functions
+    :var offsets: Start offset of each name in the blob
+    """
+
+    def __init__(self, node: CmdTreeNode, ignore_case: bool):
+        self.names = list(node.children)
+        folded = [name.lower() for name in self.names] if ignore_case else self.names
+        self.order = sorted(range(len(folded)), key=folded.__getitem__)
+        self.sorted_names = [folded[idx] for idx in self.order]
+        self.blob = "\n".join(folded)
+        self.offsets = [0, *itertools.accumulate(len(name) + 1 for name in folded[:-1])]
+
+    def prefix_matches(self, word: str) -> list[int]:
+        start = bisect.bisect_left(self.sorted_names, word)
+        end = bisect.bisect_left(self.sorted_names, word + "\U0010ffff", lo=start)
+        return self.order[start:end]
+
+    def substring_matches(self, word: str) -> Iterator[int]:
+        pos = self.blob.find(word)
+        while pos >= 0:
+            idx = bisect.bisect_right(self.offsets, pos) - 1
+            yield idx
+            if idx + 1 >= len(self.offsets):
+                return
+            pos = self.blob.find(word, self.offsets[idx + 1])
+
+    def pattern_matches(self, pattern: re.Pattern[str]) -> Iterator[int]:
+        match = pattern.search(self.blob)
+        while match is not None:
+            idx = bisect.bisect_right(self.offsets, match.start()) - 1
+            yield idx
+            if idx + 1 >= len(self.offsets):
+                return
+            match = pattern.search(self.blob, self.offsets[idx + 1])
+
+
+class CmdTreeCompleter(Completer):
+    """Completer for slash separated command paths which walks the :py:class:`CmdTreeNode`
+    lazily. Contrary to a :py:class:`NestedCompleter` created from the
+    :py:attr:`CmdTreeNode.name_dict`, nothing is built up-front. Only the children of the node
+    for the path typed so far are considered, and the node is looked up with the path index of
+    the tree.
+
+    The completions are ordered by the match type and then by the order of the children: Names
+    starting with the typed word come first, followed by names containing the word and, if
+    fuzzy matching is enabled, names which contain the characters of the word in the same
+    order. The names starting with the word are found with a sorted prefix index, which is
+    built for each node on first use together with a search string of all child names. The
+    search stops once the maximum number of completions was found.
+
+    The results are cached for each path and word. If a word is extended and the result of the
+    shorter word is complete, only that result is filtered, because every match of the longer
+    word also matches the shorter word.
+
+    The tree should not be modified while the completer is used, because the indices and cached
+    results are not invalidated.
+
+    :param root: Root node of the command tree
+    :param ignore_case: Ignore the case when matching names
+    :param fuzzy: Also complete names which contain the characters of the word in order
+    :param max_completions: Maximum number of completions, None for no limit
+    :param cache_size: Maximum number of cached results
+    """
+
+    def __init__(
+        self,
+        root: CmdTreeNode,
+        ignore_case: bool = True,
+        fuzzy: bool = True,
+        max_completions: int | None = 1000,
+        cache_size: int = 256,
+    ):
+        self.root = root
+        self.ignore_case = ignore_case
+        self.fuzzy = fuzzy
+        self.max_completions = max_completions
+        self.cache_size = cache_size
+        self._child_indices: dict[str, _ChildIndex] = {}
+        # Child positions of the matches and whether the result is complete.
+        self._results: OrderedDict[tuple[str, str], tuple[list[int], bool]] = OrderedDict()
+
+    def get_completions(
+        self, document: Document, complete_event: CompleteEvent
+    ) -> Iterable[Completion]:
+        text = document.text_before_cursor.lstrip("/")
+        parent_path, _, word = text.rpartition("/")
+        node = self.root.extract_subnode(parent_path) if parent_path else self.root
+        if node is None or node.is_leaf():
+            return
+        for name in self.matches(node, parent_path, word):
+            yield Completion(
+                name, start_position=-len(word), display_meta=node.children[name].description
+            )
+
+    def matches(self, node: CmdTreeNode, path: str, word: str) -> list[str]:
+        """Matching child names of the node at the given path, ordered by the match type."""
+        if word == "":
+            return list(node.children)[: self.max_completions]
+        if self.ignore_case:
+            word = word.lower()
+        key = (path, word)
+        cached = self._results.get(key)
+        if cached is None:
+            cached = self._search(node, path, word)
+            self._results[key] = cached
+            if len(self._results) > self.cache_size:
+                self._results.popitem(last=False)
+        else:
+            self._results.move_to_end(key)
+        index = self._child_indices[path]
+        return [index.names[idx] for idx in cached[0]]
+
+    def _search(self, node: CmdTreeNode, path: str, word: str) -> tuple[list[int], bool]:
+        index = self._child_indices.get(path)
+        if index is None:
+            index = _ChildIndex(node, self.ignore_case)
+            self._child_indices[path] = index
+        for length in range(len(word) - 1, 0, -1):
+            shorter = self._results.get((path, word[:length]))
+            if shorter is not None and shorter[1]:
+                return self._filter(index, shorter[0], word), True
+            if shorter is not None:
+                break
+        limit = self.max_completions
+        prefix_idxs = index.prefix_matches(word)
+        if limit is not None and len(prefix_idxs) > limit:
+            return heapq.nsmallest(limit, prefix_idxs), False
+        prefix_idxs.sort()
+        result = prefix_idxs
+        found = set(prefix_idxs)
+        other_matches: list[Iterator[int]] = [index.substring_matches(word)]
+        if self.fuzzy and len(word) > 1:
+            other_matches.append(index.pattern_matches(self._fuzzy_pattern(word)))
+        for matches in other_matches:
+            for idx in matches:
+                if idx in found:
+                    continue
+                if limit is not None and len(result) >= limit:
+                    return result, False
+                found.add(idx)
+                result.append(idx)
+        return result, True
+
+    def _filter(self, index: _ChildIndex, candidates: list[int], word: str) -> list[int]:
+        prefix_matches = []
+        substring_matches = []
+        fuzzy_matches = []
+        fuzzy_pattern = self._fuzzy_pattern(word)
+        for idx in sorted(candidates):
+            name = index.blob[index.offsets[idx] : index.offsets[idx] + len(index.names[idx])]
+            if name.startswith(word):
+                prefix_matches.append(idx)
+            elif word in name:
+                substring_matches.append(idx)
+            elif self.fuzzy and fuzzy_pattern.search(name):
+                fuzzy_matches.append(idx)
+        return prefix_matches + substring_matches + fuzzy_matches
+
+    @staticmethod
+    def _fuzzy_pattern(word: str) -> re.Pattern[str]:
+        return re.compile("[^\n]*?".join(map(re.escape, word)))
+
+
+def print_tree(
+    cmd_def_tree: CmdTreeNode,
+    with_description: bool,
+    max_depth: int | None = None,
+    show_hidden_elements: bool = False,
+    use_pager: bool = False,
+    stream: TextIO | None = None,
+):
+    """Print the command tree line by line, without building the whole printout in memory.
+
+    :param use_pager: Pipe the printout into the pager specified by the ``PAGER`` environment
+        variable, or ``less`` or ``more`` if it is not set. The printout is written to the
+        stream if the pager can not be started.
+    :param stream: Stream for the printout, :py:data:`sys.stdout` if None
+    """
+    if use_pager:
+        pager_cmd = os.environ.get("PAGER") or ("more.com" if os.name == "nt" else "less")
+        try:
+            pager = subprocess.Popen(
+                pager_cmd if os.name == "nt" else shlex.split(pager_cmd),
+                stdin=subprocess.PIPE,
+                encoding=sys.stdout.encoding or "utf-8",
+                errors="replace",
+            )
+        except OSError as e:
+            _LOGGER.warning(f"Could not start pager {pager_cmd!r}: {e}")
+        else:
+            assert pager.stdin is not None
+            # The pager can be closed before the whole tree was written. Closing the input
+            # flushes the buffered rest of the printout, which can fail for the same reason.
+            try:
+                with contextlib.suppress(BrokenPipeError):
+                    cmd_def_tree.write_tree(
+                        pager.stdin, with_description, max_depth, show_hidden_elements
+                    )
+            finally:
+                with contextlib.suppress(BrokenPipeError):
+                    pager.stdin.close()
+            pager.wait()
+            return
+    cmd_def_tree.write_tree(
+        stream if stream is not None else sys.stdout,
+        with_description,
+        max_depth,
+        show_hidden_elements,
+    )
+
+
 def prompt_cmd_path(
     cmd_def_tree: CmdTreeNode,
     history: History | None = None,
     compl_style: CompleteStyle = CompleteStyle.READLINE_LIKE,
 ) -> str:
-    compl_dict = cmd_def_tree.name_dict
-    compl_dict = compl_dict.get("/")
-    if compl_dict is None:
+    if cmd_def_tree.is_leaf():
         return "/"
-    nested_completer = NestedCompleter.from_nested_dict(compl_dict, separator="/")
+    completer = CmdTreeCompleter(cmd_def_tree)
     help_txt = (
         f"Additional commands for prompt:{os.linesep}"
-        f":p[b][f][<depth>] Tree Print | :r Retry | :h Help Text | :c Cancel {os.linesep}"
+        f":p[b][f][l][<depth>] Tree Print | :r Retry | :h Help Text | :c Cancel {os.linesep}"
         f"Auto complete is available using Tab after typing the slash character.{os.linesep}"
         f"If a command history was passed, use arrow up to access it.{os.linesep}"
-        f"You can also print a subtree by typing the path and appending :p[b][p][<depth>]."
+        f"You can also print a subtree by typing the path and appending :p[b][f][l][<depth>]."
         f"{os.linesep}The b option for printouts enables brief printouts without descriptions."
-        f"{os.linesep}The p option for printouts overrides hide flags to display all hidden nodes."
-        f"{os.linesep}"
+        f"{os.linesep}The f option for printouts overrides hide flags to display all hidden nodes."
+        f"{os.linesep}The l option for printouts displays the tree in a pager.{os.linesep}"
     )
     print(help_txt)
     while True:
         path_or_cmd = prompt_toolkit.prompt(
             message="> ",
             history=history,
-            completer=nested_completer,
+            completer=completer,
             complete_style=compl_style,
         )
         if ":p" in path_or_cmd:
@@ -171,6 +397,7 @@ def prompt_cmd_path(
             with_descriptions = True
             depth = None
             show_hidden_elements = False
+            use_pager = False
             pattern = r"p([a-zA-Z]*)(\d*)"
             matches = re.search(pattern, list_of_patterns[1])
             if matches:
@@ -178,14 +405,16 @@ def prompt_cmd_path(
                     with_descriptions = False
                 if "f" in matches.group(1):
                     show_hidden_elements = True
+                if "l" in matches.group(1):
+                    use_pager = True
                 if matches.group(2).isdigit():
                     depth = int(matches.group(2))
-            print(
-                tree_to_print.str_for_tree(
-                    with_description=with_descriptions,
-                    max_depth=depth,
-                    show_hidden_elements=show_hidden_elements,
-                )
+            print_tree(
+                tree_to_print,
+                with_description=with_descriptions,
+                max_depth=depth,
+                show_hidden_elements=show_hidden_elements,
+                use_pager=use_pager,
             )
             continue
         elif ":h" in path_or_cmd:
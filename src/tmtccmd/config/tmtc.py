@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import copy
 import enum
 import os
-from typing import Any
+from collections.abc import Callable, Iterator
+from typing import Any, TextIO
 
 
 class TreePart(enum.Enum):
@@ -13,32 +13,6 @@ class TreePart(enum.Enum):
     BLANK = "   "
 
 
-class DepthInfo:
-    def __init__(
-        self,
-        depth: int,
-        last_child: bool,
-        max_depth: int | None = None,
-        layer_is_last_set: set[int] | None = None,
-    ) -> None:
-        self.depth = depth
-        self.last_child = last_child
-        if layer_is_last_set is None:
-            self.set_of_layers_where_child_is_last = set()
-        else:
-            self.set_of_layers_where_child_is_last = layer_is_last_set
-        self.max_depth = max_depth
-
-    def is_layer_for_last_child(self, depth: int) -> bool:
-        return depth in self.set_of_layers_where_child_is_last
-
-    def set_layer_is_last_child(self, depth: int):
-        self.set_of_layers_where_child_is_last.add(depth)
-
-    def clear_layer_is_last_child(self, depth: int):
-        self.set_of_layers_where_child_is_last.remove(depth)
-
-
 class CmdTreeNode:
     """The command tree node is the primary data structure used to specify the command
     structure in a way it can be used by framework components.
@@ -54,6 +28,9 @@ class CmdTreeNode:
     if a node with the name ``test_node`` has the child ``event``, you could use
     ``test_node["event"]`` to access the child node.
 
+    The children of a node can also be created lazily with :py:meth:`defer_children`, for
+    example by the loaders of :py:mod:`tmtccmd.config.tree_loader` for large command catalogues.
+
     """
 
     def __init__(
@@ -88,66 +65,163 @@ class CmdTreeNode:
         self.name = name
         self.description = description
         self.parent: CmdTreeNode | None = parent
-        self.children: dict[str, CmdTreeNode] = {}
+        self._children: dict[str, CmdTreeNode] = {}
+        self._children_loader: Callable[[CmdTreeNode], None] | None = None
         self.hide_children_for_print = hide_children_for_print
         self.hide_children_which_are_leaves = hide_children_which_are_leaves
+        # Flat index of all descendants which maps the path relative to the tree root to the
+        # node. Only the tree root holds the index. Each node caches the tree root and its path
+        # relative to it, which are updated by add_child.
+        self._root: CmdTreeNode = self
+        self._path = ""
+        self._path_index: dict[str, CmdTreeNode] | None = None
 
     @classmethod
     def root_node(cls) -> CmdTreeNode:
         return cls(name="/", description="Root Node", parent=None)
 
+    @property
+    def children(self) -> dict[str, CmdTreeNode]:
+        """Children of the node. Deferred children are created on first access."""
+        if self._children_loader is not None:
+            self._load_children()
+        return self._children
+
+    @property
+    def children_loaded(self) -> bool:
+        """False if the children were deferred with :py:meth:`defer_children` and were not
+        accessed yet."""
+        return self._children_loader is None
+
+    def defer_children(self, loader: Callable[[CmdTreeNode], None]):
+        """Defer the creation of the children until they are first accessed, for example with
+        the square bracket operator, a path lookup, the completer or a printout. The loader is
+        called once with this node and adds the children with :py:meth:`add_child`.
+
+        The node is not considered a leaf while its children are deferred, so the loader should
+        only be set for nodes which have children."""
+        self._children_loader = loader
+
+    def _load_children(self):
+        loader = self._children_loader
+        assert loader is not None
+        self._children_loader = None
+        try:
+            loader(self)
+        except BaseException:
+            self._children_loader = loader
+            raise
+
     def __getitem__(self, arg):
         return self.children[arg]
 
     def add_child(self, child: CmdTreeNode):
         """Add a child to the node. This will also assign the parent class of the child to
-        the current node."""
+        the current node. A child with the same name is replaced.
+
+        The child and all its descendants are added to the path index of the tree, so children
+        should always be added with this method instead of modifying :py:attr:`children`
+        directly. Children removed from :py:attr:`children` are no longer found, but their
+        index entries are only dropped once the path is replaced by another child."""
         child.parent = self
-        self.children.update({child.name: child})
+        replaced = self._children.get(child.name)
+        self._children[child.name] = child
+        root = self._root
+        index = root._path_index
+        if index is None:
+            index = root._path_index = {}
+        path = f"{self._path}/{child.name}" if self._path else child.name
+        if replaced is not None and replaced is not child:
+            # Subtrees can be shared by several parents, in which case the cached path of the
+            # nodes is the one of the last parent they were added to. The paths are therefore
+            # rebuilt from the path of the replaced child.
+            stack = [(replaced, path)]
+            while stack:
+                node, node_path = stack.pop()
+                if index.get(node_path) is node:
+                    del index[node_path]
+                stack.extend((sub, f"{node_path}/{sub.name}") for sub in node._children.values())
+        child._root = root
+        child._path = path
+        child._path_index = None
+        index[path] = child
+        # Deferred children are registered when they are created, so only the children which
+        # already exist are traversed.
+        if child._children:
+            # Iterative traversal to support deep subtrees without recursion.
+            stack = [(sub, path) for sub in child._children.values()]
+            while stack:
+                node, parent_path = stack.pop()
+                node_path = f"{parent_path}/{node.name}"
+                node._root = root
+                node._path = node_path
+                node._path_index = None
+                index[node_path] = node
+                stack.extend((sub, node_path) for sub in node._children.values())
 
     def is_leaf(self) -> bool:
         """A leaf is a node which has no children."""
-        return len(self.children) == 0
+        return self._children_loader is None and len(self._children) == 0
 
     def contains_path(self, path: str) -> bool:
         """Check whether a full slash separated command path is contained within
         the command tree."""
         if path == "":
             return False
-        return self.contains_path_from_node_list(path.split("/"))
+        return self._find(path) is not None
 
     def contains_path_from_node_list(self, node_name_list: list[str]) -> bool:
         """Check whether the given list of nodes are contained within the command tree."""
         if len(node_name_list) == 0:
             return False
-        # Only root node.
-        if len(node_name_list) == 2 and node_name_list == ["", ""]:
-            return True
-        if node_name_list[0] == "":
-            # Cut off empty string left of root node /
-            node_name_list = node_name_list[1:]
-        for child in self.children.values():
-            if node_name_list[0] == child.name:
-                # This is the last node.
-                if len(node_name_list) == 1:
-                    return True
-                return child.contains_path_from_node_list(node_name_list[1:])
-        return False
+        return self._find("/".join(node_name_list)) is not None
 
     def extract_subnode(self, path: str) -> CmdTreeNode | None:
-        """Extract a subnode given a relative path."""
+        """Extract a subnode given a relative path. A leading slash is ignored, and the path
+        ``/`` returns the node itself."""
         if path == "":
             return None
-        return self.extract_subnode_by_node_list(path.split("/"))
+        return self._find(path)
 
     def extract_subnode_by_node_list(self, node_list: list[str]) -> CmdTreeNode | None:
         """Extract a subnode given a list which would form a relative path if it were joined
         using slashes."""
-        if not self.contains_path_from_node_list(node_list):
+        if len(node_list) == 0:
             return None
-        if len(node_list) == 1 and self.children[node_list[0]] is not None:
-            return self.children[node_list[0]]
-        return self.children[node_list[0]].extract_subnode_by_node_list(node_list[1:])
+        return self._find("/".join(node_list))
+
+    def _find(self, path: str) -> CmdTreeNode | None:
+        """Look up a relative path in the path index of the tree. An index entry is only used
+        if the node is still reachable from this node, because children can be removed from
+        :py:attr:`children` directly and replaced subtrees keep their cached paths. Other
+        paths, for example for children inserted directly into :py:attr:`children`, deferred
+        children which were not created yet or the second parent of a shared subtree, are
+        resolved by walking the children dictionaries."""
+        if path.startswith("/"):
+            path = path[1:]
+        if path == "":
+            return self
+        index = self._root._path_index
+        if index is not None:
+            node = index.get(f"{self._path}/{path}" if self._path else path)
+            if node is not None and self._is_ancestor_of(node, path.count("/") + 1):
+                return node
+        node = self
+        for name in path.split("/"):
+            node = node.children.get(name)
+            if node is None:
+                return None
+        return node
+
+    def _is_ancestor_of(self, node: CmdTreeNode, depth: int) -> bool:
+        """Check whether the node is a descendant at the given depth by following its parents
+        and checking that each of them still contains the node on the way."""
+        for _ in range(depth):
+            parent = node.parent
+            if parent is None or parent._children.get(node.name) is not node:
+                return False
+            node = parent
+        return node is self
 
     @property
     def name_dict(self) -> dict[str, dict[str, Any] | None]:
@@ -166,7 +240,9 @@ class CmdTreeNode:
         max_depth: int | None = None,
         show_hidden_elements: bool = False,
     ) -> str:
-        """Retrieve the a human readable printout of the tree.
+        """Retrieve the a human readable printout of the tree. Use :py:meth:`write_tree` or
+        :py:meth:`iter_tree_lines` for large trees to avoid building the whole printout in
+        memory.
 
         Parameters
         ------------
@@ -179,35 +255,37 @@ class CmdTreeNode:
         show_hidden_elements
             Overrides the hide argument of command tree nodes.
         """
-        return self.__str_for_depth(
-            with_description,
-            DepthInfo(depth=0, last_child=False, max_depth=max_depth),
-            show_hidden_elements=show_hidden_elements,
+        return "".join(
+            f"{line}{os.linesep}"
+            for line in self.iter_tree_lines(with_description, max_depth, show_hidden_elements)
         )
 
-    def __str_for_depth(
+    def write_tree(
         self,
+        stream: TextIO,
         with_description: bool,
-        depth_info: DepthInfo,
+        max_depth: int | None = None,
         show_hidden_elements: bool = False,
-    ) -> str:
-        # If we are at a larger depth than 0, we want to prepend the name using a special
-        # format. Example:
-        #
-        # Example 1:
-        # /
-        # ├── ACS
-        # │  └── ACS_CTRL
-        # └── TCS
-        #
-        # Example 2:
-        # /
-        # ├── ACS
-        # │  └── ACS_CTRL
-        # └── TCS
-        #    └── TCS_CTRL
+    ):
+        """Write the printout of the tree line by line to a text stream, for example
+        :py:data:`sys.stdout` or the input of a pager. The parameters are the same as for
+        :py:meth:`str_for_tree`."""
+        for line in self.iter_tree_lines(with_description, max_depth, show_hidden_elements):
+            stream.write(line)
+            stream.write("\n")
+
+    def iter_tree_lines(
+        self,
+        with_description: bool,
+        max_depth: int | None = None,
+        show_hidden_elements: bool = False,
+    ) -> Iterator[str]:
+        """Yield the lines of the printout of the tree without line separators. The tree is
+        traversed with an explicit stack, so the printout takes linear time and only the
+        lines which were not consumed yet for the current path are kept in memory. The
+        parameters are the same as for :py:meth:`str_for_tree`."""
+        # Example:
         #
-        # Example 3:
         # /
         # ├── ACS
         # │  ├── ACS_CTRL
@@ -217,104 +295,47 @@ class CmdTreeNode:
         # │  ├── TCS_CTRL
         # │  └── PT1000_0
         # └── PING
-        line = CmdTreeNode._create_leading_tree_part(depth_info)
-        if depth_info.max_depth is not None and depth_info.depth > depth_info.max_depth:
-            line += f"... (cut-off, maximum depth {depth_info.max_depth}){os.linesep}"
-            return line
-        else:
-            line += self.name
+        #
+        # Each node entry of the stack contains the node, its depth, the tree part left of its
+        # name and the indentation for its children. The indentation is shared by all children
+        # of a node. Lines which summarize hidden children are pushed as plain strings.
+        stack: list[tuple[CmdTreeNode, int, str, str] | str] = [(self, 0, "", "")]
+        while stack:
+            entry = stack.pop()
+            if isinstance(entry, str):
+                yield entry
+                continue
+            node, depth, lead, indent = entry
+            if max_depth is not None and depth > max_depth:
+                yield f"{lead}... (cut-off, maximum depth {max_depth})"
+                continue
+            line = f"{lead}{node.name}"
             if with_description:
-                line = f"{line.ljust(35)} [ " + self.description + " ]"
-        string = line + os.linesep
-        return self._handle_children_printout(
-            string, with_description, depth_info, show_hidden_elements
-        )
-
-    @staticmethod
-    def _create_leading_tree_part(depth_info: DepthInfo) -> str:
-        line = ""
-        for i in range(depth_info.depth):
-            if i == depth_info.depth - 1:
-                if depth_info.last_child:
-                    line += TreePart.CORNER.value + " "
-                else:
-                    line += TreePart.EDGE.value + " "
-            else:
-                if depth_info.is_layer_for_last_child(i):
-                    line += TreePart.BLANK.value
-                else:
-                    line += TreePart.LINE.value
-        return line
-
-    def _handle_children_printout(
-        self,
-        string: str,
-        with_description: bool,
-        depth_info: DepthInfo,
-        show_hidden_elements: bool,
-    ) -> str:
-        child_depth_info = DepthInfo(
-            depth=depth_info.depth + 1,
-            last_child=False,
-            max_depth=depth_info.max_depth,
-            layer_is_last_set=copy.copy(depth_info.set_of_layers_where_child_is_last),
-        )
-        if not show_hidden_elements and self.hide_children_for_print and len(self.children) > 0:
-            CmdTreeNode._this_is_the_last_child(child_depth_info, depth_info)
-            string += CmdTreeNode._create_supressed_children_line(
-                child_depth_info, "children are hidden"
-            )
-        else:
-            if not show_hidden_elements and self.hide_children_which_are_leaves:
-                str_if_there_are_leaves = self._handle_children_output_suppressed_leaves(
-                    with_description, depth_info, child_depth_info
-                )
-                if str_if_there_are_leaves is not None:
-                    return string + str_if_there_are_leaves
-            for idx, child in enumerate(self.children.values()):
-                if idx == len(self.children) - 1:
-                    CmdTreeNode._this_is_the_last_child(child_depth_info, depth_info)
-                # Use recursion here to get the string for the subtree.
-                string += child.__str_for_depth(
-                    with_description=with_description,
-                    depth_info=child_depth_info,
-                    show_hidden_elements=show_hidden_elements,
-                )
-        return string
-
-    def _handle_children_output_suppressed_leaves(
-        self,
-        with_description: bool,
-        depth_info: DepthInfo,
-        child_depth_info: DepthInfo,
-    ) -> str | None:
-        string = ""
-        children_which_are_not_leaves = []
-        some_children_which_are_leaves = False
-        # The children need to be sorted first: Children which are not leaves come first.
-        for child in self.children.values():
-            if child.is_leaf():
-                some_children_which_are_leaves = True
+                line = f"{line.ljust(35)} [ {node.description} ]"
+            yield line
+            if not node.children:
                 continue
-            children_which_are_not_leaves.append(child.name)
-        if not some_children_which_are_leaves:
-            return None
-        for child in children_which_are_not_leaves:
-            string += self.children[child].__str_for_depth(with_description, child_depth_info)
-        CmdTreeNode._this_is_the_last_child(child_depth_info, depth_info)
-        string += CmdTreeNode._create_supressed_children_line(child_depth_info, "leaves are hidden")
-        return string
-
-    @staticmethod
-    def _this_is_the_last_child(child_depth_info: DepthInfo, depth_info: DepthInfo):
-        child_depth_info.last_child = True
-        child_depth_info.set_layer_is_last_child(depth_info.depth)
-
-    @staticmethod
-    def _create_supressed_children_line(child_depth_info: DepthInfo, reason: str) -> str:
-        line = CmdTreeNode._create_leading_tree_part(child_depth_info)
-        line += f"... (cut-off, {reason}){os.linesep}"
-        return line
+            last_lead = f"{indent}{TreePart.CORNER.value} "
+            if not show_hidden_elements and node.hide_children_for_print:
+                yield f"{last_lead}... (cut-off, children are hidden)"
+                continue
+            children = list(node.children.values())
+            last_is_child = True
+            if not show_hidden_elements and node.hide_children_which_are_leaves:
+                non_leaves = [child for child in children if not child.is_leaf()]
+                if len(non_leaves) < len(children):
+                    stack.append(f"{last_lead}... (cut-off, leaves are hidden)")
+                    children = non_leaves
+                    last_is_child = False
+            edge_lead = f"{indent}{TreePart.EDGE.value} "
+            line_indent = indent + TreePart.LINE.value
+            for idx in range(len(children) - 1, -1, -1):
+                if last_is_child and idx == len(children) - 1:
+                    stack.append(
+                        (children[idx], depth + 1, last_lead, indent + TreePart.BLANK.value)
+                    )
+                else:
+                    stack.append((children[idx], depth + 1, edge_lead, line_indent))
 
     def __str__(self) -> str:
         return self.str_for_tree(False)
@@ -0,0 +1,234 @@
+"""Serialization and caching of command definition trees.
+
+Generated command trees, for example trees built from object and action lists, can take long to
+build. :py:func:`cached_cmd_tree` builds the tree once and stores it in a cache file together
+with a version string provided by the user, for example a hash of the files the tree is
+generated from, which can be calculated with :py:func:`hash_files`. As long as the version does
+not change, the tree is loaded from the cache file. The loaded tree is also kept in memory, so
+repeated calls, for example by the GUI, return the same tree.
+
+The cache file is a compact JSON file. Each node is stored once in a node table, and children
+are stored as indices into that table, so subtrees which are shared by multiple parents stay
+shared after loading. Descriptions are stored in a separate string table because generated
+trees usually contain many identical descriptions:
+
+.. code-block:: json
+
+    {
+        "format": 1,
+        "version": "<user version>",
+        "descriptions": ["Root Node", "ACS Subsystem"],
+        "nodes": [["/", 0, 0, [1]], ["acs", 1, 0]]
+    }
+
+Each node entry contains the name, the description index, the hide flags and optionally the
+list of child indices. The root node has the index 0.
+
+Example for a hook:
+
+.. code-block:: python
+
+    def get_command_definitions(self) -> CmdTreeNode:
+        return cached_cmd_tree(
+            ".tmtc-cmd-tree.json", hash_files("objects.csv", "actions.csv"), build_cmd_tree
+        )
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from tmtccmd.config.tmtc import CmdTreeNode
+
+_LOGGER = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+
+_HIDE_CHILDREN_FOR_PRINT = 1 << 0
+_HIDE_CHILDREN_WHICH_ARE_LEAVES = 1 << 1
+
+_CACHE_LOCK = threading.Lock()
+_CACHE: dict[tuple[str, str], CmdTreeNode] = {}
+
+
+def cmd_tree_to_dict(root: CmdTreeNode, version: str = "") -> dict[str, Any]:
+    """Convert a command tree to a dictionary which can be serialized as JSON. The format is
+    described in the module documentation."""
+    # Number the nodes in pre-order, which allows building the tree top-down when loading it.
+    # Shared nodes are numbered once, when they are visited for the first time.
+    node_ids: dict[int, int] = {}
+    ordered_nodes: list[CmdTreeNode] = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if id(node) in node_ids:
+            continue
+        node_ids[id(node)] = len(ordered_nodes)
+        ordered_nodes.append(node)
+        stack.extend(reversed(node.children.values()))
+    description_ids: dict[str, int] = {}
+    entries: list[list[Any]] = []
+    for node in ordered_nodes:
+        flags = 0
+        if node.hide_children_for_print:
+            flags |= _HIDE_CHILDREN_FOR_PRINT
+        if node.hide_children_which_are_leaves:
+            flags |= _HIDE_CHILDREN_WHICH_ARE_LEAVES
+        description_id = description_ids.setdefault(node.description, len(description_ids))
+        entry: list[Any] = [node.name, description_id, flags]
+        if node.children:
+            entry.append([node_ids[id(child)] for child in node.children.values()])
+        entries.append(entry)
+    return {
+        "format": FORMAT_VERSION,
+        "version": version,
+        "descriptions": list(description_ids),
+        "nodes": entries,
+    }
+
+
+def cmd_tree_from_dict(data: dict[str, Any]) -> CmdTreeNode:
+    """Create a command tree from a dictionary created with :py:func:`cmd_tree_to_dict`.
+
+    :raises ValueError: Invalid or unsupported data
+    """
+    if data.get("format") != FORMAT_VERSION:
+        raise ValueError(f"unsupported command tree format {data.get('format')!r}")
+    try:
+        descriptions = data["descriptions"]
+        nodes = [
+            CmdTreeNode(
+                entry[0],
+                descriptions[entry[1]],
+                hide_children_for_print=bool(entry[2] & _HIDE_CHILDREN_FOR_PRINT),
+                hide_children_which_are_leaves=bool(entry[2] & _HIDE_CHILDREN_WHICH_ARE_LEAVES),
+            )
+            for entry in data["nodes"]
+        ]
+        if not nodes:
+            raise ValueError("command tree without root node")
+        for idx, entry in enumerate(data["nodes"]):
+            if len(entry) < 4:
+                continue
+            parent = nodes[idx]
+            for child_id in entry[3]:
+                child = nodes[child_id]
+                # Children which were numbered before their parent are shared nodes, which must
+                # already be attached to a tree and must not be an ancestor of the new parent.
+                if child_id <= 0 or (child_id <= idx and not _is_shared_child(parent, child)):
+                    raise ValueError(f"invalid child index {child_id} of node {idx}")
+                parent.add_child(child)
+    except (KeyError, IndexError, TypeError) as e:
+        raise ValueError(f"invalid command tree data: {e!r}") from e
+    return nodes[0]
+
+
+def _is_shared_child(parent: CmdTreeNode, child: CmdTreeNode) -> bool:
+    if child.parent is None:
+        return False
+    node = parent
+    while node is not None:
+        if node is child:
+            return False
+        node = node.parent
+    return True
+
+
+def save_cmd_tree(root: CmdTreeNode, path: str, version: str = ""):
+    """Save a command tree to a JSON file. The file is replaced atomically, and the temporary
+    file is removed if writing it fails.
+
+    :raises OSError: Writing the file failed
+    """
+    data = cmd_tree_to_dict(root, version)
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(data, file, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+def load_cmd_tree(path: str, version: str | None = None) -> CmdTreeNode | None:
+    """Load a command tree from a JSON file.
+
+    :param version: Expected version, None to accept any version
+    :return: None if the file does not exist, is invalid or has a different version
+    """
+    try:
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+    except FileNotFoundError:
+        return None
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError) as e:
+        _LOGGER.warning(f"Could not read command tree file {path}: {e}")
+        return None
+    if not isinstance(data, dict):
+        _LOGGER.warning(f"Invalid command tree file {path}")
+        return None
+    if version is not None and data.get("version") != version:
+        return None
+    try:
+        return cmd_tree_from_dict(data)
+    except ValueError as e:
+        _LOGGER.warning(f"Invalid command tree file {path}: {e}")
+        return None
+
+
+def cached_cmd_tree(cache_path: str, version: str, build: Callable[[], CmdTreeNode]) -> CmdTreeNode:
+    """Return the command tree for the given version. The tree is returned from memory if it
+    was already loaded, loaded from the cache file if the file has the same version, or built
+    with the build function and saved to the cache file otherwise. A cache file which can not
+    be written is skipped with a warning.
+
+    The same tree object is returned for repeated calls, so it should not be modified.
+
+    :param cache_path: Path of the cache file
+    :param version: Version of the tree, for example a hash of the files the tree is generated
+        from. The tree is rebuilt when the version changes.
+    :param build: Function which builds the tree
+    """
+    key = (os.path.abspath(cache_path), version)
+    with _CACHE_LOCK:
+        tree = _CACHE.get(key)
+        if tree is not None:
+            return tree
+        tree = load_cmd_tree(cache_path, version)
+        if tree is None:
+            _LOGGER.info(f"Building command tree, version {version!r}")
+            tree = build()
+            try:
+                save_cmd_tree(tree, cache_path, version)
+            except OSError as e:
+                _LOGGER.warning(f"Could not write command tree cache {cache_path}: {e}")
+        _CACHE[key] = tree
+        return tree
+
+
+def clear_cmd_tree_cache():
+    """Clear the command trees kept in memory. The cache files are not removed."""
+    with _CACHE_LOCK:
+        _CACHE.clear()
+
+
+def hash_files(*paths: str) -> str:
+    """Calculate a version string from the content of the given files, for example the files
+    a command tree is generated from.
+
+    :raises OSError: Reading a file failed
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, "rb") as file:
+            digest.update(hashlib.sha256(file.read()).digest())
+    return digest.hexdigest()
@@ -0,0 +1,196 @@
+"""Loaders which build a :py:class:`tmtccmd.config.tmtc.CmdTreeNode` tree from a declarative
+TOML, JSON or CSV file instead of :py:meth:`tmtccmd.config.tmtc.CmdTreeNode.add_child` calls.
+
+The nodes are created lazily with :py:meth:`tmtccmd.config.tmtc.CmdTreeNode.defer_children`.
+Only the children of the root node are created when the file is loaded, and the children of a
+node are created when they are first accessed, for example with the square bracket operator,
+:py:meth:`tmtccmd.config.tmtc.CmdTreeNode.contains_path` or the command path completer. The
+file is parsed and validated completely when it is loaded.
+
+TOML and JSON files contain nested tables. Each table is a node and each key of a table which
+is not an attribute is a child. A string is a shorthand for a leaf with a description. The
+attributes are ``description``, ``hide_children_for_print`` and
+``hide_children_which_are_leaves``, see :py:class:`tmtccmd.config.tmtc.CmdTreeNode`:
+
+.. code-block:: toml
+
+    ping = "Send PUS ping command"
+
+    [acs]
+    description = "ACS Subsystem"
+    hide_children_which_are_leaves = true
+
+    [acs.mgm0]
+    description = "Magnetometer 0"
+    reset = "Reset the magnetometer"
+
+CSV files contain one row for each node with the full path, the description and optionally a
+space separated list of the enabled hide attributes. Parents which do not have a row of their
+own are created with an empty description. Empty rows and rows starting with ``#`` are ignored:
+
+.. code-block:: text
+
+    ping,Send PUS ping command
+    acs,ACS Subsystem,hide_children_which_are_leaves
+    acs/mgm0,Magnetometer 0
+    acs/mgm0/reset,Reset the magnetometer
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
+
+try:
+    import tomllib  # Python 3.11+
+except ModuleNotFoundError:
+    import tomli as tomllib  # Fallback for older versions
+
+from tmtccmd.config.tmtc import CmdTreeNode
+
+HIDE_ATTRIBUTES = ("hide_children_for_print", "hide_children_which_are_leaves")
+SPEC_ATTRIBUTES = ("description", *HIDE_ATTRIBUTES)
+
+
+def load_cmd_tree_file(path: str) -> CmdTreeNode:
+    """Load a command tree from a file. Files with the ``.toml`` suffix are parsed as TOML,
+    files with the ``.csv`` suffix as CSV and all other files as JSON.
+
+    :raises OSError: Reading the file failed
+    :raises ValueError: The file could not be parsed or contains invalid entries
+    """
+    if path.endswith(".csv"):
+        with open(path, newline="", encoding="utf-8") as file:
+            try:
+                return cmd_tree_from_rows(csv.reader(file))
+            except csv.Error as e:
+                raise ValueError(f"could not parse command tree file {path}: {e}") from e
+    try:
+        if path.endswith(".toml"):
+            with open(path, "rb") as file:
+                spec = tomllib.load(file)
+        else:
+            with open(path, encoding="utf-8") as file:
+                spec = json.load(file)
+    except (tomllib.TOMLDecodeError, json.JSONDecodeError) as e:
+        raise ValueError(f"could not parse command tree file {path}: {e}") from e
+    if not isinstance(spec, dict):
+        raise ValueError(f"command tree file {path} does not contain a table")
+    return cmd_tree_from_spec(spec)
+
+
+def cmd_tree_from_spec(spec: Mapping[str, Any]) -> CmdTreeNode:
+    """Create a command tree from the nested mapping of a TOML or JSON file. The attributes of
+    the mapping itself are ignored, because the root node always is
+    :py:meth:`tmtccmd.config.tmtc.CmdTreeNode.root_node`.
+
+    :raises ValueError: The mapping contains invalid entries
+    """
+    _validate_spec(spec)
+    root = CmdTreeNode.root_node()
+    _add_spec_children(root, spec)
+    return root
+
+
+def cmd_tree_from_rows(rows: Iterable[Sequence[str]]) -> CmdTreeNode:
+    """Create a command tree from CSV rows in the format described in the module
+    documentation. The rows only need to be iterable once.
+
+    :raises ValueError: A row is invalid
+    """
+    # The rows are grouped by the parent path. Each group is only converted to nodes when the
+    # children of the parent are accessed.
+    groups: dict[str, dict[str, tuple[str, int]]] = {}
+    for row_idx, row in enumerate(rows):
+        if not row or (len(row) == 1 and row[0].strip() == "") or row[0].startswith("#"):
+            continue
+        if len(row) > 3:
+            raise ValueError(f"row {row_idx + 1}: expected at most three columns")
+        path = row[0].strip().strip("/")
+        names = path.split("/")
+        if path == "" or "" in names:
+            raise ValueError(f"row {row_idx + 1}: invalid path {row[0]!r}")
+        flags = 0
+        for attribute in row[2].split() if len(row) == 3 else ():
+            if attribute not in HIDE_ATTRIBUTES:
+                raise ValueError(f"row {row_idx + 1}: unknown attribute {attribute!r}")
+            flags |= 1 << HIDE_ATTRIBUTES.index(attribute)
+        parent_path, _, name = path.rpartition("/")
+        groups.setdefault(parent_path, {})[name] = (row[1].strip() if len(row) > 1 else "", flags)
+        # Create the entries of implicit parents.
+        while parent_path:
+            grand_parent_path, _, parent_name = parent_path.rpartition("/")
+            siblings = groups.setdefault(grand_parent_path, {})
+            if parent_name in siblings:
+                break
+            siblings[parent_name] = ("", 0)
+            parent_path = grand_parent_path
+    root = CmdTreeNode.root_node()
+    _add_row_children(root, "", groups)
+    return root
+
+
+def _validate_spec(spec: Mapping[str, Any]):
+    stack: list[tuple[str, Mapping[str, Any]]] = [("", spec)]
+    while stack:
+        path, table = stack.pop()
+        for key, value in table.items():
+            child_path = f"{path}/{key}" if path else key
+            if key == "description":
+                valid = isinstance(value, str)
+            elif key in HIDE_ATTRIBUTES:
+                valid = isinstance(value, bool)
+            elif "/" in key or key == "":
+                raise ValueError(f"invalid node name {child_path!r}")
+            elif isinstance(value, Mapping):
+                stack.append((child_path, value))
+                valid = True
+            else:
+                valid = isinstance(value, str)
+            if not valid:
+                raise ValueError(f"invalid value {value!r} for {child_path!r}")
+
+
+def _spec_has_children(spec: Mapping[str, Any]) -> bool:
+    return any(key not in SPEC_ATTRIBUTES for key in spec)
+
+
+def _add_spec_children(node: CmdTreeNode, spec: Mapping[str, Any]):
+    for name, value in spec.items():
+        if name in SPEC_ATTRIBUTES:
+            continue
+        if isinstance(value, str):
+            node.add_child(CmdTreeNode(name, value))
+            continue
+        child = CmdTreeNode(
+            name,
+            value.get("description", ""),
+            hide_children_for_print=value.get("hide_children_for_print", False),
+            hide_children_which_are_leaves=value.get("hide_children_which_are_leaves", False),
+        )
+        if _spec_has_children(value):
+            child.defer_children(lambda deferred, value=value: _add_spec_children(deferred, value))
+        node.add_child(child)
+
+
+def _add_row_children(node: CmdTreeNode, path: str, groups: dict[str, dict[str, tuple[str, int]]]):
+    # The group is only removed once all children were created, so the rows are still
+    # available if a failed deferred load is retried.
+    for name, (description, flags) in groups.get(path, {}).items():
+        child = CmdTreeNode(
+            name,
+            description,
+            hide_children_for_print=bool(flags & 1),
+            hide_children_which_are_leaves=bool(flags & 2),
+        )
+        child_path = f"{path}/{name}" if path else name
+        if child_path in groups:
+            child.defer_children(
+                lambda deferred, child_path=child_path: _add_row_children(
+                    deferred, child_path, groups
+                )
+            )
+        node.add_child(child)
+    groups.pop(path, None)
@@ -0,0 +1,293 @@
+"""Watcher for the configuration file which applies changed runtime settings to a running
+:py:class:`tmtccmd.CcsdsTmtcWorker`.
+
+Changes to the settings of :py:class:`tmtccmd.config.loader.RuntimeFileCfg`, for example the
+inter-command delay or the log levels, are submitted to the worker, which applies them between
+two TMTC cycles. Changes to the communication interface settings are only reported, because
+they require a restart of the commander.
+
+On Linux, the directory of the configuration file is watched with inotify, so changes are
+detected immediately. On other systems, or if inotify is not available, the modification time
+of the file is polled.
+
+Editors and scripts often write a file in several steps. On Linux, the file is therefore only
+reloaded once no further change was detected for the debounce interval, so a burst of writes
+causes only one reload.
+
+Example for the configuration file path provided by the hook:
+
+.. code-block:: python
+
+    with ConfigWatcher.from_hook(hook, tmtc_backend):
+        while True:
+            state = tmtc_backend.periodic_op(None)
+            ...
+"""
+
+from __future__ import annotations
+
+import ctypes
+import dataclasses
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from tmtccmd.config.loader import RuntimeFileCfg, TmtcFileCfg, load_tmtc_file_cfg
+
+if TYPE_CHECKING:
+    from tmtccmd.config.hook import HookBase
+    from tmtccmd.core.ccsds import CcsdsTmtcWorker
+
+_LOGGER = logging.getLogger(__name__)
+
+RESTART_REQUIRED_FIELDS = ("com_if", "serial", "udp", "tcp", "shm", "unix")
+"""Fields of :py:class:`tmtccmd.config.loader.TmtcFileCfg` which require a restart."""
+
+
+@dataclasses.dataclass
+class CfgReloadResult:
+    """Result of a reload of a changed configuration file.
+
+    :var cfg: New configuration
+    :var changes: Changed runtime settings. Settings which did not change are None.
+    :var restart_required: Names of changed settings which require a restart
+    """
+
+    cfg: TmtcFileCfg
+    changes: RuntimeFileCfg
+    restart_required: list[str]
+
+    @property
+    def has_runtime_changes(self) -> bool:
+        return self.changes != RuntimeFileCfg()
+
+
+def runtime_cfg_changes(old: RuntimeFileCfg, new: RuntimeFileCfg) -> RuntimeFileCfg:
+    """Determine the changed runtime settings. Settings which were removed from the file are
+    not included, the running commander keeps their current value."""
+
+    def changed(name: str):
+        value = getattr(new, name)
+        return value if value != getattr(old, name) else None
+
+    old_levels = dict(old.log_levels)
+    return RuntimeFileCfg(
+        inter_cmd_delay=changed("inter_cmd_delay"),
+        keep_listener_mode=changed("keep_listener_mode"),
+        keep_multi_queue_mode=changed("keep_multi_queue_mode"),
+        log_level=changed("log_level"),
+        log_levels=tuple(
+            (name, level) for name, level in new.log_levels if old_levels.get(name) != level
+        ),
+    )
+
+
+def restart_required_changes(old: TmtcFileCfg, new: TmtcFileCfg) -> list[str]:
+    return [name for name in RESTART_REQUIRED_FIELDS if getattr(old, name) != getattr(new, name)]
+
+
+class ConfigWatcher:
+    """Watches a configuration file and submits changed runtime settings to a worker with
+    :py:meth:`tmtccmd.CcsdsTmtcWorker.submit_runtime_cfg`.
+
+    The file content at construction time is the baseline. Only settings which differ from the
+    last loaded configuration are submitted, so values passed on the command line are only
+    overridden once the corresponding setting in the file is changed. Files which can not be
+    parsed, for example while they are written, are ignored.
+
+    The watcher can be run in a background thread with :py:meth:`start` or by calling
+    :py:meth:`check` periodically, for example from the run loop.
+
+    :param cfg_path: Path of the configuration file, usually :py:attr:`HookBase.cfg_path`
+    :param worker: Worker the runtime settings are submitted to. Can be None if only the
+        callback is used.
+    :param poll_interval: Interval in seconds for polling the modification time. If inotify is
+        used, this is only the upper limit for the detection delay.
+    :param on_reload: Optional callback which is called for each reloaded configuration
+    :param use_inotify: Use inotify on Linux
+    :param debounce: Time in seconds without further changes of the file after which it is
+        reloaded if inotify is used
+    """
+
+    def __init__(
+        self,
+        cfg_path: str,
+        worker: CcsdsTmtcWorker | None = None,
+        poll_interval: float = 1.0,
+        on_reload: Callable[[CfgReloadResult], None] | None = None,
+        use_inotify: bool = True,
+        debounce: float = 0.2,
+    ):
+        self.cfg_path = cfg_path
+        self.worker = worker
+        self.poll_interval = poll_interval
+        self.on_reload = on_reload
+        self.use_inotify = use_inotify
+        self.debounce = debounce
+        self._cfg = load_tmtc_file_cfg(cfg_path)
+        self._check_lock = threading.Lock()
+        self._shutdown = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._inotify: _Inotify | None = None
+
+    @classmethod
+    def from_hook(cls, hook: HookBase, worker: CcsdsTmtcWorker | None, **kwargs) -> ConfigWatcher:
+        """Create a watcher for the configuration file of the hook, which is
+        :py:attr:`HookBase.cfg_path`. The keyword arguments are passed to the constructor."""
+        assert hook.cfg_path is not None
+        return cls(hook.cfg_path, worker, **kwargs)
+
+    @property
+    def cfg(self) -> TmtcFileCfg:
+        """Last valid configuration"""
+        return self._cfg
+
+    @property
+    def inotify_active(self) -> bool:
+        return self._inotify is not None
+
+    def check(self) -> CfgReloadResult | None:
+        """Reload the configuration file if it changed and submit the changed runtime settings.
+
+        :return: None if the file did not change or could not be parsed
+        """
+        with self._check_lock:
+            cfg = load_tmtc_file_cfg(self.cfg_path)
+            # The loader returns the cached object if the file did not change.
+            if cfg is self._cfg or not cfg.valid:
+                return None
+            result = CfgReloadResult(
+                cfg=cfg,
+                changes=runtime_cfg_changes(self._cfg.runtime, cfg.runtime),
+                restart_required=restart_required_changes(self._cfg, cfg),
+            )
+            self._cfg = cfg
+        if result.restart_required:
+            _LOGGER.warning(
+                f"Changed settings of {self.cfg_path} require a restart: "
+                f"{', '.join(result.restart_required)}"
+            )
+        if result.has_runtime_changes and self.worker is not None:
+            self.worker.submit_runtime_cfg(result.changes)
+        if self.on_reload is not None:
+            self.on_reload(result)
+        return result
+
+    def start(self):
+        """Start watching the configuration file in a background thread."""
+        if self._thread is not None:
+            return
+        if self.use_inotify and sys.platform.startswith("linux"):
+            try:
+                self._inotify = _Inotify(os.path.dirname(os.path.abspath(self.cfg_path)))
+            except OSError as e:
+                _LOGGER.info(f"inotify not available, polling {self.cfg_path}: {e}")
+        self._shutdown.clear()
+        self._thread = threading.Thread(target=self._watch, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._shutdown.set()
+        if self._inotify is not None:
+            self._inotify.interrupt()
+        self._thread.join()
+        self._thread = None
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+    def __enter__(self) -> ConfigWatcher:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def _watch(self):
+        file_name = os.path.basename(self.cfg_path)
+        while not self._shutdown.is_set():
+            if self._inotify is not None:
+                # The file is checked after each timeout as well, for file systems which do not
+                # support inotify, for example network file systems.
+                names = self._inotify.wait(self.poll_interval)
+                if names and file_name not in names:
+                    continue
+                if names:
+                    self._wait_until_settled(file_name)
+            elif self._shutdown.wait(self.poll_interval):
+                break
+            try:
+                self.check()
+            except Exception:
+                _LOGGER.exception(f"Applying changes of {self.cfg_path} failed")
+
+    def _wait_until_settled(self, file_name: str):
+        assert self._inotify is not None
+        deadline = time.monotonic() + self.debounce
+        while not self._shutdown.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            if file_name in self._inotify.wait(remaining):
+                deadline = time.monotonic() + self.debounce
+
+
+class _Inotify:
+    """Minimal inotify wrapper which watches a directory. Editors often replace a file instead
+    of writing it, so the directory is watched instead of the file itself."""
+
+    IN_CLOSE_WRITE = 0x008
+    IN_MOVED_TO = 0x080
+    IN_CREATE = 0x100
+    _EVENT = struct.Struct("iIII")
+
+    def __init__(self, directory: str):
+        libc = ctypes.CDLL(None, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify is not supported by the C library")
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        mask = self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE
+        if libc.inotify_add_watch(self._fd, os.fsencode(directory), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(errno, os.strerror(errno), directory)
+        # Pipe which is used to interrupt a wait when the watcher is stopped
+        self._wakeup_read, self._wakeup_write = os.pipe()
+
+    def wait(self, timeout: float) -> set[str]:
+        """Wait for events and return the names of the changed files. An empty set is returned
+        after the timeout or if the wait was interrupted."""
+        ready, _, _ = select.select([self._fd, self._wakeup_read], [], [], timeout)
+        if self._fd not in ready:
+            return set()
+        try:
+            data = os.read(self._fd, 65536)
+        except BlockingIOError:
+            return set()
+        names = set()
+        offset = 0
+        while offset + self._EVENT.size <= len(data):
+            _, _, _, name_len = self._EVENT.unpack_from(data, offset)
+            offset += self._EVENT.size
+            names.add(os.fsdecode(data[offset : offset + name_len].rstrip(b"\0")))
+            offset += name_len
+        return names
+
+    def interrupt(self):
+        os.write(self._wakeup_write, b"\x00")
+
+    def close(self):
+        os.close(self._fd)
+        os.close(self._wakeup_read)
+        os.close(self._wakeup_write)
@@ -1,8 +1,14 @@
+from __future__ import annotations
+
 import atexit
+import copy
 import logging
 import sys
+import threading
+from collections import deque
+from collections.abc import Iterable
 from datetime import timedelta
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from com_interface import ComInterface
 
@@ -16,10 +22,19 @@ from tmtccmd.tmtc.ccsds_seq_sender import (
 )
 from tmtccmd.tmtc.ccsds_tm_listener import CcsdsTmListener
 from tmtccmd.tmtc.handler import FeedWrapper, TcHandlerBase
-from tmtccmd.tmtc.procedure import TcProcedureType
-from tmtccmd.tmtc.queue import QueueWrapper
+from tmtccmd.tmtc.procedure import CustomProcedureInfo, TcProcedureType
+from tmtccmd.tmtc.queue import (
+    QueueDequeT,
+    QueueWrapper,
+    TcPriority,
+    TcQueueEntryBase,
+    WaitEntry,
+)
 from tmtccmd.util.exit import keyboard_interrupt_handler
 
+if TYPE_CHECKING:
+    from tmtccmd.config.loader import RuntimeFileCfg
+
 
 class NoValidProcedureSetError(Exception):
     pass
@@ -55,6 +70,18 @@ class CcsdsTmtcWorker(BackendBase):
             tc_handler=tc_handler,
             queue_wrapper=self._queue_wrapper,
         )
+        self._submit_lock = threading.Lock()
+        self._submitted_front: QueueDequeT = deque()
+        self._submitted_back: QueueDequeT = deque()
+        self._submitted_cfgs: list[RuntimeFileCfg] = []
+        # Procedures which are fed one after another, each with the wait after its queue.
+        self._pending_procedures: deque[tuple[TcProcedureBase, timedelta]] = deque()
+        # Procedure which was set before the first submitted procedure was fed, and whether
+        # the TC mode was switched from IDLE for the submitted procedures. Both are restored
+        # once all submitted procedures are finished.
+        self._info_before_procedures: TcProcedureBase | None = None
+        self._procedures_left_idle = False
+        self._wakeup = threading.Event()
 
     def register_keyboard_interrupt_handler(self):
         """Register a keyboard interrupt handler which closes the COM interface and prints
@@ -126,6 +153,170 @@ class CcsdsTmtcWorker(BackendBase):
     def start(self):
         self.open_com_if()
 
+    def submit_entries(self, entries: Iterable[TcQueueEntryBase], prepend: bool = False):
+        """Submit queue entries to the active TC queue. This function is thread-safe and can be
+        called from any thread, for example a GUI or an external script, while the backend is
+        running in another thread. The entries are moved into the active queue of the sequential
+        sender at the start of the next :py:meth:`tc_operation` call and the run loop is woken
+        up, see :py:meth:`wait_for_wakeup`.
+
+        If no queue is active, the submitted entries are sent as their own queue with a
+        :py:class:`tmtccmd.tmtc.procedure.CustomProcedureInfo` without a procedure and the
+        inter-command delay of the worker, even if the TC mode is IDLE. Entries with a priority
+        higher than :py:attr:`TcPriority.NORMAL` are inserted into the queue of their priority
+        class of the sequential sender instead.
+
+        :param entries: Entries to submit. The order of the entries is preserved.
+        :param prepend: Insert the entries before all remaining entries of the active queue
+            instead of appending them.
+        """
+        with self._submit_lock:
+            if prepend:
+                self._submitted_front.extendleft(reversed(list(entries)))
+            else:
+                self._submitted_back.extend(entries)
+        self._wakeup.set()
+
+    def submit_urgent(self, entry: TcQueueEntryBase):
+        """Submit an urgent entry, for example a safe-mode command. A copy of the entry with the
+        priority :py:attr:`TcPriority.URGENT` is submitted, so it is sent in the next sender cycle
+        which is not blocked by the inter-command delay, irrespective of all other queued entries
+        and their pending waits. The passed entry is not modified."""
+        urgent_entry = copy.copy(entry)
+        urgent_entry.priority = TcPriority.URGENT
+        self.submit_entries([urgent_entry], prepend=True)
+
+    def submit_procedure(self, procedure: TcProcedureBase, wait_after: timedelta = timedelta()):
+        """Submit a procedure which is executed after the active queue and all previously
+        submitted procedures. This function is thread-safe.
+
+        The procedures are passed to the feed callback of the TC handler one after another. The
+        next procedure is fed in the same :py:meth:`tc_operation` call in which the queue of
+        the previous procedure is finished, so a sequence of procedures is sent without any
+        round-trips through the run loop or prompts. If the TC mode is IDLE, it is switched to
+        :py:attr:`TcMode.MULTI_QUEUE` and back to IDLE once all submitted procedures are
+        finished. The procedure which was set before is restored then, and the ONE_QUEUE mode
+        requests the termination only then.
+
+        :param procedure: Procedure to execute
+        :param wait_after: Wait time which is appended to the queue of the procedure, for
+            example to receive the telemetry of a command before the next command is sent
+        """
+        with self._submit_lock:
+            self._pending_procedures.append((procedure, wait_after))
+        self._wakeup.set()
+
+    def submit_procedures(self, procedures: Iterable[TcProcedureBase]):
+        """Submit multiple procedures with :py:meth:`submit_procedure`."""
+        with self._submit_lock:
+            self._pending_procedures.extend((procedure, timedelta()) for procedure in procedures)
+        self._wakeup.set()
+
+    @property
+    def pending_procedures(self) -> int:
+        """Number of submitted procedures which were not fed yet"""
+        return len(self._pending_procedures)
+
+    def submit_runtime_cfg(self, cfg: RuntimeFileCfg):
+        """Submit runtime settings, for example after the configuration file was changed. This
+        function is thread-safe. The settings are applied with :py:meth:`apply_runtime_cfg` at the
+        start of the next :py:meth:`tm_operation` or :py:meth:`tc_operation` call, so a TMTC cycle
+        always runs with one consistent set of settings.
+        """
+        with self._submit_lock:
+            self._submitted_cfgs.append(cfg)
+        self._wakeup.set()
+
+    def apply_runtime_cfg(self, cfg: RuntimeFileCfg) -> list[str]:
+        """Apply runtime settings immediately. Settings which are None are not changed. Use
+        :py:meth:`submit_runtime_cfg` when calling this from another thread.
+
+        A changed inter-command delay is used starting with the next sent telecommand. It
+        replaces the delay of the active queue until the queue sets its own delay with a packet
+        delay entry.
+
+        :return: Names of the applied settings
+        """
+        applied = []
+        if cfg.inter_cmd_delay is not None:
+            delay = timedelta(seconds=cfg.inter_cmd_delay)
+            self._queue_wrapper.inter_cmd_delay = delay
+            self._seq_handler.queue_wrapper.inter_cmd_delay = delay
+            applied.append("inter_cmd_delay")
+        if cfg.keep_listener_mode is not None:
+            self.keep_listener_mode = cfg.keep_listener_mode
+            applied.append("keep_listener_mode")
+        if cfg.keep_multi_queue_mode is not None:
+            self.keep_multi_queue_mode = cfg.keep_multi_queue_mode
+            applied.append("keep_multi_queue_mode")
+        if cfg.log_level is not None:
+            logging.getLogger().setLevel(cfg.log_level)
+            applied.append("log_level")
+        for name, level in cfg.log_levels:
+            logging.getLogger(name).setLevel(level)
+            applied.append(f"log_levels.{name}")
+        return applied
+
+    def wait_for_wakeup(self, timeout: float) -> bool:
+        """Can be used by the run loop instead of :py:func:`time.sleep` to delay the next
+        :py:meth:`periodic_op` call. Returns early if new entries were submitted with
+        :py:meth:`submit_entries`.
+
+        The wake-up flag is only reset by the next :py:meth:`tm_operation` or
+        :py:meth:`tc_operation` call before it handles the submitted items, so items which are
+        submitted at any time after that always wake up the next wait.
+
+        :param timeout: Maximum delay in seconds
+        :return: True if the backend was woken up before the timeout
+        """
+        return self._wakeup.wait(timeout)
+
+    def __handle_submitted_entries(self):
+        with self._submit_lock:
+            if not self._submitted_front and not self._submitted_back:
+                return
+            if self._seq_handler.mode == SenderMode.DONE:
+                # Do not re-use the procedure and settings of the previously finished queue.
+                self._seq_handler.queue_wrapper = QueueWrapper(
+                    info=CustomProcedureInfo(None),
+                    queue=deque(),
+                    inter_cmd_delay=self.inter_cmd_delay,
+                )
+            queue = self._seq_handler.queue_wrapper.queue
+            queue.extendleft(
+                entry
+                for entry in reversed(self._submitted_front)
+                if entry.priority == TcPriority.NORMAL
+            )
+            for entry in self._submitted_front:
+                if entry.priority != TcPriority.NORMAL:
+                    self._seq_handler.add_prioritized_entry(entry)
+            for entry in self._submitted_back:
+                self._seq_handler.add_prioritized_entry(entry)
+            self._submitted_front.clear()
+            self._submitted_back.clear()
+        self._seq_handler.resume()
+
+    def __handle_submitted_cfgs(self):
+        # Reset the wake-up flag before any submitted items are checked, see wait_for_wakeup.
+        self._wakeup.clear()
+        if not self._submitted_cfgs:
+            return
+        with self._submit_lock:
+            cfgs = self._submitted_cfgs
+            self._submitted_cfgs = []
+        for cfg in cfgs:
+            try:
+                applied = self.apply_runtime_cfg(cfg)
+            except Exception as e:
+                # A bad setting in a reloaded file must not stop the running worker.
+                logging.getLogger(__name__).error(f"Applying runtime configuration failed: {e}")
+                continue
+            if applied:
+                logging.getLogger(__name__).info(
+                    f"Applied runtime configuration changes: {', '.join(applied)}"
+                )
+
     def __listener_io_error_handler(self, ctx: str):
         logger = logging.getLogger(__name__)
         logger.error(f"Communication Interface could not be {ctx}")
@@ -136,6 +327,9 @@ class CcsdsTmtcWorker(BackendBase):
             sys.exit(1)
 
     def open_com_if(self):
+        """Open the communication interface. Failures to open the interface are not retried. Use
+        a :py:class:`tmtccmd.com.reconnect.ReconnectingComInterface` as the interface to open it
+        in the background and reconnect it after link failures."""
         try:
             self._com_if.open()
         except OSError:
@@ -178,12 +372,17 @@ class CcsdsTmtcWorker(BackendBase):
         For example, for if both the TC and the TM mode are IDLE, the request will be set to
         :py:attr:`BackendRequest.DELAY_IDLE` field.
         """
-        if self.tc_mode == TcMode.IDLE and self.tm_mode == TmMode.IDLE:
+        if self.tc_mode == TcMode.IDLE and self._seq_handler.mode == SenderMode.BUSY:
+            # Submitted entries are handled in IDLE mode as well.
+            self.__sender_busy_to_req()
+        elif self.tc_mode == TcMode.IDLE and self.tm_mode == TmMode.IDLE:
             self._state._req = BackendRequest.DELAY_IDLE
         elif self.tm_mode == TmMode.LISTENER and self.tc_mode == TcMode.IDLE:
             self._state._req = BackendRequest.DELAY_LISTENER
         elif self._seq_handler.mode == SenderMode.DONE:
-            if self._state.tc_mode == TcMode.ONE_QUEUE:
+            if self._pending_procedures and self._state.tc_mode != TcMode.IDLE:
+                self._state._req = BackendRequest.CALL_NEXT
+            elif self._state.tc_mode == TcMode.ONE_QUEUE:
                 if self.keep_listener_mode:
                     self._state._req = BackendRequest.DELAY_LISTENER
                     self.tm_mode = TmMode.LISTENER
@@ -196,17 +395,17 @@ class CcsdsTmtcWorker(BackendBase):
                     self._state.mode_wrapper.tc_mode = TcMode.IDLE
                 self._state._req = BackendRequest.CALL_NEXT
         else:
-            if (
-                not self._state.sender_res.next_entry_is_tc
-                and not self._state.sender_res.queue_empty
-            ):
-                self._state._req = BackendRequest.CALL_NEXT
+            self.__sender_busy_to_req()
+
+    def __sender_busy_to_req(self):
+        if not self._state.sender_res.next_entry_is_tc and not self._state.sender_res.queue_empty:
+            self._state._req = BackendRequest.CALL_NEXT
+        else:
+            if self._state.sender_res.longest_rem_delay >= timedelta(milliseconds=1):
+                self._state._recommended_delay = self._state.sender_res.longest_rem_delay
+                self._state._req = BackendRequest.DELAY_CUSTOM
             else:
-                if int(self._state.sender_res.longest_rem_delay.microseconds / 1000.0) > 0:
-                    self._state._recommended_delay = self._state.sender_res.longest_rem_delay
-                    self._state._req = BackendRequest.DELAY_CUSTOM
-                else:
-                    self._state._req = BackendRequest.CALL_NEXT
+                self._state._req = BackendRequest.CALL_NEXT
 
     def poll_tm(self):
         """Poll TM, irrespective of current TM mode"""
@@ -217,6 +416,7 @@ class CcsdsTmtcWorker(BackendBase):
         to the user TM handler. It only does so if the :py:attr:`tm_mode` is set to the LISTENER
         mode
         """
+        self.__handle_submitted_cfgs()
         if self._state.tm_mode == TmMode.LISTENER:
             self._tm_listener.operation(self._com_if)
 
@@ -228,21 +428,61 @@ class CcsdsTmtcWorker(BackendBase):
         It is necessary to set a valid procedure before calling this by using the
         :py:attr:`current_proc_info` setter function.
 
+        Entries submitted with :py:meth:`submit_entries` are handled irrespective of the TC mode.
+
         :raises NoValidProcedureSet: No valid procedure set to be passed to the feed callback of
             the TC handler
         """
+        self.__handle_submitted_cfgs()
+        if self._pending_procedures and self._state.tc_mode == TcMode.IDLE:
+            self._state.mode_wrapper.tc_mode = TcMode.MULTI_QUEUE
+            self._procedures_left_idle = True
         if self._state.tc_mode != TcMode.IDLE:
             self.__check_and_execute_queue()
+        else:
+            self.__handle_submitted_entries()
+            if self._seq_handler.mode == SenderMode.BUSY:
+                self._state._sender_res = self._seq_handler.operation(self._com_if)
 
     def __check_and_execute_queue(self):
         if self._seq_handler.mode == SenderMode.DONE:
-            queue = self.__prepare_tc_queue()
-            if queue is None:
-                return
+            self.__load_next_queue()
+        self.__handle_submitted_entries()
+        if self._seq_handler.mode != SenderMode.DONE:
+            self._state._sender_res = self._seq_handler.operation(self._com_if)
+            if self._seq_handler.mode == SenderMode.DONE and self._pending_procedures:
+                # Feed the next submitted procedure without waiting for the next call.
+                self.__load_next_queue()
+        if (
+            self._seq_handler.mode == SenderMode.DONE
+            and not self._pending_procedures
+            and self._info_before_procedures is not None
+        ):
+            self.__finish_procedures()
+
+    def __load_next_queue(self):
+        wait_after = timedelta()
+        if self._pending_procedures:
+            with self._submit_lock:
+                procedure, wait_after = self._pending_procedures.popleft()
+            if self._info_before_procedures is None:
+                self._info_before_procedures = self._queue_wrapper.info
+            self._queue_wrapper.info = procedure
+        queue = self.__prepare_tc_queue()
+        if queue is not None and wait_after > timedelta():
+            queue.queue.append(WaitEntry(wait_after))
+        if queue is not None:
             logging.getLogger(__name__).info("Loading TC queue")
             self._seq_handler.queue_wrapper = queue
             self._seq_handler.resume()
-        self._state._sender_res = self._seq_handler.operation(self._com_if)
+
+    def __finish_procedures(self):
+        assert self._info_before_procedures is not None
+        self._queue_wrapper.info = self._info_before_procedures
+        self._info_before_procedures = None
+        if self._procedures_left_idle:
+            self._procedures_left_idle = False
+            self._state.mode_wrapper.tc_mode = TcMode.IDLE
 
     def __prepare_tc_queue(self, auto_dispatch: bool = True) -> QueueWrapper | None:
         feed_wrapper = FeedWrapper(self._queue_wrapper, auto_dispatch)
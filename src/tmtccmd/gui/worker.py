@@ -109,10 +109,8 @@ class FrontendWorker(QRunnable):
             time.sleep(1.0)
         elif state.request == BackendRequest.DELAY_CUSTOM:
             self._shared.tc_lock.release()
-            if state.next_delay.total_seconds() < 0.5:
-                time.sleep(state.next_delay.total_seconds())
-            else:
-                time.sleep(0.5)
+            # Wake up early if entries were submitted to the backend from another thread.
+            self._shared.backend.wait_for_wakeup(min(state.next_delay.total_seconds(), 0.5))
         elif state.request == BackendRequest.CALL_NEXT:
             self._shared.tc_lock.release()
 
@@ -1,8 +1,18 @@
+from __future__ import annotations
+
+import struct
+
+import crcmod.predefined
 from deprecated.sphinx import deprecated
-from spacepackets.ecss import PusService, PusTelecommand
+from spacepackets.ccsds.spacepacket import SPACE_PACKET_HEADER_SIZE
+from spacepackets.ecss import PusService, PusTelecommand, PusVerificator
+from spacepackets.ecss.tc import PusTcDataFieldHeader
+from spacepackets.seqcount import ProvidesSeqCount
 
 from tmtccmd.pus.s11_tc_sched import Subservice
 
+_crc16_ccitt_false = crcmod.predefined.mkPredefinedCrcFun("crc-ccitt-false")
+
 
 def __generic_param_less_tc_sched_cmd(
     subservice: int, apid: int = 0, seq_count: int = 0
@@ -88,3 +98,184 @@ def pack_time_tagged_tc_app_data(release_time: bytes, tc_to_insert: PusTelecomma
     # followed by the tc
     app_data.extend(tc_to_insert.pack())
     return app_data
+
+
+def stamp_raw_pus_tc(
+    buf: bytearray,
+    offset: int = 0,
+    apid: int | None = None,
+    seq_count: int | None = None,
+) -> int:
+    """Stamps the APID and the sequence count onto a raw PUS TC with a CRC16 in place and
+    recalculates the CRC16. This avoids unpacking and repacking the TC.
+
+    :param buf: Buffer containing the raw TC
+    :param offset: Start of the raw TC inside the buffer
+    :param apid: APID to stamp. Left unchanged if None
+    :param seq_count: Sequence count to stamp. Left unchanged if None
+    :raises ValueError: Buffer too short for the TC length specified in the primary header
+    :return: Length of the TC
+    """
+    if len(buf) - offset < SPACE_PACKET_HEADER_SIZE:
+        raise ValueError("buffer too short for space packet header")
+    tc_len = ((buf[offset + 4] << 8) | buf[offset + 5]) + SPACE_PACKET_HEADER_SIZE + 1
+    if len(buf) - offset < tc_len:
+        raise ValueError(f"buffer too short for TC with length {tc_len}")
+    if apid is not None:
+        buf[offset] = (buf[offset] & 0xF8) | ((apid >> 8) & 0x07)
+        buf[offset + 1] = apid & 0xFF
+    if seq_count is not None:
+        buf[offset + 2] = (buf[offset + 2] & 0xC0) | ((seq_count >> 8) & 0x3F)
+        buf[offset + 3] = seq_count & 0xFF
+    crc_pos = offset + tc_len - 2
+    struct.pack_into("!H", buf, crc_pos, _crc16_ccitt_false(bytes(buf[offset:crc_pos])))
+    return tc_len
+
+
+class TimeTaggedTcBatchBuilder:
+    """Packs many time-tagged TCs into multi-TC insert activity TC[11,4] packets without
+    unpacking and repacking any of the TCs. The inner TCs and the outer TC[11,4] packets are
+    stamped in one pass on the raw buffers.
+
+    The application data of the generated packets consists of an optional count field specifying
+    the number of contained TCs, followed by the release time and the raw TC for each
+    contained TC. If the count field length is set to 0, only one TC is packed into each
+    TC[11,4] packet, which is equivalent to :py:func:`pack_time_tagged_tc_app_data`.
+
+    :param apid: APID of the TC[11,4] packets
+    :param max_packet_size: Maximum size of the TC[11,4] packets, including the CRC16
+    :param count_field_len: Length of the count field in bytes. Can be 0, 1, 2 or 4
+    :param inner_apid: Optional APID which is stamped onto all contained TCs
+    :param seq_cnt_provider: Optional sequence count provider. The sequence count will be stamped
+        onto all contained TCs and all TC[11,4] packets. Each TC[11,4] packet gets its sequence
+        count before the TCs it contains
+    :param pus_verificator: All contained TCs and all TC[11,4] packets will be added to this
+        verificator, like for :py:class:`tmtccmd.tmtc.queue.DefaultPusQueueHelper`
+    :param source_id: Source ID of the TC[11,4] packets
+    :raises ValueError: Invalid count field length or maximum packet size
+    """
+
+    def __init__(
+        self,
+        apid: int,
+        max_packet_size: int = 1024,
+        count_field_len: int = 1,
+        inner_apid: int | None = None,
+        seq_cnt_provider: ProvidesSeqCount | None = None,
+        pus_verificator: PusVerificator | None = None,
+        source_id: int = 0,
+    ):
+        if count_field_len not in (0, 1, 2, 4):
+            raise ValueError(f"invalid count field length {count_field_len}")
+        sec_header = PusTcDataFieldHeader(
+            service=PusService.S11_TC_SCHED, subservice=Subservice.TC_INSERT, source_id=source_id
+        ).pack()
+        self._header_len = SPACE_PACKET_HEADER_SIZE + len(sec_header)
+        if max_packet_size < self._header_len + count_field_len + 2:
+            raise ValueError(f"maximum packet size {max_packet_size} too small")
+        self.apid = apid
+        self.max_packet_size = max_packet_size
+        self.count_field_len = count_field_len
+        self.inner_apid = inner_apid
+        self.seq_cnt_provider = seq_cnt_provider
+        self.pus_verificator = pus_verificator
+        self._sec_header = bytes(sec_header)
+        self._max_tcs = 1 if count_field_len == 0 else pow(2, 8 * count_field_len) - 1
+        self._packets: list[bytearray] = []
+        self._current: bytearray | None = None
+        self._current_count = 0
+        self._current_seq_count = 0
+
+    def _start_packet(self):
+        self._current = bytearray(SPACE_PACKET_HEADER_SIZE)
+        self._current.extend(self._sec_header)
+        self._current.extend(bytes(self.count_field_len))
+        self._current_count = 0
+        self._current_seq_count = 0
+        if self.seq_cnt_provider is not None:
+            self._current_seq_count = self.seq_cnt_provider.get_and_increment()
+
+    def _finish_packet(self):
+        packet = self._current
+        if packet is None or self._current_count == 0:
+            return
+        if self.count_field_len > 0:
+            packet[self._header_len : self._header_len + self.count_field_len] = (
+                self._current_count.to_bytes(self.count_field_len, "big")
+            )
+        # Space for the CRC16, which is calculated by the stamping function.
+        packet.extend(bytes(2))
+        # Packet ID: TC packet type with secondary header flag set.
+        struct.pack_into(
+            "!HHH",
+            packet,
+            0,
+            0x1800 | (self.apid & 0x7FF),
+            0xC000 | (self._current_seq_count & 0x3FFF),
+            len(packet) - SPACE_PACKET_HEADER_SIZE - 1,
+        )
+        stamp_raw_pus_tc(packet)
+        if self.pus_verificator is not None:
+            self.pus_verificator.add_tc(PusTelecommand.unpack(packet))
+        self._packets.append(packet)
+        self._current = None
+        self._current_count = 0
+
+    def add(self, release_time: bytes, tc: bytes | bytearray | PusTelecommand):
+        """Add a time-tagged TC. A new TC[11,4] packet is started if the TC does not fit into the
+        current one anymore. The TC is checked and stamped before it is added, so the builder is
+        unchanged if the TC is rejected.
+
+        :param release_time: Absolute time when the TC shall be released, already packed
+        :param tc: TC to insert. Raw TCs are expected to contain a CRC16
+        :raises ValueError: TC does not fit into a TC[11,4] packet with the maximum size, or the
+            length field or the CRC16 of a raw TC is invalid
+        """
+        raw_tc = bytearray(tc.pack() if isinstance(tc, PusTelecommand) else tc)
+        if len(raw_tc) < SPACE_PACKET_HEADER_SIZE + 2:
+            raise ValueError(f"raw TC with length {len(raw_tc)} too short")
+        tc_len = ((raw_tc[4] << 8) | raw_tc[5]) + SPACE_PACKET_HEADER_SIZE + 1
+        if tc_len != len(raw_tc):
+            raise ValueError(
+                f"TC length {tc_len} in the primary header does not match the raw TC length "
+                f"{len(raw_tc)}"
+            )
+        if _crc16_ccitt_false(bytes(raw_tc)) != 0:
+            raise ValueError("invalid CRC16 of raw TC")
+        entry_len = len(release_time) + len(raw_tc)
+        if self._header_len + self.count_field_len + entry_len + 2 > self.max_packet_size:
+            raise ValueError(
+                f"time-tagged TC with length {entry_len} exceeds maximum packet size "
+                f"{self.max_packet_size}"
+            )
+        if (
+            self._current is None
+            or self._current_count >= self._max_tcs
+            or len(self._current) + entry_len + 2 > self.max_packet_size
+        ):
+            self._finish_packet()
+            self._start_packet()
+        assert self._current is not None
+        if self.inner_apid is not None or self.seq_cnt_provider is not None:
+            stamp_raw_pus_tc(
+                raw_tc,
+                apid=self.inner_apid,
+                seq_count=(
+                    self.seq_cnt_provider.get_and_increment()
+                    if self.seq_cnt_provider is not None
+                    else None
+                ),
+            )
+        self._current.extend(release_time)
+        self._current.extend(raw_tc)
+        self._current_count += 1
+        if self.pus_verificator is not None:
+            self.pus_verificator.add_tc(PusTelecommand.unpack(raw_tc))
+
+    def build(self) -> list[bytearray]:
+        """Finish the current TC[11,4] packet and retrieve all packed TC[11,4] packets. The
+        builder is empty afterwards and can be re-used."""
+        self._finish_packet()
+        packets = self._packets
+        self._packets = []
+        return packets
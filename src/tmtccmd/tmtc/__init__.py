@@ -1,8 +1,17 @@
 from spacepackets.ecss import PusTelemetry
 
+from .batch import (
+    BatchCommand,
+    InvalidBatchScriptError,
+    load_batch_script,
+    parse_batch_script,
+    submit_batch,
+)
 from .ccsds_tm_listener import CcsdsTmListener  # noqa re-export
 from .common import *  # noqa re-export
 from .decorator import route_to_registered_service_handlers, service_provider
+from .dispatch import CmdPathDispatcher, CmdPathMatch
+from .dry_run import DryRunReport, LinkModel, dry_run_queue
 from .handler import FeedWrapper, SendCbParams, TcHandlerBase
 from .procedure import (
     CustomProcedureInfo,
@@ -21,7 +30,14 @@ from .queue import (
     QueueWrapper,
     RawTcEntry,
     SpacePacketEntry,
+    TcPriority,
     TcQueueEntryBase,
     TcQueueEntryType,
     WaitEntry,
 )
+from .queue_file import (
+    MappedTcQueue,
+    TcQueueFileReader,
+    TcQueueFileWriter,
+    write_queue_file,
+)
@@ -0,0 +1,159 @@
+"""Non-interactive execution of batch scripts which contain command paths.
+
+A batch script contains one command path per line, optionally followed by ``key=value``
+arguments which are passed to the feed callback with
+:py:attr:`tmtccmd.tmtc.procedure.TreeCommandingProcedure.args`. A ``wait`` line waits for the
+given time in seconds, or in milliseconds with the ``ms`` suffix, after the previous command,
+for example to receive its telemetry. Arguments with spaces can be quoted and ``#`` starts a
+comment. A command with the name ``wait`` can be written with a leading slash:
+
+.. code-block:: text
+
+    # Check the ACS
+    ping
+    acs/mgm0/reset
+    wait 2.5
+    acs/mgt/set_dipoles x=0.1 y=-0.2 "label=first test"
+    wait 500ms
+    /wait
+
+All command paths are validated against the command tree before anything is sent. The commands
+are then submitted to the :py:class:`tmtccmd.CcsdsTmtcWorker` with
+:py:meth:`tmtccmd.CcsdsTmtcWorker.submit_procedure`, which feeds them one after another.
+
+Example:
+
+.. code-block:: python
+
+    commands = load_batch_script("check_acs.txt", hook_obj.get_command_definitions())
+    submit_batch(tmtc_backend, commands)
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import shlex
+from collections.abc import Iterable
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from tmtccmd.tmtc.procedure import TreeCommandingProcedure
+
+if TYPE_CHECKING:
+    from tmtccmd.config.tmtc import CmdTreeNode
+    from tmtccmd.core.ccsds import CcsdsTmtcWorker
+
+
+class InvalidBatchScriptError(Exception):
+    """Raised for invalid batch scripts. All problems of the script are collected in
+    :py:attr:`errors`, so they can be fixed at once."""
+
+    def __init__(self, errors: list[str]):
+        super().__init__("invalid batch script:\n" + "\n".join(errors))
+        self.errors = errors
+
+
+@dataclasses.dataclass
+class BatchCommand:
+    """Command of a batch script.
+
+    :var cmd_path: Command path
+    :var args: Command arguments
+    :var wait_after: Sum of the wait lines after the command
+    :var line: Line number in the script
+    """
+
+    cmd_path: str
+    args: dict[str, str] = dataclasses.field(default_factory=dict)
+    wait_after: timedelta = timedelta()
+    line: int = 0
+
+    def to_procedure(self) -> TreeCommandingProcedure:
+        return TreeCommandingProcedure(self.cmd_path, dict(self.args))
+
+
+def parse_batch_script(lines: Iterable[str]) -> list[BatchCommand]:
+    """Parse the lines of a batch script.
+
+    :raises InvalidBatchScriptError: The script contains invalid lines
+    """
+    commands: list[BatchCommand] = []
+    errors = []
+    for line_num, line in enumerate(lines, start=1):
+        try:
+            tokens = shlex.split(line, comments=True)
+        except ValueError as e:
+            errors.append(f"line {line_num}: {e}")
+            continue
+        if not tokens:
+            continue
+        if tokens[0] == "wait":
+            if len(tokens) != 2:
+                errors.append(f"line {line_num}: expected one wait time")
+                continue
+            wait_time = _parse_wait_time(tokens[1])
+            if wait_time is None:
+                errors.append(f"line {line_num}: invalid wait time {tokens[1]!r}")
+            elif not commands:
+                errors.append(f"line {line_num}: wait before the first command")
+            else:
+                commands[-1].wait_after += wait_time
+            continue
+        args = {}
+        for token in tokens[1:]:
+            key, sep, value = token.partition("=")
+            if not sep or not key:
+                errors.append(f"line {line_num}: expected key=value argument, got {token!r}")
+            args[key] = value
+        commands.append(BatchCommand(cmd_path=tokens[0], args=args, line=line_num))
+    if errors:
+        raise InvalidBatchScriptError(errors)
+    return commands
+
+
+def validate_batch_commands(commands: Iterable[BatchCommand], tree: CmdTreeNode):
+    """Check that all command paths are contained in the command tree.
+
+    :raises InvalidBatchScriptError: Unknown command paths
+    """
+    errors = [
+        f"line {command.line}: unknown command path {command.cmd_path!r}"
+        for command in commands
+        if command.cmd_path.strip("/") == "" or not tree.contains_path(command.cmd_path)
+    ]
+    if errors:
+        raise InvalidBatchScriptError(errors)
+
+
+def load_batch_script(path: str, tree: CmdTreeNode | None = None) -> list[BatchCommand]:
+    """Parse a batch script file and validate the command paths if a command tree is given.
+
+    :raises OSError: Reading the file failed
+    :raises InvalidBatchScriptError: The script is invalid or contains unknown command paths
+    """
+    with open(path, encoding="utf-8") as file:
+        commands = parse_batch_script(file)
+    if tree is not None:
+        validate_batch_commands(commands, tree)
+    return commands
+
+
+def submit_batch(worker: CcsdsTmtcWorker, commands: Iterable[BatchCommand]):
+    """Submit the commands to the worker, which executes them one after another."""
+    for command in commands:
+        worker.submit_procedure(command.to_procedure(), wait_after=command.wait_after)
+
+
+def _parse_wait_time(text: str) -> timedelta | None:
+    scale = 1.0
+    if text.endswith("ms"):
+        text, scale = text[:-2], 1e-3
+    elif text.endswith("s"):
+        text = text[:-1]
+    try:
+        seconds = float(text) * scale
+    except ValueError:
+        return None
+    if not seconds >= 0 or seconds == float("inf"):
+        return None
+    return timedelta(seconds=seconds)
@@ -2,6 +2,7 @@
 
 import enum
 import logging
+from collections import deque
 from datetime import timedelta
 
 from com_interface import ComInterface
@@ -14,7 +15,7 @@ from tmtccmd.tmtc import (
     TcQueueEntryType,
 )
 from tmtccmd.tmtc.handler import SendCbParams, TcHandlerBase
-from tmtccmd.tmtc.queue import QueueWrapper
+from tmtccmd.tmtc.queue import QueueDequeT, QueueWrapper, TcPriority
 
 
 class SenderMode(enum.IntEnum):
@@ -32,7 +33,23 @@ class SeqResultWrapper:
 
 
 class SequentialCcsdsSender:
-    """Specific implementation of CommandSenderReceiver to send multiple telecommands in sequence"""
+    """Specific implementation of CommandSenderReceiver to send multiple telecommands in sequence.
+
+    The entries of the queue wrapper form the :py:attr:`TcPriority.NORMAL` priority class.
+    Entries of higher priority classes can be inserted with :py:meth:`add_prioritized_entry`.
+    They are kept in one queue per priority class and are always handled before the entries of
+    lower priority classes. Each priority class has its own wait countdown, so wait entries of
+    lower priority classes do not delay higher priority TCs.
+
+    Entries with a higher priority inside the queue of the queue wrapper, for example added by
+    the feed callback, are moved to the queue of their priority class when the queue wrapper is
+    set. Entries which are added to that queue later, and the entries of queues which are not a
+    :py:class:`collections.deque` like :py:class:`tmtccmd.tmtc.queue_file.MappedTcQueue`, are
+    moved when they reach the front of the queue.
+
+    The inter-command delay applies to all TCs. A packet delay entry therefore changes the
+    inter-command delay for all priority classes, irrespective of its own priority class.
+    """
 
     def __init__(
         self,
@@ -48,12 +65,18 @@ class SequentialCcsdsSender:
         self._proc_wrapper = ProcedureWrapper(None)
         self._mode = SenderMode.DONE
         self._wait_cd = Countdown(None)
+        # Index 0 is unused, the NORMAL priority class uses the queue of the queue wrapper and
+        # the default wait countdown.
+        self._prio_queues: list[QueueDequeT] = [deque() for _ in TcPriority]
+        self._prio_wait_cds = [Countdown(None) for _ in TcPriority]
+        self._active_prio = TcPriority.NORMAL
         self._send_cd = Countdown(queue_wrapper.inter_cmd_delay)
         self._current_res = SeqResultWrapper(self._mode)
         self._current_res.longest_rem_delay = queue_wrapper.inter_cmd_delay
         self._op_divider = 0
         self._last_queue_entry: TcQueueEntryBase | None = None
         self._last_tc: TcQueueEntryBase | None = None
+        self._classify_queue()
 
     @property
     def queue_wrapper(self):
@@ -71,6 +94,7 @@ class SequentialCcsdsSender:
         self._current_res.longest_rem_delay = queue_wrapper.inter_cmd_delay
         self._proc_wrapper.procedure = self._queue_wrapper.info
         self._queue_wrapper = queue_wrapper
+        self._classify_queue()
 
     def handle_new_queue_forced(self, queue_wrapper: QueueWrapper):
         self._mode = SenderMode.DONE
@@ -80,9 +104,58 @@ class SequentialCcsdsSender:
     def resume(self):
         """Can be used to resume a finished sequential sender it the provided queue is
         not empty anymore"""
-        if self._mode == SenderMode.DONE and self.queue_wrapper.queue:
+        if self._mode == SenderMode.DONE and self._next_priority() is not None:
             self._mode = SenderMode.BUSY
 
+    def add_prioritized_entry(self, entry: TcQueueEntryBase):
+        """Insert an entry according to its priority class. Entries with the NORMAL priority are
+        appended to the queue of the queue wrapper. The sender is resumed if it is finished.
+        """
+        if entry.priority == TcPriority.NORMAL:
+            self.queue_wrapper.queue.append(entry)
+        else:
+            self._prio_queues[entry.priority].append(entry)
+        self.resume()
+
+    def _classify_queue(self):
+        """Move the entries with a priority higher than NORMAL from the queue of the queue wrapper
+        to the queues of their priority classes."""
+        queue = self._queue_wrapper.queue
+        if not isinstance(queue, deque) or all(
+            entry.priority == TcPriority.NORMAL for entry in queue
+        ):
+            return
+        normal_entries = []
+        for entry in queue:
+            if entry.priority == TcPriority.NORMAL:
+                normal_entries.append(entry)
+            else:
+                self._prio_queues[entry.priority].append(entry)
+        # The queue object is kept, it might be referenced by the queue helper.
+        queue.clear()
+        queue.extend(normal_entries)
+
+    def _queue_for(self, prio: TcPriority) -> QueueDequeT:
+        if prio == TcPriority.NORMAL:
+            return self.queue_wrapper.queue
+        return self._prio_queues[prio]
+
+    def _wait_cd_for(self, prio: TcPriority) -> Countdown:
+        if prio == TcPriority.NORMAL:
+            return self._wait_cd
+        return self._prio_wait_cds[prio]
+
+    def _next_priority(self) -> TcPriority | None:
+        """Highest priority class with pending entries."""
+        queue = self.queue_wrapper.queue
+        while queue and queue[0].priority != TcPriority.NORMAL:
+            entry = queue.popleft()
+            self._prio_queues[entry.priority].append(entry)
+        for prio in reversed(TcPriority):
+            if self._queue_for(prio):
+                return prio
+        return None
+
     def operation(self, com_if: ComInterface) -> SeqResultWrapper:
         """Primary function which should be called periodically to consume a TC queue.
 
@@ -102,7 +175,8 @@ class SequentialCcsdsSender:
         :return:
         """
         # Do not use continue anywhere in this while loop for now
-        if not self.queue_wrapper.queue:
+        next_prio = self._next_priority()
+        if next_prio is None:
             self._current_res.queue_empty = True
             if self.no_delay_remaining():
                 self._proc_wrapper.procedure = self._queue_wrapper.info
@@ -112,24 +186,27 @@ class SequentialCcsdsSender:
                 return
         else:
             self._current_res.queue_empty = False
+            self._active_prio = next_prio
             self._check_next_telecommand(com_if)
         self._update_largest_delay()
         self.__print_rem_timeout(op_divider=self._op_divider)
         self._op_divider += 1
 
     def __print_rem_timeout(self, op_divider: int, divisor: int = 15):
-        if not self.__wait_cd_timed_out() and op_divider % divisor == 0:
-            rem_time = self._wait_cd.remaining_time()
-            if self._wait_cd.remaining_time() > timedelta():
+        wait_cd = self._wait_cd_for(self._active_prio)
+        if not wait_cd.timed_out() and op_divider % divisor == 0:
+            rem_time = wait_cd.remaining_time()
+            if rem_time > timedelta():
                 print(f"{rem_time.total_seconds():.01f} seconds wait time remaining")
 
     def _check_next_telecommand(self, com_if: ComInterface):
         """Sends the next telecommand and returns whether an actual telecommand was sent"""
-        next_queue_entry = self.queue_wrapper.queue[0]
+        queue = self._queue_for(self._active_prio)
+        next_queue_entry = queue[0]
         is_tc = self.handle_non_tc_entry(next_queue_entry)
         consume_queue_entry = True
         if is_tc:
-            if self.no_delay_remaining():
+            if self.__send_cd_timed_out() and self._wait_cd_for(self._active_prio).timed_out():
                 self._current_res.tc_sent = True
             else:
                 self._current_res.tc_sent = False
@@ -145,17 +222,22 @@ class SequentialCcsdsSender:
                     self._send_cd.reset(self.queue_wrapper.inter_cmd_delay)
                 else:
                     self._send_cd.reset()
-            self.queue_wrapper.queue.popleft()
-            if self.queue_wrapper.queue:
-                self._current_res.next_entry_is_tc = self.queue_wrapper.queue[0].is_tc()
+            queue.popleft()
+            next_prio = self._next_priority()
+            if next_prio is not None:
+                self._current_res.next_entry_is_tc = self._queue_for(next_prio)[0].is_tc()
             else:
                 self._current_res.next_entry_is_tc = False
-        if not self.queue_wrapper.queue and self.no_delay_remaining():
+        if self._next_priority() is None and self.no_delay_remaining():
             self._tc_handler.queue_finished_cb(ProcedureWrapper(self._queue_wrapper.info))
             self._mode = SenderMode.DONE
 
     def no_delay_remaining(self) -> bool:
-        return self.__send_cd_timed_out() and self.__wait_cd_timed_out()
+        return (
+            self.__send_cd_timed_out()
+            and self.__wait_cd_timed_out()
+            and all(wait_cd.timed_out() for wait_cd in self._prio_wait_cds)
+        )
 
     def __send_cd_timed_out(self):
         """Internal wrapper API to allow easier testing"""
@@ -179,7 +261,7 @@ class SequentialCcsdsSender:
             logging.getLogger(__name__).info(
                 f"Waiting for {wait_entry.wait_time.total_seconds() * 1000} milliseconds."
             )
-            self._wait_cd.reset(new_timeout=wait_entry.wait_time)
+            self._wait_cd_for(self._active_prio).reset(new_timeout=wait_entry.wait_time)
         elif queue_entry.etype == TcQueueEntryType.PACKET_DELAY:
             timeout_entry = cast_wrapper.to_packet_delay_entry()
             self.queue_wrapper.inter_cmd_delay = timeout_entry.delay_time
@@ -191,6 +273,12 @@ class SequentialCcsdsSender:
         return is_tc
 
     def _update_largest_delay(self):
-        self._current_res.longest_rem_delay = max(
-            self._wait_cd.remaining_time(), self._send_cd.remaining_time()
-        )
+        next_prio = self._next_priority()
+        if next_prio is not None:
+            wait_delay = self._wait_cd_for(next_prio).remaining_time()
+        else:
+            wait_delay = max(
+                self._wait_cd.remaining_time(),
+                *(wait_cd.remaining_time() for wait_cd in self._prio_wait_cds),
+            )
+        self._current_res.longest_rem_delay = max(wait_delay, self._send_cd.remaining_time())
@@ -0,0 +1,222 @@
+"""Dispatch of command paths to handler functions, for example inside
+:py:meth:`tmtccmd.tmtc.handler.TcHandlerBase.feed_cb`.
+
+Handlers are registered for path patterns. A pattern segment can be a literal node name, a
+parameter like ``{device}`` which matches one node name, or, as the last segment, a subtree
+parameter like ``{cmd*}`` which matches all remaining node names, including none. The patterns
+are compiled into a trie, so a command path is usually resolved in a single pass over its nodes
+and the matched node names are passed to the handler as keyword arguments.
+
+At each level, literal names take precedence over parameters. If the literal branch does not
+lead to a handler for the full path, the parameter branch is tried, so ``acs/mgm0/calibrate``
+matches ``acs/{device}/calibrate`` even if ``acs/mgm0/reset`` is registered. If no pattern
+matches the full path, the deepest matching subtree pattern is used.
+
+Example:
+
+.. code-block:: python
+
+    dispatcher = CmdPathDispatcher(hook.get_command_definitions())
+
+    @dispatcher.route("ping")
+    def ping(q: DefaultPusQueueHelper):
+        q.add_pus_tc(PusTelecommand(apid=EXAMPLE_PUS_APID, service=17, subservice=1))
+
+    @dispatcher.route("acs/{device}/reset")
+    def reset_acs_device(q: DefaultPusQueueHelper, device: str):
+        ...
+
+    def feed_cb(self, info: ProcedureWrapper, wrapper: FeedWrapper):
+        ...
+        if not dispatcher.dispatch(def_proc.cmd_path, self.queue_helper):
+            _LOGGER.warning(f"No handler for command path {def_proc.cmd_path}")
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from tmtccmd.config.tmtc import CmdTreeNode
+
+
+@dataclasses.dataclass
+class CmdPathMatch:
+    """Result of resolving a command path.
+
+    :var pattern: Pattern the handler was registered for
+    :var handler: Registered handler
+    :var params: Node names matched by the parameters of the pattern. Subtree parameters
+        contain the slash separated remaining path.
+    """
+
+    pattern: str
+    handler: Callable[..., Any]
+    params: dict[str, str]
+
+    def __call__(self, *args, **kwargs) -> Any:
+        """Call the handler with the given arguments and the parameters as keyword arguments."""
+        return self.handler(*args, **kwargs, **self.params)
+
+
+class _TrieNode:
+    __slots__ = ("literals", "param", "subtree", "handler")
+
+    def __init__(self):
+        self.literals: dict[str, _TrieNode] = {}
+        # Parameter name and the node for the next segment.
+        self.param: tuple[str, _TrieNode] | None = None
+        # Parameter name, pattern and handler of a subtree pattern ending at this node.
+        self.subtree: tuple[str, str, Callable[..., Any]] | None = None
+        self.handler: tuple[str, Callable[..., Any]] | None = None
+
+
+class CmdPathDispatcher:
+    """Registry which maps command path patterns to handlers. The pattern syntax is described
+    in the module documentation.
+
+    :param tree: Optional command tree. If it is set, the literal start of each pattern up to
+        the first parameter must be a path of the tree.
+    """
+
+    def __init__(self, tree: CmdTreeNode | None = None):
+        self.tree = tree
+        self._root = _TrieNode()
+        self._patterns: list[str] = []
+
+    @property
+    def patterns(self) -> list[str]:
+        """Registered patterns in registration order"""
+        return list(self._patterns)
+
+    def register(self, pattern: str, handler: Callable[..., Any]):
+        """Register a handler for a path pattern. Leading and trailing slashes are ignored and
+        the pattern ``/`` is the root node.
+
+        :raises ValueError: The pattern is invalid, a handler is already registered for it, it
+            uses a different parameter name than another pattern at the same position, or its
+            literal start is not a path of the command tree
+        """
+        segments = _split(pattern)
+        # Number of literal segments before the first parameter
+        prefix_len = next(
+            (idx for idx, segment in enumerate(segments) if segment.startswith("{")),
+            len(segments),
+        )
+        node = self._root
+        for idx, segment in enumerate(segments):
+            if not (segment.startswith("{") and segment.endswith("}")):
+                if segment == "" or "{" in segment or "}" in segment:
+                    raise ValueError(f"invalid segment {segment!r} in pattern {pattern!r}")
+                node = node.literals.setdefault(segment, _TrieNode())
+                continue
+            name = segment[1:-1]
+            if name.endswith("*"):
+                name = name[:-1]
+                if idx != len(segments) - 1:
+                    raise ValueError(f"subtree parameter must be last in pattern {pattern!r}")
+            if not name.isidentifier() or segments.count(segment) > 1:
+                raise ValueError(f"invalid parameter name {name!r} in pattern {pattern!r}")
+            if segment.endswith("*}"):
+                if node.subtree is not None:
+                    raise ValueError(f"handler for pattern {pattern!r} already registered")
+                self._check_tree(pattern, segments[:prefix_len])
+                node.subtree = (name, pattern, handler)
+                self._patterns.append(pattern)
+                return
+            if node.param is None:
+                node.param = (name, _TrieNode())
+            elif node.param[0] != name:
+                raise ValueError(
+                    f"parameter {name!r} of pattern {pattern!r} conflicts with parameter "
+                    f"{node.param[0]!r} of another pattern"
+                )
+            node = node.param[1]
+        if node.handler is not None:
+            raise ValueError(f"handler for pattern {pattern!r} already registered")
+        self._check_tree(pattern, segments[:prefix_len])
+        node.handler = (pattern, handler)
+        self._patterns.append(pattern)
+
+    def route(self, pattern: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """Decorator which registers the decorated function with :py:meth:`register`."""
+
+        def decorator(handler: Callable[..., Any]) -> Callable[..., Any]:
+            self.register(pattern, handler)
+            return handler
+
+        return decorator
+
+    def resolve(self, cmd_path: str) -> CmdPathMatch | None:
+        """Find the handler for a command path.
+
+        :return: None if no pattern matches the path
+        """
+        names = _split(cmd_path)
+        # Deepest subtree pattern along the visited branches, the position of its first segment
+        # and the parameters matched before it.
+        fallback: list[tuple[tuple[str, str, Callable[..., Any]], int, dict[str, str]]] = []
+        match = self._resolve_from(self._root, names, 0, {}, fallback)
+        if match is not None:
+            return match
+        if fallback:
+            (name, pattern, handler), idx, params = fallback[0]
+            params[name] = "/".join(names[idx:])
+            return CmdPathMatch(pattern=pattern, handler=handler, params=params)
+        return None
+
+    def _resolve_from(
+        self,
+        node: _TrieNode,
+        names: list[str],
+        idx: int,
+        params: dict[str, str],
+        fallback: list[tuple[tuple[str, str, Callable[..., Any]], int, dict[str, str]]],
+    ) -> CmdPathMatch | None:
+        if node.subtree is not None and (not fallback or fallback[0][1] < idx):
+            fallback[:] = [(node.subtree, idx, dict(params))]
+        if idx == len(names):
+            if node.handler is None:
+                return None
+            return CmdPathMatch(pattern=node.handler[0], handler=node.handler[1], params=params)
+        child = node.literals.get(names[idx])
+        if child is not None:
+            match = self._resolve_from(child, names, idx + 1, params, fallback)
+            if match is not None:
+                return match
+        if node.param is not None:
+            name, child = node.param
+            params[name] = names[idx]
+            match = self._resolve_from(child, names, idx + 1, params, fallback)
+            if match is not None:
+                return match
+            del params[name]
+        return None
+
+    def dispatch(self, cmd_path: str, *args, **kwargs) -> bool:
+        """Call the handler for a command path with the given arguments and the parameters of
+        the pattern as keyword arguments.
+
+        :return: False if no pattern matches the path
+        """
+        match = self.resolve(cmd_path)
+        if match is None:
+            return False
+        match(*args, **kwargs)
+        return True
+
+    def _check_tree(self, pattern: str, literal_prefix: list[str]):
+        if self.tree is None or not literal_prefix:
+            return
+        if not self.tree.contains_path_from_node_list(literal_prefix):
+            raise ValueError(
+                f"path {'/'.join(literal_prefix)!r} of pattern {pattern!r} is not in the command "
+                "tree"
+            )
+
+
+def _split(path: str) -> list[str]:
+    path = path.strip("/")
+    return path.split("/") if path else []
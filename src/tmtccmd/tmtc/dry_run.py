@@ -0,0 +1,207 @@
+"""Dry-run analysis of TC queues. This can be used as a pre-flight check to determine whether a
+procedure fits into a contact window without sending anything."""
+
+from __future__ import annotations
+
+import bisect
+import dataclasses
+import itertools
+from datetime import timedelta
+from typing import cast
+
+from tmtccmd.tmtc.queue import (
+    PacketDelayEntry,
+    PusTcEntry,
+    QueueWrapper,
+    RawTcEntry,
+    SpacePacketEntry,
+    TcQueueEntryBase,
+    TcQueueEntryType,
+    WaitEntry,
+)
+
+
+@dataclasses.dataclass
+class LinkModel:
+    """Simple model of the uplink.
+
+    :var bitrate: Uplink bandwidth in bits per second
+    :var per_packet_overhead: Additional bytes transmitted for each TC, for example for framing
+        or transfer frame headers
+    :var latency: One-way latency which is added to the transmission time of each TC
+    """
+
+    bitrate: float
+    per_packet_overhead: int = 0
+    latency: timedelta = dataclasses.field(default_factory=timedelta)
+
+
+@dataclasses.dataclass
+class DryRunReport:
+    """Result of a queue dry-run.
+
+    :var total_duration: Time until the sequential sender would report the queue as finished, or
+        until the last TC arrived if a link model was used and the link is the bottleneck
+    :var tc_sizes: Size of each TC in bytes, in the order they would be sent
+    :var send_times: Time offset in seconds at which each TC would be sent by the sender
+    :var arrival_times: Time offset in seconds at which each TC would have been received
+        completely. Only contains values if a link model was used
+    :var peak_rate: Highest transmitted data rate in bytes per second, measured over the
+        configured peak window. If a link model was used, only the bytes transmitted inside the
+        window are counted, so the peak rate does not exceed the link bandwidth
+    """
+
+    total_duration: timedelta
+    tc_sizes: list[int]
+    send_times: list[float]
+    arrival_times: list[float]
+    peak_rate: float
+
+    @property
+    def num_tcs(self) -> int:
+        return len(self.tc_sizes)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(self.tc_sizes)
+
+    def fits_in(self, window: timedelta) -> bool:
+        return self.total_duration <= window
+
+
+def tc_size(entry: TcQueueEntryBase) -> int:
+    """Determine the size of a TC queue entry without packing it.
+
+    :return: Size in bytes, 0 for queue entries which are not TCs
+    """
+    etype = entry.etype
+    if etype == TcQueueEntryType.PUS_TC:
+        return cast(PusTcEntry, entry).pus_tc.packet_len
+    if etype == TcQueueEntryType.RAW_TC:
+        return len(cast(RawTcEntry, entry).tc)
+    if etype == TcQueueEntryType.CCSDS_TC:
+        return cast(SpacePacketEntry, entry).space_packet.sp_header.packet_len
+    return 0
+
+
+def _peak_rate(times: list[float], sizes: list[int], window: float) -> float:
+    """Two-pointer sliding window over the sorted send times."""
+    peak = 0
+    window_bytes = 0
+    start = 0
+    for end, time in enumerate(times):
+        window_bytes += sizes[end]
+        while times[start] <= time - window:
+            window_bytes -= sizes[start]
+            start += 1
+        if window_bytes > peak:
+            peak = window_bytes
+    return peak / window
+
+
+def _peak_link_rate(
+    tx_starts: list[float], tx_durations: list[float], bytes_per_sec: float, window: float
+) -> float:
+    """Peak rate of the serialized transmissions on the link, only counting the bytes which are
+    transmitted inside the window. The transmitted bytes in a window only change their slope at
+    the start and end of a transmission, so the maximum is found for a window which starts at
+    a transmission start or ends at a transmission end."""
+    # Accumulated transmission time before each transmission start
+    busy_before = list(itertools.accumulate(tx_durations, initial=0.0))
+
+    def busy_until(time: float) -> float:
+        idx = bisect.bisect_right(tx_starts, time) - 1
+        if idx < 0:
+            return 0.0
+        return busy_before[idx] + min(time - tx_starts[idx], tx_durations[idx])
+
+    peak_busy = 0.0
+    for start, duration in zip(tx_starts, tx_durations, strict=True):
+        tx_end = start + duration
+        peak_busy = max(
+            peak_busy,
+            busy_until(start + window) - busy_until(start),
+            busy_until(tx_end) - busy_until(tx_end - window),
+        )
+    return min(peak_busy / window, 1.0) * bytes_per_sec
+
+
+def dry_run_queue(
+    queue_wrapper: QueueWrapper,
+    link: LinkModel | None = None,
+    peak_window: timedelta = timedelta(seconds=1),
+) -> DryRunReport:
+    """Simulate the consumption of a TC queue by the
+    :py:class:`tmtccmd.tmtc.ccsds_seq_sender.SequentialCcsdsSender` against a virtual clock.
+    The passed queue wrapper is not modified.
+
+    The same semantics as for the sequential sender apply: The first TC is sent immediately,
+    wait entries delay the next TC, packet delay entries change the inter-command delay and
+    delay the next TC and the queue is only finished after all delays have expired. If a link
+    model is passed, the TCs are additionally serialized on the modelled link.
+
+    :param queue_wrapper: Queue to analyze
+    :param link: Optional uplink model
+    :param peak_window: Window used to determine the peak data rate
+    :raises ValueError: Invalid peak window or link bitrate
+    """
+    window = peak_window.total_seconds()
+    if window <= 0:
+        raise ValueError("peak window must be positive")
+    if link is not None and link.bitrate <= 0:
+        raise ValueError("link bitrate must be positive")
+    wait_type = TcQueueEntryType.WAIT
+    delay_type = TcQueueEntryType.PACKET_DELAY
+
+    inter_cmd_delay = queue_wrapper.inter_cmd_delay.total_seconds()
+    now = 0.0
+    send_ready = 0.0
+    wait_ready = 0.0
+    tc_sizes: list[int] = []
+    send_times: list[float] = []
+    for entry in queue_wrapper.queue:
+        if not entry.is_tc():
+            # Non-TC entries are consumed immediately, even if delays are still pending.
+            etype = entry.etype
+            if etype is wait_type:
+                wait_ready = now + cast(WaitEntry, entry).wait_time.total_seconds()
+            elif etype is delay_type:
+                inter_cmd_delay = cast(PacketDelayEntry, entry).delay_time.total_seconds()
+                send_ready = now + inter_cmd_delay
+            continue
+        if send_ready > now:
+            now = send_ready
+        if wait_ready > now:
+            now = wait_ready
+        tc_sizes.append(tc_size(entry))
+        send_times.append(now)
+        send_ready = now + inter_cmd_delay
+    end = max(now, send_ready, wait_ready)
+
+    arrival_times: list[float] = []
+    if link is not None:
+        bytes_per_sec = link.bitrate / 8.0
+        overhead = link.per_packet_overhead
+        latency = link.latency.total_seconds()
+        link_free = 0.0
+        tx_starts: list[float] = []
+        tx_durations: list[float] = []
+        for send_time, size in zip(send_times, tc_sizes, strict=True):
+            start = send_time if send_time > link_free else link_free
+            duration = (size + overhead) / bytes_per_sec
+            link_free = start + duration
+            tx_starts.append(start)
+            tx_durations.append(duration)
+            arrival_times.append(link_free + latency)
+        if arrival_times and arrival_times[-1] > end:
+            end = arrival_times[-1]
+        peak_rate = _peak_link_rate(tx_starts, tx_durations, bytes_per_sec, window)
+    else:
+        peak_rate = _peak_rate(send_times, tc_sizes, window)
+    return DryRunReport(
+        total_duration=timedelta(seconds=end),
+        tc_sizes=tc_sizes,
+        send_times=send_times,
+        arrival_times=arrival_times,
+        peak_rate=peak_rate,
+    )
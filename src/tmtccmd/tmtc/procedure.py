@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import enum
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
-from tmtccmd.cfdp import CfdpRequestWrapper
+if TYPE_CHECKING:
+    from tmtccmd.cfdp import CfdpRequestWrapper
 
 
 class TcProcedureType(enum.Enum):
@@ -30,29 +31,40 @@ class CustomProcedureInfo(TcProcedureBase):
 class TreeCommandingProcedure(TcProcedureBase):
     """Generic abstraction for procedures. A procedure can be a single command or a sequence
     of commands. Generally, one procedure is mapped to a specific TC queue which is packed
-    during run-time"""
+    during run-time.
 
-    def __init__(self, cmd_path: str | None):
+    :param cmd_path: Command path in the command tree
+    :param args: Optional command arguments, for example from a batch script, which can be used
+        by the feed callback to parametrize the commands
+    """
+
+    def __init__(self, cmd_path: str | None, args: dict[str, str] | None = None):
         super().__init__(TcProcedureType.TREE_COMMANDING)
         self.cmd_path = cmd_path
+        self.args: dict[str, str] = args if args is not None else {}
 
     @classmethod
     def empty(cls):
         return cls(None)
 
     def __repr__(self):
+        if self.args:
+            return f"CmdInfo(cmd_path={self.cmd_path!r}, args={self.args!r})"
         return f"CmdInfo(cmd_path={self.cmd_path!r})"
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, TreeCommandingProcedure):
-            return self.cmd_path == other.cmd_path
+            return self.cmd_path == other.cmd_path and self.args == other.args
         return False
 
 
 class CfdpProcedure(TcProcedureBase):
     def __init__(self):
+        # Deferred, so the CFDP library is only imported when CFDP is used.
+        from tmtccmd.cfdp import CfdpRequestWrapper
+
         super().__init__(TcProcedureType.CFDP)
-        self.request_wrapper = CfdpRequestWrapper(None)
+        self.request_wrapper: CfdpRequestWrapper = CfdpRequestWrapper(None)
 
     @property
     def cfdp_request_type(self):
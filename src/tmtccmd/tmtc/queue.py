@@ -4,7 +4,7 @@ import abc
 from abc import ABC
 from collections import deque
 from datetime import timedelta
-from enum import Enum
+from enum import Enum, IntEnum
 from typing import Any, cast
 
 from spacepackets.ccsds import SpacePacket
@@ -12,7 +12,7 @@ from spacepackets.ecss import PusService, PusVerificator, check_pus_crc
 from spacepackets.ecss.tc import PusTelecommand
 from spacepackets.seqcount import ProvidesSeqCount
 
-from tmtccmd.pus.s11_tc_sched import Subservice as Pus11Subservice
+from tmtccmd.pus.s11_tc_sched_defs import Subservice as Pus11Subservice
 from tmtccmd.tmtc.procedure import TcProcedureBase, TreeCommandingProcedure
 
 
@@ -26,11 +26,22 @@ class TcQueueEntryType(Enum):
     PACKET_DELAY = "set-delay"
 
 
+class TcPriority(IntEnum):
+    """Priority class of a queue entry. Entries with a priority higher than NORMAL are sent
+    before all entries of lower priority classes and are not blocked by their pending waits.
+    The order of entries within the same priority class is preserved."""
+
+    NORMAL = 0
+    HIGH = 1
+    URGENT = 2
+
+
 class TcQueueEntryBase:
     """Generic TC queue entry abstraction. This allows filling the TC queue with custom objects"""
 
-    def __init__(self, etype: TcQueueEntryType):
+    def __init__(self, etype: TcQueueEntryType, priority: TcPriority = TcPriority.NORMAL):
         self.etype = etype
+        self.priority = priority
 
     def is_tc(self) -> bool:
         """Check whether concrete object is an actual telecommand"""
@@ -45,8 +56,8 @@ QueueDequeT = deque[TcQueueEntryBase]
 
 
 class PusTcEntry(TcQueueEntryBase):
-    def __init__(self, pus_tc: PusTelecommand):
-        super().__init__(TcQueueEntryType.PUS_TC)
+    def __init__(self, pus_tc: PusTelecommand, priority: TcPriority = TcPriority.NORMAL):
+        super().__init__(TcQueueEntryType.PUS_TC, priority)
         self.pus_tc = pus_tc
 
     def __repr__(self):
@@ -54,8 +65,8 @@ class PusTcEntry(TcQueueEntryBase):
 
 
 class SpacePacketEntry(TcQueueEntryBase):
-    def __init__(self, space_packet: SpacePacket):
-        super().__init__(TcQueueEntryType.CCSDS_TC)
+    def __init__(self, space_packet: SpacePacket, priority: TcPriority = TcPriority.NORMAL):
+        super().__init__(TcQueueEntryType.CCSDS_TC, priority)
         self.space_packet = space_packet
 
     def __repr__(self):
@@ -63,8 +74,8 @@ class SpacePacketEntry(TcQueueEntryBase):
 
 
 class LogQueueEntry(TcQueueEntryBase):
-    def __init__(self, log_str: str):
-        super().__init__(TcQueueEntryType.LOG)
+    def __init__(self, log_str: str, priority: TcPriority = TcPriority.NORMAL):
+        super().__init__(TcQueueEntryType.LOG, priority)
         self.log_str = log_str
 
     def __repr__(self):
@@ -72,8 +83,8 @@ class LogQueueEntry(TcQueueEntryBase):
 
 
 class RawTcEntry(TcQueueEntryBase):
-    def __init__(self, tc: bytes):
-        super().__init__(TcQueueEntryType.RAW_TC)
+    def __init__(self, tc: bytes, priority: TcPriority = TcPriority.NORMAL):
+        super().__init__(TcQueueEntryType.RAW_TC, priority)
         self.tc = tc
 
     def __repr__(self):
@@ -81,8 +92,8 @@ class RawTcEntry(TcQueueEntryBase):
 
 
 class WaitEntry(TcQueueEntryBase):
-    def __init__(self, wait_time: timedelta):
-        super().__init__(TcQueueEntryType.WAIT)
+    def __init__(self, wait_time: timedelta, priority: TcPriority = TcPriority.NORMAL):
+        super().__init__(TcQueueEntryType.WAIT, priority)
         self.wait_time = wait_time
 
     @classmethod
@@ -94,8 +105,8 @@ class WaitEntry(TcQueueEntryBase):
 
 
 class PacketDelayEntry(TcQueueEntryBase):
-    def __init__(self, delay_time: timedelta):
-        super().__init__(TcQueueEntryType.PACKET_DELAY)
+    def __init__(self, delay_time: timedelta, priority: TcPriority = TcPriority.NORMAL):
+        super().__init__(TcQueueEntryType.PACKET_DELAY, priority)
         self.delay_time = delay_time
 
     @classmethod
@@ -252,14 +263,27 @@ class DefaultPusQueueHelper(QueueHelperBase):
             self._pus_packet_handler(pus_entry.pus_tc)
 
     def _handle_time_tagged_tc(self, pus_tc: PusTelecommand):
-        new_pus_tc_app_data = bytearray()
-        new_pus_tc_app_data.extend(pus_tc.app_data[: self.tc_sched_timestamp_len])
+        # Imported on first use to keep "import tmtccmd" fast: the TC scheduling module imports
+        # the deprecated package and the spacepackets time modules, which take about 25 ms.
+        from tmtccmd.pus.s11_tc_sched import stamp_raw_pus_tc
+
+        new_pus_tc_app_data = bytearray(pus_tc.app_data)
         pus_tc_raw = new_pus_tc_app_data[self.tc_sched_timestamp_len :]
         if not check_pus_crc(pus_tc_raw):
             raise ValueError(f"crc check on contained PUS TC with length {len(pus_tc_raw)} failed")
-        time_tagged_tc = PusTelecommand.unpack(pus_tc_raw)
-        self._pus_packet_handler(time_tagged_tc)
-        new_pus_tc_app_data.extend(time_tagged_tc.pack())
+        seq_count = None
+        if self.seq_cnt_provider is not None:
+            seq_count = self.seq_cnt_provider.get_and_increment()
+        stamp_raw_pus_tc(
+            new_pus_tc_app_data,
+            self.tc_sched_timestamp_len,
+            apid=self.pus_apid,
+            seq_count=seq_count,
+        )
+        if self.pus_verificator is not None:
+            self.pus_verificator.add_tc(
+                PusTelecommand.unpack(new_pus_tc_app_data[self.tc_sched_timestamp_len :])
+            )
         pus_tc._app_data = new_pus_tc_app_data
 
     def _pus_packet_handler(self, pus_tc: PusTelecommand):
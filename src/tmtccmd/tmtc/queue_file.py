@@ -0,0 +1,439 @@
+"""Persistent binary format for prepared TC queues.
+
+This allows building large uploads like onboard software patches or schedule tables offline once
+and loading them instantly later. The file layout is the following, with all fields using network
+byte order:
+
+1. File header: 4 byte magic ``TCQF``, 1 byte format version, 1 byte flags, 8 byte inter-command
+   delay in microseconds, 4 byte entry count and a 2 byte command path length, followed by the
+   UTF-8 encoded command path of the :py:class:`tmtccmd.tmtc.TreeCommandingProcedure` the queue
+   was created for. The flags field specifies whether a command path is present.
+2. Entry records: 1 byte entry type ID, 1 byte :py:class:`tmtccmd.tmtc.queue.TcPriority`,
+   4 byte payload length and the payload itself.
+
+The payload format depends on the entry type:
+
+- PUS TC: 1 byte flags field specifying whether the TC has a checksum, followed by the packed TC.
+- CCSDS TC: 1 byte flags field specifying whether the secondary header and the user data are
+  present, 2 byte secondary header length, followed by the packed space packet.
+- Raw TC: The raw TC.
+- Log: UTF-8 encoded log string.
+- Wait and packet delay: 8 byte duration in microseconds.
+
+Custom queue entries can not be serialized. The magic is only written when the writer is closed
+without an error, so files of aborted writes are rejected by the reader.
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+from collections import deque
+from collections.abc import Iterable, Iterator
+from datetime import timedelta
+from pathlib import Path
+from typing import BinaryIO, cast
+
+from spacepackets.ccsds import SpacePacket, SpacePacketHeader
+from spacepackets.ccsds.spacepacket import SPACE_PACKET_HEADER_SIZE
+from spacepackets.ecss.tc import PusTelecommand
+
+from tmtccmd.tmtc.procedure import TcProcedureBase, TcProcedureType, TreeCommandingProcedure
+from tmtccmd.tmtc.queue import (
+    LogQueueEntry,
+    PacketDelayEntry,
+    PusTcEntry,
+    QueueDequeT,
+    QueueEntryHelper,
+    QueueWrapper,
+    RawTcEntry,
+    SpacePacketEntry,
+    TcPriority,
+    TcQueueEntryBase,
+    TcQueueEntryType,
+    WaitEntry,
+)
+
+QUEUE_FILE_MAGIC = b"TCQF"
+QUEUE_FILE_VERSION = 2
+
+_HEADER_FMT = "!4sBBQIH"
+_HEADER_LEN = struct.calcsize(_HEADER_FMT)
+_ENTRY_HEADER_FMT = "!BBI"
+_ENTRY_HEADER_LEN = struct.calcsize(_ENTRY_HEADER_FMT)
+
+_FLAG_CMD_PATH = 1 << 0
+_PUS_FLAG_CHECKSUM = 1 << 0
+_CCSDS_FLAG_SEC_HEADER = 1 << 0
+_CCSDS_FLAG_USER_DATA = 1 << 1
+
+_ENTRY_IDS: dict[TcQueueEntryType, int] = {
+    TcQueueEntryType.PUS_TC: 0,
+    TcQueueEntryType.CCSDS_TC: 1,
+    TcQueueEntryType.RAW_TC: 2,
+    TcQueueEntryType.LOG: 3,
+    TcQueueEntryType.WAIT: 4,
+    TcQueueEntryType.PACKET_DELAY: 5,
+}
+_ENTRY_TYPES: dict[int, TcQueueEntryType] = {v: k for k, v in _ENTRY_IDS.items()}
+
+
+class InvalidQueueFileError(Exception):
+    pass
+
+
+def _to_micros(delta: timedelta, name: str) -> int:
+    if delta < timedelta():
+        raise ValueError(f"negative {name} {delta} can not be serialized")
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def pack_queue_entry(entry: TcQueueEntryBase) -> bytes:
+    """Serialize a single queue entry into its record representation, including the record
+    header.
+
+    :raises ValueError: Entry type can not be serialized, or negative wait or delay time.
+    """
+    entry_id = _ENTRY_IDS.get(entry.etype)
+    if entry_id is None:
+        raise ValueError(f"can not serialize queue entry of type {entry.etype}")
+    helper = QueueEntryHelper(entry)
+    if entry.etype == TcQueueEntryType.PUS_TC:
+        pus_tc = helper.to_pus_tc_entry().pus_tc
+        flags = _PUS_FLAG_CHECKSUM if pus_tc.has_checksum else 0
+        payload = bytes([flags]) + pus_tc.pack()
+    elif entry.etype == TcQueueEntryType.CCSDS_TC:
+        space_packet = helper.to_space_packet_entry().space_packet
+        flags = 0
+        sec_header_len = 0
+        if space_packet.sec_header is not None:
+            flags |= _CCSDS_FLAG_SEC_HEADER
+            sec_header_len = len(space_packet.sec_header)
+        if space_packet.user_data is not None:
+            flags |= _CCSDS_FLAG_USER_DATA
+        payload = struct.pack("!BH", flags, sec_header_len) + space_packet.pack()
+    elif entry.etype == TcQueueEntryType.RAW_TC:
+        payload = bytes(helper.to_raw_tc_entry().tc)
+    elif entry.etype == TcQueueEntryType.LOG:
+        payload = helper.to_log_entry().log_str.encode()
+    elif entry.etype == TcQueueEntryType.WAIT:
+        payload = struct.pack("!Q", _to_micros(helper.to_wait_entry().wait_time, "wait time"))
+    else:
+        payload = struct.pack(
+            "!Q", _to_micros(helper.to_packet_delay_entry().delay_time, "packet delay")
+        )
+    return struct.pack(_ENTRY_HEADER_FMT, entry_id, entry.priority, len(payload)) + payload
+
+
+def unpack_queue_entry(etype: TcQueueEntryType, payload: bytes) -> TcQueueEntryBase:
+    """Deserialize the payload of a single entry record.
+
+    :raises InvalidQueueFileError: Invalid payload.
+    """
+    try:
+        if etype == TcQueueEntryType.PUS_TC:
+            if payload[0] & _PUS_FLAG_CHECKSUM:
+                return PusTcEntry(PusTelecommand.unpack(payload[1:]))
+            return PusTcEntry(PusTelecommand.unpack_no_checksum(payload[1:]))
+        if etype == TcQueueEntryType.CCSDS_TC:
+            flags, sec_header_len = struct.unpack("!BH", payload[:3])
+            raw_packet = payload[3:]
+            sp_header = SpacePacketHeader.unpack(raw_packet)
+            sec_header = None
+            user_data = None
+            user_data_start = SPACE_PACKET_HEADER_SIZE
+            if flags & _CCSDS_FLAG_SEC_HEADER:
+                user_data_start += sec_header_len
+                sec_header = raw_packet[SPACE_PACKET_HEADER_SIZE:user_data_start]
+            if flags & _CCSDS_FLAG_USER_DATA:
+                user_data = raw_packet[user_data_start:]
+            return SpacePacketEntry(SpacePacket(sp_header, sec_header, user_data))
+        if etype == TcQueueEntryType.RAW_TC:
+            return RawTcEntry(payload)
+        if etype == TcQueueEntryType.LOG:
+            return LogQueueEntry(payload.decode())
+        if etype == TcQueueEntryType.WAIT:
+            return WaitEntry(timedelta(microseconds=struct.unpack("!Q", payload)[0]))
+        if etype == TcQueueEntryType.PACKET_DELAY:
+            return PacketDelayEntry(timedelta(microseconds=struct.unpack("!Q", payload)[0]))
+    except (ValueError, IndexError, struct.error) as e:
+        raise InvalidQueueFileError(f"invalid payload for entry type {etype}: {e}") from e
+    raise InvalidQueueFileError(f"unsupported entry type {etype}")
+
+
+class TcQueueFileWriter:
+    """Streaming writer for the TC queue file format. Entries are written to the file as they
+    are passed, so arbitrarily large queues can be serialized without holding them in memory.
+    The entry count in the file header is patched when the writer is closed.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        info: TcProcedureBase | None = None,
+        inter_cmd_delay: timedelta = timedelta(),
+    ):
+        # Checked before the file is created.
+        _to_micros(inter_cmd_delay, "inter-command delay")
+        self._file: BinaryIO = open(path, "wb")  # noqa: SIM115
+        self._entry_count = 0
+        cmd_path = b""
+        flags = 0
+        if info is not None and info.procedure_type == TcProcedureType.TREE_COMMANDING:
+            tree_cmd_path = cast(TreeCommandingProcedure, info).cmd_path
+            if tree_cmd_path is not None:
+                flags |= _FLAG_CMD_PATH
+                cmd_path = tree_cmd_path.encode()
+        self._flags = flags
+        self._cmd_path = cmd_path
+        self._inter_cmd_delay = inter_cmd_delay
+        # The magic is written when the writer is closed successfully.
+        self._write_header(bytes(len(QUEUE_FILE_MAGIC)))
+        self._file.write(cmd_path)
+
+    def _write_header(self, magic: bytes = QUEUE_FILE_MAGIC):
+        self._file.write(
+            struct.pack(
+                _HEADER_FMT,
+                magic,
+                QUEUE_FILE_VERSION,
+                self._flags,
+                _to_micros(self._inter_cmd_delay, "inter-command delay"),
+                self._entry_count,
+                len(self._cmd_path),
+            )
+        )
+
+    @property
+    def entry_count(self) -> int:
+        return self._entry_count
+
+    def write_entry(self, entry: TcQueueEntryBase):
+        """:raises ValueError: Entry type can not be serialized, or negative wait or delay
+        time."""
+        self._file.write(pack_queue_entry(entry))
+        self._entry_count += 1
+
+    def write_entries(self, entries: Iterable[TcQueueEntryBase]):
+        for entry in entries:
+            self.write_entry(entry)
+
+    def close(self):
+        """Write the final file header and close the file."""
+        if self._file.closed:
+            return
+        self._file.seek(0)
+        self._write_header()
+        self._file.close()
+
+    def abort(self):
+        """Close the file without writing the final file header, so the reader rejects it."""
+        self._file.close()
+
+    def __enter__(self) -> TcQueueFileWriter:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def write_queue_file(path: Path | str, queue_wrapper: QueueWrapper):
+    """Serialize a full queue wrapper into a TC queue file.
+
+    :raises ValueError: Queue contains entries which can not be serialized.
+    """
+    with TcQueueFileWriter(path, queue_wrapper.info, queue_wrapper.inter_cmd_delay) as writer:
+        writer.write_entries(queue_wrapper.queue)
+
+
+class MappedTcQueue:
+    """Deque-like view on the entries of a memory-mapped TC queue file. Entries are only
+    deserialized when they are accessed, so this can be passed to the
+    :py:class:`tmtccmd.tmtc.ccsds_seq_sender.SequentialCcsdsSender` directly without deserializing
+    the whole file first. Entries can still be prepended or appended like for a regular deque.
+    """
+
+    def __init__(self, data: mmap.mmap | bytes, offset: int, entry_count: int):
+        self._data = data
+        self._offset = offset
+        self._remaining = entry_count
+        self._peeked: TcQueueEntryBase | None = None
+        self._head: QueueDequeT = deque()
+        self._tail: QueueDequeT = deque()
+
+    def _record_bounds(self, offset: int) -> tuple[int, int, int, int]:
+        if offset + _ENTRY_HEADER_LEN > len(self._data):
+            raise InvalidQueueFileError("queue file truncated")
+        entry_id, priority, payload_len = struct.unpack_from(_ENTRY_HEADER_FMT, self._data, offset)
+        start = offset + _ENTRY_HEADER_LEN
+        end = start + payload_len
+        if end > len(self._data):
+            raise InvalidQueueFileError("queue file truncated")
+        return entry_id, priority, start, end
+
+    def _record_at(self, offset: int) -> tuple[TcQueueEntryBase, int]:
+        entry_id, priority, start, end = self._record_bounds(offset)
+        etype = _ENTRY_TYPES.get(entry_id)
+        if etype is None:
+            raise InvalidQueueFileError(f"unknown entry type ID {entry_id}")
+        try:
+            entry_priority = TcPriority(priority)
+        except ValueError as e:
+            raise InvalidQueueFileError(f"invalid entry priority {priority}") from e
+        entry = unpack_queue_entry(etype, bytes(self._data[start:end]))
+        entry.priority = entry_priority
+        return entry, end
+
+    def _peek_mapped(self) -> TcQueueEntryBase:
+        if self._peeked is None:
+            self._peeked, _ = self._record_at(self._offset)
+        return self._peeked
+
+    def _iter_mapped(self) -> Iterator[TcQueueEntryBase]:
+        offset = self._offset
+        for _ in range(self._remaining):
+            entry, offset = self._record_at(offset)
+            yield entry
+
+    @property
+    def mapped_remaining(self) -> int:
+        """Number of entries which were not consumed from the file yet."""
+        return self._remaining
+
+    def popleft(self) -> TcQueueEntryBase:
+        if self._head:
+            return self._head.popleft()
+        if self._remaining > 0:
+            if self._peeked is not None:
+                entry = self._peeked
+                self._peeked = None
+                *_, self._offset = self._record_bounds(self._offset)
+            else:
+                entry, self._offset = self._record_at(self._offset)
+            self._remaining -= 1
+            return entry
+        if self._tail:
+            return self._tail.popleft()
+        raise IndexError("pop from an empty queue")
+
+    def append(self, entry: TcQueueEntryBase):
+        self._tail.append(entry)
+
+    def appendleft(self, entry: TcQueueEntryBase):
+        self._head.appendleft(entry)
+
+    def extend(self, entries: Iterable[TcQueueEntryBase]):
+        self._tail.extend(entries)
+
+    def extendleft(self, entries: Iterable[TcQueueEntryBase]):
+        """Prepend the entries in reverse order, like :py:meth:`collections.deque.extendleft`."""
+        self._head.extendleft(entries)
+
+    def clear(self):
+        self._head.clear()
+        self._tail.clear()
+        self._remaining = 0
+        self._peeked = None
+
+    def __getitem__(self, index: int) -> TcQueueEntryBase:
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("queue index out of range")
+        if index < len(self._head):
+            return self._head[index]
+        index -= len(self._head)
+        if index < self._remaining:
+            if index == 0:
+                return self._peek_mapped()
+            for i, entry in enumerate(self._iter_mapped()):
+                if i == index:
+                    return entry
+        return self._tail[index - self._remaining]
+
+    def __iter__(self) -> Iterator[TcQueueEntryBase]:
+        yield from self._head
+        yield from self._iter_mapped()
+        yield from self._tail
+
+    def __len__(self) -> int:
+        return len(self._head) + self._remaining + len(self._tail)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(head={self._head!r}, mapped_remaining={self._remaining}, "
+            f"tail={self._tail!r})"
+        )
+
+
+class TcQueueFileReader:
+    """Memory-mapped reader for the TC queue file format. Only the file header is parsed when
+    the file is opened. The reader needs to stay open while the entries of a queue retrieved with
+    :py:meth:`to_queue_wrapper` are consumed.
+
+    :raises InvalidQueueFileError: Invalid file header.
+    """
+
+    def __init__(self, path: Path | str):
+        self._file: BinaryIO = open(path, "rb")  # noqa: SIM115
+        try:
+            self._data: mmap.mmap | bytes = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        except ValueError:
+            # Empty files can not be memory-mapped
+            self._data = b""
+        try:
+            self._parse_header()
+        except InvalidQueueFileError:
+            self.close()
+            raise
+
+    def _parse_header(self):
+        if len(self._data) < _HEADER_LEN:
+            raise InvalidQueueFileError("file too short for queue file header")
+        magic, version, flags, delay_us, entry_count, cmd_path_len = struct.unpack_from(
+            _HEADER_FMT, self._data, 0
+        )
+        if magic != QUEUE_FILE_MAGIC:
+            raise InvalidQueueFileError(f"invalid magic {magic!r}")
+        if version != QUEUE_FILE_VERSION:
+            raise InvalidQueueFileError(f"unsupported queue file version {version}")
+        self.entry_count: int = entry_count
+        self.inter_cmd_delay = timedelta(microseconds=delay_us)
+        self._entries_offset = _HEADER_LEN + cmd_path_len
+        if self._entries_offset > len(self._data):
+            raise InvalidQueueFileError("queue file truncated")
+        self.info: TcProcedureBase = TreeCommandingProcedure.empty()
+        if flags & _FLAG_CMD_PATH:
+            cmd_path = bytes(self._data[_HEADER_LEN : self._entries_offset]).decode()
+            self.info = TreeCommandingProcedure(cmd_path)
+
+    def __iter__(self) -> Iterator[TcQueueEntryBase]:
+        return iter(MappedTcQueue(self._data, self._entries_offset, self.entry_count))
+
+    def to_queue_wrapper(self, info: TcProcedureBase | None = None) -> QueueWrapper:
+        """Create a queue wrapper backed by a :py:class:`MappedTcQueue`.
+
+        :param info: Can be used to override the procedure stored in the file.
+        """
+        queue = MappedTcQueue(self._data, self._entries_offset, self.entry_count)
+        return QueueWrapper(
+            info=info if info is not None else self.info,
+            queue=cast(QueueDequeT, queue),
+            inter_cmd_delay=self.inter_cmd_delay,
+        )
+
+    def close(self):
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._file.close()
+
+    def __enter__(self) -> TcQueueFileReader:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
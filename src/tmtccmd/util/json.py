@@ -23,6 +23,18 @@ class JsonKeyNames(enum.Enum):
     SERIAL_PORT = "serial_port"
     SERIAL_HINT = "serial_hint"
 
+    SHM_PATH = "shm_path"
+    SHM_CAPACITY = "shm_capacity"
+
+    UNIX_SOCKET_PATH = "unix_socket_path"
+    UNIX_SOCKET_TYPE = "unix_socket_type"
+
+    INTER_CMD_DELAY = "inter_cmd_delay"
+    KEEP_LISTENER_MODE = "keep_listener_mode"
+    KEEP_MULTI_QUEUE_MODE = "keep_multi_queue_mode"
+    LOG_LEVEL = "log_level"
+    LOG_LEVELS = "log_levels"
+
 
 def check_json_file(json_cfg_path: str) -> bool:
     """The check JSON file and return whether it was valid or not. A JSON file is invalid
@@ -39,12 +51,11 @@ def check_json_file(json_cfg_path: str) -> bool:
             print(f"Configuration JSON {json_cfg_path} did not exist, created a new one.")
             return False
     else:
-        with open(json_cfg_path, "r+") as file:
-            try:
-                json.load(file)
-            except json.decoder.JSONDecodeError:
-                _LOGGER.warning("JSON decode error, file format might be invalid.")
-                return False
+        from tmtccmd.config.loader import load_tmtc_file_cfg
+
+        if not load_tmtc_file_cfg(json_cfg_path).valid:
+            _LOGGER.warning("JSON decode error, file format might be invalid.")
+            return False
     return True
 
 
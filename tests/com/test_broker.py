@@ -0,0 +1,158 @@
+import socket
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+from unittest import TestCase, skipUnless
+
+from com_interface import ComInterface
+
+from tmtccmd.com.broker import SlowSubscriberPolicy, TmBroker
+from tmtccmd.com.uds import UnixSocketClient
+
+
+class _FakeComIf(ComInterface):
+    def __init__(self):
+        self.opened = False
+        self.sent: list[bytes] = []
+        self.tm_queue: list[bytes] = []
+        self.receive_error: OSError | None = None
+        self.lock = threading.Lock()
+
+    @property
+    def id(self) -> str:
+        return "fake"
+
+    def initialize(self, args: Any = 0) -> Any:
+        pass
+
+    def open(self, args: Any = 0) -> None:
+        self.opened = True
+
+    def is_open(self) -> bool:
+        return self.opened
+
+    def close(self, args: Any = 0) -> None:
+        self.opened = False
+
+    def send(self, data: bytes | bytearray) -> None:
+        self.sent.append(bytes(data))
+
+    def receive(self, parameters: Any = 0) -> list[bytes]:
+        if self.receive_error is not None:
+            raise self.receive_error
+        with self.lock:
+            packets, self.tm_queue = self.tm_queue, []
+        return packets
+
+    def packets_available(self, parameters: Any = 0) -> int:
+        return len(self.tm_queue)
+
+    def push(self, packets: list[bytes]):
+        with self.lock:
+            self.tm_queue.extend(packets)
+
+
+def _wait_for(condition, timeout: float = 2.0) -> bool:
+    end = time.time() + timeout
+    while time.time() < end:
+        if condition():
+            return True
+        time.sleep(0.002)
+    return condition()
+
+
+def _receive(client: UnixSocketClient, num: int) -> list[bytes]:
+    packets = []
+    end = time.time() + 2.0
+    while len(packets) < num and time.time() < end:
+        packets.extend(client.receive())
+    return packets
+
+
+@skipUnless(
+    hasattr(socket, "AF_UNIX") and hasattr(socket, "SOCK_SEQPACKET"),
+    "requires Unix domain sockets with SOCK_SEQPACKET support",
+)
+class TestTmBroker(TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.socket_path = str(Path(self.tmp_dir.name) / "broker.sock")
+        self.com_if = _FakeComIf()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _client(self, broker: TmBroker) -> UnixSocketClient:
+        num_subscribers = broker.num_subscribers
+        client = UnixSocketClient(self.socket_path)
+        client.open()
+        self.addCleanup(client.close)
+        self.assertTrue(_wait_for(lambda: broker.num_subscribers == num_subscribers + 1))
+        return client
+
+    def test_fan_out_and_tc_forwarding(self):
+        with TmBroker(self.com_if, self.socket_path) as broker:
+            self.assertTrue(self.com_if.is_open())
+            first = self._client(broker)
+            second = self._client(broker)
+            self.com_if.push([b"tm0", b"tm1"])
+            self.assertEqual(_receive(first, 2), [b"tm0", b"tm1"])
+            self.assertEqual(_receive(second, 2), [b"tm0", b"tm1"])
+            first.send(b"tc0")
+            second.send(b"tc1")
+            self.assertTrue(_wait_for(lambda: broker.tc_forwarded == 2))
+            self.assertEqual(sorted(self.com_if.sent), [b"tc0", b"tc1"])
+            self.assertEqual(broker.tm_received, 2)
+            first.close()
+            self.assertTrue(_wait_for(lambda: broker.num_subscribers == 1))
+        self.assertFalse(self.com_if.is_open())
+        self.assertFalse(Path(self.socket_path).exists())
+        self.assertEqual(second.receive(), [])
+        self.assertFalse(second.is_open())
+
+    def test_slow_subscriber_drops_oldest(self):
+        with TmBroker(self.com_if, self.socket_path, max_queued_bytes=16 * 1024) as broker:
+            fast = self._client(broker)
+            self._client(broker)
+            received = []
+            for batch in range(40):
+                packets = [bytes([batch, idx]) * 512 for idx in range(64)]
+                self.com_if.push(packets)
+                received.extend(_receive(fast, 64))
+                self.assertEqual(len(received), (batch + 1) * 64)
+            fast_stats, slow_stats = sorted(
+                broker.subscriber_stats(), key=lambda stats: stats.tm_sent, reverse=True
+            )
+            self.assertEqual(fast_stats.tm_sent, 40 * 64)
+            self.assertEqual(fast_stats.tm_dropped, 0)
+            self.assertGreater(slow_stats.tm_dropped, 0)
+            self.assertEqual(
+                slow_stats.tm_sent + slow_stats.tm_dropped + slow_stats.tm_queued, 40 * 64
+            )
+
+    def test_slow_subscriber_disconnected(self):
+        with TmBroker(
+            self.com_if,
+            self.socket_path,
+            max_queued_bytes=16 * 1024,
+            policy=SlowSubscriberPolicy.DISCONNECT,
+        ) as broker:
+            fast = self._client(broker)
+            self._client(broker)
+            for batch in range(40):
+                self.com_if.push([bytes([batch, idx]) * 512 for idx in range(64)])
+                self.assertEqual(len(_receive(fast, 64)), 64)
+            self.assertEqual(broker.num_subscribers, 1)
+
+    def test_receive_error_keeps_broker_running(self):
+        with TmBroker(self.com_if, self.socket_path) as broker:
+            client = self._client(broker)
+            self.com_if.receive_error = ConnectionResetError("link down")
+            with self.assertLogs("tmtccmd.com.broker", level="ERROR") as logs:
+                self.assertTrue(_wait_for(lambda: broker.tm_receive_errors >= 3))
+            self.assertEqual(len(logs.records), 1)
+            self.com_if.receive_error = None
+            self.com_if.push([b"tm0"])
+            self.assertEqual(_receive(client, 1), [b"tm0"])
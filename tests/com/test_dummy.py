@@ -1,8 +1,11 @@
+from datetime import timedelta
 from unittest import TestCase
 
+from spacepackets.ccsds.time import CdsShortTimestamp
 from spacepackets.ecss import PusTelecommand
+from spacepackets.ecss.tm import PusTm
 
-from tmtccmd.com.dummy import DummyInterface
+from tmtccmd.com.dummy import DummyHandler, DummyInterface, DummySimCfg
 
 
 class TestDummy(TestCase):
@@ -20,3 +23,96 @@ class TestDummy(TestCase):
         replies = dummy_com_if.receive()
         # Full verification set (acceptance, start and completion) and ping reply
         self.assertEqual(len(replies), 4)
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestDummySimulator(TestCase):
+    def setUp(self):
+        self.clock = _FakeClock()
+
+    def _handler(self, cfg: DummySimCfg) -> DummyHandler:
+        return DummyHandler(cfg, clock=self.clock)
+
+    def test_periodic_streams(self):
+        handler = self._handler(DummySimCfg(apid=0x05, hk_rate=100, event_rate=10, verif_rate=20))
+        self.assertEqual(handler.packets_available(), 0)
+        self.clock.now += 1.0
+        self.assertEqual(handler.packets_available(), 130)
+        packets = handler.receive_reply_package()
+        self.assertEqual(len(packets), 130)
+        self.assertEqual(handler.packets_available(), 0)
+        services = [PusTm.unpack(packet, CdsShortTimestamp.TIMESTAMP_SIZE) for packet in packets]
+        self.assertEqual(sum(1 for tm in services if tm.service == 3), 100)
+        self.assertEqual(sum(1 for tm in services if tm.service == 5), 10)
+        self.assertEqual(sum(1 for tm in services if tm.service == 1), 20)
+        self.assertEqual(len({tm.seq_count for tm in services}), 130)
+        self.assertTrue(all(tm.apid == 0x05 for tm in services))
+        self.assertEqual(handler.tm_generated, 130)
+
+    def test_hk_layout(self):
+        handler = self._handler(DummySimCfg(hk_rate=1, hk_data_len=4, hk_set_id=2))
+        self.clock.now += 1.0
+        tm = PusTm.unpack(handler.receive_reply_package()[0], CdsShortTimestamp.TIMESTAMP_SIZE)
+        self.assertEqual(tm.service, 3)
+        self.assertEqual(tm.source_data, bytes([1, 2, 3, 4, 0, 0, 0, 2, 0, 0, 0, 0]))
+
+    def test_max_burst(self):
+        handler = self._handler(DummySimCfg(hk_rate=1000, max_burst=50))
+        self.clock.now += 10.0
+        self.assertEqual(handler.packets_available(), 50)
+        self.clock.now += 0.01
+        self.assertEqual(handler.packets_available(), 60)
+
+    def test_latency_and_jitter(self):
+        handler = self._handler(
+            DummySimCfg(
+                hk_rate=10,
+                latency=timedelta(milliseconds=500),
+                jitter=timedelta(milliseconds=50),
+                seed=1,
+            )
+        )
+        self.clock.now += 1.0
+        # Packets generated in the last 500 ms are still in flight.
+        self.assertLessEqual(handler.packets_available(), 6)
+        self.clock.now += 0.6
+        # All packets generated up to one second after the start have arrived.
+        self.assertEqual(handler.packets_available(), 11)
+
+    def test_loss(self):
+        handler = self._handler(DummySimCfg(hk_rate=1000, loss_rate=0.5, seed=2))
+        self.clock.now += 1.0
+        available = handler.packets_available()
+        self.assertEqual(available + handler.tm_lost, 1000)
+        self.assertGreater(handler.tm_lost, 400)
+        self.assertLess(handler.tm_lost, 600)
+
+    def test_reordering(self):
+        handler = self._handler(
+            DummySimCfg(hk_rate=100, reorder_rate=0.2, reorder_delay=timedelta(seconds=0.1), seed=3)
+        )
+        self.clock.now += 2.0
+        handler.packets_available()
+        self.clock.now += 1.0
+        packets = handler.receive_reply_package()
+        seq_counts = [
+            PusTm.unpack(packet, CdsShortTimestamp.TIMESTAMP_SIZE).seq_count for packet in packets
+        ]
+        self.assertNotEqual(seq_counts, sorted(seq_counts))
+        self.assertEqual(len(set(seq_counts)), len(seq_counts))
+        self.assertEqual(handler.tm_generated, 300)
+
+    def test_ping_with_sim(self):
+        com_if = DummyInterface(DummySimCfg(latency=timedelta(seconds=1.0)), clock=self.clock)
+        com_if.send(PusTelecommand(apid=0x02, service=17, subservice=1).pack())
+        self.assertEqual(com_if.packets_available(), 0)
+        self.clock.now += 1.0
+        self.assertEqual(com_if.packets_available(), 4)
+        self.assertEqual(len(com_if.receive()), 4)
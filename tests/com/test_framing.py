@@ -0,0 +1,87 @@
+import random
+from unittest import TestCase
+
+from dle_encoder import DleEncoder
+from spacepackets.ecss import PusTelecommand
+
+from tmtccmd.com.framing import (
+    CobsDeframer,
+    DleDeframer,
+    cobs_encode_frame,
+    dle_encode_frame,
+    split_space_packets,
+)
+
+
+def _random_packets(num: int) -> list[bytes]:
+    rng = random.Random(7)
+    # Small byte values, so the packets contain many delimiters and escape characters.
+    return [bytes(rng.randrange(0, 20) for _ in range(rng.randrange(1, 300))) for _ in range(num)]
+
+
+def _feed_in_chunks(deframer: CobsDeframer | DleDeframer, stream: bytes, chunk_size: int):
+    packets = []
+    for idx in range(0, len(stream), chunk_size):
+        packets.extend(deframer.feed(stream[idx : idx + chunk_size]))
+    return packets
+
+
+class TestFraming(TestCase):
+    def test_split_space_packets(self):
+        ping = PusTelecommand(apid=0x02, service=17, subservice=1).pack()
+        buf = bytearray(ping + ping + ping[:5])
+        self.assertEqual(split_space_packets(buf), [bytes(ping), bytes(ping)])
+        self.assertEqual(buf, ping[:5])
+        buf.extend(ping[5:])
+        self.assertEqual(split_space_packets(buf), [bytes(ping)])
+        self.assertEqual(len(buf), 0)
+
+    def test_cobs_deframer(self):
+        packets = _random_packets(200)
+        stream = b"".join(cobs_encode_frame(packet) for packet in packets)
+        for chunk_size in (1, 7, 256, len(stream)):
+            deframer = CobsDeframer()
+            self.assertEqual(_feed_in_chunks(deframer, stream, chunk_size), packets)
+            self.assertEqual(deframer.parsing_error_count, 0)
+
+    def test_cobs_deframer_resync(self):
+        deframer = CobsDeframer(max_frame_size=16)
+        frame = cobs_encode_frame(b"\x01\x00\x02")
+        # Garbage before the first delimiter is discarded.
+        self.assertEqual(deframer.feed(b"\x05\x06" + frame), [b"\x01\x00\x02"])
+        # Invalid frame
+        self.assertEqual(deframer.feed(b"\x00\x05\x01\x00"), [])
+        self.assertEqual(deframer.parsing_error_count, 1)
+        # Oversized incomplete frame
+        self.assertEqual(deframer.feed(b"\x00" + bytes(range(1, 30))), [])
+        self.assertEqual(deframer.parsing_error_count, 2)
+        self.assertEqual(deframer.feed(b"\x01" + frame), [b"\x01\x00\x02"])
+
+    def test_dle_encode_matches_library(self):
+        encoder = DleEncoder()
+        encoder_cr = DleEncoder(escape_cr=True)
+        for packet in _random_packets(100):
+            self.assertEqual(dle_encode_frame(packet), encoder.encode(packet))
+            self.assertEqual(dle_encode_frame(packet, escape_cr=True), encoder_cr.encode(packet))
+
+    def test_dle_deframer(self):
+        packets = _random_packets(200)
+        encoder = DleEncoder(escape_cr=True)
+        stream = b"".join(bytes(encoder.encode(packet)) for packet in packets)
+        for chunk_size in (1, 7, 256, len(stream)):
+            deframer = DleDeframer()
+            self.assertEqual(_feed_in_chunks(deframer, stream, chunk_size), packets)
+            self.assertEqual(deframer.parsing_error_count, 0)
+
+    def test_dle_deframer_errors(self):
+        deframer = DleDeframer(max_frame_size=16)
+        frame = dle_encode_frame(b"\x02\x10\x03")
+        # Unterminated frame followed by a valid frame
+        self.assertEqual(deframer.feed(b"\x02\x05" + frame), [b"\x02\x10\x03"])
+        # Invalid escape sequence
+        self.assertEqual(deframer.feed(b"\x02\x10\x05\x03"), [])
+        self.assertEqual(deframer.parsing_error_count, 1)
+        # Oversized incomplete frame
+        self.assertEqual(deframer.feed(b"\x02" + bytes(range(0x20, 0x40))), [])
+        self.assertEqual(deframer.parsing_error_count, 2)
+        self.assertEqual(deframer.feed(b"\x05\x03" + frame), [b"\x02\x10\x03"])
@@ -0,0 +1,148 @@
+import time
+from datetime import timedelta
+from typing import Any
+from unittest import TestCase
+
+from com_interface import ComInterface, SendError
+from spacepackets.ccsds.time import CdsShortTimestamp
+from spacepackets.ecss import PusTelecommand
+from spacepackets.ecss.pus_1_verification import RequestId, Service1Tm, VerificationParams
+
+from tmtccmd.com.multi_link import LinkSelectPolicy, MultiLinkComInterface
+from tmtccmd.pus.s1_verification import Subservice as Pus1Subservice
+
+
+class _FakeLink(ComInterface):
+    def __init__(self, name: str, fail_open: bool = False):
+        self.name = name
+        self.fail_open = fail_open
+        self.fail_send = False
+        self.opened = False
+        self.sent: list[bytes] = []
+        self.rx: list[bytes] = []
+
+    @property
+    def id(self) -> str:
+        return self.name
+
+    def initialize(self, args: Any = 0) -> Any:
+        pass
+
+    def open(self, args: Any = 0) -> None:
+        if self.fail_open:
+            raise ConnectionRefusedError("refused")
+        self.opened = True
+
+    def is_open(self) -> bool:
+        return self.opened
+
+    def close(self, args: Any = 0) -> None:
+        self.opened = False
+
+    def send(self, data: bytes | bytearray) -> None:
+        if self.fail_send:
+            raise SendError("broken link", None)
+        self.sent.append(bytes(data))
+
+    def receive(self, parameters: Any = 0) -> list[bytes]:
+        packets = self.rx
+        self.rx = []
+        return packets
+
+    def packets_available(self, parameters: Any = 0) -> int:
+        return len(self.rx)
+
+
+class TestMultiLink(TestCase):
+    def setUp(self):
+        self.link_a = _FakeLink("a")
+        self.link_b = _FakeLink("b")
+        self.tc = PusTelecommand(apid=0x02, service=17, subservice=1).pack()
+
+    def _multi(self, **kwargs) -> MultiLinkComInterface:
+        multi = MultiLinkComInterface([self.link_a, self.link_b], **kwargs)
+        multi.open()
+        self.addCleanup(multi.close)
+        return multi
+
+    def test_failover(self):
+        multi = self._multi()
+        multi.send(self.tc)
+        self.assertEqual(len(self.link_a.sent), 1)
+        self.link_a.fail_send = True
+        multi.send(self.tc)
+        self.assertEqual(len(self.link_b.sent), 1)
+        self.assertEqual(multi.healthy_links(), [1])
+        self.assertEqual(multi.stats[0].failures, 1)
+        self.assertFalse(self.link_a.is_open())
+        self.link_b.fail_send = True
+        with self.assertRaises(SendError):
+            multi.send(self.tc)
+
+    def test_round_robin(self):
+        multi = self._multi(policy=LinkSelectPolicy.ROUND_ROBIN)
+        for _ in range(4):
+            multi.send(self.tc)
+        self.assertEqual(len(self.link_a.sent), 2)
+        self.assertEqual(len(self.link_b.sent), 2)
+        self.assertEqual([stats.tc_sent for stats in multi.stats], [2, 2])
+
+    def test_merge_and_dedup(self):
+        multi = self._multi()
+        self.link_a.rx = [b"tm0", b"tm1"]
+        self.link_b.rx = [b"tm1", b"tm2"]
+        self.assertEqual(multi.packets_available(), 4)
+        self.assertEqual(multi.receive(), [b"tm0", b"tm1", b"tm2"])
+        self.assertEqual(multi.duplicates_dropped, 1)
+        self.assertEqual([stats.tm_received for stats in multi.stats], [2, 2])
+
+    def test_no_dedup(self):
+        multi = self._multi(dedup=False)
+        self.link_a.rx = [b"tm1"]
+        self.link_b.rx = [b"tm1"]
+        self.assertEqual(multi.receive(), [b"tm1", b"tm1"])
+
+    def test_latency_measurement(self):
+        multi = self._multi(policy=LinkSelectPolicy.LOWEST_LATENCY)
+        tc = PusTelecommand(apid=0x02, service=17, subservice=1)
+        multi.send(tc.pack())
+        # Link a has no measurement yet and is preferred over link b for that reason.
+        self.assertEqual(len(self.link_a.sent), 1)
+        self.link_a.rx = [
+            Service1Tm(
+                subservice=Pus1Subservice.TM_ACCEPTANCE_SUCCESS,
+                apid=0x02,
+                verif_params=VerificationParams(
+                    req_id=RequestId(tc.packet_id, tc.packet_seq_control)
+                ),
+                timestamp=CdsShortTimestamp.empty().pack(),
+            ).pack()
+        ]
+        multi.receive()
+        latency = multi.stats[0].latency
+        self.assertIsNotNone(latency)
+        # Link b is now preferred because it is unmeasured.
+        multi.send(self.tc)
+        self.assertEqual(len(self.link_b.sent), 1)
+        multi.update_latency(1, 10.0)
+        multi.send(self.tc)
+        self.assertEqual(len(self.link_a.sent), 2)
+
+    def test_background_reconnect(self):
+        self.link_b.fail_open = True
+        multi = self._multi(reconnect_interval=timedelta(milliseconds=5))
+        self.assertEqual(multi.healthy_links(), [0])
+        self.link_b.fail_open = False
+        end = time.time() + 2.0
+        while multi.healthy_links() != [0, 1] and time.time() < end:
+            time.sleep(0.005)
+        self.assertEqual(multi.healthy_links(), [0, 1])
+
+    def test_no_link_opened(self):
+        self.link_a.fail_open = True
+        self.link_b.fail_open = True
+        multi = MultiLinkComInterface([self.link_a, self.link_b])
+        with self.assertRaises(OSError):
+            multi.open()
+        with self.assertRaises(ValueError):
+            MultiLinkComInterface([])
@@ -0,0 +1,178 @@
+import time
+from datetime import timedelta
+from typing import Any
+from unittest import TestCase
+
+from com_interface import ComInterface, SendError
+
+from tmtccmd.com.reconnect import ReconnectCfg, ReconnectingComInterface, TcBufferPolicy
+
+FAST_CFG = ReconnectCfg(
+    initial_delay=timedelta(milliseconds=2), max_delay=timedelta(milliseconds=10)
+)
+
+
+class _FakeLink(ComInterface):
+    def __init__(self, fail_open: bool = False):
+        self.fail_open = fail_open
+        self.fail_send = False
+        self.opened = False
+        self.open_calls = 0
+        self.close_calls = 0
+        self.sent: list[bytes] = []
+        self.rx: list[bytes] = []
+
+    @property
+    def id(self) -> str:
+        return "fake"
+
+    def initialize(self, args: Any = 0) -> Any:
+        pass
+
+    def open(self, args: Any = 0) -> None:
+        self.open_calls += 1
+        if self.fail_open:
+            raise ConnectionRefusedError("refused")
+        self.opened = True
+
+    def is_open(self) -> bool:
+        return self.opened
+
+    def close(self, args: Any = 0) -> None:
+        self.close_calls += 1
+        self.opened = False
+
+    def send(self, data: bytes | bytearray) -> None:
+        if self.fail_send:
+            raise SendError("broken pipe", None)
+        self.sent.append(bytes(data))
+
+    def receive(self, parameters: Any = 0) -> list[bytes]:
+        packets = self.rx
+        self.rx = []
+        return packets
+
+    def packets_available(self, parameters: Any = 0) -> int:
+        return len(self.rx)
+
+
+def _wait_for(condition, timeout: float = 2.0) -> bool:
+    end = time.time() + timeout
+    while not condition() and time.time() < end:
+        time.sleep(0.001)
+    return condition()
+
+
+class TestReconnect(TestCase):
+    def _wrapper(self, link: ComInterface, **kwargs) -> ReconnectingComInterface:
+        kwargs.setdefault("cfg", FAST_CFG)
+        com_if = ReconnectingComInterface(link, **kwargs)
+        self.addCleanup(com_if.close)
+        return com_if
+
+    def test_backoff(self):
+        com_if = ReconnectingComInterface(
+            _FakeLink(), ReconnectCfg(multiplier=2.0, max_delay=timedelta(seconds=3))
+        )
+        self.assertEqual(com_if.next_delay(0.5), 1.0)
+        self.assertEqual(com_if.next_delay(2.0), 3.0)
+        for _ in range(100):
+            self.assertTrue(0.9 <= com_if._jittered(1.0) <= 1.1)
+
+    def test_non_blocking_open_and_buffering(self):
+        link = _FakeLink(fail_open=True)
+        com_if = self._wrapper(link)
+        start = time.time()
+        com_if.open()
+        self.assertLess(time.time() - start, 0.1)
+        self.assertTrue(com_if.is_open())
+        self.assertFalse(com_if.connected)
+        com_if.send(b"tc0")
+        com_if.send(b"tc1")
+        self.assertEqual(com_if.receive(), [])
+        self.assertEqual(com_if.buffered_tcs, 2)
+        self.assertTrue(_wait_for(lambda: link.open_calls >= 3))
+        link.fail_open = False
+        self.assertTrue(_wait_for(lambda: com_if.connected))
+        self.assertEqual(link.sent, [b"tc0", b"tc1"])
+        self.assertEqual(com_if.buffered_tcs, 0)
+        self.assertEqual(com_if.connects, 1)
+
+    def test_buffer_limit(self):
+        link = _FakeLink(fail_open=True)
+        cfg = ReconnectCfg(max_buffered_tcs=2)
+        com_if = self._wrapper(link, cfg=cfg)
+        for idx in range(3):
+            com_if.send(bytes([idx]))
+        self.assertEqual(com_if.buffered_tcs, 2)
+        self.assertEqual(com_if.tcs_dropped, 1)
+
+    def test_reconnect_after_send_failure(self):
+        link = _FakeLink()
+        com_if = self._wrapper(link)
+        com_if.open()
+        self.assertTrue(_wait_for(lambda: com_if.connected))
+        link.fail_send = True
+        com_if.send(b"tc")
+        self.assertEqual(com_if.failures, 1)
+        self.assertEqual(com_if.buffered_tcs, 1)
+        link.fail_send = False
+        self.assertTrue(_wait_for(lambda: com_if.connects == 2))
+        self.assertEqual(link.sent, [b"tc"])
+
+    def test_link_closed_detection(self):
+        link = _FakeLink()
+        com_if = self._wrapper(link)
+        com_if.open()
+        self.assertTrue(_wait_for(lambda: com_if.connected))
+        link.rx = [b"tm"]
+        self.assertEqual(com_if.packets_available(), 1)
+        self.assertEqual(com_if.receive(), [b"tm"])
+        # The wrapped interface noticed that the connection was lost.
+        link.opened = False
+        self.assertEqual(com_if.receive(), [])
+        self.assertEqual(com_if.failures, 1)
+        self.assertTrue(_wait_for(lambda: com_if.connects == 2))
+
+    def test_policies(self):
+        com_if = self._wrapper(
+            _FakeLink(fail_open=True),
+            cfg=ReconnectCfg(tc_policy=TcBufferPolicy.REJECT),
+        )
+        with self.assertRaises(SendError):
+            com_if.send(b"tc")
+        com_if = self._wrapper(
+            _FakeLink(fail_open=True), cfg=ReconnectCfg(tc_policy=TcBufferPolicy.DROP)
+        )
+        com_if.send(b"tc")
+        self.assertEqual(com_if.tcs_dropped, 1)
+        self.assertEqual(com_if.buffered_tcs, 0)
+
+    def test_factory(self):
+        first = _FakeLink(fail_open=True)
+        created: list[_FakeLink] = []
+
+        def factory() -> _FakeLink:
+            created.append(_FakeLink())
+            return created[-1]
+
+        com_if = self._wrapper(first, factory=factory)
+        com_if.open()
+        self.assertTrue(_wait_for(lambda: com_if.connected))
+        self.assertEqual(first.open_calls, 1)
+        self.assertEqual(len(created), 1)
+        self.assertIs(com_if.com_if, created[0])
+
+    def test_failed_factory_interfaces_closed(self):
+        created: list[_FakeLink] = []
+
+        def factory() -> _FakeLink:
+            created.append(_FakeLink(fail_open=len(created) < 2))
+            return created[-1]
+
+        com_if = self._wrapper(_FakeLink(fail_open=True), factory=factory)
+        com_if.open()
+        self.assertTrue(_wait_for(lambda: com_if.connected))
+        self.assertEqual(len(created), 3)
+        self.assertEqual([link.close_calls for link in created], [1, 1, 0])
+        self.assertIs(com_if.com_if, created[2])
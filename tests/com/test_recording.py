@@ -0,0 +1,140 @@
+import struct
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from spacepackets.ecss import PusTelecommand
+
+from tmtccmd.com.dummy import DummyInterface
+from tmtccmd.com.recording import (
+    InvalidRecordingError,
+    PacketDirection,
+    RecordingComInterface,
+    RecordingReader,
+    ReplayComInterface,
+)
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 10.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRecording(TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp_dir.name) / "pass.rec"
+        self.clock = _FakeClock()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _record(self, packets: list[tuple[float, bytes]]):
+        with RecordingComInterface(DummyInterface(), self.path, clock=self.clock) as com_if:
+            start = self.clock.now
+            for offset, packet in packets:
+                self.clock.now = start + offset
+                com_if._record(PacketDirection.RECEIVED, packet)
+
+    def test_record_dummy_traffic(self):
+        com_if = RecordingComInterface(DummyInterface(), self.path, clock=self.clock)
+        com_if.open()
+        ping = PusTelecommand(apid=0x02, service=17, subservice=1).pack()
+        self.clock.now += 0.5
+        com_if.send(ping)
+        self.clock.now += 0.25
+        replies = com_if.receive()
+        self.assertEqual(len(replies), 4)
+        com_if.close()
+        com_if.close_recording()
+        with RecordingReader(self.path) as reader:
+            records = list(reader)
+            received = list(reader.records(PacketDirection.RECEIVED))
+        self.assertEqual(len(records), 5)
+        self.assertEqual(records[0].direction, PacketDirection.SENT)
+        self.assertEqual(records[0].packet, ping)
+        self.assertAlmostEqual(records[0].timestamp, 0.5)
+        self.assertEqual([record.packet for record in received], replies)
+        self.assertAlmostEqual(received[0].timestamp, 0.75)
+
+    def test_recording_continues_after_reopen(self):
+        with RecordingComInterface(DummyInterface(), self.path, clock=self.clock) as com_if:
+            ping = PusTelecommand(apid=0x02, service=17, subservice=1).pack()
+            com_if.open()
+            com_if.send(ping)
+            com_if.close()
+            com_if.open()
+            com_if.send(ping)
+        with RecordingReader(self.path) as reader:
+            sent = list(reader.records(PacketDirection.SENT))
+        self.assertEqual([record.packet for record in sent], [ping, ping])
+
+    def test_replay_packets_available(self):
+        self._record([(0.0, b"a"), (0.5, b"b"), (0.75, b"c"), (2.0, b"d")])
+        replay = ReplayComInterface(self.path, max_batch=2, clock=self.clock)
+        replay.open()
+        self.assertEqual(replay.packets_available(), 1)
+        self.clock.now += 1.0
+        self.assertEqual(replay.packets_available(), 3)
+        self.assertEqual(replay.receive(), [b"a", b"b"])
+        self.assertEqual(replay.packets_available(), 1)
+        self.clock.now += 1.0
+        self.assertEqual(replay.packets_available(), 2)
+        self.assertEqual(replay.receive(), [b"c", b"d"])
+        self.assertEqual(replay.packets_available(), 0)
+        self.assertTrue(replay.finished)
+        replay.close()
+
+    def test_replay_real_time_and_scaled(self):
+        self._record([(1.0, b"a"), (1.5, b"b"), (3.0, b"c")])
+        replay = ReplayComInterface(self.path, clock=self.clock)
+        replay.open()
+        # Timing is relative to the first received packet.
+        self.assertEqual(replay.receive(), [b"a"])
+        self.clock.now += 0.4
+        self.assertEqual(replay.packets_available(), 0)
+        self.clock.now += 0.1
+        self.assertEqual(replay.receive(), [b"b"])
+        self.clock.now += 1.5
+        self.assertEqual(replay.receive(), [b"c"])
+        self.assertTrue(replay.finished)
+        replay.close()
+
+        replay = ReplayComInterface(self.path, speed=4.0, clock=self.clock)
+        replay.open()
+        self.clock.now += 0.125
+        self.assertEqual(replay.receive(), [b"a", b"b"])
+        self.clock.now += 0.375
+        self.assertEqual(replay.receive(), [b"c"])
+        replay.close()
+
+    def test_replay_max_speed(self):
+        packets = [(i * 0.01, struct.pack("!I", i)) for i in range(100)]
+        self._record(packets)
+        replay = ReplayComInterface(self.path, speed=None, max_batch=30, clock=self.clock)
+        replay.open()
+        batches = []
+        while not replay.finished:
+            batches.append(replay.receive())
+        self.assertEqual([len(batch) for batch in batches], [30, 30, 30, 10])
+        self.assertEqual([p for batch in batches for p in batch], [p for _, p in packets])
+        replay.send(b"tc")
+        self.assertEqual(replay.tc_count, 1)
+        replay.close()
+
+    def test_truncated_recording(self):
+        self._record([(0.0, b"abc"), (0.1, b"def")])
+        data = self.path.read_bytes()
+        self.path.write_bytes(data[:-1])
+        with RecordingReader(self.path) as reader:
+            self.assertEqual([record.packet for record in reader], [b"abc"])
+
+    def test_invalid_recording(self):
+        self.path.write_bytes(b"XXXX\x01")
+        with self.assertRaises(InvalidRecordingError):
+            RecordingReader(self.path)
+        with self.assertRaises(ValueError):
+            ReplayComInterface(self.path, speed=0.0)
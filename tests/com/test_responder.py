@@ -0,0 +1,96 @@
+import socket
+import time
+from unittest import TestCase
+
+from com_interface.ip_utils import EthAddr
+from com_interface.tcp import TcpSpacepacketsClient
+from com_interface.udp import UdpClient
+from spacepackets.ccsds import PacketId, PacketType
+from spacepackets.ccsds.time import CdsShortTimestamp
+from spacepackets.ecss.tc import PusTelecommand
+from spacepackets.ecss.tm import PusTm
+
+from tmtccmd.com.dummy import DummySimCfg
+from tmtccmd.com.responder import PusResponder
+
+LOCALHOST = EthAddr("127.0.0.1", 0)
+
+
+def _receive(com_if, num: int, timeout: float = 2.0) -> list[bytes]:
+    packets = []
+    end = time.time() + timeout
+    while len(packets) < num and time.time() < end:
+        packets.extend(com_if.receive())
+        time.sleep(0.001)
+    return packets
+
+
+class TestResponder(TestCase):
+    def test_udp_ping(self):
+        with PusResponder(udp_addr=LOCALHOST, tcp_addr=None) as responder:
+            assert responder.udp_addr is not None
+            self.assertNotEqual(responder.udp_addr.port, 0)
+            client = UdpClient("udp", send_address=responder.udp_addr)
+            client.open()
+            try:
+                client.send(PusTelecommand(apid=0x02, service=17, subservice=1).pack())
+                packets = _receive(client, 4)
+            finally:
+                client.close()
+        self.assertEqual(len(packets), 4)
+        services = [PusTm.unpack(packet, CdsShortTimestamp.TIMESTAMP_SIZE) for packet in packets]
+        self.assertEqual(
+            [(tm.service, tm.subservice) for tm in services], [(1, 1), (1, 3), (17, 2), (1, 7)]
+        )
+        self.assertEqual(responder.tc_count, 1)
+
+    def test_udp_generic_tc_verification(self):
+        with PusResponder(udp_addr=LOCALHOST, tcp_addr=None) as responder:
+            assert responder.udp_addr is not None
+            client = UdpClient("udp", send_address=responder.udp_addr)
+            client.open()
+            try:
+                client.send(PusTelecommand(apid=0x02, service=8, subservice=128).pack())
+                packets = _receive(client, 2)
+            finally:
+                client.close()
+        subservices = [
+            PusTm.unpack(packet, CdsShortTimestamp.TIMESTAMP_SIZE).subservice for packet in packets
+        ]
+        self.assertEqual(subservices, [1, 7])
+
+    def test_tcp_split_packets(self):
+        with PusResponder(udp_addr=None, tcp_addr=LOCALHOST) as responder:
+            assert responder.tcp_addr is not None
+            client = TcpSpacepacketsClient(
+                "tcp",
+                space_packet_ids=[PacketId(PacketType.TM, True, 0x02)],
+                inner_thread_delay=0.01,
+                target_address=responder.tcp_addr,
+            )
+            client.open()
+            try:
+                ping = PusTelecommand(apid=0x02, service=17, subservice=1).pack()
+                # Split a TC across two sends.
+                client.send(ping[:4])
+                client.send(ping[4:] + ping)
+                packets = _receive(client, 8)
+            finally:
+                client.close()
+        self.assertEqual(len(packets), 8)
+        self.assertEqual(responder.tc_count, 2)
+
+    def test_tm_stream(self):
+        with PusResponder(
+            udp_addr=LOCALHOST, tcp_addr=None, sim_cfg=DummySimCfg(apid=0x02, hk_rate=500)
+        ) as responder:
+            assert responder.udp_addr is not None
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock.settimeout(2.0)
+            try:
+                # Unknown data registers the sender as a TM receiver as well.
+                sock.sendto(bytes(2), responder.udp_addr.to_tuple)
+                packet = sock.recv(4096)
+            finally:
+                sock.close()
+        self.assertEqual(PusTm.unpack(packet, CdsShortTimestamp.TIMESTAMP_SIZE).service, 3)
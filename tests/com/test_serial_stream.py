@@ -0,0 +1,71 @@
+import os
+import sys
+import time
+import unittest
+from unittest import TestCase
+
+from com_interface.serial_base import SerialCfg, SerialCommunicationType
+
+from tmtccmd.com.framing import CobsDeframer, DleDeframer, cobs_encode_frame, dle_encode_frame
+from tmtccmd.com.serial_stream import StreamingSerialComIF
+from tmtccmd.config.com import create_default_serial_interface
+from tmtccmd.config.defs import CoreComInterfaces
+
+
+def _receive(com_if: StreamingSerialComIF, num: int) -> list[bytes]:
+    packets = []
+    end = time.time() + 2.0
+    while len(packets) < num and time.time() < end:
+        packets.extend(com_if.receive())
+        time.sleep(0.001)
+    return packets
+
+
+@unittest.skipUnless(sys.platform.startswith("linux"), "requires Linux pseudo-terminals")
+class TestStreamingSerial(TestCase):
+    def setUp(self):
+        self.master_fd, slave_fd = os.openpty()
+        self.port = os.ttyname(slave_fd)
+        self.addCleanup(os.close, self.master_fd)
+        self.addCleanup(os.close, slave_fd)
+
+    def _read_master(self, deframer: CobsDeframer | DleDeframer, num: int) -> list[bytes]:
+        packets = []
+        end = time.time() + 2.0
+        while len(packets) < num and time.time() < end:
+            packets.extend(deframer.feed(os.read(self.master_fd, 4096)))
+        return packets
+
+    def _check_echo(self, com_if: StreamingSerialComIF, deframer, encode_frame):
+        com_if.open()
+        self.addCleanup(com_if.close)
+        self.assertTrue(com_if.is_open())
+        packets = [bytes([i, 0, 2, 3, 0x10, 0x0D]) * (i + 1) for i in range(20)]
+        for packet in packets:
+            com_if.send(packet)
+        self.assertEqual(self._read_master(deframer, len(packets)), packets)
+        os.write(self.master_fd, b"".join(encode_frame(packet) for packet in packets))
+        self.assertEqual(_receive(com_if, len(packets)), packets)
+        self.assertEqual(com_if.packets_available(), 0)
+        com_if.close()
+        self.assertFalse(com_if.is_open())
+
+    def test_cobs(self):
+        com_if = create_default_serial_interface(
+            CoreComInterfaces.SERIAL_COBS.value,
+            SerialCfg(CoreComInterfaces.SERIAL_COBS.value, self.port, 115200, 0.02),
+            stream_deframing=True,
+        )
+        assert isinstance(com_if, StreamingSerialComIF)
+        self.assertEqual(com_if.ser_com_type, SerialCommunicationType.COBS)
+        self._check_echo(com_if, CobsDeframer(), cobs_encode_frame)
+
+    def test_dle(self):
+        com_if = create_default_serial_interface(
+            CoreComInterfaces.SERIAL_DLE.value,
+            SerialCfg(CoreComInterfaces.SERIAL_DLE.value, self.port, 115200, 0.02),
+            stream_deframing=True,
+        )
+        assert isinstance(com_if, StreamingSerialComIF)
+        self.assertEqual(com_if.ser_com_type, SerialCommunicationType.DLE_ENCODING)
+        self._check_echo(com_if, DleDeframer(), dle_encode_frame)
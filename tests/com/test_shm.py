@@ -0,0 +1,135 @@
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest import TestCase
+
+from com_interface import SendError
+
+from tmtccmd.com.shm import (
+    InvalidSharedMemoryError,
+    SharedMemoryComInterface,
+    SharedMemoryLink,
+    ShmCfg,
+    ShmSide,
+    load_shm_cfg,
+)
+from tmtccmd.config.com import SharedMemoryConfig, create_com_interface_config_default
+from tmtccmd.config.defs import CoreComInterfaces
+
+
+class TestSharedMemory(TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        # Registered first, so the directory is removed after all links were closed.
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.cfg = ShmCfg(path=str(Path(self.tmp_dir.name) / "link"), capacity=64)
+
+    def _link_pair(self) -> tuple[SharedMemoryComInterface, SharedMemoryLink]:
+        com_if = SharedMemoryComInterface(self.cfg)
+        com_if.open()
+        self.addCleanup(com_if.close)
+        target = SharedMemoryLink(self.cfg, ShmSide.TARGET)
+        self.addCleanup(target.close)
+        return com_if, target
+
+    def test_tc_and_tm(self):
+        com_if, target = self._link_pair()
+        self.assertEqual(com_if.id, CoreComInterfaces.SHARED_MEMORY.value)
+        com_if.send(b"tc0")
+        com_if.send(b"tc1")
+        self.assertEqual(target.packets_available(), 2)
+        self.assertEqual(target.receive(), [b"tc0", b"tc1"])
+        self.assertEqual(target.receive(), [])
+        self.assertEqual(target.send([b"tm0", b"tm1", b"tm2"]), 3)
+        self.assertEqual(com_if.packets_available(), 3)
+        self.assertEqual(com_if.receive(), [b"tm0", b"tm1", b"tm2"])
+        self.assertEqual(target.capacity, 64)
+
+    def test_wrap_around(self):
+        com_if, target = self._link_pair()
+        for idx in range(50):
+            packet = bytes([idx]) * (idx % 20 + 1)
+            self.assertEqual(target.send([packet]), 1)
+            self.assertEqual(com_if.receive(), [packet])
+
+    def test_full(self):
+        com_if, target = self._link_pair()
+        # 3 records with 4 byte length field and 16 byte packets use 60 of the 64 bytes.
+        self.assertEqual(target.send([bytes(16)] * 4), 3)
+        self.assertEqual(com_if.link.receive(1), [bytes(16)])
+        self.assertEqual(target.send([bytes(16)]), 1)
+        for _ in range(3):
+            com_if.send(bytes(16))
+        with self.assertRaises(SendError):
+            com_if.send(bytes(16))
+
+    def test_packet_larger_than_ring_buffer(self):
+        com_if, target = self._link_pair()
+        # A packet which fits exactly uses the whole ring buffer.
+        com_if.send(bytes(60))
+        self.assertEqual(target.receive(), [bytes(60)])
+        with self.assertRaises(ValueError):
+            com_if.send(bytes(61))
+        with self.assertRaises(ValueError):
+            target.send([b"tm0", bytes(61)])
+        self.assertEqual(com_if.receive(), [])
+
+    def test_wait(self):
+        com_if, target = self._link_pair()
+        self.assertFalse(target.wait(0.01))
+
+        def send_later():
+            time.sleep(0.05)
+            com_if.send(b"tc")
+
+        thread = threading.Thread(target=send_later)
+        start = time.time()
+        thread.start()
+        self.assertTrue(target.wait(2.0))
+        self.assertLess(time.time() - start, 1.0)
+        thread.join()
+        self.assertEqual(target.receive(), [b"tc"])
+
+    def test_concurrent_creation(self):
+        links: list[SharedMemoryLink] = []
+        errors: list[Exception] = []
+
+        def create(side: ShmSide):
+            try:
+                link = SharedMemoryLink(self.cfg, side)
+            except Exception as e:
+                errors.append(e)
+            else:
+                links.append(link)
+                self.addCleanup(link.close)
+
+        threads = [threading.Thread(target=create, args=(ShmSide(i % 2),)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(len(links), 8)
+        # Only the shared memory file and the FIFOs are left, no temporary files.
+        self.assertEqual(
+            {path.name for path in Path(self.tmp_dir.name).iterdir()} - {"link.tc", "link.tm"},
+            {"link"},
+        )
+
+    def test_invalid_file(self):
+        Path(self.cfg.path).write_bytes(bytes(128))
+        with self.assertRaises(InvalidSharedMemoryError):
+            SharedMemoryLink(self.cfg, ShmSide.GROUND)
+
+    def test_config(self):
+        toml_path = Path(self.tmp_dir.name) / "tmtc_conf.toml"
+        toml_path.write_text(f'[shm]\npath = "{self.cfg.path}"\ncapacity = 4096\n')
+        shm_cfg = load_shm_cfg(str(toml_path))
+        self.assertEqual(shm_cfg, ShmCfg(path=self.cfg.path, capacity=4096))
+        com_cfg = create_com_interface_config_default(
+            CoreComInterfaces.SHARED_MEMORY.value, str(toml_path), None
+        )
+        assert isinstance(com_cfg, SharedMemoryConfig)
+        self.assertEqual(com_cfg.shm_cfg, shm_cfg)
+        self.assertEqual(load_shm_cfg(str(Path(self.tmp_dir.name) / "missing.toml")), ShmCfg())
@@ -0,0 +1,109 @@
+import json
+import socket
+import tempfile
+import time
+from pathlib import Path
+from unittest import TestCase, skipUnless
+
+from com_interface import SendError
+from spacepackets.ecss import PusTelecommand
+
+from tmtccmd.com.uds import (
+    UnixSocketClient,
+    UnixSocketType,
+    determine_unix_socket_path,
+    determine_unix_socket_type,
+)
+from tmtccmd.config.com import UnixSocketConfig, create_com_interface_config_default
+from tmtccmd.config.defs import CoreComInterfaces
+
+
+def _receive(client: UnixSocketClient, num: int) -> list[bytes]:
+    packets = []
+    end = time.time() + 2.0
+    while len(packets) < num and time.time() < end:
+        packets.extend(client.receive())
+    return packets
+
+
+@skipUnless(
+    hasattr(socket, "AF_UNIX") and hasattr(socket, "SOCK_SEQPACKET"),
+    "requires Unix domain sockets with SOCK_SEQPACKET support",
+)
+class TestUnixSocket(TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.socket_path = str(Path(self.tmp_dir.name) / "sim.sock")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _server(self, sock_type: int) -> socket.socket:
+        server = socket.socket(socket.AF_UNIX, sock_type)
+        server.bind(self.socket_path)
+        server.listen()
+        self.addCleanup(server.close)
+        return server
+
+    def test_seqpacket(self):
+        server = self._server(socket.SOCK_SEQPACKET)
+        client = UnixSocketClient(self.socket_path)
+        self.assertEqual(client.id, CoreComInterfaces.UNIX.value)
+        client.open()
+        self.addCleanup(client.close)
+        conn, _ = server.accept()
+        self.addCleanup(conn.close)
+        client.send(b"tc0")
+        client.send(b"tc1")
+        self.assertEqual(conn.recv(4096), b"tc0")
+        self.assertEqual(conn.recv(4096), b"tc1")
+        self.assertEqual(client.packets_available(), 0)
+        conn.send(b"tm0")
+        conn.send(b"tm1")
+        self.assertEqual(_receive(client, 2), [b"tm0", b"tm1"])
+        conn.close()
+        end = time.time() + 2.0
+        while client.is_open() and time.time() < end:
+            self.assertEqual(client.receive(), [])
+        self.assertFalse(client.is_open())
+        with self.assertRaises(SendError):
+            client.send(b"tc")
+
+    def test_stream_framing(self):
+        server = self._server(socket.SOCK_STREAM)
+        client = UnixSocketClient(self.socket_path, UnixSocketType.STREAM)
+        client.open()
+        self.addCleanup(client.close)
+        conn, _ = server.accept()
+        self.addCleanup(conn.close)
+        ping = PusTelecommand(apid=0x02, service=17, subservice=1).pack()
+        conn.sendall(ping + ping[:3])
+        self.assertEqual(_receive(client, 1), [bytes(ping)])
+        conn.sendall(ping[3:])
+        self.assertEqual(_receive(client, 1), [bytes(ping)])
+
+    def test_connection_refused(self):
+        client = UnixSocketClient(self.socket_path)
+        with self.assertRaises(OSError):
+            client.open()
+        self.assertFalse(client.is_open())
+
+    def test_config(self):
+        toml_path = Path(self.tmp_dir.name) / "tmtc_conf.toml"
+        toml_path.write_text(f'[unix]\npath = "{self.socket_path}"\ntype = "stream"\n')
+        self.assertEqual(determine_unix_socket_path(str(toml_path)), self.socket_path)
+        self.assertEqual(determine_unix_socket_type(str(toml_path)), UnixSocketType.STREAM)
+        com_cfg = create_com_interface_config_default(
+            CoreComInterfaces.UNIX.value, str(toml_path), None
+        )
+        assert isinstance(com_cfg, UnixSocketConfig)
+        self.assertEqual(com_cfg.socket_path, self.socket_path)
+        self.assertEqual(com_cfg.socket_type, UnixSocketType.STREAM)
+        json_path = Path(self.tmp_dir.name) / "tmtc_conf.json"
+        json_path.write_text(json.dumps({"unix_socket_path": self.socket_path}))
+        self.assertEqual(determine_unix_socket_path(str(json_path)), self.socket_path)
+        self.assertEqual(determine_unix_socket_type(str(json_path)), UnixSocketType.SEQPACKET)
+        toml_path.write_text("[tmtc]\n")
+        self.assertIsNone(
+            create_com_interface_config_default(CoreComInterfaces.UNIX.value, str(toml_path), None)
+        )
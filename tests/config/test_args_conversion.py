@@ -1,5 +1,5 @@
 import argparse
-import os
+import io
 from unittest import TestCase
 from unittest.mock import MagicMock, call, patch
 
@@ -170,13 +170,14 @@ class TestArgs(TestCase):
         root_node_only = CmdTreeNode.root_node()
         tc_params = CommandingParams()
         tc_params.print_tree = True
-        perform_tree_printout(tc_params, root_node_only)
-        self.assertEqual(len(print_mock.call_args_list), 2)
+        stream = io.StringIO()
+        perform_tree_printout(tc_params, root_node_only, stream)
+        self.assertEqual(len(print_mock.call_args_list), 1)
         self.assertEqual(
             print_mock.call_args_list[0],
             call("Printing command tree with full descriptions:"),
         )
-        printout = print_mock.call_args_list[1].args[0]
+        printout = stream.getvalue()
         self.assertTrue("/" in printout)
         self.assertTrue("[ Root Node ]" in printout)
 
@@ -186,13 +187,14 @@ class TestArgs(TestCase):
         tc_params = CommandingParams()
         tc_params.print_tree = True
         tc_params.tree_print_with_description = False
-        perform_tree_printout(tc_params, root_node_only)
-        self.assertEqual(len(print_mock.call_args_list), 2)
+        stream = io.StringIO()
+        perform_tree_printout(tc_params, root_node_only, stream)
+        self.assertEqual(len(print_mock.call_args_list), 1)
         self.assertEqual(
             print_mock.call_args_list[0],
             call("Printing command tree without descriptions:"),
         )
-        self.assertEqual(print_mock.call_args_list[1], call(f"/{os.linesep}"))
+        self.assertEqual(stream.getvalue(), "/\n")
 
     @patch("builtins.print")
     def test_tree_printout_2(self, print_mock: MagicMock):
@@ -202,15 +204,13 @@ class TestArgs(TestCase):
         tc_params.print_tree = True
         tc_params.tree_print_with_description = False
         tc_params.tree_print_max_depth = 0
-        perform_tree_printout(tc_params, root_node_only)
-        self.assertEqual(len(print_mock.call_args_list), 2)
+        stream = io.StringIO()
+        perform_tree_printout(tc_params, root_node_only, stream)
+        self.assertEqual(len(print_mock.call_args_list), 1)
         self.assertEqual(
             print_mock.call_args_list[0],
             call("Printing command tree without descriptions and maximum depth 0:"),
         )
         self.assertEqual(
-            print_mock.call_args_list[1],
-            call(
-                f"/{os.linesep}{TreePart.CORNER.value} ... (cut-off, maximum depth 0){os.linesep}"
-            ),
+            stream.getvalue(), f"/\n{TreePart.CORNER.value} ... (cut-off, maximum depth 0)\n"
         )
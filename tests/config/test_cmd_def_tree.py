@@ -1,7 +1,8 @@
+import io
 import os
 from unittest import TestCase
 
-from tmtccmd.config.tmtc import CmdTreeNode
+from tmtccmd.config.tmtc import CmdTreeNode, TreePart
 
 
 class TestCmdDefTree(TestCase):
@@ -102,6 +103,95 @@ class TestCmdDefTree(TestCase):
         self.cmd_tree.children["acs"].add_child(CmdTreeNode("acs_ctrl", "ACS Controller"))
         self.assertTrue(self.cmd_tree.contains_path("/acs/acs_ctrl"))
 
+    def test_extract_subnode_leading_slash(self):
+        self.tree_with_two_layers()
+        self.assertIs(
+            self.cmd_tree.extract_subnode("/acs/acs_ctrl"), self.cmd_tree["acs"]["acs_ctrl"]
+        )
+        self.assertIs(self.cmd_tree.extract_subnode("/"), self.cmd_tree)
+
+    def test_path_not_contained(self):
+        self.tree_with_two_layers()
+        self.assertFalse(self.cmd_tree.contains_path("/acs/"))
+        self.assertFalse(self.cmd_tree.contains_path("//acs"))
+        self.assertFalse(self.cmd_tree.contains_path("/acs/tcs"))
+        self.assertFalse(self.cmd_tree.contains_path_from_node_list([]))
+        self.assertTrue(self.cmd_tree.contains_path_from_node_list(["", ""]))
+
+    def test_relative_path_from_subnode(self):
+        self.tree_with_two_layers()
+        acs_node = self.cmd_tree["acs"]
+        self.assertIs(acs_node.extract_subnode("acs_ctrl"), acs_node["acs_ctrl"])
+        self.assertFalse(acs_node.contains_path("acs"))
+
+    def test_subtree_attached_later(self):
+        mgm = CmdTreeNode("mgm_0", "MGM 0")
+        mgm.add_child(CmdTreeNode("update_cfg", "Update Configuration"))
+        acs = CmdTreeNode("acs", "ACS Subsystem")
+        acs.add_child(mgm)
+        self.assertIs(acs.extract_subnode("mgm_0/update_cfg"), mgm["update_cfg"])
+        self.cmd_tree.add_child(acs)
+        self.assertTrue(self.cmd_tree.contains_path("/acs/mgm_0/update_cfg"))
+        self.assertIs(mgm.extract_subnode("update_cfg"), mgm["update_cfg"])
+        mgm.add_child(CmdTreeNode("reset", "Reset"))
+        self.assertIs(self.cmd_tree.extract_subnode("acs/mgm_0/reset"), mgm["reset"])
+
+    def test_replaced_child(self):
+        self.tree_with_two_layers()
+        new_acs = CmdTreeNode("acs", "New ACS Subsystem")
+        new_acs.add_child(CmdTreeNode("mgm_0", "MGM 0"))
+        self.cmd_tree.add_child(new_acs)
+        self.assertFalse(self.cmd_tree.contains_path("/acs/acs_ctrl"))
+        self.assertIs(self.cmd_tree.extract_subnode("acs"), new_acs)
+        self.assertTrue(self.cmd_tree.contains_path("/acs/mgm_0"))
+
+    def test_replaced_shared_child(self):
+        other = CmdTreeNode("other", "Other Commands")
+        other.add_child(CmdTreeNode("ping", "Ping"))
+        mgm_0 = CmdTreeNode("mgm_0", "MGM 0")
+        mgm_1 = CmdTreeNode("mgm_1", "MGM 1")
+        self.cmd_tree.add_child(mgm_0)
+        self.cmd_tree.add_child(mgm_1)
+        mgm_0.add_child(other)
+        mgm_1.add_child(other)
+        mgm_0.add_child(CmdTreeNode("other", "Other Commands"))
+        self.assertTrue(self.cmd_tree.contains_path("mgm_0/other"))
+        self.assertFalse(self.cmd_tree.contains_path("mgm_0/other/ping"))
+        self.assertIs(self.cmd_tree.extract_subnode("mgm_1/other/ping"), other["ping"])
+
+    def test_removed_child(self):
+        self.tree_with_two_layers()
+        del self.cmd_tree.children["acs"]
+        self.assertFalse(self.cmd_tree.contains_path("acs"))
+        self.assertIsNone(self.cmd_tree.extract_subnode("acs/acs_ctrl"))
+        self.cmd_tree.children.clear()
+        self.assertFalse(self.cmd_tree.contains_path("tcs"))
+
+    def test_detached_subtree_lookup(self):
+        old_acs = CmdTreeNode("acs", "ACS Subsystem")
+        old_acs.add_child(CmdTreeNode("ctrl", "old"))
+        self.cmd_tree.add_child(old_acs)
+        new_acs = CmdTreeNode("acs", "ACS Subsystem")
+        new_acs.add_child(CmdTreeNode("ctrl", "new"))
+        self.cmd_tree.add_child(new_acs)
+        self.assertIs(old_acs.extract_subnode("ctrl"), old_acs["ctrl"])
+        self.assertEqual(self.cmd_tree.extract_subnode("acs/ctrl").description, "new")
+
+    def test_child_inserted_directly(self):
+        self.tree_with_two_layers()
+        node = CmdTreeNode("direct", "Inserted without add_child", parent=self.cmd_tree["tcs"])
+        self.cmd_tree["tcs"].children["direct"] = node
+        self.assertIs(self.cmd_tree.extract_subnode("tcs/direct"), node)
+
+    def test_deep_tree(self):
+        node = self.cmd_tree
+        for i in range(2000):
+            child = CmdTreeNode(f"level_{i}", "Deep node")
+            node.add_child(child)
+            node = child
+        path = "/".join(f"level_{i}" for i in range(2000))
+        self.assertIs(self.cmd_tree.extract_subnode(path), node)
+
     def test_named_dict(self):
         self.base_tree()
         self.cmd_tree.children["acs"].add_child(CmdTreeNode("acs_ctrl", "ACS Controller"))
@@ -363,3 +453,23 @@ class TestCmdDefTree(TestCase):
                 f"      └── 0{os.linesep}"
             ),
         )
+
+    def test_write_tree(self):
+        self.tree_with_two_layers()
+        stream = io.StringIO()
+        self.cmd_tree.write_tree(stream, with_description=False)
+        self.assertEqual(stream.getvalue(), "/\n├── acs\n│  └── acs_ctrl\n├── tcs\n└── ping\n")
+
+    def test_iter_tree_lines_deep_tree(self):
+        node = self.cmd_tree
+        for i in range(5000):
+            child = CmdTreeNode(f"level_{i}", "Deep node")
+            node.add_child(child)
+            node = child
+        lines = list(self.cmd_tree.iter_tree_lines(with_description=False))
+        self.assertEqual(len(lines), 5001)
+        self.assertEqual(
+            lines[-1], f"{TreePart.BLANK.value * 4999}{TreePart.CORNER.value} level_4999"
+        )
+        lines = list(self.cmd_tree.iter_tree_lines(with_description=False, max_depth=2))
+        self.assertEqual(len(lines), 4)
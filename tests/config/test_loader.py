@@ -0,0 +1,118 @@
+import dataclasses
+import json
+import os
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from tmtccmd.com.ser_utils import determine_baud_rate, determine_com_port
+from tmtccmd.com.tcpip_utils import EthAddr, TcpIpType, load_tcpip_address_from_toml
+from tmtccmd.com.utils import determine_com_if
+from tmtccmd.config import loader
+from tmtccmd.config.loader import TmtcFileCfg, clear_tmtc_file_cfg_cache, load_tmtc_file_cfg
+from tmtccmd.util.json import JsonKeyNames
+
+TOML_CFG = """
+[tmtc]
+interface = "udp"
+
+[serial]
+port = "/dev/ttyUSB0"
+baud = 115200
+
+[udp]
+addr = "127.0.0.1"
+port = 7301
+
+[tcp]
+addr = "127.0.0.1"
+port = "invalid"
+
+[unix]
+path = "/tmp/sim.sock"
+type = "stream"
+"""
+
+
+class TestConfigLoader(TestCase):
+    def setUp(self):
+        clear_tmtc_file_cfg_cache()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.toml_path = str(Path(self.tmp_dir.name) / "tmtc_conf.toml")
+        self.json_path = str(Path(self.tmp_dir.name) / "tmtc_conf.json")
+        Path(self.toml_path).write_text(TOML_CFG)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_toml(self):
+        cfg = load_tmtc_file_cfg(self.toml_path)
+        self.assertTrue(cfg.valid)
+        self.assertEqual(cfg.com_if, "udp")
+        self.assertEqual(cfg.serial.port, "/dev/ttyUSB0")
+        self.assertEqual(cfg.serial.baud_rate, 115200)
+        self.assertIsNone(cfg.serial.hint)
+        self.assertEqual(cfg.udp.send_addr, ("127.0.0.1", 7301))
+        self.assertIsNone(cfg.tcp.send_addr)
+        self.assertEqual(cfg.unix.path, "/tmp/sim.sock")
+        self.assertEqual(cfg.unix.socket_type, "stream")
+        self.assertIsNone(cfg.shm.path)
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            cfg.com_if = "tcp"
+
+    def test_json(self):
+        Path(self.json_path).write_text(
+            json.dumps(
+                {
+                    JsonKeyNames.COM_IF.value: "tcp",
+                    JsonKeyNames.SERIAL_BAUDRATE.value: 9600,
+                    JsonKeyNames.SERIAL_HINT.value: "FTDI",
+                    JsonKeyNames.TCPIP_TCP_DEST_IP_ADDRESS.value: "10.0.0.1",
+                    JsonKeyNames.TCPIP_TCP_DEST_PORT.value: "7301",
+                    JsonKeyNames.TCPIP_UDP_RECV_IP_ADDRESS.value: "0.0.0.0",
+                    JsonKeyNames.TCPIP_UDP_RECV_PORT.value: 7302,
+                    JsonKeyNames.SHM_CAPACITY.value: 4096,
+                }
+            )
+        )
+        cfg = load_tmtc_file_cfg(self.json_path)
+        self.assertTrue(cfg.valid)
+        self.assertEqual(cfg.com_if, "tcp")
+        self.assertEqual(cfg.serial.baud_rate, 9600)
+        self.assertEqual(cfg.serial.hint, "FTDI")
+        self.assertIsNone(cfg.serial.port)
+        self.assertEqual(cfg.tcp.send_addr, ("10.0.0.1", 7301))
+        self.assertIsNone(cfg.udp.send_addr)
+        self.assertEqual(cfg.udp.recv_addr, ("0.0.0.0", 7302))
+        self.assertEqual(cfg.shm.capacity, 4096)
+
+    def test_invalid_and_missing_files(self):
+        Path(self.json_path).write_text("{ invalid")
+        self.assertEqual(
+            load_tmtc_file_cfg(self.json_path), TmtcFileCfg(path=self.json_path, valid=False)
+        )
+        missing = str(Path(self.tmp_dir.name) / "missing.toml")
+        self.assertFalse(load_tmtc_file_cfg(missing).valid)
+
+    def test_file_parsed_once(self):
+        with patch.object(loader, "_parse_file", wraps=loader._parse_file) as parse:
+            self.assertEqual(determine_com_if({}, self.toml_path, False), "udp")
+            self.assertEqual(determine_baud_rate(self.toml_path), 115200)
+            self.assertEqual(determine_com_port(self.toml_path), "/dev/ttyUSB0")
+            self.assertEqual(
+                load_tcpip_address_from_toml(TcpIpType.UDP, self.toml_path),
+                EthAddr("127.0.0.1", 7301),
+            )
+            self.assertEqual(parse.call_count, 1)
+
+    def test_changed_file_reloaded(self):
+        first = load_tmtc_file_cfg(self.toml_path)
+        self.assertIs(load_tmtc_file_cfg(self.toml_path), first)
+        Path(self.toml_path).write_text(TOML_CFG.replace('"udp"', '"tcp"'))
+        stat = os.stat(self.toml_path)
+        # Make sure the modification time differs on file systems with a coarse resolution.
+        os.utime(self.toml_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        second = load_tmtc_file_cfg(self.toml_path)
+        self.assertIsNot(second, first)
+        self.assertEqual(second.com_if, "tcp")
@@ -1,9 +1,16 @@
-from unittest import TestCase
+import io
+import os
+import subprocess
+import sys
+import tempfile
+from unittest import TestCase, skipIf
 from unittest.mock import MagicMock, patch
 
+from prompt_toolkit.completion import CompleteEvent
+from prompt_toolkit.document import Document
 from prompt_toolkit.history import InMemoryHistory
 
-from tmtccmd.config.prompt import prompt_cmd_path
+from tmtccmd.config.prompt import CmdTreeCompleter, print_tree, prompt_cmd_path
 from tmtccmd.config.tmtc import CmdTreeNode
 
 
@@ -26,8 +33,9 @@ class TestPromptFunc(TestCase):
             prompt.assert_not_called()
             self.assertEqual(cmd_path, "/")
 
+    @patch("sys.stdout", new_callable=io.StringIO)
     @patch("builtins.print")
-    def test_prompt_cmd_path_full_print(self, mocked_print: MagicMock):
+    def test_prompt_cmd_path_full_print(self, mocked_print: MagicMock, stdout: io.StringIO):
         self.base_tree()
         with patch(
             "tmtccmd.config.prompt.prompt_toolkit.prompt", side_effect=[":pf", "acs"]
@@ -36,13 +44,13 @@ class TestPromptFunc(TestCase):
             self.assertEqual(len(prompt.call_args_list), 2)
             self.assertEqual(cmd_path, "/acs")
             call_list = mocked_print.call_args_list
-            self.assertEqual(len(call_list), 2)
+            self.assertEqual(len(call_list), 1)
             help_txt = mocked_print.call_args_list[0].args[0]
             self.assertTrue("Additional commands for prompt:" in help_txt)
-            self.assertTrue(":p[b][f][<depth>] Tree Print" in help_txt)
+            self.assertTrue(":p[b][f][l][<depth>] Tree Print" in help_txt)
             self.assertTrue(":r Retry" in help_txt)
             self.assertTrue(":h Help Text" in help_txt)
-            printout = mocked_print.call_args_list[1].args[0]
+            printout = stdout.getvalue()
             self.assertTrue("acs" in printout)
             self.assertTrue("ACS Subsystem" in printout)
             self.assertTrue("tcs" in printout)
@@ -88,7 +96,7 @@ class TestPromptFunc(TestCase):
             self.assertEqual(len(call_list), 2)
             help_txt = mocked_print.call_args_list[0].args[0]
             self.assertTrue("Additional commands for prompt:" in help_txt)
-            self.assertTrue(":p[b][f][<depth>] Tree Print" in help_txt)
+            self.assertTrue(":p[b][f][l][<depth>] Tree Print" in help_txt)
             self.assertTrue(":r Retry" in help_txt)
             self.assertTrue(":h Help Text" in help_txt)
             help_txt_2 = mocked_print.call_args_list[1].args[0]
@@ -102,3 +110,125 @@ class TestPromptFunc(TestCase):
             cmd_path = prompt_cmd_path(self.cmd_tree, history=history)
             self.assertEqual(len(prompt.call_args_list), 1)
             self.assertEqual(cmd_path, "/ping")
+
+
+class TestCmdTreeCompleter(TestCase):
+    def setUp(self) -> None:
+        self.cmd_tree = CmdTreeNode.root_node()
+        acs = CmdTreeNode("acs", "ACS Subsystem")
+        self.cmd_tree.add_child(acs)
+        self.cmd_tree.add_child(CmdTreeNode("tcs", "TCS Subsystem"))
+        self.cmd_tree.add_child(CmdTreeNode("ping", "Ping Command"))
+        for name in ["mgm_1", "acs_ctrl", "MGM_0", "gyro_0", "str_mgmt"]:
+            acs.add_child(CmdTreeNode(name, f"{name} description"))
+        self.completer = CmdTreeCompleter(self.cmd_tree)
+
+    def complete(self, text: str) -> list[str]:
+        return [
+            completion.text
+            for completion in self.completer.get_completions(Document(text), CompleteEvent())
+        ]
+
+    def test_root_level(self):
+        self.assertEqual(self.complete(""), ["acs", "tcs", "ping"])
+        self.assertEqual(self.complete("/"), ["acs", "tcs", "ping"])
+        self.assertEqual(self.complete("p"), ["ping"])
+
+    def test_nested_level(self):
+        self.assertEqual(
+            self.complete("acs/"), ["mgm_1", "acs_ctrl", "MGM_0", "gyro_0", "str_mgmt"]
+        )
+        completions = list(self.completer.get_completions(Document("acs/gy"), CompleteEvent()))
+        self.assertEqual(len(completions), 1)
+        self.assertEqual(completions[0].text, "gyro_0")
+        self.assertEqual(completions[0].start_position, -2)
+        self.assertEqual(completions[0].display_meta_text, "gyro_0 description")
+
+    def test_match_order(self):
+        # Prefix matches in tree order, then substring matches, then fuzzy matches.
+        self.assertEqual(self.complete("acs/mgm"), ["mgm_1", "MGM_0", "str_mgmt"])
+        self.assertEqual(self.complete("acs/m0"), ["MGM_0"])
+        self.assertEqual(self.complete("acs/ctrl"), ["acs_ctrl"])
+        self.assertEqual(self.complete("acs/sr"), ["acs_ctrl", "str_mgmt"])
+
+    def test_incremental_word(self):
+        self.assertEqual(self.complete("acs/g"), ["gyro_0", "mgm_1", "MGM_0", "str_mgmt"])
+        self.assertEqual(self.complete("acs/gy"), ["gyro_0"])
+        self.assertEqual(self.complete("acs/g"), ["gyro_0", "mgm_1", "MGM_0", "str_mgmt"])
+
+    def test_case_sensitive_without_fuzzy(self):
+        completer = CmdTreeCompleter(self.cmd_tree, ignore_case=False, fuzzy=False)
+        completions = completer.get_completions(Document("acs/mgm"), CompleteEvent())
+        self.assertEqual([c.text for c in completions], ["mgm_1", "str_mgmt"])
+
+    def test_no_completions(self):
+        self.assertEqual(self.complete("ping/"), [])
+        self.assertEqual(self.complete("invalid/"), [])
+        self.assertEqual(self.complete("acs//"), [])
+
+    def test_max_completions_and_cache_size(self):
+        completer = CmdTreeCompleter(self.cmd_tree, max_completions=2, cache_size=1)
+        completions = completer.get_completions(Document("acs/m"), CompleteEvent())
+        self.assertEqual([c.text for c in completions], ["mgm_1", "MGM_0"])
+        list(completer.get_completions(Document("acs/g"), CompleteEvent()))
+        self.assertEqual(list(completer._results), [("acs", "g")])
+
+    def test_truncated_result_keeps_tree_order(self):
+        completer = CmdTreeCompleter(self.cmd_tree, max_completions=1)
+        completions = completer.get_completions(Document("acs/m"), CompleteEvent())
+        self.assertEqual([c.text for c in completions], ["mgm_1"])
+        # The truncated result of the shorter word must not be used for filtering.
+        completions = completer.get_completions(Document("acs/mt"), CompleteEvent())
+        self.assertEqual([c.text for c in completions], ["str_mgmt"])
+
+
+class TestPrintTree(TestCase):
+    def setUp(self) -> None:
+        self.cmd_tree = CmdTreeNode.root_node()
+        self.cmd_tree.add_child(CmdTreeNode("acs", "ACS Subsystem"))
+        self.cmd_tree.add_child(CmdTreeNode("ping", "Ping Command"))
+
+    def test_stream(self):
+        stream = io.StringIO()
+        print_tree(self.cmd_tree, with_description=False, stream=stream)
+        self.assertEqual(stream.getvalue(), "/\n├── acs\n└── ping\n")
+
+    @skipIf(os.name == "nt", "POSIX shell quoting is used for the pager command")
+    def test_pager(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            out_path = os.path.join(tmp_dir, "pager_out.txt")
+            script = (
+                f"import sys; open({out_path!r}, 'w', encoding='utf-8').write(sys.stdin.read())"
+            )
+            pager = f"{sys.executable} -c {script!r}"
+            stream = io.StringIO()
+            with patch.dict(os.environ, {"PAGER": pager}):
+                print_tree(self.cmd_tree, with_description=False, use_pager=True, stream=stream)
+            with open(out_path, encoding="utf-8") as out:
+                self.assertEqual(out.read(), "/\n├── acs\n└── ping\n")
+            self.assertEqual(stream.getvalue(), "")
+
+    @skipIf(os.name == "nt", "POSIX shell quoting is used for the pager command")
+    def test_pager_closed_early(self):
+        for i in range(5000):
+            self.cmd_tree.add_child(CmdTreeNode(f"node_with_a_long_name_{i}", "Node"))
+        pagers = []
+        popen_cls = subprocess.Popen
+
+        def popen(*args, **kwargs):
+            pagers.append(popen_cls(*args, **kwargs))
+            return pagers[-1]
+
+        with (
+            patch.dict(os.environ, {"PAGER": f"{sys.executable} -c pass"}),
+            patch("tmtccmd.config.prompt.subprocess.Popen", side_effect=popen),
+        ):
+            print_tree(self.cmd_tree, with_description=True, use_pager=True)
+        self.assertEqual(len(pagers), 1)
+        self.assertTrue(pagers[0].stdin.closed)
+
+    def test_pager_not_found(self):
+        stream = io.StringIO()
+        with patch.dict(os.environ, {"PAGER": "tmtccmd-nonexistent-pager"}):
+            print_tree(self.cmd_tree, with_description=False, use_pager=True, stream=stream)
+        self.assertEqual(stream.getvalue(), "/\n├── acs\n└── ping\n")
@@ -0,0 +1,162 @@
+import json
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from tmtccmd.config.tmtc import CmdTreeNode
+from tmtccmd.config.tree_cache import (
+    cached_cmd_tree,
+    clear_cmd_tree_cache,
+    cmd_tree_from_dict,
+    cmd_tree_to_dict,
+    hash_files,
+    load_cmd_tree,
+    save_cmd_tree,
+)
+
+
+def build_tree() -> CmdTreeNode:
+    root = CmdTreeNode.root_node()
+    root.add_child(CmdTreeNode("ping", "Send PUS ping command"))
+    root.add_child(CmdTreeNode("acs", "ACS Subsystem", hide_children_which_are_leaves=True))
+    root["acs"].add_child(CmdTreeNode("acs_ctrl", "ACS Controller"))
+    root["acs"].add_child(CmdTreeNode("mgm0", "Magnetometer 0"))
+    root["acs"].add_child(CmdTreeNode("mgm1", "Magnetometer 1"))
+    mgm_node = CmdTreeNode("other cmds", "Other MGM commands", hide_children_for_print=True)
+    mgm_node.add_child(CmdTreeNode("reset", "Reset"))
+    root["acs"]["mgm0"].add_child(mgm_node)
+    root["acs"]["mgm1"].add_child(mgm_node)
+    root.add_child(CmdTreeNode("tcs", "TCS Subsystem"))
+    root["tcs"].add_child(CmdTreeNode("acs_ctrl", "ACS Controller"))
+    return root
+
+
+class TestCmdTreeSerialization(TestCase):
+    def test_round_trip(self):
+        tree = build_tree()
+        data = json.loads(json.dumps(cmd_tree_to_dict(tree, "v1")))
+        self.assertEqual(data["version"], "v1")
+        self.assertEqual(data["nodes"][0][0], "/")
+        # Identical descriptions and shared nodes are only stored once.
+        self.assertEqual(len(data["descriptions"]), 9)
+        self.assertEqual(len(data["nodes"]), 10)
+        loaded = cmd_tree_from_dict(data)
+        self.assertEqual(loaded.str_for_tree(True), tree.str_for_tree(True))
+        self.assertEqual(loaded.name_dict, tree.name_dict)
+        self.assertTrue(loaded["acs"].hide_children_which_are_leaves)
+        self.assertFalse(loaded["acs"].hide_children_for_print)
+        other_cmds = loaded["acs"]["mgm0"]["other cmds"]
+        self.assertIs(other_cmds, loaded["acs"]["mgm1"]["other cmds"])
+        self.assertTrue(other_cmds.hide_children_for_print)
+        self.assertIs(loaded.extract_subnode("acs/mgm0/other cmds/reset"), other_cmds["reset"])
+        self.assertIs(loaded.extract_subnode("acs/mgm1/other cmds/reset"), other_cmds["reset"])
+        self.assertIsNot(loaded["acs"]["acs_ctrl"], loaded["tcs"]["acs_ctrl"])
+
+    def test_root_only(self):
+        loaded = cmd_tree_from_dict(cmd_tree_to_dict(CmdTreeNode.root_node()))
+        self.assertEqual(loaded.name, "/")
+        self.assertTrue(loaded.is_leaf())
+
+    def test_invalid_data(self):
+        data = cmd_tree_to_dict(build_tree())
+        for invalid in [
+            {**data, "format": 0},
+            {**data, "nodes": []},
+            {**data, "descriptions": []},
+            {**data, "nodes": [["/", 0, 0, [1]]]},
+            {**data, "nodes": [["/", 0, 0, [1]], ["a", 0, 0, [0]]]},
+            {**data, "nodes": [["/", 0, 0, [1]], ["a", 0, 0, [2]], ["b", 0, 0, [1]]]},
+            {**data, "nodes": [["/", 0, 0, [1]], ["a", 0, 0, [1]]]},
+            {**data, "nodes": [["/", 0, 0, [2]], ["a", 0, 0], ["b", 0, 0, [1]]]},
+            {**data, "nodes": [["/", 0, "0"]]},
+        ]:
+            with self.subTest(invalid=invalid), self.assertRaises(ValueError):
+                cmd_tree_from_dict(invalid)
+
+
+class TestCmdTreeCache(TestCase):
+    def setUp(self):
+        clear_cmd_tree_cache()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = str(Path(self.tmp_dir.name) / "cmd_tree.json")
+
+    def tearDown(self):
+        clear_cmd_tree_cache()
+        self.tmp_dir.cleanup()
+
+    def test_save_load(self):
+        tree = build_tree()
+        save_cmd_tree(tree, self.cache_path, "v1")
+        self.assertFalse(Path(f"{self.cache_path}.tmp").exists())
+        loaded = load_cmd_tree(self.cache_path, "v1")
+        assert loaded is not None
+        self.assertEqual(loaded.str_for_tree(True), tree.str_for_tree(True))
+        self.assertIsNotNone(load_cmd_tree(self.cache_path))
+        self.assertIsNone(load_cmd_tree(self.cache_path, "v2"))
+
+    def test_failed_save_removes_tmp_file(self):
+        with (
+            patch("tmtccmd.config.tree_cache.json.dump", side_effect=OSError("disk full")),
+            self.assertRaises(OSError),
+        ):
+            save_cmd_tree(build_tree(), self.cache_path, "v1")
+        self.assertFalse(Path(f"{self.cache_path}.tmp").exists())
+        self.assertFalse(Path(self.cache_path).exists())
+
+    def test_load_missing_or_invalid(self):
+        self.assertIsNone(load_cmd_tree(self.cache_path))
+        Path(self.cache_path).write_text("{")
+        with self.assertLogs("tmtccmd.config.tree_cache", "WARNING"):
+            self.assertIsNone(load_cmd_tree(self.cache_path))
+        Path(self.cache_path).write_text('{"format": 1, "nodes": [["/"]]}')
+        with self.assertLogs("tmtccmd.config.tree_cache", "WARNING"):
+            self.assertIsNone(load_cmd_tree(self.cache_path))
+
+    def test_cached_tree_is_built_once(self):
+        build = MagicMock(side_effect=build_tree)
+        tree = cached_cmd_tree(self.cache_path, "v1", build)
+        self.assertIs(cached_cmd_tree(self.cache_path, "v1", build), tree)
+        build.assert_called_once()
+        self.assertTrue(Path(self.cache_path).exists())
+        # A new process only loads the cache file.
+        clear_cmd_tree_cache()
+        loaded = cached_cmd_tree(self.cache_path, "v1", build)
+        build.assert_called_once()
+        self.assertIsNot(loaded, tree)
+        self.assertEqual(loaded.str_for_tree(True), tree.str_for_tree(True))
+
+    def test_version_change_rebuilds_tree(self):
+        cached_cmd_tree(self.cache_path, "v1", build_tree)
+        clear_cmd_tree_cache()
+        build = MagicMock(return_value=CmdTreeNode.root_node())
+        tree = cached_cmd_tree(self.cache_path, "v2", build)
+        build.assert_called_once()
+        self.assertTrue(tree.is_leaf())
+        data = json.loads(Path(self.cache_path).read_text())
+        self.assertEqual(data["version"], "v2")
+
+    def test_invalid_cache_file_rebuilds_tree(self):
+        Path(self.cache_path).write_text("not json")
+        build = MagicMock(side_effect=build_tree)
+        with self.assertLogs("tmtccmd.config.tree_cache", "WARNING"):
+            cached_cmd_tree(self.cache_path, "v1", build)
+        build.assert_called_once()
+        self.assertIsNotNone(load_cmd_tree(self.cache_path, "v1"))
+
+    def test_unwritable_cache_file(self):
+        cache_path = str(Path(self.tmp_dir.name) / "missing" / "cmd_tree.json")
+        with self.assertLogs("tmtccmd.config.tree_cache", "WARNING"):
+            tree = cached_cmd_tree(cache_path, "v1", build_tree)
+        self.assertIn("acs", tree.children)
+
+    def test_hash_files(self):
+        first = Path(self.tmp_dir.name) / "objects.csv"
+        second = Path(self.tmp_dir.name) / "actions.csv"
+        first.write_text("0x01,ACS")
+        second.write_text("0x01,reset")
+        version = hash_files(str(first), str(second))
+        self.assertEqual(hash_files(str(first), str(second)), version)
+        self.assertNotEqual(hash_files(str(second), str(first)), version)
+        second.write_text("0x01,reboot")
+        self.assertNotEqual(hash_files(str(first), str(second)), version)
@@ -0,0 +1,199 @@
+import csv
+import io
+import json
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from prompt_toolkit.completion import CompleteEvent
+from prompt_toolkit.document import Document
+
+from tmtccmd.config.prompt import CmdTreeCompleter
+from tmtccmd.config.tmtc import CmdTreeNode
+from tmtccmd.config.tree_loader import cmd_tree_from_rows, cmd_tree_from_spec, load_cmd_tree_file
+
+TOML_TREE = """
+ping = "Send PUS ping command"
+
+[acs]
+description = "ACS Subsystem"
+hide_children_which_are_leaves = true
+acs_ctrl = "ACS Controller"
+
+[acs.mgm0]
+description = "Magnetometer 0"
+reset = "Reset the magnetometer"
+
+[tcs]
+description = "TCS Subsystem"
+hide_children_for_print = true
+heater = "Heater"
+"""
+
+CSV_TREE = """# path,description,attributes
+ping,Send PUS ping command
+
+acs,ACS Subsystem,hide_children_which_are_leaves
+acs/acs_ctrl,ACS Controller
+acs/mgm0,Magnetometer 0
+acs/mgm0/reset,Reset the magnetometer
+tcs/heater,Heater
+tcs,TCS Subsystem,hide_children_for_print
+"""
+
+
+def eager_tree() -> CmdTreeNode:
+    root = CmdTreeNode.root_node()
+    root.add_child(CmdTreeNode("ping", "Send PUS ping command"))
+    root.add_child(CmdTreeNode("acs", "ACS Subsystem", hide_children_which_are_leaves=True))
+    root["acs"].add_child(CmdTreeNode("acs_ctrl", "ACS Controller"))
+    root["acs"].add_child(CmdTreeNode("mgm0", "Magnetometer 0"))
+    root["acs"]["mgm0"].add_child(CmdTreeNode("reset", "Reset the magnetometer"))
+    root.add_child(CmdTreeNode("tcs", "TCS Subsystem", hide_children_for_print=True))
+    root["tcs"].add_child(CmdTreeNode("heater", "Heater"))
+    return root
+
+
+class TestDeferredChildren(TestCase):
+    def test_loader_called_once_on_access(self):
+        calls = []
+
+        def loader(node: CmdTreeNode):
+            calls.append(node.name)
+            node.add_child(CmdTreeNode("event", "Event"))
+
+        root = CmdTreeNode.root_node()
+        test_node = CmdTreeNode("test", "Test Node")
+        test_node.defer_children(loader)
+        root.add_child(test_node)
+        self.assertFalse(test_node.children_loaded)
+        self.assertFalse(test_node.is_leaf())
+        self.assertEqual(calls, [])
+        self.assertTrue(root.contains_path("test/event"))
+        self.assertTrue(test_node.children_loaded)
+        self.assertIs(root.extract_subnode("/test/event"), test_node["event"])
+        self.assertEqual(root.str_for_tree(False).count("event"), 1)
+        self.assertEqual(calls, ["test"])
+
+    def test_failing_loader_is_retried(self):
+        calls = []
+
+        def loader(node: CmdTreeNode):
+            calls.append(node.name)
+            if len(calls) == 1:
+                raise RuntimeError("loading failed")
+            node.add_child(CmdTreeNode("event", "Event"))
+
+        node = CmdTreeNode("test", "Test Node")
+        node.defer_children(loader)
+        with self.assertRaises(RuntimeError):
+            list(node.children)
+        self.assertFalse(node.children_loaded)
+        self.assertIn("event", node.children)
+        self.assertEqual(len(calls), 2)
+
+
+class TestCmdTreeLoader(TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write(self, name: str, content: str) -> str:
+        path = Path(self.tmp_dir.name) / name
+        path.write_text(content)
+        return str(path)
+
+    def check_tree(self, root: CmdTreeNode):
+        self.assertEqual(list(root.children), ["ping", "acs", "tcs"])
+        self.assertFalse(root["acs"].children_loaded)
+        self.assertFalse(root["tcs"].children_loaded)
+        self.assertTrue(root.contains_path("acs/mgm0/reset"))
+        self.assertTrue(root["acs"].children_loaded)
+        self.assertTrue(root["acs"]["mgm0"].children_loaded)
+        # Sibling subtrees are not created by the lookup.
+        self.assertFalse(root["tcs"].children_loaded)
+        self.assertFalse(root.contains_path("tcs/cooler"))
+        self.assertTrue(root["acs"]["acs_ctrl"].is_leaf())
+        self.assertEqual(
+            root.str_for_tree(True, show_hidden_elements=True),
+            eager_tree().str_for_tree(True, show_hidden_elements=True),
+        )
+        self.assertEqual(root.str_for_tree(True), eager_tree().str_for_tree(True))
+
+    def test_toml(self):
+        self.check_tree(load_cmd_tree_file(self.write("tree.toml", TOML_TREE)))
+
+    def test_json(self):
+        spec = {
+            "ping": "Send PUS ping command",
+            "acs": {
+                "description": "ACS Subsystem",
+                "hide_children_which_are_leaves": True,
+                "acs_ctrl": "ACS Controller",
+                "mgm0": {"description": "Magnetometer 0", "reset": "Reset the magnetometer"},
+            },
+            "tcs": {"description": "TCS Subsystem", "hide_children_for_print": True},
+        }
+        spec["tcs"]["heater"] = "Heater"
+        self.check_tree(load_cmd_tree_file(self.write("tree.json", json.dumps(spec))))
+
+    def test_csv(self):
+        root = load_cmd_tree_file(self.write("tree.csv", CSV_TREE))
+        self.check_tree(root)
+
+    def test_csv_implicit_parents(self):
+        root = cmd_tree_from_rows([["a/b/c", "C"], ["a/d", "D"]])
+        self.assertEqual(root["a"].description, "")
+        self.assertEqual(list(root["a"].children), ["b", "d"])
+        self.assertEqual(root.extract_subnode("a/b/c").description, "C")
+
+    def test_csv_failed_load_is_retried(self):
+        root = cmd_tree_from_rows(csv.reader(io.StringIO(CSV_TREE)))
+        acs = root["acs"]
+        with (
+            patch.object(CmdTreeNode, "add_child", side_effect=RuntimeError("loading failed")),
+            self.assertRaises(RuntimeError),
+        ):
+            list(acs.children)
+        self.assertFalse(acs.children_loaded)
+        self.assertEqual(list(acs.children), ["acs_ctrl", "mgm0"])
+        self.assertTrue(root.contains_path("acs/mgm0/reset"))
+
+    def test_completer(self):
+        root = cmd_tree_from_rows(csv.reader(io.StringIO(CSV_TREE)))
+        completer = CmdTreeCompleter(root)
+        completions = completer.get_completions(Document("acs/mgm0/"), CompleteEvent())
+        self.assertEqual([completion.text for completion in completions], ["reset"])
+        self.assertFalse(root["tcs"].children_loaded)
+
+    def test_invalid_spec(self):
+        for spec in [
+            {"acs": 1},
+            {"acs": {"description": 1}},
+            {"acs": {"hide_children_for_print": "yes"}},
+            {"acs": {"mgm0": {"reset": ["a"]}}},
+            {"acs/mgm0": "Magnetometer 0"},
+        ]:
+            with self.subTest(spec=spec), self.assertRaises(ValueError):
+                cmd_tree_from_spec(spec)
+
+    def test_invalid_rows(self):
+        for rows in [
+            [["acs", "ACS", "hide_everything"]],
+            [["acs//mgm0", "MGM"]],
+            [["/", "Root"]],
+            [["acs", "ACS", "", "extra"]],
+        ]:
+            with self.subTest(rows=rows), self.assertRaises(ValueError):
+                cmd_tree_from_rows(rows)
+
+    def test_invalid_file(self):
+        with self.assertRaises(ValueError):
+            load_cmd_tree_file(self.write("tree.toml", "[acs"))
+        with self.assertRaises(ValueError):
+            load_cmd_tree_file(self.write("tree.json", "[]"))
+        with self.assertRaises(ValueError):
+            load_cmd_tree_file(self.write("tree.csv", f"acs,{'x' * (csv.field_size_limit() + 1)}"))
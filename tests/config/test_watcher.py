@@ -0,0 +1,212 @@
+import json
+import logging
+import sys
+import tempfile
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+from unittest import TestCase, skipUnless
+from unittest.mock import MagicMock
+
+from tmtccmd import CcsdsTmListener, CcsdsTmtcWorker
+from tmtccmd.com.dummy import DummyInterface
+from tmtccmd.config.loader import RuntimeFileCfg, clear_tmtc_file_cfg_cache, load_tmtc_file_cfg
+from tmtccmd.config.watcher import ConfigWatcher, runtime_cfg_changes
+from tmtccmd.core import TcMode, TmMode
+from tmtccmd.util.json import JsonKeyNames
+
+TOML_CFG = """
+[tmtc]
+interface = "udp"
+delay = 0.5
+keep_listener_mode = true
+
+[log]
+level = "info"
+
+[log.levels]
+"tmtccmd.test.watcher" = "DEBUG"
+"tmtccmd.test.invalid" = "NOT_A_LEVEL"
+
+[udp]
+addr = "127.0.0.1"
+port = 7301
+"""
+
+
+class TestConfigWatcher(TestCase):
+    def setUp(self):
+        clear_tmtc_file_cfg_cache()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cfg_path = Path(self.tmp_dir.name) / "tmtc_conf.toml"
+        self.cfg_path.write_text(TOML_CFG)
+        self.root_level = logging.getLogger().level
+
+    def tearDown(self):
+        logging.getLogger().setLevel(self.root_level)
+        logging.getLogger("tmtccmd.test.watcher").setLevel(logging.NOTSET)
+        self.tmp_dir.cleanup()
+        clear_tmtc_file_cfg_cache()
+
+    def _update_cfg(self, old: str, new: str):
+        self.cfg_path.write_text(self.cfg_path.read_text().replace(old, new))
+
+    def _create_worker(self) -> CcsdsTmtcWorker:
+        return CcsdsTmtcWorker(
+            tc_mode=TcMode.IDLE,
+            tm_mode=TmMode.IDLE,
+            com_if=DummyInterface(),
+            tm_listener=MagicMock(spec=CcsdsTmListener),
+            tc_handler=MagicMock(),
+        )
+
+    def test_runtime_cfg_toml(self):
+        runtime = load_tmtc_file_cfg(str(self.cfg_path)).runtime
+        self.assertEqual(runtime.inter_cmd_delay, 0.5)
+        self.assertTrue(runtime.keep_listener_mode)
+        self.assertIsNone(runtime.keep_multi_queue_mode)
+        self.assertEqual(runtime.log_level, "INFO")
+        self.assertEqual(runtime.log_levels, (("tmtccmd.test.watcher", "DEBUG"),))
+
+    def test_runtime_cfg_json(self):
+        json_path = Path(self.tmp_dir.name) / "tmtc_conf.json"
+        json_path.write_text(
+            json.dumps(
+                {
+                    JsonKeyNames.INTER_CMD_DELAY.value: 2,
+                    JsonKeyNames.KEEP_MULTI_QUEUE_MODE.value: False,
+                    JsonKeyNames.LOG_LEVEL.value: 15,
+                    JsonKeyNames.LOG_LEVELS.value: {"tmtccmd": "error"},
+                }
+            )
+        )
+        runtime = load_tmtc_file_cfg(str(json_path)).runtime
+        self.assertEqual(
+            runtime,
+            RuntimeFileCfg(
+                inter_cmd_delay=2.0,
+                keep_multi_queue_mode=False,
+                log_level=15,
+                log_levels=(("tmtccmd", "ERROR"),),
+            ),
+        )
+
+    def test_runtime_cfg_changes(self):
+        old = RuntimeFileCfg(inter_cmd_delay=0.5, log_levels=(("a", "INFO"), ("b", "INFO")))
+        new = RuntimeFileCfg(keep_listener_mode=False, log_levels=(("a", "INFO"), ("b", "DEBUG")))
+        self.assertEqual(
+            runtime_cfg_changes(old, new),
+            RuntimeFileCfg(keep_listener_mode=False, log_levels=(("b", "DEBUG"),)),
+        )
+        self.assertEqual(runtime_cfg_changes(new, new), RuntimeFileCfg())
+
+    def test_check(self):
+        worker = MagicMock(spec=CcsdsTmtcWorker)
+        watcher = ConfigWatcher(str(self.cfg_path), worker)
+        self.assertIsNone(watcher.check())
+        self._update_cfg("delay = 0.5", "delay = 0.25")
+        result = watcher.check()
+        assert result is not None
+        self.assertEqual(result.changes, RuntimeFileCfg(inter_cmd_delay=0.25))
+        self.assertEqual(result.restart_required, [])
+        worker.submit_runtime_cfg.assert_called_once_with(RuntimeFileCfg(inter_cmd_delay=0.25))
+        self.assertIsNone(watcher.check())
+
+    def test_from_hook(self):
+        hook = MagicMock()
+        hook.cfg_path = str(self.cfg_path)
+        worker = MagicMock(spec=CcsdsTmtcWorker)
+        watcher = ConfigWatcher.from_hook(hook, worker, poll_interval=0.5)
+        self.assertEqual(watcher.cfg_path, str(self.cfg_path))
+        self.assertIs(watcher.worker, worker)
+        self.assertEqual(watcher.poll_interval, 0.5)
+
+    def test_restart_required(self):
+        worker = MagicMock(spec=CcsdsTmtcWorker)
+        watcher = ConfigWatcher(str(self.cfg_path), worker)
+        self._update_cfg("port = 7301", "port = 7302")
+        result = watcher.check()
+        assert result is not None
+        self.assertFalse(result.has_runtime_changes)
+        self.assertEqual(result.restart_required, ["udp"])
+        worker.submit_runtime_cfg.assert_not_called()
+
+    def test_invalid_file_ignored(self):
+        watcher = ConfigWatcher(str(self.cfg_path))
+        self.cfg_path.write_text("[tmtc\n")
+        self.assertIsNone(watcher.check())
+        self.assertEqual(watcher.cfg.runtime.inter_cmd_delay, 0.5)
+        self.cfg_path.write_text(TOML_CFG.replace("delay = 0.5", "delay = 1.5"))
+        result = watcher.check()
+        assert result is not None
+        self.assertEqual(result.changes, RuntimeFileCfg(inter_cmd_delay=1.5))
+
+    def test_worker_applies_submitted_cfg(self):
+        worker = self._create_worker()
+        worker.submit_runtime_cfg(load_tmtc_file_cfg(str(self.cfg_path)).runtime)
+        self.assertEqual(worker.inter_cmd_delay, timedelta())
+        self.assertTrue(worker.wait_for_wakeup(0))
+        worker.tc_operation()
+        self.assertEqual(worker.inter_cmd_delay, timedelta(seconds=0.5))
+        self.assertTrue(worker.keep_listener_mode)
+        self.assertFalse(worker.keep_multi_queue_mode)
+        self.assertEqual(logging.getLogger().level, logging.INFO)
+        self.assertEqual(logging.getLogger("tmtccmd.test.watcher").level, logging.DEBUG)
+
+    def test_invalid_submitted_cfg_is_logged(self):
+        worker = self._create_worker()
+        logger = logging.getLogger("tmtccmd.test.watcher")
+        self.addCleanup(logger.setLevel, logger.level)
+        worker.submit_runtime_cfg(RuntimeFileCfg(log_levels=(("tmtccmd.test.watcher", 15),)))
+        worker.submit_runtime_cfg(RuntimeFileCfg(log_level="Level 15"))
+        with self.assertLogs("tmtccmd.core.ccsds", level="ERROR"):
+            worker.tc_operation()
+        self.assertEqual(logger.level, 15)
+
+    def test_apply_runtime_cfg(self):
+        worker = self._create_worker()
+        applied = worker.apply_runtime_cfg(
+            RuntimeFileCfg(
+                keep_multi_queue_mode=True, log_levels=(("tmtccmd.test.watcher", "ERROR"),)
+            )
+        )
+        self.assertEqual(applied, ["keep_multi_queue_mode", "log_levels.tmtccmd.test.watcher"])
+        self.assertTrue(worker.keep_multi_queue_mode)
+        self.assertEqual(logging.getLogger("tmtccmd.test.watcher").level, logging.ERROR)
+
+    def test_watcher_thread(self):
+        reloaded = threading.Event()
+        results = []
+
+        def on_reload(result):
+            results.append(result)
+            reloaded.set()
+
+        with ConfigWatcher(str(self.cfg_path), poll_interval=0.05, on_reload=on_reload):
+            self._update_cfg("keep_listener_mode = true", "keep_listener_mode = false")
+            self.assertTrue(reloaded.wait(5.0))
+        self.assertEqual(results[0].changes, RuntimeFileCfg(keep_listener_mode=False))
+
+    @skipUnless(sys.platform.startswith("linux"), "requires inotify")
+    def test_write_burst_reloaded_once(self):
+        results = []
+        reloaded = threading.Event()
+
+        def on_reload(result):
+            results.append(result)
+            reloaded.set()
+
+        watcher = ConfigWatcher(
+            str(self.cfg_path), poll_interval=10.0, on_reload=on_reload, debounce=0.3
+        )
+        with watcher:
+            if not watcher.inotify_active:
+                self.skipTest("inotify not available")
+            for delay in (0.1, 0.2, 0.3, 0.4, 0.5):
+                self.cfg_path.write_text(TOML_CFG.replace("delay = 0.5", f"delay = {delay + 1}"))
+                time.sleep(0.02)
+            self.assertTrue(reloaded.wait(5.0))
+            time.sleep(0.4)
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].changes, RuntimeFileCfg(inter_cmd_delay=1.5))
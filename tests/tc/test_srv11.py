@@ -0,0 +1,135 @@
+import struct
+from unittest import TestCase
+
+from spacepackets.ecss import PusService, PusTc, PusVerificator, check_pus_crc
+from spacepackets.seqcount import SeqCountProvider
+
+from tmtccmd.pus.s11_tc_sched import (
+    Subservice,
+    TimeTaggedTcBatchBuilder,
+    create_time_tagged_cmd,
+    stamp_raw_pus_tc,
+)
+from tmtccmd.tmtc.queue import DefaultPusQueueHelper, QueueWrapper
+
+
+class TestSrv11Tc(TestCase):
+    def setUp(self):
+        self.release_time = struct.pack("!I", 1000)
+        self.ping = PusTc(service=17, subservice=1, apid=0x02)
+
+    def test_stamp_raw_tc(self):
+        raw_tc = self.ping.pack()
+        tc_len = stamp_raw_pus_tc(raw_tc, apid=0x33, seq_count=0x1234)
+        self.assertEqual(tc_len, len(raw_tc))
+        self.assertTrue(check_pus_crc(raw_tc))
+        unpacked = PusTc.unpack(raw_tc)
+        self.assertEqual(unpacked.apid, 0x33)
+        self.assertEqual(unpacked.seq_count, 0x1234)
+        self.assertEqual(unpacked.service, 17)
+
+    def test_stamp_raw_tc_too_short(self):
+        raw_tc = self.ping.pack()
+        with self.assertRaises(ValueError):
+            stamp_raw_pus_tc(raw_tc[:-1])
+
+    def test_batch_builder(self):
+        seq_cnt_provider = SeqCountProvider(14)
+        verificator = PusVerificator()
+        builder = TimeTaggedTcBatchBuilder(
+            apid=0x05,
+            max_packet_size=64,
+            inner_apid=0x33,
+            seq_cnt_provider=seq_cnt_provider,
+            pus_verificator=verificator,
+        )
+        for _ in range(10):
+            builder.add(self.release_time, self.ping)
+        packets = builder.build()
+        entry_len = len(self.release_time) + len(self.ping.pack())
+        # Header: 6 + 5 bytes, 1 byte count field, 2 bytes CRC
+        tcs_per_packet = (64 - 14) // entry_len
+        self.assertEqual(len(packets), -(-10 // tcs_per_packet))
+        inner_seq_counts = []
+        all_seq_counts = []
+        for packet in packets:
+            self.assertLessEqual(len(packet), 64)
+            outer = PusTc.unpack(packet)
+            all_seq_counts.append(outer.seq_count)
+            self.assertEqual(outer.apid, 0x05)
+            self.assertEqual(outer.service, PusService.S11_TC_SCHED)
+            self.assertEqual(outer.subservice, Subservice.TC_INSERT)
+            app_data = outer.app_data
+            count = app_data[0]
+            offset = 1
+            for _ in range(count):
+                self.assertEqual(app_data[offset : offset + 4], self.release_time)
+                offset += 4
+                inner = PusTc.unpack(app_data[offset:])
+                self.assertEqual(inner.apid, 0x33)
+                inner_seq_counts.append(inner.seq_count)
+                all_seq_counts.append(inner.seq_count)
+                offset += inner.packet_len
+            self.assertEqual(offset, len(app_data))
+        self.assertEqual(len(inner_seq_counts), 10)
+        self.assertEqual(len(set(inner_seq_counts)), 10)
+        # Each TC[11,4] packet gets its sequence count before the contained TCs.
+        self.assertEqual(all_seq_counts, list(range(10 + len(packets))))
+        self.assertEqual(len(verificator.verif_dict), 10 + len(packets))
+        self.assertEqual(builder.build(), [])
+
+    def test_batch_builder_single_tc(self):
+        builder = TimeTaggedTcBatchBuilder(apid=0x05, count_field_len=0)
+        builder.add(self.release_time, self.ping.pack())
+        builder.add(self.release_time, self.ping.pack())
+        packets = builder.build()
+        self.assertEqual(len(packets), 2)
+        self.assertEqual(
+            PusTc.unpack(packets[0]),
+            create_time_tagged_cmd(self.release_time, self.ping, apid=0x05),
+        )
+
+    def test_batch_builder_tc_too_large(self):
+        builder = TimeTaggedTcBatchBuilder(apid=0x05, max_packet_size=20)
+        with self.assertRaises(ValueError):
+            builder.add(self.release_time, self.ping)
+
+    def test_batch_builder_rejected_tc(self):
+        seq_cnt_provider = SeqCountProvider(14)
+        builder = TimeTaggedTcBatchBuilder(apid=0x05, seq_cnt_provider=seq_cnt_provider)
+        builder.add(self.release_time, self.ping)
+        raw_tc = self.ping.pack()
+        corrupt_crc = bytearray(raw_tc)
+        corrupt_crc[-1] ^= 0xFF
+        wrong_length = raw_tc + bytes(2)
+        for invalid_tc in (corrupt_crc, wrong_length, raw_tc[:4]):
+            with self.subTest(tc=invalid_tc.hex()), self.assertRaises(ValueError):
+                builder.add(self.release_time, invalid_tc)
+        builder.add(self.release_time, self.ping)
+        packets = builder.build()
+        self.assertEqual(len(packets), 1)
+        self.assertTrue(check_pus_crc(packets[0]))
+        tc_11_4 = PusTc.unpack(packets[0])
+        entry_len = len(self.release_time) + len(raw_tc)
+        self.assertEqual(tc_11_4.app_data[0], 2)
+        self.assertEqual(len(tc_11_4.app_data), 1 + 2 * entry_len)
+        # The sequence counts of the rejected TCs are not consumed.
+        inner = PusTc.unpack(tc_11_4.app_data[1 + entry_len + len(self.release_time) :])
+        self.assertEqual(inner.seq_count, 2)
+
+    def test_queue_helper_stamps_time_tagged_tc(self):
+        queue_wrapper = QueueWrapper.empty()
+        helper = DefaultPusQueueHelper(
+            queue_wrapper,
+            tc_sched_timestamp_len=4,
+            seq_cnt_provider=None,
+            pus_verificator=None,
+            default_pus_apid=0x44,
+        )
+        helper.add_pus_tc(create_time_tagged_cmd(self.release_time, self.ping))
+        outer = queue_wrapper.queue[0].pus_tc
+        self.assertEqual(outer.apid, 0x44)
+        self.assertEqual(outer.app_data[:4], self.release_time)
+        inner = PusTc.unpack(outer.app_data[4:])
+        self.assertEqual(inner.apid, 0x44)
+        self.assertEqual(inner.service, 17)
@@ -1,3 +1,6 @@
+import os
+import tempfile
+import threading
 from datetime import timedelta
 from unittest import TestCase
 from unittest.mock import MagicMock
@@ -14,8 +17,9 @@ from tmtccmd.tmtc import (
     TcProcedureType,
 )
 from tmtccmd.tmtc.handler import FeedWrapper, SendCbParams
-from tmtccmd.tmtc.procedure import TreeCommandingProcedure
-from tmtccmd.tmtc.queue import DefaultPusQueueHelper, QueueWrapper
+from tmtccmd.tmtc.procedure import CustomProcedureInfo, TreeCommandingProcedure
+from tmtccmd.tmtc.queue import DefaultPusQueueHelper, QueueWrapper, RawTcEntry, TcPriority
+from tmtccmd.tmtc.queue_file import TcQueueFileReader, TcQueueFileWriter
 
 
 class TcHandlerMock(TcHandlerBase):
@@ -35,13 +39,14 @@ class TcHandlerMock(TcHandlerBase):
         )
         self.send_cb_call_args: SendCbParams | None = None
         self.send_cb_cmd_path_arg: str | None = None
+        self.finished_procedures: list[TcProcedureBase] = []
 
     def send_cb(self, send_params: SendCbParams):
         self.send_cb_call_count += 1
         self.send_cb_call_args = send_params
 
-    def queue_finished_cb(self, info: TcProcedureBase):
-        pass
+    def queue_finished_cb(self, info: ProcedureWrapper):
+        self.finished_procedures.append(info.procedure)
 
     def feed_cb(self, info: ProcedureWrapper, wrapper: FeedWrapper):
         self.queue_helper.queue_wrapper = wrapper.queue_wrapper
@@ -184,6 +189,98 @@ class TestBackend(TestCase):
         self.assertIsNotNone(def_proc)
         self.assertEqual(def_proc.cmd_path, "/ping")
 
+    def test_submit_entries_in_idle_mode(self):
+        self.assertFalse(self.backend.wait_for_wakeup(0.0))
+        self.backend.submit_entries([RawTcEntry(bytes([0, 1, 2])), RawTcEntry(bytes([3, 4]))])
+        self.assertTrue(self.backend.wait_for_wakeup(1.0))
+        # The wake-up flag is only reset when the submitted entries are handled.
+        self.assertTrue(self.backend.wait_for_wakeup(0.0))
+        res = self.backend.periodic_op()
+        self.assertFalse(self.backend.wait_for_wakeup(0.0))
+        self.assertEqual(res.request, BackendRequest.CALL_NEXT)
+        self.assertEqual(self.tc_handler.feed_cb_call_count, 0)
+        self.assertEqual(self.tc_handler.send_cb_call_count, 1)
+        self.assertEqual(
+            self.tc_handler.send_cb_call_args.entry.to_raw_tc_entry().tc, bytes([0, 1, 2])
+        )
+        self.backend.periodic_op()
+        self.assertEqual(self.tc_handler.send_cb_call_count, 2)
+        res = self.backend.periodic_op()
+        self.assertEqual(res.request, BackendRequest.DELAY_IDLE)
+
+    def test_submitted_entries_use_own_queue(self):
+        self.backend.tc_mode = TcMode.ONE_QUEUE
+        self.backend.current_procedure = TreeCommandingProcedure(cmd_path="/ping")
+        self.assertEqual(self.backend.periodic_op().request, BackendRequest.TERMINATION_NO_ERROR)
+        self.backend.inter_cmd_delay = timedelta(milliseconds=20)
+        self.backend.submit_entries([RawTcEntry(bytes([0])), RawTcEntry(bytes([1]))])
+        res = self.backend.periodic_op()
+        self.assertEqual(res.request, BackendRequest.DELAY_CUSTOM)
+        while self.backend.periodic_op().request != BackendRequest.DELAY_IDLE:
+            pass
+        self.assertEqual(self.tc_handler.send_cb_call_count, 3)
+        self.assertEqual(self.tc_handler.feed_cb_call_count, 1)
+        finished = self.tc_handler.finished_procedures
+        self.assertEqual(finished[0], TreeCommandingProcedure(cmd_path="/ping"))
+        self.assertIsInstance(finished[-1], CustomProcedureInfo)
+        self.assertIsNone(finished[-1].procedure)
+
+    def test_submit_prepend_to_mapped_queue(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "queue.bin")
+            with TcQueueFileWriter(path) as writer:
+                writer.write_entries(RawTcEntry(bytes([i])) for i in range(2, 4))
+            with TcQueueFileReader(path) as reader:
+                self.backend.tc_mode = TcMode.ONE_QUEUE
+                self.backend.current_procedure = TreeCommandingProcedure(cmd_path="/ping")
+                self.tc_handler.feed_cb = lambda info, wrapper: setattr(
+                    wrapper, "queue_wrapper", reader.to_queue_wrapper(info.procedure)
+                )
+                self.backend.submit_entries(
+                    [RawTcEntry(bytes([0])), RawTcEntry(bytes([1]))], prepend=True
+                )
+                sent = []
+                request = BackendRequest.CALL_NEXT
+                while request == BackendRequest.CALL_NEXT:
+                    request = self.backend.periodic_op().request
+                    assert self.tc_handler.send_cb_call_args is not None
+                    sent.append(self.tc_handler.send_cb_call_args.entry.to_raw_tc_entry().tc)
+                self.assertEqual(request, BackendRequest.TERMINATION_NO_ERROR)
+        self.assertEqual(sent, [bytes([i]) for i in range(4)])
+
+    def test_submit_urgent_entry(self):
+        self.backend.tm_mode = TmMode.IDLE
+        self.backend.tc_mode = TcMode.ONE_QUEUE
+        self.backend.current_procedure = TreeCommandingProcedure(cmd_path="/event")
+        self.backend.periodic_op()
+        self._check_tc_req_recvd(17, 1)
+        self.backend.submit_entries([RawTcEntry(bytes([1]))])
+        urgent_entry = RawTcEntry(bytes([0]))
+        self.backend.submit_urgent(urgent_entry)
+        self.assertEqual(urgent_entry.priority, TcPriority.NORMAL)
+        self.backend.periodic_op()
+        self.assertEqual(self.tc_handler.send_cb_call_args.entry.to_raw_tc_entry().tc, bytes([0]))
+        self.backend.periodic_op()
+        self._check_tc_req_recvd(5, 1)
+        res = self.backend.periodic_op()
+        self.assertEqual(self.tc_handler.send_cb_call_args.entry.to_raw_tc_entry().tc, bytes([1]))
+        self.assertEqual(res.request, BackendRequest.TERMINATION_NO_ERROR)
+        self.assertEqual(self.tc_handler.feed_cb_call_count, 1)
+
+    def test_submit_entries_from_other_thread(self):
+        def producer(start: int):
+            for i in range(start, start + 50):
+                self.backend.submit_entries([RawTcEntry(bytes([i]))])
+
+        threads = [threading.Thread(target=producer, args=(i * 50,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        while self.backend.periodic_op().request == BackendRequest.CALL_NEXT:
+            pass
+        self.assertEqual(self.tc_handler.send_cb_call_count, 200)
+
     def _check_tc_req_recvd(self, service: int, subservice: int):
         assert self.tc_handler.send_cb_call_args is not None
         self.assertEqual(self.tc_handler.send_cb_call_args.com_if, self.com_if)
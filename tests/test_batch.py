@@ -0,0 +1,175 @@
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from tests.test_backend import TcHandlerMock
+from tmtccmd import CcsdsTmListener, CcsdsTmtcWorker
+from tmtccmd.com.dummy import DummyInterface
+from tmtccmd.config.tmtc import CmdTreeNode
+from tmtccmd.core import BackendRequest, TcMode, TmMode
+from tmtccmd.tmtc.batch import (
+    BatchCommand,
+    InvalidBatchScriptError,
+    load_batch_script,
+    parse_batch_script,
+    submit_batch,
+    validate_batch_commands,
+)
+from tmtccmd.tmtc.procedure import TreeCommandingProcedure
+
+SCRIPT = """# Check the ACS
+ping
+acs/mgm0/reset  # Reset first
+
+acs/mgt/set_dipoles x=0.1 y=-0.2 "label=first test"
+wait 2.5
+wait 500ms
+/wait
+"""
+
+
+def cmd_tree() -> CmdTreeNode:
+    root = CmdTreeNode.root_node()
+    root.add_child(CmdTreeNode("ping", "Ping"))
+    root.add_child(CmdTreeNode("wait", "Wait command"))
+    root.add_child(CmdTreeNode("acs", "ACS Subsystem"))
+    root["acs"].add_child(CmdTreeNode("mgm0", "Magnetometer 0"))
+    root["acs"]["mgm0"].add_child(CmdTreeNode("reset", "Reset"))
+    root["acs"].add_child(CmdTreeNode("mgt", "Magnetorquer"))
+    root["acs"]["mgt"].add_child(CmdTreeNode("set_dipoles", "Set Dipoles"))
+    return root
+
+
+class TestBatchScript(TestCase):
+    def test_parse(self):
+        commands = parse_batch_script(SCRIPT.splitlines())
+        self.assertEqual(
+            commands,
+            [
+                BatchCommand("ping", line=2),
+                BatchCommand("acs/mgm0/reset", line=3),
+                BatchCommand(
+                    "acs/mgt/set_dipoles",
+                    {"x": "0.1", "y": "-0.2", "label": "first test"},
+                    wait_after=timedelta(seconds=3),
+                    line=5,
+                ),
+                BatchCommand("/wait", line=8),
+            ],
+        )
+        self.assertEqual(
+            commands[2].to_procedure(),
+            TreeCommandingProcedure(
+                "acs/mgt/set_dipoles", {"x": "0.1", "y": "-0.2", "label": "first test"}
+            ),
+        )
+
+    def test_parse_errors_are_collected(self):
+        script = ["wait 1", "ping x", "ping 'x=1", "ping", "wait", "wait -1", "wait 1h", "wait nan"]
+        with self.assertRaises(InvalidBatchScriptError) as cm:
+            parse_batch_script(script)
+        self.assertEqual(
+            [error.split(":")[0] for error in cm.exception.errors],
+            [f"line {line_num}" for line_num in (1, 2, 3, 5, 6, 7, 8)],
+        )
+
+    def test_validation(self):
+        tree = cmd_tree()
+        validate_batch_commands(parse_batch_script(SCRIPT.splitlines()), tree)
+        commands = parse_batch_script(["ping", "acs/mgm1/reset", "tcs", "/"])
+        with self.assertRaises(InvalidBatchScriptError) as cm:
+            validate_batch_commands(commands, tree)
+        self.assertEqual(len(cm.exception.errors), 3)
+        self.assertIn("line 2", cm.exception.errors[0])
+
+    def test_load(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "script.txt"
+            path.write_text(SCRIPT)
+            self.assertEqual(len(load_batch_script(str(path), cmd_tree())), 4)
+            path.write_text("ping\ntcs\n")
+            self.assertEqual(len(load_batch_script(str(path))), 2)
+            with self.assertRaises(InvalidBatchScriptError):
+                load_batch_script(str(path), cmd_tree())
+
+
+class TestBatchExecution(TestCase):
+    def setUp(self):
+        self.tc_handler = TcHandlerMock(0x06)
+        self.worker = CcsdsTmtcWorker(
+            tc_mode=TcMode.ONE_QUEUE,
+            tm_mode=TmMode.IDLE,
+            com_if=DummyInterface(),
+            tm_listener=MagicMock(specs=CcsdsTmListener),
+            tc_handler=self.tc_handler,
+        )
+
+    def test_commands_are_pipelined(self):
+        submit_batch(self.worker, parse_batch_script(["/ping", "/event", "/ping"]))
+        self.assertEqual(self.worker.pending_procedures, 3)
+        requests = []
+        for _ in range(10):
+            requests.append(self.worker.periodic_op().request)
+            if requests[-1] == BackendRequest.TERMINATION_NO_ERROR:
+                break
+        # One TC per call, the next procedure is fed as soon as the previous queue is done.
+        self.assertEqual(requests[-1], BackendRequest.TERMINATION_NO_ERROR)
+        self.assertEqual(len(requests), 4)
+        self.assertEqual(self.tc_handler.feed_cb_call_count, 3)
+        self.assertEqual(self.tc_handler.send_cb_call_count, 4)
+        self.assertEqual(self.worker.pending_procedures, 0)
+        self.assertEqual(self.worker.tc_mode, TcMode.IDLE)
+
+    def test_wait_after_command(self):
+        self.worker.submit_procedure(TreeCommandingProcedure("/ping"), timedelta(seconds=60))
+        self.worker.submit_procedure(TreeCommandingProcedure("/ping"))
+        # The TC is sent in the first call and the wait entry is handled in the second call.
+        for _ in range(2):
+            self.assertEqual(self.worker.periodic_op().request, BackendRequest.CALL_NEXT)
+        self.assertEqual(self.tc_handler.feed_cb_call_count, 1)
+        for _ in range(3):
+            state = self.worker.periodic_op()
+            self.assertEqual(state.request, BackendRequest.DELAY_CUSTOM)
+            self.assertGreater(state.next_delay, timedelta(seconds=50))
+        self.assertEqual(self.tc_handler.feed_cb_call_count, 1)
+        self.assertEqual(self.worker.pending_procedures, 1)
+
+    def test_idle_worker_switches_to_multi_queue(self):
+        self.worker.tc_mode = TcMode.IDLE
+        self.worker.submit_procedures(
+            [TreeCommandingProcedure("/ping"), TreeCommandingProcedure("/ping")]
+        )
+        # The second procedure is fed in the same call in which the first queue is finished.
+        self.assertEqual(self.worker.periodic_op().request, BackendRequest.CALL_NEXT)
+        self.assertEqual(self.worker.tc_mode, TcMode.MULTI_QUEUE)
+        self.assertEqual(self.tc_handler.feed_cb_call_count, 2)
+        self.assertEqual(self.worker.periodic_op().request, BackendRequest.DELAY_IDLE)
+        self.assertEqual(self.worker.tc_mode, TcMode.IDLE)
+        self.assertEqual(self.tc_handler.send_cb_call_count, 2)
+        self.assertEqual(self.worker.periodic_op().request, BackendRequest.DELAY_IDLE)
+
+    def test_idle_worker_returns_to_idle_with_kept_multi_queue_mode(self):
+        self.worker.tc_mode = TcMode.IDLE
+        self.worker.keep_multi_queue_mode = True
+        self.worker.submit_procedure(TreeCommandingProcedure("/ping"))
+        self.assertEqual(self.worker.periodic_op().request, BackendRequest.DELAY_IDLE)
+        self.assertEqual(self.worker.tc_mode, TcMode.IDLE)
+        for _ in range(3):
+            self.worker.periodic_op()
+        # The last command of the batch is not sent again.
+        self.assertEqual(self.tc_handler.feed_cb_call_count, 1)
+        self.assertEqual(self.tc_handler.send_cb_call_count, 1)
+
+    def test_previous_procedure_is_restored(self):
+        self.worker.tc_mode = TcMode.MULTI_QUEUE
+        self.worker.keep_multi_queue_mode = True
+        previous = TreeCommandingProcedure("/event")
+        self.worker.current_procedure = previous
+        self.worker.submit_procedure(TreeCommandingProcedure("/ping"))
+        self.worker.periodic_op()
+        self.assertIs(self.worker.current_procedure.procedure, previous)
+        self.assertEqual(self.worker.tc_mode, TcMode.MULTI_QUEUE)
+        self.worker.periodic_op()
+        self.assertEqual(self.tc_handler.send_cb_cmd_path_arg, "/event")
@@ -0,0 +1,128 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from tmtccmd.config.tmtc import CmdTreeNode
+from tmtccmd.tmtc.dispatch import CmdPathDispatcher
+
+
+def cmd_tree() -> CmdTreeNode:
+    root = CmdTreeNode.root_node()
+    root.add_child(CmdTreeNode("ping", "Ping"))
+    root.add_child(CmdTreeNode("acs", "ACS Subsystem"))
+    root["acs"].add_child(CmdTreeNode("mgm0", "Magnetometer 0"))
+    root["acs"]["mgm0"].add_child(CmdTreeNode("reset", "Reset"))
+    return root
+
+
+class TestCmdPathDispatcher(TestCase):
+    def setUp(self):
+        self.dispatcher = CmdPathDispatcher()
+
+    def test_literal_paths(self):
+        ping = MagicMock()
+        reset = MagicMock()
+        self.dispatcher.register("ping", ping)
+        self.dispatcher.register("/acs/mgm0/reset", reset)
+        self.assertTrue(self.dispatcher.dispatch("/ping", "queue"))
+        ping.assert_called_once_with("queue")
+        self.assertTrue(self.dispatcher.dispatch("acs/mgm0/reset", "queue", delay=2))
+        reset.assert_called_once_with("queue", delay=2)
+        self.assertFalse(self.dispatcher.dispatch("acs/mgm0", "queue"))
+        self.assertFalse(self.dispatcher.dispatch("acs/mgm0/reset/now", "queue"))
+        self.assertIsNone(self.dispatcher.resolve("tcs"))
+        self.assertEqual(self.dispatcher.patterns, ["ping", "/acs/mgm0/reset"])
+
+    def test_parameters(self):
+        calls = []
+
+        @self.dispatcher.route("acs/{device}/{cmd}")
+        def acs_cmd(queue, device: str, cmd: str):
+            calls.append((queue, device, cmd))
+
+        self.assertTrue(self.dispatcher.dispatch("acs/mgm1/reset", "queue"))
+        self.assertEqual(calls, [("queue", "mgm1", "reset")])
+        match = self.dispatcher.resolve("/acs/mgt/set_dipoles")
+        assert match is not None
+        self.assertEqual(match.pattern, "acs/{device}/{cmd}")
+        self.assertEqual(match.params, {"device": "mgt", "cmd": "set_dipoles"})
+
+    def test_literals_take_precedence(self):
+        literal = MagicMock()
+        param = MagicMock()
+        self.dispatcher.register("acs/mgm0/reset", literal)
+        self.dispatcher.register("acs/{device}/reset", param)
+        self.dispatcher.dispatch("acs/mgm0/reset")
+        literal.assert_called_once_with()
+        self.dispatcher.dispatch("acs/mgm1/reset")
+        param.assert_called_once_with(device="mgm1")
+        self.assertIsNone(self.dispatcher.resolve("acs/mgm0/update"))
+
+    def test_backtracking_to_parameter(self):
+        reset = MagicMock()
+        calibrate = MagicMock()
+        self.dispatcher.register("acs/mgm0/reset", reset)
+        self.dispatcher.register("acs/{device}/calibrate", calibrate)
+        match = self.dispatcher.resolve("acs/mgm0/calibrate")
+        assert match is not None
+        self.assertIs(match.handler, calibrate)
+        self.assertEqual(match.params, {"device": "mgm0"})
+        match = self.dispatcher.resolve("acs/mgm0/reset")
+        assert match is not None
+        self.assertIs(match.handler, reset)
+        self.assertEqual(match.params, {})
+
+    def test_subtree(self):
+        acs = MagicMock()
+        mgm = MagicMock()
+        root = MagicMock()
+        self.dispatcher.register("acs/{cmd*}", acs)
+        self.dispatcher.register("acs/{device}/{cmd*}", mgm)
+        self.dispatcher.register("/", root)
+        self.dispatcher.register("acs/mgt", MagicMock())
+        match = self.dispatcher.resolve("acs/mgm0/reset/now")
+        assert match is not None
+        self.assertIs(match.handler, mgm)
+        self.assertEqual(match.params, {"device": "mgm0", "cmd": "reset/now"})
+        # The deepest subtree pattern is used, also if it is on the parameter branch.
+        match = self.dispatcher.resolve("acs/mgt/set_dipoles")
+        assert match is not None
+        self.assertIs(match.handler, mgm)
+        self.assertEqual(match.params, {"device": "mgt", "cmd": "set_dipoles"})
+        # Subtree parameters also match an empty remaining path.
+        match = self.dispatcher.resolve("acs")
+        assert match is not None
+        self.assertIs(match.handler, acs)
+        self.assertEqual(match.params, {"cmd": ""})
+        match = self.dispatcher.resolve("acs/mgm0")
+        assert match is not None
+        self.assertIs(match.handler, mgm)
+        self.assertEqual(match.params, {"device": "mgm0", "cmd": ""})
+        match = self.dispatcher.resolve("/")
+        assert match is not None
+        self.assertIs(match.handler, root)
+
+    def test_invalid_patterns(self):
+        self.dispatcher.register("acs/{device}/reset", MagicMock())
+        for pattern in [
+            "acs/{device}/reset",
+            "acs/{dev}/update",
+            "acs/{cmd*}/reset",
+            "acs/{}",
+            "acs/{1device}",
+            "acs/mgm{0}",
+            "acs//mgm0",
+            "acs/{device}/{device}",
+        ]:
+            with self.subTest(pattern=pattern), self.assertRaises(ValueError):
+                self.dispatcher.register(pattern, MagicMock())
+
+    def test_tree_validation(self):
+        dispatcher = CmdPathDispatcher(cmd_tree())
+        dispatcher.register("ping", MagicMock())
+        dispatcher.register("acs/{device}/reset", MagicMock())
+        dispatcher.register("acs/mgm0/{cmd*}", MagicMock())
+        with self.assertRaises(ValueError):
+            dispatcher.register("tcs/{device}", MagicMock())
+        with self.assertRaises(ValueError):
+            dispatcher.register("acs/mgm1/reset", MagicMock())
+        self.assertEqual(len(dispatcher.patterns), 3)
@@ -0,0 +1,96 @@
+from collections import deque
+from datetime import timedelta
+from unittest import TestCase
+
+from spacepackets.ecss import PusTelecommand
+
+from tmtccmd.tmtc.dry_run import LinkModel, dry_run_queue
+from tmtccmd.tmtc.procedure import TreeCommandingProcedure
+from tmtccmd.tmtc.queue import (
+    LogQueueEntry,
+    PacketDelayEntry,
+    PusTcEntry,
+    QueueWrapper,
+    RawTcEntry,
+    WaitEntry,
+)
+
+
+class TestDryRun(TestCase):
+    def setUp(self) -> None:
+        self.ping = PusTelecommand(apid=0x22, service=17, subservice=1)
+        self.queue_wrapper = QueueWrapper(
+            info=TreeCommandingProcedure.empty(),
+            queue=deque(),
+            inter_cmd_delay=timedelta(milliseconds=100),
+        )
+
+    def test_empty(self):
+        report = dry_run_queue(self.queue_wrapper)
+        self.assertEqual(report.total_duration, timedelta())
+        self.assertEqual(report.num_tcs, 0)
+        self.assertEqual(report.peak_rate, 0)
+
+    def test_inter_cmd_delay(self):
+        self.queue_wrapper.queue.extend(
+            [PusTcEntry(self.ping), LogQueueEntry("Test"), RawTcEntry(bytes(10))]
+        )
+        report = dry_run_queue(self.queue_wrapper)
+        self.assertEqual(report.send_times, [0.0, 0.1])
+        self.assertEqual(report.tc_sizes, [len(self.ping.pack()), 10])
+        # The sender only finishes after the last inter-command delay has expired.
+        self.assertEqual(report.total_duration, timedelta(milliseconds=200))
+        self.assertTrue(report.fits_in(timedelta(seconds=1)))
+        self.assertEqual(len(self.queue_wrapper.queue), 3)
+
+    def test_wait_and_packet_delay(self):
+        self.queue_wrapper.queue.extend(
+            [
+                RawTcEntry(bytes(10)),
+                WaitEntry.from_millis(1000),
+                RawTcEntry(bytes(10)),
+                PacketDelayEntry.from_millis(500),
+                RawTcEntry(bytes(10)),
+                RawTcEntry(bytes(10)),
+            ]
+        )
+        report = dry_run_queue(self.queue_wrapper)
+        self.assertEqual(report.send_times, [0.0, 1.0, 1.5, 2.0])
+        self.assertEqual(report.total_duration, timedelta(seconds=2.5))
+        self.assertEqual(self.queue_wrapper.inter_cmd_delay, timedelta(milliseconds=100))
+
+    def test_link_model(self):
+        self.queue_wrapper.inter_cmd_delay = timedelta()
+        self.queue_wrapper.queue.extend([RawTcEntry(bytes(100)) for _ in range(10)])
+        # 100 bytes per second
+        report = dry_run_queue(
+            self.queue_wrapper,
+            LinkModel(bitrate=800, latency=timedelta(milliseconds=250)),
+        )
+        self.assertEqual(report.send_times, [0.0] * 10)
+        self.assertAlmostEqual(report.arrival_times[0], 1.25)
+        self.assertAlmostEqual(report.arrival_times[-1], 10.25)
+        self.assertAlmostEqual(report.total_duration.total_seconds(), 10.25)
+        self.assertAlmostEqual(report.peak_rate, 100)
+        self.assertEqual(report.total_bytes, 1000)
+
+    def test_link_peak_rate_limited_by_bandwidth(self):
+        # 1200 bytes per second, the transmissions straddle the edges of the peak window.
+        link = LinkModel(bitrate=9600, per_packet_overhead=10)
+        self.queue_wrapper.inter_cmd_delay = timedelta(milliseconds=95)
+        self.queue_wrapper.queue.extend([RawTcEntry(bytes(100)) for _ in range(40)])
+        for window in (
+            timedelta(milliseconds=10),
+            timedelta(milliseconds=250),
+            timedelta(seconds=1),
+        ):
+            with self.subTest(window=window):
+                report = dry_run_queue(self.queue_wrapper, link, peak_window=window)
+                self.assertLessEqual(report.peak_rate, 1200)
+                self.assertGreater(report.peak_rate, 1000)
+
+    def test_invalid_params(self):
+        with self.assertRaises(ValueError):
+            dry_run_queue(self.queue_wrapper, LinkModel(bitrate=0))
+        with self.assertRaises(ValueError):
+            dry_run_queue(self.queue_wrapper, peak_window=timedelta())
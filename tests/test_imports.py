@@ -0,0 +1,24 @@
+from unittest import TestCase
+
+import tmtccmd
+import tmtccmd.config
+from benchmarks.import_bench import imported_lazy_modules
+
+
+class TestImports(TestCase):
+    def test_heavy_modules_not_imported_eagerly(self):
+        self.assertEqual(imported_lazy_modules(), [])
+
+    def test_lazy_attributes(self):
+        from tmtccmd.config.args import SetupParams
+        from tmtccmd.config.hook import HookBase
+
+        self.assertIs(tmtccmd.HookBase, HookBase)
+        self.assertIs(tmtccmd.config.SetupParams, SetupParams)
+        self.assertIn("CcsdsTmtcWorker", dir(tmtccmd))
+        for name in tmtccmd.__all__:
+            self.assertTrue(hasattr(tmtccmd, name), name)
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            tmtccmd.config.DoesNotExist  # noqa: B018
@@ -0,0 +1,170 @@
+import os
+import tempfile
+from collections import deque
+from datetime import timedelta
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from com_interface import ComInterface
+from spacepackets.ccsds import SpacePacket, SpacePacketHeader
+from spacepackets.ccsds.spacepacket import PacketType
+from spacepackets.ecss import PusTelecommand
+
+from tmtccmd.tmtc.ccsds_seq_sender import SequentialCcsdsSender
+from tmtccmd.tmtc.handler import TcHandlerBase
+from tmtccmd.tmtc.procedure import TreeCommandingProcedure
+from tmtccmd.tmtc.queue import (
+    LogQueueEntry,
+    PacketDelayEntry,
+    PusTcEntry,
+    QueueEntryHelper,
+    QueueWrapper,
+    RawTcEntry,
+    SpacePacketEntry,
+    TcPriority,
+    TcQueueEntryBase,
+    TcQueueEntryType,
+    WaitEntry,
+)
+from tmtccmd.tmtc.queue_file import (
+    InvalidQueueFileError,
+    TcQueueFileReader,
+    TcQueueFileWriter,
+    write_queue_file,
+)
+
+
+class TestQueueFile(TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "queue.bin")
+        self.pus_tc = PusTelecommand(apid=0x22, service=17, subservice=1, seq_count=5)
+        self.space_packet = SpacePacket(
+            SpacePacketHeader(packet_type=PacketType.TC, apid=0x33, seq_count=2, data_len=3),
+            None,
+            bytes([1, 2, 3, 4]),
+        )
+        self.queue_wrapper = QueueWrapper(
+            info=TreeCommandingProcedure("/acs/mgm0/ping"),
+            queue=deque(
+                [
+                    PusTcEntry(self.pus_tc),
+                    SpacePacketEntry(self.space_packet),
+                    LogQueueEntry("Test Log"),
+                    RawTcEntry(bytes([0, 1, 2])),
+                    WaitEntry.from_millis(200),
+                    PacketDelayEntry(timedelta(seconds=1.5)),
+                ]
+            ),
+            inter_cmd_delay=timedelta(milliseconds=50),
+        )
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_round_trip(self):
+        write_queue_file(self.path, self.queue_wrapper)
+        with TcQueueFileReader(self.path) as reader:
+            self.assertEqual(reader.entry_count, 6)
+            self.assertEqual(reader.inter_cmd_delay, timedelta(milliseconds=50))
+            self.assertEqual(reader.info, TreeCommandingProcedure("/acs/mgm0/ping"))
+            entries = [QueueEntryHelper(entry) for entry in reader]
+        self.assertEqual(entries[0].to_pus_tc_entry().pus_tc, self.pus_tc)
+        self.assertEqual(entries[1].to_space_packet_entry().space_packet, self.space_packet)
+        self.assertEqual(entries[2].to_log_entry().log_str, "Test Log")
+        self.assertEqual(entries[3].to_raw_tc_entry().tc, bytes([0, 1, 2]))
+        self.assertEqual(entries[4].to_wait_entry().wait_time, timedelta(milliseconds=200))
+        self.assertEqual(entries[5].to_packet_delay_entry().delay_time, timedelta(seconds=1.5))
+
+    def test_streaming_writer(self):
+        with TcQueueFileWriter(self.path) as writer:
+            for i in range(100):
+                writer.write_entry(RawTcEntry(bytes([i])))
+            self.assertEqual(writer.entry_count, 100)
+        with TcQueueFileReader(self.path) as reader:
+            self.assertEqual(reader.entry_count, 100)
+            self.assertEqual(reader.info, TreeCommandingProcedure.empty())
+            self.assertEqual([entry.tc for entry in reader], [bytes([i]) for i in range(100)])
+
+    def test_priority_round_trip(self):
+        with TcQueueFileWriter(self.path) as writer:
+            writer.write_entry(RawTcEntry(bytes([0])))
+            writer.write_entry(RawTcEntry(bytes([1]), TcPriority.URGENT))
+            writer.write_entry(WaitEntry(timedelta(milliseconds=10), TcPriority.HIGH))
+        with TcQueueFileReader(self.path) as reader:
+            self.assertEqual(
+                [entry.priority for entry in reader],
+                [TcPriority.NORMAL, TcPriority.URGENT, TcPriority.HIGH],
+            )
+
+    def test_aborted_write_rejected(self):
+        with self.assertRaises(RuntimeError), TcQueueFileWriter(self.path) as writer:
+            writer.write_entry(RawTcEntry(bytes([0])))
+            raise RuntimeError("aborted")
+        with self.assertRaises(InvalidQueueFileError):
+            TcQueueFileReader(self.path)
+
+    def test_custom_entry_rejected(self):
+        with TcQueueFileWriter(self.path) as writer, self.assertRaises(ValueError):
+            writer.write_entry(TcQueueEntryBase(TcQueueEntryType.CUSTOM))
+
+    def test_negative_times_rejected(self):
+        with TcQueueFileWriter(self.path) as writer:
+            for entry in (
+                WaitEntry(timedelta(milliseconds=-1)),
+                PacketDelayEntry(timedelta(seconds=-2)),
+            ):
+                with self.subTest(entry=entry), self.assertRaises(ValueError):
+                    writer.write_entry(entry)
+            self.assertEqual(writer.entry_count, 0)
+        with TcQueueFileReader(self.path) as reader:
+            self.assertEqual(list(reader), [])
+        with self.assertRaises(ValueError):
+            TcQueueFileWriter(self.path, inter_cmd_delay=timedelta(seconds=-1))
+
+    def test_invalid_file(self):
+        with open(self.path, "wb") as file:
+            file.write(b"invalid file contents")
+        with self.assertRaises(InvalidQueueFileError):
+            TcQueueFileReader(self.path)
+
+    def test_mapped_queue(self):
+        write_queue_file(self.path, self.queue_wrapper)
+        with TcQueueFileReader(self.path) as reader:
+            wrapper = reader.to_queue_wrapper()
+            queue = wrapper.queue
+            self.assertEqual(len(queue), 6)
+            queue.appendleft(LogQueueEntry("First"))
+            queue.append(LogQueueEntry("Last"))
+            self.assertEqual(len(queue), 8)
+            self.assertEqual(queue[0].etype, TcQueueEntryType.LOG)
+            self.assertEqual(queue[1].etype, TcQueueEntryType.PUS_TC)
+            self.assertEqual(queue[-1].etype, TcQueueEntryType.LOG)
+            self.assertEqual(queue.popleft().log_str, "First")
+            peeked = queue[0]
+            self.assertIs(queue.popleft(), peeked)
+            self.assertEqual(queue[0].etype, TcQueueEntryType.CCSDS_TC)
+            etypes = []
+            while queue:
+                etypes.append(queue.popleft().etype)
+            self.assertEqual(etypes[-1], TcQueueEntryType.LOG)
+            self.assertEqual(len(etypes), 6)
+            with self.assertRaises(IndexError):
+                queue.popleft()
+
+    def test_sender_with_mapped_queue(self):
+        with TcQueueFileWriter(self.path, inter_cmd_delay=timedelta()) as writer:
+            for i in range(10):
+                writer.write_entry(RawTcEntry(bytes([i])))
+        tc_handler = MagicMock(spec=TcHandlerBase)
+        com_if = MagicMock(spec=ComInterface)
+        with TcQueueFileReader(self.path) as reader:
+            sender = SequentialCcsdsSender(QueueWrapper.empty(), tc_handler)
+            sender.queue_wrapper = reader.to_queue_wrapper()
+            for _ in range(10):
+                sender.operation(com_if)
+            self.assertFalse(sender.queue_wrapper.queue)
+        sent = [
+            call.args[0].entry.to_raw_tc_entry().tc for call in tc_handler.send_cb.call_args_list
+        ]
+        self.assertEqual(sent, [bytes([i]) for i in range(10)])
@@ -10,7 +10,13 @@ from spacepackets.ecss import PusTelecommand
 from tmtccmd.tmtc.ccsds_seq_sender import SenderMode, SequentialCcsdsSender
 from tmtccmd.tmtc.handler import SendCbParams, TcHandlerBase
 from tmtccmd.tmtc.procedure import TreeCommandingProcedure
-from tmtccmd.tmtc.queue import DefaultPusQueueHelper, QueueWrapper
+from tmtccmd.tmtc.queue import (
+    DefaultPusQueueHelper,
+    QueueWrapper,
+    RawTcEntry,
+    TcPriority,
+    WaitEntry,
+)
 
 
 class TestSendReceive(TestCase):
@@ -181,3 +187,86 @@ class TestSendReceive(TestCase):
         self.assertTrue(self.seq_sender.no_delay_remaining())
         self.seq_sender.operation(self.com_if)
         self.assertEqual(self.seq_sender.mode, SenderMode.DONE)
+
+    def test_priority_entry_preempts_wait(self):
+        self.queue_helper.add_raw_tc(bytes([0]))
+        self.queue_helper.add_wait(timedelta(seconds=10))
+        self.queue_helper.add_raw_tc(bytes([1]))
+        self.seq_sender.resume()
+        res = self.seq_sender.operation(self.com_if)
+        self.assertTrue(res.tc_sent)
+        # Wait entry is handled, the next normal TC is blocked now.
+        self.seq_sender.operation(self.com_if)
+        res = self.seq_sender.operation(self.com_if)
+        self.assertFalse(res.tc_sent)
+        for i in range(2):
+            self.seq_sender.add_prioritized_entry(
+                RawTcEntry(bytes([0xA0 + i]), priority=TcPriority.HIGH)
+            )
+        self.seq_sender.add_prioritized_entry(RawTcEntry(bytes([0xF0]), priority=TcPriority.URGENT))
+        self.assertTrue(res.next_entry_is_tc)
+        sent = []
+        for _ in range(3):
+            res = self.seq_sender.operation(self.com_if)
+            self.assertTrue(res.tc_sent)
+            call_args = self.tc_handler_mock.send_cb.call_args
+            send_cb_params = cast(SendCbParams, call_args.args[0])
+            sent.append(send_cb_params.entry.to_raw_tc_entry().tc)
+        self.assertEqual(sent, [bytes([0xF0]), bytes([0xA0]), bytes([0xA1])])
+        # The wait of the normal priority class is still pending.
+        res = self.seq_sender.operation(self.com_if)
+        self.assertFalse(res.tc_sent)
+        self.assertEqual(len(self.queue_wrapper.queue), 1)
+        self.assertEqual(self.seq_sender.mode, SenderMode.BUSY)
+        self.assertTrue(res.longest_rem_delay > timedelta(seconds=9))
+
+    def test_priority_wait_delays_finish(self):
+        wait_delay = timedelta(milliseconds=20)
+        self.seq_sender.add_prioritized_entry(RawTcEntry(bytes([0]), priority=TcPriority.HIGH))
+        self.seq_sender.add_prioritized_entry(WaitEntry(wait_delay, priority=TcPriority.HIGH))
+        self.assertEqual(self.seq_sender.mode, SenderMode.BUSY)
+        res = self.seq_sender.operation(self.com_if)
+        self.assertTrue(res.tc_sent)
+        self.seq_sender.operation(self.com_if)
+        self.assertFalse(self.seq_sender.no_delay_remaining())
+        self.assertEqual(self.seq_sender.mode, SenderMode.BUSY)
+        time.sleep(wait_delay.total_seconds())
+        self.seq_sender.operation(self.com_if)
+        self.assertEqual(self.seq_sender.mode, SenderMode.DONE)
+
+    def test_priorities_in_fed_queue(self):
+        queue_wrapper = QueueWrapper.empty()
+        queue_wrapper.queue.extend(
+            [
+                RawTcEntry(bytes([0])),
+                WaitEntry(timedelta(seconds=10)),
+                RawTcEntry(bytes([1])),
+                RawTcEntry(bytes([0xA0]), priority=TcPriority.HIGH),
+                RawTcEntry(bytes([0xF0]), priority=TcPriority.URGENT),
+            ]
+        )
+        self.seq_sender.queue_wrapper = queue_wrapper
+        self.assertEqual(len(queue_wrapper.queue), 3)
+        sent = []
+        for _ in range(3):
+            res = self.seq_sender.operation(self.com_if)
+            self.assertTrue(res.tc_sent)
+            call_args = self.tc_handler_mock.send_cb.call_args
+            sent.append(cast(SendCbParams, call_args.args[0]).entry.to_raw_tc_entry().tc)
+        self.assertEqual(sent, [bytes([0xF0]), bytes([0xA0]), bytes([0])])
+
+    def test_priority_entry_appended_to_queue(self):
+        self.queue_helper.add_raw_tc(bytes([0]))
+        self.queue_helper.add_wait(timedelta(seconds=10))
+        self.seq_sender.resume()
+        self.seq_sender.operation(self.com_if)
+        self.seq_sender.operation(self.com_if)
+        # The normal priority class waits now, the appended entry is moved to its class.
+        self.queue_wrapper.queue.append(RawTcEntry(bytes([0xA0]), priority=TcPriority.HIGH))
+        res = self.seq_sender.operation(self.com_if)
+        self.assertTrue(res.tc_sent)
+        call_args = self.tc_handler_mock.send_cb.call_args
+        self.assertEqual(
+            cast(SendCbParams, call_args.args[0]).entry.to_raw_tc_entry().tc, bytes([0xA0])
+        )
+        self.assertEqual(self.seq_sender.mode, SenderMode.BUSY)